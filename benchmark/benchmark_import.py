@@ -0,0 +1,36 @@
+import subprocess
+import sys
+import unittest
+
+
+_import_time_script = """
+import time
+
+t0 = time.perf_counter()
+import openmdao.api
+t1 = time.perf_counter()
+import dymos
+t2 = time.perf_counter()
+
+print(t1 - t0, t2 - t1)
+"""
+
+
+class BenchmarkImport(unittest.TestCase):
+
+    def benchmark_import_time(self):
+        """ Importing dymos should cost little more than importing openmdao. """
+        # Take the best of several cold starts to reduce the noise of the measurement.
+        om_times = []
+        dymos_times = []
+        for _ in range(5):
+            out = subprocess.check_output([sys.executable, '-c', _import_time_script], text=True)
+            om_time, dymos_time = (float(s) for s in out.split())
+            om_times.append(om_time)
+            dymos_times.append(dymos_time)
+
+        self.assertLess(min(dymos_times), 0.1 * min(om_times))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
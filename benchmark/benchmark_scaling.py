@@ -0,0 +1,332 @@
+"""
+Scaling benchmarks of the individual stages of a dymos problem.
+
+Each case builds a trajectory of linked phases whose ODE has a given number of decoupled states,
+and separately measures the wall time and peak memory of Problem.setup, final_setup, run_model,
+compute_totals, total coloring, simulate, check_error, a grid refinement iteration, and load_case.
+Cases are swept over the number of segments, the transcription order, the number of states, and
+the number of phases.
+
+The results of each sweep are compared against a baseline file, and any stage which is slower or
+uses more memory than its baseline by more than the allowed tolerance is reported as a regression.
+If there is no baseline, nothing can be compared, so the benchmarks are skipped with a warning and
+the command line run exits with an error.  The baseline is read from the file given by the
+environment variable DYMOS_BENCHMARK_BASELINE, or from benchmark_scaling_baseline.json next to
+this file.  Since the timings depend on the machine, baselines are not shared between machines and
+are generated with
+
+    python benchmark_scaling.py --save-baseline [filename]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+import unittest
+import warnings
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.coloring import compute_total_coloring
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.grid_refinement.error_estimation import check_error
+from dymos.grid_refinement.hp_adaptive.hp_adaptive import HPAdaptive
+from dymos.grid_refinement.refinement import _snapshot_solution, _warm_start
+from dymos.load_case import find_phases
+
+
+STAGES = ('setup', 'final_setup', 'run_model', 'compute_totals', 'coloring', 'simulate',
+          'check_error', 'refine', 'load_case')
+
+# The default settings of each case, and the values over which each setting is swept.
+DEFAULT_CASE = {'num_segments': 10, 'order': 3, 'num_states': 2, 'num_phases': 1}
+
+SWEEPS = {'num_segments': (5, 10, 20, 40),
+          'order': (3, 5, 7),
+          'num_states': (2, 8, 32),
+          'num_phases': (1, 2, 4)}
+
+# The fractional increase over the baseline allowed before a stage is considered a regression.
+TIME_TOLERANCE = 0.5
+MEMORY_TOLERANCE = 0.2
+
+# Stages which take less time than this are dominated by noise and are not compared.
+MIN_TIME = 0.01
+
+BASELINE_FILE = os.environ.get('DYMOS_BENCHMARK_BASELINE',
+                               os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            'benchmark_scaling_baseline.json'))
+
+
+class _ScalingODE(om.ExplicitComponent):
+    """
+    An ODE with num_states decoupled states, x_i_dot = u - x_i.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare('num_states', types=int, default=2)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn, dtype=int)
+
+        self.add_input('u', shape=(nn,), units='1/s')
+
+        for i in range(self.options['num_states']):
+            self.add_input(f'x{i}', shape=(nn,), units=None)
+            self.add_output(f'x{i}_dot', shape=(nn,), units='1/s')
+            self.declare_partials(of=f'x{i}_dot', wrt=f'x{i}', rows=ar, cols=ar, val=-1.0)
+            self.declare_partials(of=f'x{i}_dot', wrt='u', rows=ar, cols=ar, val=1.0)
+
+    def compute(self, inputs, outputs):
+        for i in range(self.options['num_states']):
+            outputs[f'x{i}_dot'] = inputs['u'] - inputs[f'x{i}']
+
+
+def make_problem(num_segments=10, order=3, num_states=2, num_phases=1):
+    """
+    Build a problem with a trajectory of num_phases linked phases, without setting it up.
+    """
+    p = om.Problem(reports=False)
+    p.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+
+    traj = p.model.add_subsystem('traj', dm.Trajectory())
+    states = [f'x{i}' for i in range(num_states)]
+
+    for iphase in range(num_phases):
+        phase = dm.Phase(ode_class=_ScalingODE, ode_init_kwargs={'num_states': num_states},
+                         transcription=dm.Radau(num_segments=num_segments, order=order))
+        traj.add_phase(f'phase{iphase}', phase)
+
+        phase.set_time_options(fix_initial=iphase == 0, duration_bounds=(0.1, 10.0), units='s')
+        for name in states:
+            phase.add_state(name, fix_initial=iphase == 0, rate_source=f'{name}_dot', targets=[name])
+        phase.add_control('u', units='1/s', lower=-1.0, upper=1.0, targets=['u'])
+
+        if iphase == num_phases - 1:
+            phase.add_boundary_constraint('x0', loc='final', equals=0.5)
+            phase.add_objective('time', loc='final')
+
+    if num_phases > 1:
+        traj.link_phases([f'phase{i}' for i in range(num_phases)], vars=['time'] + states)
+
+    p.model.linear_solver = om.DirectSolver()
+
+    return p
+
+
+def _set_initial_guess(p, num_states, num_phases):
+    for iphase in range(num_phases):
+        phase_path = f'traj.phase{iphase}'
+        phase = p.model._get_subsystem(f'traj.phases.phase{iphase}')
+        p.set_val(f'{phase_path}.t_initial', float(iphase))
+        p.set_val(f'{phase_path}.t_duration', 1.0)
+        for i in range(num_states):
+            p.set_val(f'{phase_path}.states:x{i}', phase.interp(f'x{i}', [1.0, 0.5]))
+        p.set_val(f'{phase_path}.controls:u', phase.interp('u', [0.0, 0.5]))
+
+
+def _refine_grid(p, refine_results):
+    """
+    Perform one iteration of hp grid refinement, as done by dm.run_problem, without rerunning the driver.
+
+    The grid of each phase which needs refinement is refined, the problem is set up again, and the
+    refined phases are warm started from the previous solution.
+    """
+    phases = find_phases(p.model)
+    refined_phases = [phase_path for phase_path in refine_results
+                      if np.any(refine_results[phase_path]['need_refinement'])]
+
+    HPAdaptive(phases).refine(refine_results, 1)
+    snapshot = _snapshot_solution(p, phases, refined_phases)
+
+    p.setup(check=False)
+    _warm_start(p, phases, snapshot)
+    p.final_setup()
+
+
+class _StageRecorder(object):
+    """
+    Measures the wall time, and optionally the peak memory allocation, of a sequence of stages.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.results = {}
+
+    def measure(self, stage, func, *args, **kwargs):
+        if self.trace_memory:
+            tracemalloc.start()
+            mem0 = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        ret = func(*args, **kwargs)
+        elapsed = time.perf_counter() - t0
+        if self.trace_memory:
+            self.results[stage] = tracemalloc.get_traced_memory()[1] - mem0
+            tracemalloc.stop()
+        else:
+            self.results[stage] = elapsed
+        return ret
+
+
+def profile_stages(num_segments=10, order=3, num_states=2, num_phases=1, trace_memory=False):
+    """
+    Run each stage of a case once, returning the wall time (s) or peak memory (bytes) of each.
+    """
+    rec = _StageRecorder(trace_memory=trace_memory)
+
+    p = make_problem(num_segments=num_segments, order=order, num_states=num_states,
+                     num_phases=num_phases)
+
+    rec.measure('setup', p.setup, check=False)
+    rec.measure('final_setup', p.final_setup)
+    _set_initial_guess(p, num_states, num_phases)
+    rec.measure('run_model', p.run_model)
+    rec.measure('compute_totals', p.compute_totals)
+    rec.measure('coloring', compute_total_coloring, p)
+
+    prev = {'inputs': p.model.list_inputs(units=True, prom_name=True, out_stream=None),
+            'outputs': p.model.list_outputs(units=True, prom_name=True, out_stream=None)}
+
+    with np.errstate(all='ignore'):
+        rec.measure('simulate', p.model.traj.simulate, times_per_seg=10)
+        refine_results = rec.measure('check_error', check_error, find_phases(p.model))
+        rec.measure('refine', _refine_grid, p, refine_results)
+
+    # Load the solution on the original grid into the refined problem, as when restarting.
+    rec.measure('load_case', dm.load_case, p, prev)
+
+    p.cleanup()
+
+    return rec.results
+
+
+def run_sweep(setting, values=None):
+    """
+    Profile the stages of each case of the sweep of the given setting.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping each case name, f'{setting}={value}', to a dict with keys 'time'
+        and 'memory', each mapping the name of each stage to its wall time or peak memory.
+    """
+    results = {}
+    for val in SWEEPS[setting] if values is None else values:
+        case = dict(DEFAULT_CASE, **{setting: val})
+        results[f'{setting}={val}'] = {'time': profile_stages(**case),
+                                       'memory': profile_stages(trace_memory=True, **case)}
+    return results
+
+
+def compare_to_baseline(results, baseline, time_tol=TIME_TOLERANCE, memory_tol=MEMORY_TOLERANCE):
+    """
+    Return a message describing each stage of each case which regressed relative to the baseline.
+
+    Cases and stages which are not in the baseline cannot be compared, and a warning is issued for them.
+    """
+    regressions = []
+    for case_name, case_results in results.items():
+        if case_name not in baseline:
+            warnings.warn(f'Case {case_name} is not in the baseline and was not compared.')
+            continue
+        missing = [stage for stage in STAGES if stage not in baseline[case_name]['time']]
+        if missing:
+            warnings.warn(f'Stages {missing} of case {case_name} are not in the baseline and were not compared.')
+        for stage, t in case_results['time'].items():
+            t_base = baseline[case_name]['time'].get(stage)
+            if t_base is not None and max(t, t_base) > MIN_TIME and t > (1.0 + time_tol) * t_base:
+                regressions.append(f'{case_name} {stage}: time {t:.4f} s exceeds baseline {t_base:.4f} s')
+        for stage, mem in case_results['memory'].items():
+            mem_base = baseline[case_name]['memory'].get(stage)
+            if mem_base is not None and mem > (1.0 + memory_tol) * mem_base:
+                regressions.append(f'{case_name} {stage}: peak memory {mem / 2**20:.2f} MiB exceeds '
+                                   f'baseline {mem_base / 2**20:.2f} MiB')
+    return regressions
+
+
+def print_results(results):
+    """
+    Print a table of the time and peak memory of each stage of each case.
+    """
+    header = f'{"case":<18}' + ''.join(f'{stage:>16}' for stage in STAGES)
+    print(header)
+    for case_name, case_results in results.items():
+        print(f'{case_name:<18}' + ''.join(f'{case_results["time"][stage]:>15.4f}s' for stage in STAGES))
+        print(f'{"":<18}' + ''.join(f'{case_results["memory"][stage] / 2**20:>13.2f}MiB' for stage in STAGES))
+
+
+def _load_baseline():
+    """
+    Return the baseline results, or None with a warning if there is no baseline file.
+    """
+    if not os.path.exists(BASELINE_FILE):
+        warnings.warn(f'No benchmark baseline was found at {BASELINE_FILE}, so the results cannot be '
+                      f'checked for regressions.  Generate one with '
+                      f'`python benchmark_scaling.py --save-baseline`.')
+        return None
+    with open(BASELINE_FILE) as f:
+        return json.load(f)
+
+
+@use_tempdirs
+class BenchmarkScaling(unittest.TestCase):
+    """ Scaling benchmarks of the stages of setting up, running, and post-processing a problem. """
+
+    def _run_and_compare(self, setting):
+        baseline = _load_baseline()
+        if baseline is None:
+            self.skipTest(f'No benchmark baseline was found at {BASELINE_FILE}.')
+
+        results = run_sweep(setting)
+        print_results(results)
+
+        regressions = compare_to_baseline(results, baseline)
+        self.assertFalse(regressions, msg='\n'.join(regressions))
+
+    def benchmark_num_segments(self):
+        self._run_and_compare('num_segments')
+
+    def benchmark_order(self):
+        self._run_and_compare('order')
+
+    def benchmark_num_states(self):
+        self._run_and_compare('num_states')
+
+    def benchmark_num_phases(self):
+        self._run_and_compare('num_phases')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    parser = argparse.ArgumentParser(description='Run the dymos scaling benchmarks.')
+    parser.add_argument('--save-baseline', nargs='?', const=BASELINE_FILE, default=None,
+                        help='Save the results to the given baseline file rather than comparing '
+                             'against it.')
+    parser.add_argument('--sweep', choices=tuple(SWEEPS), action='append',
+                        help='The setting to be swept.  May be given more than once.  By default, '
+                             'all settings are swept.')
+    args = parser.parse_args()
+
+    all_results = {}
+    for setting in args.sweep or SWEEPS:
+        all_results.update(run_sweep(setting))
+    print_results(all_results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(all_results, f, indent=2)
+        print(f'Saved baseline to {args.save_baseline}')
+    else:
+        baseline = _load_baseline()
+        if baseline is None:
+            sys.exit(f'No benchmark baseline was found at {BASELINE_FILE}.  Run with --save-baseline to '
+                     f'create one.')
+        regressions = compare_to_baseline(all_results, baseline)
+        print('\n'.join(regressions) if regressions else 'No regressions found.')
+        if regressions:
+            sys.exit(1)
@@ -1,8 +1,59 @@
 __version__ = '1.6.1-dev'
 
-from .phase import Phase, AnalyticPhase
-from .transcriptions import GaussLobatto, Radau, ExplicitShooting, Analytic
-from .trajectory.trajectory import Trajectory
+import importlib
+
 from .run_problem import run_problem
 from .load_case import load_case
 from .options import options
+
+# The phase, transcription, trajectory, and results reader classes are imported on first access so that
+# importing dymos does not import every transcription, ODE component, and report.
+_lazy_attrs = {
+    'Phase': '.phase',
+    'AnalyticPhase': '.phase',
+    'GaussLobatto': '.transcriptions',
+    'Radau': '.transcriptions',
+    'ExplicitShooting': '.transcriptions',
+    'Analytic': '.transcriptions',
+    'Trajectory': '.trajectory.trajectory',
+    'ResultsReader': '.utils.results_store',
+}
+
+_lazy_submodules = ('examples', 'grid_refinement', 'models', 'phase', 'trajectory', 'transcriptions',
+                    'utils', 'visualization')
+
+
+def __getattr__(name):
+    """
+    Import the public classes and subpackages of dymos on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the requested attribute.
+
+    Returns
+    -------
+    object
+        The requested class or subpackage.
+    """
+    if name in _lazy_attrs:
+        val = getattr(importlib.import_module(_lazy_attrs[name], __name__), name)
+    elif name in _lazy_submodules:
+        val = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = val
+    return val
+
+
+def __dir__():
+    """
+    Return the names of the attributes of dymos, including those which are imported on access.
+
+    Returns
+    -------
+    list of str
+        The attribute names.
+    """
+    return sorted(set(globals()) | set(_lazy_attrs) | set(_lazy_submodules))
@@ -1,18 +1,27 @@
 """
 Generic utilities for use by the grid refinement schemes.
 """
+import functools
+import weakref
+from collections import OrderedDict
+
 import numpy as np
-from scipy.linalg import block_diag
 
 import openmdao.api as om
 
 from ..transcriptions import GaussLobatto, Radau
-from ..utils.lagrange import lagrange_matrices
+from ..transcriptions.grid_data import _segment_lagrange_matrices, _assemble_block_diag
 from ..utils.misc import get_rate_units
 from ..utils.introspection import get_targets
 
 from .grid_refinement_ode_system import GridRefinementODESystem
 
+_refinement_problems = weakref.WeakKeyDictionary()
+""" The grid refinement ODE problems of each phase, keyed by the grid on which they are evaluated. """
+
+_MAX_REFINEMENT_PROBLEMS_PER_PHASE = 2
+""" The number of grids for which the grid refinement ODE problem of a phase is retained. """
+
 
 def interpolation_lagrange_matrix(old_grid, new_grid):
     """
@@ -27,8 +36,10 @@ def interpolation_lagrange_matrix(old_grid, new_grid):
 
     Returns
     -------
-    ndarray
-        The lagrange interpolation matrix.
+    scipy.sparse.csr_matrix
+        The block diagonal lagrange interpolation matrix.
+    scipy.sparse.csr_matrix
+        The block diagonal lagrange differentiation matrix.
     """
     L_blocks = []
     D_blocks = []
@@ -42,17 +53,39 @@ def interpolation_lagrange_matrix(old_grid, new_grid):
         indices = new_grid.subset_node_indices['all'][i1:i2]
         nodes_eval = new_grid.node_stau[indices]
 
-        L_block, D_block = lagrange_matrices(nodes_given, nodes_eval)
+        L_block, D_block = _segment_lagrange_matrices(tuple(nodes_given), tuple(nodes_eval))
 
         L_blocks.append(L_block)
         D_blocks.append(D_block)
 
-    L = block_diag(*L_blocks)
-    D = block_diag(*D_blocks)
+    L = _assemble_block_diag(L_blocks, sparse=True)
+    D = _assemble_block_diag(D_blocks, sparse=True)
 
     return L, D
 
 
+@functools.lru_cache(maxsize=256)
+def _segment_integration_matrix(nodes):
+    """
+    Return the integration matrix of a single segment, cached by the nodes of the segment.
+
+    Parameters
+    ----------
+    nodes : tuple of float
+        The nodes of the segment in segment tau space.
+
+    Returns
+    -------
+    ndarray
+        Read-only matrix which integrates the rates at all but the first node of the segment
+        to give the change in value from the first node to each of those nodes.
+    """
+    _, D_block = _segment_lagrange_matrices(nodes, nodes[1:])
+    I_block = np.linalg.inv(D_block[:, 1:])
+    I_block.flags.writeable = False
+    return I_block
+
+
 def integration_matrix(grid):
     """
     Evaluate the Integration matrix of the given grid.
@@ -64,27 +97,85 @@ def integration_matrix(grid):
 
     Returns
     -------
-    ndarray
-        The integration matrix used to propagate initial states over segments.
+    scipy.sparse.csr_matrix
+        The block diagonal integration matrix used to propagate initial states over segments.
     """
     I_blocks = []
 
     for iseg in range(grid.num_segments):
         i1, i2 = grid.subset_segment_indices['all'][iseg, :]
         indices = grid.subset_node_indices['all'][i1:i2]
-        nodes_given = grid.node_stau[indices]
+        I_blocks.append(_segment_integration_matrix(tuple(grid.node_stau[indices])))
+
+    return _assemble_block_diag(I_blocks, sparse=True)
 
-        i1, i2 = grid.subset_segment_indices['all'][iseg, :]
-        indices = grid.subset_node_indices['all'][i1:i2]
-        nodes_eval = grid.node_stau[indices][1:]
 
-        _, D_block = lagrange_matrices(nodes_given, nodes_eval)
-        I_block = np.linalg.inv(D_block[:, 1:])
-        I_blocks.append(I_block)
+def _sparse_dot(A, x):
+    """
+    Compute the product of a sparse matrix with an array of values of any shape at each node.
 
-    I = block_diag(*I_blocks)
+    Parameters
+    ----------
+    A : scipy.sparse.csr_matrix
+        The matrix, with one column per node at which x is given.
+    x : ndarray
+        The values at each node, where the first axis corresponds to the nodes.
 
-    return I
+    Returns
+    -------
+    ndarray
+        The product, where the first axis corresponds to the rows of A.
+    """
+    return np.reshape(A @ np.reshape(x, (x.shape[0], -1)), (A.shape[0],) + x.shape[1:])
+
+
+def _get_refinement_problem(phase, grid_data):
+    """
+    Return a problem which evaluates the ODE of the given phase on the given grid.
+
+    The problem is set up the first time it is requested for a given phase and grid, and is
+    reused by subsequent requests.
+
+    Parameters
+    ----------
+    phase : Phase
+        The Phase whose ODE is to be evaluated.
+    grid_data : GridData
+        The grid on which the ODE is to be evaluated.
+
+    Returns
+    -------
+    om.Problem
+        A problem containing a GridRefinementODESystem, on which final_setup has been called.
+    """
+    key = (grid_data.transcription, tuple(grid_data.transcription_order),
+           tuple(grid_data.segment_ends), grid_data.compressed, phase.options['ode_class'])
+
+    phase_problems = _refinement_problems.setdefault(phase, OrderedDict())
+
+    if key in phase_problems:
+        phase_problems.move_to_end(key)
+        return phase_problems[key]
+
+    p_refine = om.Problem(model=om.Group())
+    grid_refinement_system = GridRefinementODESystem(grid_data=grid_data,
+                                                     time=phase.time_options,
+                                                     states=phase.state_options,
+                                                     controls=phase.control_options,
+                                                     polynomial_controls=phase.polynomial_control_options,
+                                                     parameters=phase.parameter_options,
+                                                     ode_class=phase.options['ode_class'],
+                                                     ode_init_kwargs=phase.options[
+                                                         'ode_init_kwargs'])
+    p_refine.model.add_subsystem('grid_refinement_system', grid_refinement_system, promotes=['*'])
+    p_refine.setup()
+    p_refine.final_setup()
+
+    phase_problems[key] = p_refine
+    if len(phase_problems) > _MAX_REFINEMENT_PROBLEMS_PER_PHASE:
+        phase_problems.popitem(last=False)
+
+    return p_refine
 
 
 def eval_ode_on_grid(phase, transcription):
@@ -126,20 +217,8 @@ def eval_ode_on_grid(phase, transcription):
     L, _ = interpolation_lagrange_matrix(old_grid=phase.options['transcription'].grid_data,
                                          new_grid=grid_data)
 
-    # Create a new problem for the grid_refinement
-    # For this test, use the same grid as the original problem.
-    p_refine = om.Problem(model=om.Group())
-    grid_refinement_system = GridRefinementODESystem(grid_data=grid_data,
-                                                     time=phase.time_options,
-                                                     states=phase.state_options,
-                                                     controls=phase.control_options,
-                                                     polynomial_controls=phase.polynomial_control_options,
-                                                     parameters=phase.parameter_options,
-                                                     ode_class=phase.options['ode_class'],
-                                                     ode_init_kwargs=phase.options[
-                                                         'ode_init_kwargs'])
-    p_refine.model.add_subsystem('grid_refinement_system', grid_refinement_system, promotes=['*'])
-    p_refine.setup()
+    # Get the problem which evaluates the ODE on the new grid.
+    p_refine = _get_refinement_problem(phase, grid_data)
 
     # Set the values in the refinement problem using the outputs from the first
     ode = p_refine.model.grid_refinement_system.ode
@@ -148,8 +227,8 @@ def eval_ode_on_grid(phase, transcription):
     t_phase_prev = phase.get_val('timeseries.time_phase', units=phase.time_options['units'])
     t_initial = np.repeat(t_prev[0, 0], repeats=transcription.grid_data.num_nodes, axis=0)
     t_duration = np.repeat(t_prev[-1, 0], repeats=transcription.grid_data.num_nodes, axis=0)
-    t = np.dot(L, t_prev)
-    t_phase = np.dot(L, t_phase_prev)
+    t = _sparse_dot(L, t_prev)
+    t_phase = _sparse_dot(L, t_phase_prev)
     targets = get_targets(ode, 'time', phase.time_options['targets'])
     time_phase_targets = get_targets(ode, 'time_phase', phase.time_options['time_phase_targets'])
     t_initial_targets = get_targets(ode, 't_initial', phase.time_options['t_initial_targets'])
@@ -165,7 +244,7 @@ def eval_ode_on_grid(phase, transcription):
 
     for name, options in phase.state_options.items():
         x_prev = phase.get_val(f'timeseries.states:{name}', units=options['units'])
-        x[name] = np.dot(L, x_prev)
+        x[name] = _sparse_dot(L, x_prev)
         targets = get_targets(ode, name, options['targets'])
         if targets:
             p_refine.set_val(f'states:{name}', x[name])
@@ -176,17 +255,17 @@ def eval_ode_on_grid(phase, transcription):
         rate2_targets = get_targets(ode, f'{name}_rate12', options['rate2_targets'])
 
         u_prev = phase.get_val(f'timeseries.controls:{name}', units=options['units'])
-        u[name] = np.dot(L, u_prev)
+        u[name] = _sparse_dot(L, u_prev)
         if targets:
             p_refine.set_val(f'controls:{name}', u[name])
 
         u_rate_prev = phase.get_val(f'timeseries.control_rates:{name}_rate')
-        u_rate[name] = np.dot(L, u_rate_prev)
+        u_rate[name] = _sparse_dot(L, u_rate_prev)
         if rate_targets:
             p_refine.set_val(f'control_rates:{name}_rate', u_rate[name])
 
         u_rate2_prev = phase.get_val(f'timeseries.control_rates:{name}_rate2')
-        u_rate2[name] = np.dot(L, u_rate2_prev)
+        u_rate2[name] = _sparse_dot(L, u_rate2_prev)
         if rate2_targets:
             p_refine.set_val(f'control_rates:{name}_rate2', u_rate2[name])
 
@@ -196,17 +275,17 @@ def eval_ode_on_grid(phase, transcription):
         rate2_targets = get_targets(ode, f'{name}_rate2', options['rate2_targets'])
 
         p_prev = phase.get_val(f'timeseries.polynomial_controls:{name}', units=options['units'])
-        p[name] = np.dot(L, p_prev)
+        p[name] = _sparse_dot(L, p_prev)
         if targets:
             p_refine.set_val(f'polynomial_controls:{name}', p[name])
 
         p_rate_prev = phase.get_val(f'timeseries.polynomial_control_rates:{name}_rate')
-        p_rate[name] = np.dot(L, p_rate_prev)
+        p_rate[name] = _sparse_dot(L, p_rate_prev)
         if rate_targets:
             p_refine.set_val(f'polynomial_control_rates:{name}_rate', p_rate[name])
 
         p_rate2_prev = phase.get_val(f'timeseries.polynomial_control_rates:{name}_rate2')
-        p_rate2[name] = np.dot(L, p_rate2_prev)
+        p_rate2[name] = _sparse_dot(L, p_rate2_prev)
         if rate2_targets:
             p_refine.set_val(f'polynomial_control_rates:{name}_rate2', p_rate2[name])
 
@@ -267,7 +346,8 @@ def eval_ode_on_grid(phase, transcription):
             f[name] = om.convert_units(param[rate_source], src_units, rate_units)
             f[name] = np.broadcast_to(f[name], (grid_data.num_nodes,) + shape)
         elif rate_source_class in {'ode'}:
-            f[name] = p_refine.get_val(f'ode.{rate_source}', units=rate_units)
+            # Copy the rates since the problem, and the vector they view, are reused.
+            f[name] = p_refine.get_val(f'ode.{rate_source}', units=rate_units).copy()
 
         if len(f[name].shape) == 1:
             f[name] = np.reshape(f[name], newshape=(f[name].shape[0], 1))
@@ -306,7 +386,7 @@ def compute_state_quadratures(x_hat, f_hat, t_duration, transcription):
 
     left_end_idxs = gd.subset_node_indices['segment_ends'][0::2]
     all_idxs = gd.subset_node_indices['all']
-    not_left_end_idxs = np.array(sorted(set(all_idxs).difference(left_end_idxs)))
+    not_left_end_idxs = np.setdiff1d(all_idxs, left_end_idxs)
 
     dt_dstau = np.atleast_2d(0.5 * t_duration * gd.node_dptau_dstau[not_left_end_idxs]).T
 
@@ -322,7 +402,7 @@ def compute_state_quadratures(x_hat, f_hat, t_duration, transcription):
         left_end_idxs_repeated = np.repeat(left_end_idxs, nnps)
         x_prime[state_name][not_left_end_idxs, ...] = \
             x_hat[state_name][left_end_idxs_repeated, ...] \
-            + dt_dstau * np.dot(I, f_hat[state_name][not_left_end_idxs, ...])
+            + dt_dstau * _sparse_dot(I, f_hat[state_name][not_left_end_idxs, ...])
 
     return x_prime
 
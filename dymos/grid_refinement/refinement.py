@@ -6,12 +6,136 @@ from .hp_adaptive.hp_adaptive import HPAdaptive
 from .write_iteration import write_error, write_refine_iter
 
 from dymos.grid_refinement.error_estimation import check_error
-from dymos.load_case import load_case, find_phases
+from dymos.load_case import find_phases
+from dymos.utils.coloring_cache import cached_total_coloring
+from dymos.utils.profiling import instrument_problem, profile_section
 
 import numpy as np
 import sys
 
 
+def _snapshot_solution(problem, phases, refined_phases):
+    """
+    Record the current solution of the problem in memory so that it can be restored after refinement.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The OpenMDAO problem object whose solution is being recorded.
+    phases : dict
+        A dictionary mapping the absolute path of each Phase in the problem to the Phase object.
+    refined_phases : list of str
+        The absolute paths of the phases whose grid is about to be refined.
+
+    Returns
+    -------
+    dict
+        A dictionary with key 'outputs' mapping the absolute name of each output to its value,
+        key 'inputs' mapping the absolute name of one input fed by each automatic IndepVarComp
+        output to its value, and key 'timeseries' mapping the path of each refined phase to the
+        time, state, and control histories from which its new grid is interpolated.
+    """
+    model = problem.model
+
+    outputs = {name: val.copy() for name, val in model._outputs.items()
+               if not name.startswith('_auto_ivc.')}
+
+    # Automatic IndepVarComp outputs are renumbered by setup, so track them by a connected input.
+    inputs = {}
+    auto_ivc_srcs = set()
+    for abs_in, src in model._conn_global_abs_in2out.items():
+        if src.startswith('_auto_ivc.') and src not in auto_ivc_srcs:
+            auto_ivc_srcs.add(src)
+            inputs[abs_in] = model._outputs[src].copy()
+
+    timeseries = {}
+    for phase_path in refined_phases:
+        phase = phases[phase_path]
+        time_units = phase.time_options['units']
+        time, unique_idxs = np.unique(problem.get_val(f'{phase_path}.timeseries.time', units=time_units),
+                                      return_index=True)
+        timeseries[phase_path] = {'time': time, 'states': {}, 'controls': {}}
+
+        for name, options in phase.state_options.items():
+            val = problem.get_val(f'{phase_path}.timeseries.states:{name}', units=options['units'])
+            timeseries[phase_path]['states'][name] = val[unique_idxs, ...]
+
+        for name, options in phase.control_options.items():
+            val = problem.get_val(f'{phase_path}.timeseries.controls:{name}', units=options['units'])
+            timeseries[phase_path]['controls'][name] = val[unique_idxs, ...]
+
+    return {'outputs': outputs, 'inputs': inputs, 'timeseries': timeseries}
+
+
+def _warm_start(problem, phases, snapshot):
+    """
+    Set the values of a newly refined problem from a snapshot of the previous solution.
+
+    Every variable whose size is unchanged by refinement is restored to its previous value, which
+    reproduces the previous solution exactly in phases whose grid was not refined.  The states and
+    controls of the refined phases are then interpolated from their previous time histories onto
+    the new grid.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The OpenMDAO problem object which has been set up with the refined grid.
+    phases : dict
+        A dictionary mapping the absolute path of each Phase in the problem to the Phase object.
+    snapshot : dict
+        The previous solution, as returned by _snapshot_solution.
+    """
+    model = problem.model
+    abs2meta_out = model._var_allprocs_abs2meta['output']
+    abs2meta_in = model._var_allprocs_abs2meta['input']
+
+    for name, val in snapshot['outputs'].items():
+        if name in abs2meta_out and abs2meta_out[name]['size'] == val.size:
+            problem.set_val(name, val.reshape(abs2meta_out[name]['shape']))
+
+    for name, val in snapshot['inputs'].items():
+        if name in abs2meta_in and abs2meta_in[name]['size'] == val.size and \
+                model._conn_global_abs_in2out[name].startswith('_auto_ivc.'):
+            problem.set_val(name, val.reshape(abs2meta_in[name]['shape']))
+
+    for phase_path, history in snapshot['timeseries'].items():
+        phase = phases[phase_path]
+        time = history['time']
+
+        for name, val in history['states'].items():
+            problem.set_val(f'{phase_path}.states:{name}',
+                            phase.interp(name=name, xs=time, ys=val, kind='slinear'),
+                            units=phase.state_options[name]['units'])
+
+        for name, val in history['controls'].items():
+            problem.set_val(f'{phase_path}.controls:{name}',
+                            phase.interp(name=name, xs=time, ys=val, kind='slinear'),
+                            units=phase.control_options[name]['units'])
+
+
+def _run_driver(problem, case_prefix=None, reset_iter_counts=True):
+    """
+    Run the driver of the problem, using the total coloring from the coloring cache if it is cached.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The OpenMDAO problem object to be run.
+    case_prefix : str or None
+        Prefix to prepend to coordinates when recording.
+    reset_iter_counts : bool
+        If True and model has been run previously, reset all iteration counters.
+
+    Returns
+    -------
+    bool
+        Failure flag; True if failed to converge, False is successful.
+    """
+    problem.final_setup()
+    with cached_total_coloring(problem):
+        return problem.run_driver(case_prefix=case_prefix, reset_iter_counts=reset_iter_counts)
+
+
 def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_prefix=None, reset_iter_counts=True):
     """
     This function performs grid refinement for a phases in which solve_segments is true.
@@ -33,9 +157,9 @@ def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_pre
     refinement_methods = {'hp': HPAdaptive, 'ph': PHAdaptive}
     _case_prefix = '' if case_prefix is None else f'{case_prefix}_'
 
-    failed = problem.run_driver(case_prefix=f'{_case_prefix}{refine_method}_0_'
-                                if refine_iteration_limit > 0 else _case_prefix,
-                                reset_iter_counts=reset_iter_counts)
+    failed = _run_driver(problem, case_prefix=f'{_case_prefix}{refine_method}_0_'
+                         if refine_iteration_limit > 0 else _case_prefix,
+                         reset_iter_counts=reset_iter_counts)
 
     if refine_iteration_limit > 0:
         out_file = 'grid_refinement.out'
@@ -43,7 +167,8 @@ def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_pre
         ref = refinement_methods[refine_method](phases)
         with open(out_file, 'w+') as f:
             for i in range(1, refine_iteration_limit + 1):
-                refine_results = check_error(phases)
+                with profile_section('', 'grid_refinement', 'check_error'):
+                    refine_results = check_error(phases)
 
                 refined_phases = [phase_path for phase_path in refine_results if
                                   phases[phase_path].refine_options['refine'] and
@@ -55,19 +180,20 @@ def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_pre
                 if not refined_phases:
                     break
 
-                ref.refine(refine_results, i)
+                with profile_section('', 'grid_refinement', 'refine'):
+                    ref.refine(refine_results, i)
 
                 for stream in f, sys.stdout:
                     write_refine_iter(stream, i, phases, refine_results)
 
-                prev_soln = {'inputs': problem.model.list_inputs(out_stream=None, units=True, prom_name=True),
-                             'outputs': problem.model.list_outputs(out_stream=None, units=True, prom_name=True)}
+                snapshot = _snapshot_solution(problem, phases, refined_phases)
 
                 problem.setup()
+                instrument_problem(problem)
 
-                load_case(problem, prev_soln)
+                _warm_start(problem, phases, snapshot)
 
-                failed = problem.run_driver(case_prefix=f'{_case_prefix}{refine_method}_{i}_')
+                failed = _run_driver(problem, case_prefix=f'{_case_prefix}{refine_method}_{i}_')
 
             for stream in [f, sys.stdout]:
                 if i == refine_iteration_limit-1:
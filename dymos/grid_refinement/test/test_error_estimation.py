@@ -8,7 +8,10 @@ from openmdao.utils.testing_utils import use_tempdirs, require_pyoptsparse
 
 import dymos as dm
 from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
-from dymos.grid_refinement.error_estimation import eval_ode_on_grid, compute_state_quadratures
+from dymos.grid_refinement.error_estimation import eval_ode_on_grid, compute_state_quadratures, \
+    integration_matrix, interpolation_lagrange_matrix, _refinement_problems
+from dymos.transcriptions.grid_data import GridData
+from dymos.utils.lagrange import lagrange_matrices
 
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 OPT, OPTIMIZER = set_pyoptsparse_opt('SLSQP', fallback=True)
@@ -122,3 +125,61 @@ class TestBrachistochroneExample(unittest.TestCase):
                             assert_near_equal(x[name].ravel(), x_solution.ravel())
                             assert_near_equal(f[name].ravel(), f_solution.ravel())
                             assert_near_equal(x_hat[name], x[name], tolerance=err_tol)
+
+
+@use_tempdirs
+class TestErrorEstimationMatrices(unittest.TestCase):
+
+    def test_integration_matrix(self):
+        gd = GridData(num_segments=4, transcription='radau-ps', transcription_order=[3, 4, 4, 3])
+        I = integration_matrix(gd)
+
+        nnps = np.array(gd.subset_num_nodes_per_segment['all']) - 1
+        self.assertEqual(I.shape, (np.sum(nnps), np.sum(nnps)))
+        self.assertEqual(I.nnz, np.sum(nnps**2))
+
+        # The first diagonal block inverts the differentiation matrix of the first segment.
+        nodes = gd.node_stau[:nnps[0] + 1]
+        _, D = lagrange_matrices(nodes, nodes[1:])
+        assert_near_equal(I[:nnps[0], :nnps[0]].toarray() @ D[:, 1:], np.eye(nnps[0]), tolerance=1.0E-12)
+
+    def test_interpolation_lagrange_matrix(self):
+        old_gd = GridData(num_segments=3, transcription='gauss-lobatto', transcription_order=3)
+        new_gd = GridData(num_segments=3, transcription='gauss-lobatto', transcription_order=5)
+        L, D = interpolation_lagrange_matrix(old_gd, new_gd)
+
+        self.assertEqual(L.shape, (15, 9))
+
+        # Linear functions of segment tau are interpolated exactly.
+        assert_near_equal(L @ old_gd.node_stau, new_gd.node_stau, tolerance=1.0E-12)
+        assert_near_equal(D @ old_gd.node_stau, np.ones(15), tolerance=1.0E-12)
+
+    def test_refinement_problem_reused(self):
+        p = om.Problem()
+        phase = dm.Phase(ode_class=BrachistochroneODE, transcription=dm.Radau(num_segments=5, order=3))
+        p.model.add_subsystem('phase0', phase)
+        phase.set_time_options(fix_initial=True)
+        phase.add_state('x')
+        phase.add_state('y')
+        phase.add_state('v')
+        phase.add_control('theta', units='deg')
+        phase.add_parameter('g', units='m/s**2', val=9.80665)
+        p.setup()
+
+        p.set_val('phase0.t_duration', 2.0)
+        p.set_val('phase0.states:v', phase.interp('v', [0, 10]))
+        p.set_val('phase0.controls:theta', phase.interp('theta', [5, 100]))
+        p.run_model()
+
+        _, _, _, f0 = eval_ode_on_grid(phase, dm.Radau(num_segments=5, order=4))
+        self.assertEqual(len(_refinement_problems[phase]), 1)
+        p_refine = next(iter(_refinement_problems[phase].values()))
+
+        p.set_val('phase0.states:v', phase.interp('v', [0, 20]))
+        p.run_model()
+
+        # A second evaluation on the same grid reuses the problem and sees the new values.
+        _, _, _, f1 = eval_ode_on_grid(phase, dm.Radau(num_segments=5, order=4))
+        self.assertEqual(len(_refinement_problems[phase]), 1)
+        self.assertIs(next(iter(_refinement_problems[phase].values())), p_refine)
+        assert_near_equal(f1['x'], 2.0 * f0['x'], tolerance=1.0E-12)
@@ -2,9 +2,13 @@ import unittest
 
 
 import numpy as np
+from numpy.testing import assert_array_equal
 import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 import dymos as dm
+from dymos.grid_refinement.refinement import _snapshot_solution, _warm_start
+from dymos.load_case import find_phases
 
 
 class _BrysonDenhamODE(om.ExplicitComponent):
@@ -144,3 +148,58 @@ class TestGridRefinement(unittest.TestCase):
 
         self.assertGreaterEqual(num_seg, 5)
         self.assertGreater(sum(seg_orders), 5 * 3)
+
+    def test_warm_start_refined_phase(self):
+        p = om.Problem()
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+
+        for name in ('phase0', 'phase1'):
+            phase = traj.add_phase(name, dm.Phase(ode_class=_BrysonDenhamODE,
+                                                  transcription=dm.Radau(num_segments=5, order=3)))
+            phase.set_time_options(fix_initial=True, fix_duration=True)
+            phase.add_state('x', fix_initial=True, fix_final=True, rate_source='v')
+            phase.add_state('v', fix_initial=True, fix_final=True, rate_source='u')
+            phase.add_state('J', fix_initial=True, fix_final=False)
+            phase.add_control('u', continuity=True, rate_continuity=False)
+
+        p.setup()
+
+        phases = find_phases(p.model)
+
+        for name, phase in traj._phases.items():
+            p.set_val(f'traj.phases.{name}.t_initial', 0.0)
+            p.set_val(f'traj.phases.{name}.t_duration', 2.0)
+            p.set_val(f'traj.phases.{name}.states:x', phase.interp('x', ys=[0, 1]))
+            p.set_val(f'traj.phases.{name}.states:v', phase.interp('v', ys=[1, -1]))
+            p.set_val(f'traj.phases.{name}.states:J', phase.interp('J', ys=[0, 1]))
+            p.set_val(f'traj.phases.{name}.controls:u', phase.interp('u', ys=[-2, 2]))
+
+        p.run_model()
+
+        phase0_x = p.get_val('traj.phases.phase0.states:x').copy()
+
+        snapshot = _snapshot_solution(p, phases, ['traj.phases.phase1'])
+
+        # Refine the grid of phase1 only.
+        tx = traj._phases['phase1'].options['transcription']
+        tx.options['num_segments'] = 8
+        tx.init_grid()
+
+        p.setup()
+        _warm_start(p, phases, snapshot)
+        p.final_setup()
+
+        # The unrefined phase is restored exactly.
+        assert_array_equal(p.get_val('traj.phases.phase0.states:x'), phase0_x)
+        assert_array_equal(p.get_val('traj.phases.phase1.t_duration'), [2.0])
+
+        # The refined phase is interpolated onto the new grid.
+        phase1 = traj._phases['phase1']
+        self.assertEqual(p.get_val('traj.phases.phase1.states:x').shape, (8 * 3 + 1, 1))
+        assert_near_equal(p.get_val('traj.phases.phase1.states:x'), phase1.interp('x', ys=[0, 1]))
+        assert_near_equal(p.get_val('traj.phases.phase1.controls:u'), phase1.interp('u', ys=[-2, 2]))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
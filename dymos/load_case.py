@@ -2,8 +2,6 @@ import numpy as np
 
 import openmdao.api as om
 from openmdao.recorders.case import Case
-from .phase.phase import Phase
-from .trajectory import Trajectory
 from openmdao.utils.om_warnings import issue_warning
 
 
@@ -24,6 +22,8 @@ def find_phases(sys):
         A dictionary mapping the absolute path of each Phase object in the given group to each
         Phase object.
     """
+    from .phase.phase import Phase
+
     phase_paths = {}
     if isinstance(sys, Phase):
         phase_paths[sys.pathname] = sys
@@ -50,6 +50,8 @@ def find_trajectories(sys):
         A dictionary mapping the absolute path of each Trajectory object in the given group to each
         Phase object.
     """
+    from .trajectory import Trajectory
+
     traj_paths = {}
     if isinstance(sys, Trajectory):
         traj_paths[sys.pathname] = sys
@@ -59,6 +61,69 @@ def find_trajectories(sys):
     return traj_paths
 
 
+def _build_suffix_index(prom_names):
+    """
+    Build a map from every dotted suffix of the given promoted names to the promoted name.
+
+    For instance, 'traj.phases.phase0.states:x' is indexed under 'states:x', 'phase0.states:x',
+    'phases.phase0.states:x', and 'traj.phases.phase0.states:x'.  When more than one variable
+    shares a suffix, the first one given is kept.
+
+    Parameters
+    ----------
+    prom_names : Iterable of str
+        The promoted variable names to be indexed.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping each dotted suffix to the promoted name which ends with it.
+    """
+    index = {}
+    for prom_name in prom_names:
+        parts = prom_name.split('.')
+        for i in range(len(parts) - 1, -1, -1):
+            index.setdefault('.'.join(parts[i:]), prom_name)
+    return index
+
+
+class _ResultsStoreVars(object):
+    """
+    Provide the variables of a results store in the form of the previous solution in load_case.
+
+    The value of each variable is only loaded from the results store when it is requested.
+
+    Parameters
+    ----------
+    reader : ResultsReader
+        The reader of the results store.
+    """
+    def __init__(self, reader):
+        self._reader = reader
+
+    def __iter__(self):
+        return iter(self._reader.list_vars())
+
+    def get(self, prom_name):
+        """
+        Return the value and units of the variable with the given promoted name.
+
+        Parameters
+        ----------
+        prom_name : str or None
+            The promoted name of the variable in the results store.
+
+        Returns
+        -------
+        dict or None
+            The value, units, and name of the variable, or None if it is not in the results store.
+        """
+        if prom_name is None or prom_name not in self._reader:
+            return None
+        return {'val': self._reader.get_val(prom_name), 'units': self._reader.get_units(prom_name),
+                'abs_name': prom_name}
+
+
 def load_case(problem, previous_solution):
     """
     Populate a guess for the given problem involving Dymos Phases by interpolating results
@@ -68,14 +133,17 @@ def load_case(problem, previous_solution):
     ----------
     problem : om.Problem
         An OpenMDAO Problem object which contains one or more Dymos Phases.
-    previous_solution : dict [or Case]
+    previous_solution : dict [or Case or ResultsReader]
         A dictionary with key 'inputs' mapped to the output of problem.model.list_inputs for
         a previous iteration, and key 'outputs' mapped to the output of prob.model.list_outputs.
         Both list_inputs and list_outputs should be called with `units=True` and `prom_names=True`.
+        If given as a ResultsReader, only the variables of the results store needed to populate
+        the guess are loaded.
     """
+    from .utils.results_store import ResultsReader
 
     # allow old style arguments using a Case or OpenMDAO problem instead of dictionary
-    assert(isinstance(previous_solution, Case) or isinstance(previous_solution, dict))
+    assert(isinstance(previous_solution, (Case, dict, ResultsReader)))
     if isinstance(previous_solution, Case):
         case = previous_solution
         previous_solution = {'inputs': case.list_inputs(out_stream=None, units=True, prom_name=True),
@@ -87,30 +155,28 @@ def load_case(problem, previous_solution):
     if not phase_paths and not traj_paths:
         return
 
-    prev_vars = {}
-    prev_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                      for k, v in previous_solution['inputs']})
-    prev_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                      for k, v in previous_solution['outputs']})
-
-    problem.final_setup()  # make sure list_inputs and list_outputs can work
+    if isinstance(previous_solution, ResultsReader):
+        prev_vars = _ResultsStoreVars(previous_solution)
+    else:
+        prev_vars = {}
+        prev_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
+                          for k, v in previous_solution['inputs']})
+        prev_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
+                          for k, v in previous_solution['outputs']})
+    prev_index = _build_suffix_index(prev_vars)
 
-    phase_io = {'inputs': problem.model.list_inputs(units=True, prom_name=True, out_stream=None),
-                'outputs': problem.model.list_outputs(units=True, prom_name=True, out_stream=None)}
+    problem.final_setup()  # make sure the promoted variable names are available
 
-    phase_vars = {}
-    phase_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                       for k, v in phase_io['inputs']})
-    phase_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                       for k, v in phase_io['outputs']})
+    # Only the promoted names of the variables in the current model are needed.
+    prom2abs = problem.model._var_allprocs_prom2abs_list
+    phase_index = _build_suffix_index(list(prom2abs['input']) + list(prom2abs['output']))
 
     for traj_abs_path, traj in traj_paths.items():
         traj_name = traj_abs_path.rpartition('.')[-1]
         for param_name in traj.parameter_options:
-            prev_match = [s for s in prev_vars if s.endswith(f'{traj_name}.parameters:{param_name}')]
-            if prev_match:
+            prev_data = prev_vars.get(prev_index.get(f'{traj_name}.parameters:{param_name}'))
+            if prev_data is not None:
                 # In previous outputs
-                prev_data = prev_vars[prev_match[0]]
                 prev_val = prev_data['val']
                 prev_units = prev_data['units']
             else:
@@ -121,29 +187,29 @@ def load_case(problem, previous_solution):
         phase_name = phase_abs_path.rpartition('.')[-1]
 
         # Get the initial time and duration from the previous result and set them into the new phase.
-        prev_time_path = [s for s in prev_vars if s.endswith(f'{phase_name}.timeseries.time')][0]
+        prev_time = prev_vars.get(prev_index.get(f'{phase_name}.timeseries.time'))
 
-        prev_time_val = prev_vars[prev_time_path]['val']
+        prev_time_val = prev_time['val']
         prev_time_val, unique_idxs = np.unique(prev_time_val, return_index=True)
-        prev_time_units = prev_vars[prev_time_path]['units']
+        prev_time_units = prev_time['units']
 
         t_initial = prev_time_val[0]
         t_duration = prev_time_val[-1] - prev_time_val[0]
 
-        ti_path = [s for s in phase_vars.keys() if s.endswith(f'{phase_name}.t_initial')]
+        ti_path = phase_index.get(f'{phase_name}.t_initial')
         if ti_path:
-            problem.set_val(ti_path[0], t_initial, units=prev_time_units)
+            problem.set_val(ti_path, t_initial, units=prev_time_units)
 
-        td_path = [s for s in phase_vars.keys() if s.endswith(f'{phase_name}.t_duration')]
+        td_path = phase_index.get(f'{phase_name}.t_duration')
         if td_path:
-            problem.set_val(td_path[0], t_duration, units=prev_time_units)
+            problem.set_val(td_path, t_duration, units=prev_time_units)
 
         # Interpolate the timeseries state outputs from the previous solution onto the new grid.
         for state_name, options in phase.state_options.items():
-            state_path = [s for s in phase_vars if s.endswith(f'{phase_name}.states:{state_name}')][0]
-            prev_state_path = [s for s in prev_vars if s.endswith(f'{phase_name}.timeseries.states:{state_name}')][0]
-            prev_state_val = prev_vars[prev_state_path]['val']
-            prev_state_units = prev_vars[prev_state_path]['units']
+            state_path = phase_index.get(f'{phase_name}.states:{state_name}')
+            prev_state = prev_vars.get(prev_index.get(f'{phase_name}.timeseries.states:{state_name}'))
+            prev_state_val = prev_state['val']
+            prev_state_units = prev_state['units']
             problem.set_val(state_path,
                             phase.interp(name=state_name,
                                          xs=prev_time_val,
@@ -151,9 +217,9 @@ def load_case(problem, previous_solution):
                                          kind='slinear'),
                             units=prev_state_units)
 
-            init_val_path = [s for s in phase_vars if s.endswith(f'{phase_name}.initial_states:{state_name}')]
+            init_val_path = phase_index.get(f'{phase_name}.initial_states:{state_name}')
             if init_val_path:
-                problem.set_val(init_val_path[0], prev_state_val[0, ...], units=prev_state_units)
+                problem.set_val(init_val_path, prev_state_val[0, ...], units=prev_state_units)
 
             if options['fix_final']:
                 warning_message = f"{phase_name}.states:{state_name} specifies 'fix_final=True'. " \
@@ -163,11 +229,10 @@ def load_case(problem, previous_solution):
 
         # Interpolate the timeseries control outputs from the previous solution onto the new grid.
         for control_name, options in phase.control_options.items():
-            control_path = [s for s in phase_vars if s.endswith(f'{phase_name}.controls:{control_name}')][0]
-            prev_control_path = [s for s in prev_vars
-                                 if s.endswith(f'{phase_name}.timeseries.controls:{control_name}')][0]
-            prev_control_val = prev_vars[prev_control_path]['val']
-            prev_control_units = prev_vars[prev_control_path]['units']
+            control_path = phase_index.get(f'{phase_name}.controls:{control_name}')
+            prev_control = prev_vars.get(prev_index.get(f'{phase_name}.timeseries.controls:{control_name}'))
+            prev_control_val = prev_control['val']
+            prev_control_units = prev_control['units']
             problem.set_val(control_path,
                             phase.interp(name=control_name,
                                          xs=prev_time_val,
@@ -182,11 +247,10 @@ def load_case(problem, previous_solution):
 
         # Set the output polynomial control outputs from the previous solution as the value
         for pc_name, options in phase.polynomial_control_options.items():
-            pc_path = [s for s in phase_vars if
-                       s.endswith(f'{phase_name}.polynomial_controls:{pc_name}')][0]
-            prev_pc_path = [s for s in prev_vars if s.endswith(f'{phase_name}.polynomial_controls:{pc_name}')][0]
-            prev_pc_val = prev_vars[prev_pc_path]['val']
-            prev_pc_units = prev_vars[prev_pc_path]['units']
+            pc_path = phase_index.get(f'{phase_name}.polynomial_controls:{pc_name}')
+            prev_pc = prev_vars.get(prev_index.get(f'{phase_name}.polynomial_controls:{pc_name}'))
+            prev_pc_val = prev_pc['val']
+            prev_pc_units = prev_pc['units']
             problem.set_val(pc_path, prev_pc_val, units=prev_pc_units)
             if options['fix_final']:
                 warning_message = f"{phase_name}.polynomial_controls:{pc_name} specifies 'fix_final=True'. " \
@@ -196,13 +260,12 @@ def load_case(problem, previous_solution):
 
         # Set the timeseries parameter outputs from the previous solution as the parameter value
         for param_name in phase.parameter_options:
-            prev_match = [s for s in prev_vars if s.endswith(f'{phase_name}.parameters:{param_name}')]
-            if prev_match:
+            prev_data = prev_vars.get(prev_index.get(f'{phase_name}.parameters:{param_name}'))
+            if prev_data is not None:
                 # In previous outputs
-                prev_data = prev_vars[prev_match[0]]
                 prev_param_val = prev_data['val']
                 prev_param_units = prev_data['units']
-                param_path = [s for s in phase_vars if s.endswith(f'{phase_name}.parameters:{param_name}')][0]
+                param_path = phase_index.get(f'{phase_name}.parameters:{param_name}')
             else:
                 continue
             problem.set_val(param_path, prev_param_val[0, ...], units=prev_param_units)
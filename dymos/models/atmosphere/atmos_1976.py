@@ -10,6 +10,8 @@ import numpy as np
 
 import openmdao.api as om
 
+from .tabulated_properties import TabulatedProperties
+
 USatm1976Data = namedtuple('USatm1976Data', ['alt', 'temp', 'pres', 'rho', 'a', 'viscosity'])
 USatm1976Data.__doc__ = \
     """
@@ -1233,6 +1235,13 @@ USatm1976Data.akima_drho = \
               [-2.4871899999999984e-12, 1.5658737190306762e-16, 0.0000000000000000e+00, 0.0000000000000000e+00]])
 
 
+# The Akima coefficients of temperature, pressure, density, viscosity, and the derivative of density wrt
+# altitude, stacked into a single array of shape (n_bins, 5, 4) so that they are evaluated together.
+_akima_coeffs = np.stack((USatm1976Data.akima_T, USatm1976Data.akima_P, USatm1976Data.akima_rho,
+                          USatm1976Data.akima_viscosity, USatm1976Data.akima_drho), axis=1)
+_T, _P, _RHO, _VISC, _DRHO = range(5)
+
+
 class USatm1976Comp(om.ExplicitComponent):
     """
     Component model for the United States standard atmosphere 1976 tables.
@@ -1284,6 +1293,8 @@ class USatm1976Comp(om.ExplicitComponent):
         self.declare_partials(['temp', 'pres', 'rho', 'viscosity', 'drhos_dh', 'sos'], 'h',
                               rows=arange, cols=arange)
 
+        self._table = TabulatedProperties(USatm1976Data.alt, _akima_coeffs)
+
     def compute(self, inputs, outputs):
         """
         Interpolate atmospheric properties for a given altitude.
@@ -1295,7 +1306,6 @@ class USatm1976Comp(om.ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        table_points = USatm1976Data.alt
         h = inputs['h']
 
         if self._geodetic:
@@ -1303,22 +1313,14 @@ class USatm1976Comp(om.ExplicitComponent):
 
         # From this point forward, h is geopotential altitude (z in the original reference).
 
-        idx = np.searchsorted(table_points, h, side='left')
-        h_bin_left = np.hstack((table_points[0], table_points))
-        dx = h - h_bin_left[idx]
-
-        coeffs = USatm1976Data.akima_T[idx]
-        outputs['temp'] = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-
-        coeffs = USatm1976Data.akima_P[idx]
-        outputs['pres'] = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
+        vals = self._table.evaluate(h)
+        derivs = self._table.derivative(h)
 
-        coeffs = USatm1976Data.akima_rho[idx]
-        outputs['rho'] = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-        outputs['drhos_dh'] = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-
-        coeffs = USatm1976Data.akima_viscosity[idx]
-        outputs['viscosity'] = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
+        outputs['temp'] = vals[:, _T]
+        outputs['pres'] = vals[:, _P]
+        outputs['rho'] = vals[:, _RHO]
+        outputs['drhos_dh'] = derivs[:, _RHO]
+        outputs['viscosity'] = vals[:, _VISC]
 
         outputs['sos'] = np.sqrt(self._K * outputs['temp'])
 
@@ -1333,7 +1335,6 @@ class USatm1976Comp(om.ExplicitComponent):
         partials : Jacobian
             Subjac components written to partials[output_name, input_name].
         """
-        table_points = USatm1976Data.alt
         h = inputs['h']
         dz_dh = 1.0
 
@@ -1343,31 +1344,15 @@ class USatm1976Comp(om.ExplicitComponent):
 
         # From this point forawrd, h is geopotential altitude (z in the original reference).
 
-        idx = np.searchsorted(table_points, h, side='left')
-        h_index = np.hstack((table_points[0], table_points))
-        dx = h - h_index[idx]
-
-        coeffs = USatm1976Data.akima_T[idx]
-        dT_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-        T = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-
-        coeffs = USatm1976Data.akima_P[idx]
-        dP_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-
-        coeffs = USatm1976Data.akima_rho[idx]
-        drho_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-
-        coeffs = USatm1976Data.akima_viscosity[idx]
-        dvisc_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-
-        coeffs = USatm1976Data.akima_drho[idx]
-        d2rho_dh2 = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
+        # The bins of h were found in compute, and are reused here when h is unchanged.
+        T = self._table.evaluate(h)[:, _T]
+        derivs = self._table.derivative(h)
 
-        partials['temp', 'h'][...] = dT_dh.ravel()
-        partials['pres', 'h'][...] = dP_dh.ravel()
-        partials['rho', 'h'][...] = drho_dh.ravel()
-        partials['viscosity', 'h'][...] = dvisc_dh.ravel()
-        partials['drhos_dh', 'h'][...] = d2rho_dh2.ravel()
+        partials['temp', 'h'][...] = derivs[:, _T]
+        partials['pres', 'h'][...] = derivs[:, _P]
+        partials['rho', 'h'][...] = derivs[:, _RHO]
+        partials['viscosity', 'h'][...] = derivs[:, _VISC]
+        partials['drhos_dh', 'h'][...] = derivs[:, _DRHO]
         partials['sos', 'h'][...] = (0.5 / np.sqrt(self._K * T) * partials['temp', 'h'] * self._K)
 
         if self._geodetic:
@@ -0,0 +1,135 @@
+import numpy as np
+
+
+class TabulatedProperties(object):
+    """
+    Piecewise-cubic interpolation of several properties tabulated at the same breakpoints.
+
+    The coefficients of each property in each bin are stacked into a single array so that all
+    properties are evaluated from one gather.  The bin index and offset of the most recently
+    evaluated points are cached, so that evaluating the values and then the derivatives of the
+    properties at the same points only locates the points in the table once.
+
+    Parameters
+    ----------
+    points : np.array
+        The sorted breakpoints of the table, of shape (n,).
+    coeffs : np.array
+        The cubic coefficients of each property in each bin, of shape (n + 1, num_props, 4).  Bin i
+        spans (points[i-1], points[i]], with the first and last bins extrapolating beyond the table.
+        Within bin i, the value of a property is c0 + c1 * dx + c2 * dx**2 + c3 * dx**3, where dx is
+        the distance from the left end of the bin, or from points[0] for the first bin.
+    """
+    def __init__(self, points, coeffs):
+        self._points = np.asarray(points)
+        self._coeffs = np.asarray(coeffs)
+
+        if self._coeffs.shape[0] != self._points.size + 1:
+            raise ValueError(f'Tabulated properties with {self._points.size} points require '
+                             f'{self._points.size + 1} bins of coefficients but {self._coeffs.shape[0]} '
+                             f'were given.')
+
+        self._bin_left = np.hstack((self._points[0], self._points))
+
+        # If the breakpoints are uniformly spaced, the bin of each point can be computed directly.
+        spacing = np.diff(self._points)
+        self._uniform_spacing = spacing[0] if np.allclose(spacing, spacing[0], rtol=1.0E-12, atol=0.0) else None
+
+        self._cached_x = None
+        self._cached_dx = None
+        self._cached_coeffs = None
+
+    @property
+    def num_props(self):
+        """
+        The number of tabulated properties.
+
+        Returns
+        -------
+        int
+            The number of tabulated properties.
+        """
+        return self._coeffs.shape[1]
+
+    def _find_bins(self, x):
+        """
+        Return the index of the bin containing each point.
+
+        Parameters
+        ----------
+        x : np.array
+            The points to be located, of shape (nn,).
+
+        Returns
+        -------
+        np.array
+            The index of the bin containing each point.
+        """
+        x = np.real(x)
+
+        if self._uniform_spacing is None:
+            return np.searchsorted(self._points, x, side='left')
+
+        idx = np.ceil((x - self._points[0]) / self._uniform_spacing)
+        return np.clip(idx, 0, self._points.size).astype(int)
+
+    def _locate(self, x):
+        """
+        Return the offset of each point within its bin and the coefficients of its bin.
+
+        The result is reused while the points are unchanged.
+
+        Parameters
+        ----------
+        x : np.array
+            The points at which the properties are evaluated, of shape (nn,).
+
+        Returns
+        -------
+        np.array
+            The offset of each point from the left end of its bin, of shape (nn, 1).
+        np.array
+            The coefficients of the bin containing each point, of shape (nn, num_props, 4).
+        """
+        if self._cached_x is None or self._cached_x.dtype != x.dtype or \
+                self._cached_x.shape != x.shape or not np.array_equal(self._cached_x, x):
+            idx = self._find_bins(x)
+            self._cached_dx = (x - self._bin_left[idx])[:, np.newaxis]
+            self._cached_coeffs = self._coeffs[idx]
+            self._cached_x = np.array(x, copy=True)
+
+        return self._cached_dx, self._cached_coeffs
+
+    def evaluate(self, x):
+        """
+        Return the value of each property at the given points.
+
+        Parameters
+        ----------
+        x : np.array
+            The points at which the properties are evaluated, of shape (nn,).
+
+        Returns
+        -------
+        np.array
+            The value of each property at each point, of shape (nn, num_props).
+        """
+        dx, c = self._locate(x)
+        return c[..., 0] + dx * (c[..., 1] + dx * (c[..., 2] + dx * c[..., 3]))
+
+    def derivative(self, x):
+        """
+        Return the derivative of each property with respect to x at the given points.
+
+        Parameters
+        ----------
+        x : np.array
+            The points at which the derivatives are evaluated, of shape (nn,).
+
+        Returns
+        -------
+        np.array
+            The derivative of each property at each point, of shape (nn, num_props).
+        """
+        dx, c = self._locate(x)
+        return c[..., 1] + dx * (2.0 * c[..., 2] + 3.0 * c[..., 3] * dx)
@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+
+from dymos.models.atmosphere.tabulated_properties import TabulatedProperties
+
+
+def _make_table(points):
+    """
+    Tabulate x**3 - 2 x and 4 x**2 on the given points, extrapolating the end bins.
+    """
+    bin_left = np.hstack((points[0], points))
+    coeffs = np.zeros((points.size + 1, 2, 4))
+
+    # Expand each polynomial about the left end of each bin.
+    a = bin_left
+    coeffs[:, 0, 0] = a ** 3 - 2 * a
+    coeffs[:, 0, 1] = 3 * a ** 2 - 2
+    coeffs[:, 0, 2] = 3 * a
+    coeffs[:, 0, 3] = 1.0
+    coeffs[:, 1, 0] = 4 * a ** 2
+    coeffs[:, 1, 1] = 8 * a
+    coeffs[:, 1, 2] = 4.0
+
+    return TabulatedProperties(points, coeffs)
+
+
+class TestTabulatedProperties(unittest.TestCase):
+
+    def test_evaluate(self):
+        for points in (np.linspace(-2.0, 3.0, 11), np.array([-2.0, -1.5, 0.0, 0.1, 2.0, 3.0])):
+            with self.subTest(uniform=len(points) == 11):
+                table = _make_table(points)
+                x = np.linspace(-4.0, 5.0, 37)
+
+                vals = table.evaluate(x)
+                derivs = table.derivative(x)
+
+                self.assertEqual(vals.shape, (x.size, table.num_props))
+                assert_near_equal(vals[:, 0], x ** 3 - 2 * x, tolerance=1.0E-12)
+                assert_near_equal(vals[:, 1], 4 * x ** 2, tolerance=1.0E-12)
+                assert_near_equal(derivs[:, 0], 3 * x ** 2 - 2, tolerance=1.0E-12)
+                assert_near_equal(derivs[:, 1], 8 * x, tolerance=1.0E-12)
+
+    def test_uniform_bins_match_searchsorted(self):
+        points = np.linspace(0.0, 1000.0, 21)
+        table = _make_table(points)
+        self.assertIsNotNone(table._uniform_spacing)
+
+        x = np.hstack((np.random.uniform(-100.0, 1100.0, 1000), points[1:-1] + 1.0E-3))
+        np.testing.assert_array_equal(table._find_bins(x), np.searchsorted(points, x, side='left'))
+
+    def test_bins_cached(self):
+        table = _make_table(np.array([-2.0, -1.5, 0.0, 0.1, 2.0, 3.0]))
+        self.assertIsNone(table._uniform_spacing)
+        x = np.linspace(-4.0, 5.0, 37)
+
+        with mock.patch.object(table, '_find_bins', wraps=table._find_bins) as find_bins:
+            table.evaluate(x)
+            table.derivative(x.copy())
+            self.assertEqual(find_bins.call_count, 1)
+
+            table.evaluate(x + 0.1)
+            self.assertEqual(find_bins.call_count, 2)
+
+            # Complex points, as used by complex step, are never matched to cached real points.
+            vals = table.evaluate(x + 0.1 + 1.0E-30j)
+            self.assertEqual(find_bins.call_count, 3)
+
+        assert_near_equal(vals.imag[:, 1] / 1.0E-30, 8 * (x + 0.1), tolerance=1.0E-12)
+
+    def test_invalid_coeffs(self):
+        with self.assertRaises(ValueError) as e:
+            TabulatedProperties(np.arange(5.0), np.zeros((5, 2, 4)))
+
+        self.assertEqual(str(e.exception), 'Tabulated properties with 5 points require 6 bins of '
+                                           'coefficients but 5 were given.')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
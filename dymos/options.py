@@ -16,3 +16,25 @@ options.declare('plots', default='matplotlib', values=['matplotlib', 'bokeh'],
 
 options.declare('notebook_mode', default=False, types=bool,
                 desc='If True, provide notebook-enhanced plots and outputs.')
+
+options.declare('plot_workers', default=1, types=int, lower=1,
+                desc='The number of processes in which the timeseries plots of run_problem are made.')
+
+options.declare('incremental_plots', default=False, types=bool,
+                desc='If True, run_problem only remakes the timeseries plots whose data has changed '
+                     'since they were last made.')
+
+_env_profile = os.environ.get('DYMOS_PROFILE', '0')
+_profile_default = _env_profile.lower() in ('1', 'yes', 'true')
+
+options.declare('profiling', default=_profile_default, types=bool,
+                desc='If True, record the number of calls and cumulative time of the ODE, timeseries, '
+                     'continuity, collocation, and interpolation systems of each phase, and of simulation '
+                     'and grid refinement, and report them from run_problem.')
+
+options.declare('coloring_cache_dir', default=os.environ.get('DYMOS_COLORING_CACHE_DIR', None), types=str,
+                allow_none=True,
+                desc='If given, the directory in which the total coloring of the driver run by run_problem is '
+                     'cached, keyed by the structure of the phases, ODEs, and driver of the problem.  When a '
+                     'problem with the same structure is run again, including after grid refinement to a '
+                     'grid that was seen before, its coloring is loaded rather than computed.')
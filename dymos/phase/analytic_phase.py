@@ -452,7 +452,8 @@ class AnalyticPhase(Phase):
         raise NotImplementedError('Method `simulate` is not available for AnalyticPhase.')
 
     def set_simulate_options(self, method=_unspecified, atol=_unspecified, rtol=_unspecified,
-                             first_step=_unspecified, max_step=_unspecified):
+                             first_step=_unspecified, max_step=_unspecified,
+                             vectorized=_unspecified, analytic_jac=_unspecified):
         """
         Stub to make sure users are informed that simulate cannot be done on AnalyticPhase.
 
@@ -468,6 +469,10 @@ class AnalyticPhase(Phase):
             Initial step size for the integration.
         max_step : float
             Maximum step size for the integration.
+        vectorized : bool
+            If True, evaluate the ODE at multiple points per call when scipy requests it.
+        analytic_jac : bool
+            If True, provide the implicit integration methods with the Jacobian of the ODE.
 
         Returns
         -------
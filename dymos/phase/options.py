@@ -605,6 +605,19 @@ class SimulateOptionsDictionary(om.OptionsDictionary):
         self.declare(name='max_step', types=float, default=np.inf,
                      desc='Maximum allowable step size')
 
+        self.declare(name='vectorized', types=bool, default=False,
+                     desc='If True, scipy.integrate.solve_ivp evaluates the ODE in vectorized '
+                          'fashion, using a second instance of the ODE with one node per state '
+                          'variable element.  This reduces the number of ODE evaluations needed '
+                          'for the finite-difference Jacobian of the implicit methods '
+                          '(BDF and Radau).')
+
+        self.declare(name='analytic_jac', types=bool, default=False,
+                     desc='If True, the implicit methods (BDF, Radau, and LSODA) are provided '
+                          'a Jacobian computed from the partials declared by the ODE, which must '
+                          'then be accurate.  If False, scipy.integrate.solve_ivp approximates it '
+                          'with finite differences.')
+
 
 class ConstraintOptionsDictionary(om.OptionsDictionary):
     """
@@ -25,6 +25,7 @@ from ..utils.introspection import configure_time_introspection, _configure_const
     configure_timeseries_output_introspection, classify_var, get_promoted_vars
 from ..utils.misc import _unspecified
 from ..utils.lgl import lgl
+from ..utils.profiling import profile_section
 
 
 om_dev_version = openmdao.__version__.endswith('dev')
@@ -1938,9 +1939,12 @@ class Phase(om.Group):
                                  'the name of the interpolated variable or a node subset.')
             elif name in self.state_options:
                 # For states in explicit shooting phases, interp should just return the initial
-                # value.
+                # value, or the initial value in each segment when using multiple shooting.
                 if isinstance(self.options['transcription'], dm.ExplicitShooting):
-                    node_locations = np.array([-1.0])
+                    if self.options['transcription'].options['multiple_shooting']:
+                        node_locations = gd.segment_ends[:-1]
+                    else:
+                        node_locations = np.array([-1.0])
                 else:
                     node_locations = gd.node_ptau[gd.subset_node_indices['state_input']]
             elif name in self.control_options:
@@ -2152,7 +2156,8 @@ class Phase(om.Group):
         sim_phase.initialize_values_from_phase(sim_prob, self)
 
         print(f'\nSimulating phase {self.pathname}')
-        sim_prob.run_model()
+        with profile_section(self.pathname, 'simulate'):
+            sim_prob.run_model()
         print(f'Done simulating phase {self.pathname}')
         sim_prob.record('final')
 
@@ -2160,6 +2165,217 @@ class Phase(om.Group):
 
         return sim_prob
 
+    def simulate_ensemble(self, initial_states=None, parameters=None, controls=None,
+                          polynomial_controls=None, times_per_seg=10, method=_unspecified,
+                          atol=_unspecified, rtol=_unspecified, first_step=_unspecified,
+                          max_step=_unspecified):
+        """
+        Simulate an ensemble of perturbations of the Phase using a single vectorized integration.
+
+        The ODE is instantiated once with one node per member of the ensemble, and the states of all
+        members are integrated together by scipy.integrate.solve_ivp.  Each member starts from the
+        current values of this Phase plus its own perturbations.  The initial time and duration of
+        the phase are the same for every member.
+
+        Since solve_ivp controls the RMS norm of the error of all members together, the tolerances
+        are divided by the square root of the ensemble size.  The error estimate of every member
+        in each step is then within the given tolerances, as in a standalone simulation, at the
+        cost of more steps for the members whose error is smaller than that of the others.
+
+        If left unspecified, options `method`, `atol`, `rtol`, `first_step`, and `max_step` will
+        be taken from Phase.simulate_options.
+
+        Parameters
+        ----------
+        initial_states : dict of {str: array_like} or None
+            The perturbation of the initial value of each state, of shape (ensemble_size,) + shape.
+        parameters : dict of {str: array_like} or None
+            The perturbation of each parameter, of shape (ensemble_size,) + shape.
+        controls : dict of {str: array_like} or None
+            The perturbation of each control, of shape (ensemble_size, num_control_input_nodes) + shape,
+            or of shape (ensemble_size,) + shape for a perturbation which is constant in time.
+        polynomial_controls : dict of {str: array_like} or None
+            The perturbation of each polynomial control, of shape (ensemble_size, order + 1) + shape,
+            or of shape (ensemble_size,) + shape for a perturbation which is constant in time.
+        times_per_seg : int
+            Number of equally spaced times per segment at which output is requested.
+        method : str
+            The scipy.integrate.solve_ivp integration method.  Only the explicit methods are supported.
+        atol : float
+            Absolute convergence tolerance of each member of the ensemble.
+        rtol : float
+            Relative convergence tolerance of each member of the ensemble.
+        first_step : float
+            Initial step size for the integration.
+        max_step : float
+            Maximum step size for the integration.
+
+        Returns
+        -------
+        dict
+            A dictionary with key 'time' mapped to the output times, of shape (num_times,), and keys
+            'states:{name}', 'controls:{name}', and 'polynomial_controls:{name}' mapped to the values
+            of each member at each time, of shape (ensemble_size, num_times) + shape.
+        """
+        from scipy.integrate import solve_ivp
+        from ..transcriptions.solve_ivp.components import ODEIntegrationInterface
+        from ..utils.interpolate import LagrangeBarycentricInterpolant
+
+        if self.simulate_options is None:
+            raise RuntimeError(f'Phase {self.pathname} does not support simulation.')
+
+        perturbations = {'state': (initial_states or {}, self.state_options),
+                         'parameter': (parameters or {}, self.parameter_options),
+                         'control': (controls or {}, self.control_options),
+                         'polynomial control': (polynomial_controls or {}, self.polynomial_control_options)}
+
+        ensemble_sizes = set()
+        for var_type, (deltas, var_options) in perturbations.items():
+            for name, delta in deltas.items():
+                if name not in var_options:
+                    raise ValueError(f'{self.pathname}: Unable to perturb {name} in an ensemble simulation. '
+                                     f'It is not a {var_type} of the phase.')
+                ensemble_sizes.add(np.shape(delta)[0])
+
+        for name in perturbations['parameter'][0]:
+            if self.parameter_options[name]['static_target'] is True:
+                raise ValueError(f'{self.pathname}: Parameter {name} has a static target and cannot be perturbed '
+                                 f'in an ensemble simulation.')
+
+        if len(ensemble_sizes) != 1:
+            raise ValueError(f'{self.pathname}: The perturbations of an ensemble simulation must be given with the '
+                             f'same number of members in their first dimension, but got {sorted(ensemble_sizes)}.')
+        ensemble_size = ensemble_sizes.pop()
+
+        sim_options = {key: val for key, val in self.simulate_options.items()
+                       if key not in ('vectorized', 'analytic_jac')}
+        for key, val in {'method': method, 'atol': atol, 'rtol': rtol, 'first_step': first_step,
+                         'max_step': max_step}.items():
+            if val is not _unspecified:
+                sim_options[key] = val
+
+        if sim_options['method'] in ('BDF', 'Radau', 'LSODA'):
+            raise ValueError(f"{self.pathname}: Ensemble simulation requires an explicit integration method "
+                             f"('RK23', 'RK45', or 'DOP853') but method is '{sim_options['method']}'.")
+
+        # With these tolerances, the RMS norm of the scaled error of the stacked states is the root of
+        # the sum of the squared norms of the members with the given tolerances, so accepting a step
+        # requires the norm of each member to be at most 1.
+        tol_scale = 1.0 / np.sqrt(ensemble_size)
+        sim_options['atol'] = sim_options['atol'] * tol_scale
+        sim_options['rtol'] = sim_options['rtol'] * tol_scale
+
+        iface = ODEIntegrationInterface(ode_class=self.options['ode_class'],
+                                        time_options=self.time_options,
+                                        state_options=self.state_options,
+                                        control_options=self.control_options,
+                                        polynomial_control_options=self.polynomial_control_options,
+                                        parameter_options=self.parameter_options,
+                                        ode_init_kwargs=self.options['ode_init_kwargs'],
+                                        num_nodes=ensemble_size,
+                                        ensemble=True)
+        iface.prob.setup(check=False)
+
+        gd = self.options['transcription'].grid_data
+        time_units = self.time_options['units']
+        t_initial = self.get_val('t_initial', units=time_units).item()
+        t_duration = self.get_val('t_duration', units=time_units).item()
+        iface.prob.set_val('t_initial', t_initial, units=time_units)
+        iface.prob.set_val('t_duration', t_duration, units=time_units)
+        seg_times = t_initial + 0.5 * (gd.segment_ends + 1.0) * t_duration
+
+        # The initial state vector of each member, the state vectors of the members are concatenated.
+        y0 = np.zeros((ensemble_size, sum(options['size'] for options in iface.state_options.values())))
+        for name, options in iface.state_options.items():
+            pos, size = options['pos'], options['size']
+            val = self.get_val(f'timeseries.states:{name}', units=options['units'])[0, ...]
+            delta = perturbations['state'][0].get(name, np.zeros((ensemble_size,) + options['shape']))
+            y0[:, pos:pos + size] = np.reshape(val, (1, size)) + np.reshape(delta, (ensemble_size, size))
+
+        for name, options in self.parameter_options.items():
+            val = self.get_val(f'parameters:{name}', units=options['units'])
+            delta = perturbations['parameter'][0].get(name, np.zeros((ensemble_size,) + options['shape']))
+            iface.prob.set_val(f'parameters:{name}', val + np.reshape(delta, (ensemble_size,) + options['shape']),
+                               units=options['units'])
+
+        # The values of each member at the nodes of each control interpolant, with the nodes on the
+        # first axis and the members on the second.
+        interp_values = {}
+        for var_type, prefix in (('control', 'controls'), ('polynomial control', 'polynomial_controls')):
+            deltas, var_options = perturbations[var_type]
+            for name, options in var_options.items():
+                val = self.get_val(f'{prefix}:{name}', units=options['units'])
+                delta = np.asarray(deltas.get(name, np.zeros((ensemble_size,) + val.shape)))
+                if delta.size == ensemble_size * np.prod(options['shape']):
+                    # The perturbation is constant in time.
+                    delta = np.reshape(delta, (ensemble_size, 1) + options['shape'])
+                else:
+                    delta = np.reshape(delta, (ensemble_size,) + val.shape)
+                val = val + delta
+                if prefix == 'controls':
+                    val = val[:, gd.input_maps['dynamic_control_input_to_disc'], ...]
+                interp_values[name] = np.swapaxes(val, 0, 1)
+
+        interps = {}
+        for name, options in self.polynomial_control_options.items():
+            interps[name] = LagrangeBarycentricInterpolant(lgl(options['order'] + 1)[0],
+                                                           (ensemble_size,) + options['shape'])
+            iface.set_interpolant(name, interps[name])
+            iface.setup_interpolant(name, t_initial, t_initial + t_duration, interp_values[name])
+
+        control_disc_stau = gd.node_stau[gd.subset_node_indices['control_disc']]
+
+        results = {'time': []}
+        results.update({f'states:{name}': [] for name in self.state_options})
+        results.update({f'controls:{name}': [] for name in self.control_options})
+        results.update({f'polynomial_controls:{name}': [] for name in self.polynomial_control_options})
+
+        y = y0.ravel()
+
+        print(f'\nSimulating an ensemble of {ensemble_size} members of phase {self.pathname}')
+        for iseg in range(gd.num_segments):
+            t0_seg = seg_times[iseg]
+            tf_seg = seg_times[iseg + 1]
+
+            i1, i2 = gd.subset_segment_indices['control_disc'][iseg, :]
+            for name, options in self.control_options.items():
+                interps[name] = LagrangeBarycentricInterpolant(control_disc_stau[i1:i2],
+                                                               (ensemble_size,) + options['shape'])
+                iface.set_interpolant(name, interps[name])
+                iface.setup_interpolant(name, t0_seg, tf_seg, interp_values[name][i1:i2, ...])
+
+            t_eval = np.linspace(t0_seg, tf_seg, times_per_seg)
+
+            sol = solve_ivp(fun=iface.eval_ensemble, t_span=(t0_seg, tf_seg), y0=y, t_eval=t_eval,
+                            **sim_options)
+
+            if not sol.success:
+                raise om.AnalysisError(f'solve_ivp failed: {sol.message} Dynamics changing '
+                                       f'too dramatically')
+
+            y = sol.y[:, -1]
+
+            # Reshape the solution to (member, time, state vector)
+            sol_y = np.swapaxes(np.reshape(sol.y, (ensemble_size, -1, times_per_seg)), 1, 2)
+
+            results['time'].append(t_eval)
+            for name, options in iface.state_options.items():
+                pos, size = options['pos'], options['size']
+                results[f'states:{name}'].append(np.reshape(sol_y[..., pos:pos + size],
+                                                            (ensemble_size, times_per_seg) + options['shape']))
+            for prefix, var_options in (('controls', self.control_options),
+                                        ('polynomial_controls', self.polynomial_control_options)):
+                for name in var_options:
+                    results[f'{prefix}:{name}'].append(np.swapaxes(interps[name].eval(t_eval), 0, 1))
+        print(f'Done simulating an ensemble of phase {self.pathname}')
+
+        results['time'] = np.concatenate(results['time'])
+        for name in results:
+            if name != 'time':
+                results[name] = np.concatenate(results[name], axis=1)
+
+        return results
+
     def set_refine_options(self, refine=_unspecified, tol=_unspecified, min_order=_unspecified,
                            max_order=_unspecified, smoothness_factor=_unspecified):
         """
@@ -2193,7 +2409,8 @@ class Phase(om.Group):
             self.refine_options['smoothness_factor'] = smoothness_factor
 
     def set_simulate_options(self, method=_unspecified, atol=_unspecified, rtol=_unspecified,
-                             first_step=_unspecified, max_step=_unspecified):
+                             first_step=_unspecified, max_step=_unspecified,
+                             vectorized=_unspecified, analytic_jac=_unspecified):
         """
         Set the specified option(s) for grid refinement in the phase.
 
@@ -2209,6 +2426,10 @@ class Phase(om.Group):
             Initial step size for the integration.
         max_step : float
             Maximum step size for the integration.
+        vectorized : bool
+            If True, evaluate the ODE at multiple points per call when scipy requests it.
+        analytic_jac : bool
+            If True, provide the implicit integration methods with the Jacobian of the ODE.
         """
         if method is not _unspecified:
             self.simulate_options['method'] = method
@@ -2220,6 +2441,10 @@ class Phase(om.Group):
             self.simulate_options['first_step'] = first_step
         if max_step is not _unspecified:
             self.simulate_options['max_step'] = max_step
+        if vectorized is not _unspecified:
+            self.simulate_options['vectorized'] = vectorized
+        if analytic_jac is not _unspecified:
+            self.simulate_options['analytic_jac'] = analytic_jac
 
     def is_time_fixed(self, loc):
         """
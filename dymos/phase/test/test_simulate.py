@@ -3,9 +3,11 @@ import unittest
 import numpy as np
 
 import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
 import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
 
 
 class MainPhase(dm.Phase):
@@ -88,5 +90,111 @@ class TestSimulateShapedParams(unittest.TestCase):
             self.fail('Simulate did not correctly complete.')
 
 
+@use_tempdirs
+class TestSimulateEnsemble(unittest.TestCase):
+
+    def _make_problem(self):
+        p = om.Problem(model=om.Group())
+
+        phase = dm.Phase(ode_class=BrachistochroneODE, transcription=dm.Radau(num_segments=5, order=3))
+        p.model.add_subsystem('phase0', phase)
+
+        phase.set_time_options(fix_initial=True, units='s')
+        phase.add_state('x', rate_source='xdot', fix_initial=True)
+        phase.add_state('y', rate_source='ydot', fix_initial=True)
+        phase.add_state('v', rate_source='vdot', fix_initial=True)
+        phase.add_control('theta', units='deg', rate_continuity=False)
+        phase.add_parameter('g', units='m/s**2', opt=False, val=9.80665)
+
+        p.setup()
+
+        p.set_val('phase0.t_initial', 0.0)
+        p.set_val('phase0.t_duration', 1.8)
+        p.set_val('phase0.states:x', phase.interp('x', [0, 10]))
+        p.set_val('phase0.states:y', phase.interp('y', [10, 5]))
+        p.set_val('phase0.states:v', phase.interp('v', [0, 9.9]))
+        p.set_val('phase0.controls:theta', phase.interp('theta', [5, 100]))
+
+        p.run_model()
+
+        return p, phase
+
+    def _simulate(self, phase):
+        sim_prob = phase.simulate(times_per_seg=10, atol=1.0E-10, rtol=1.0E-10)
+        return {name: sim_prob.get_val(f'phase0.timeseries.{name}')
+                for name in ('time', 'states:x', 'states:y', 'states:v', 'controls:theta')}
+
+    def test_simulate_ensemble(self):
+        p, phase = self._make_problem()
+
+        results = phase.simulate_ensemble(initial_states={'x': np.array([0.0, 1.0, 0.0, 0.0])},
+                                          parameters={'g': np.array([0.0, 0.0, -1.0, 0.0])},
+                                          controls={'theta': np.array([0.0, 0.0, 0.0, 2.0])},
+                                          times_per_seg=10, atol=1.0E-10, rtol=1.0E-10)
+
+        self.assertEqual(results['time'].shape, (50,))
+        for name in ('states:x', 'states:y', 'states:v', 'controls:theta'):
+            self.assertEqual(results[name].shape, (4, 50, 1))
+
+        # The unperturbed member matches the simulation of the phase.
+        expected = self._simulate(phase)
+        assert_near_equal(results['time'], expected['time'].ravel(), tolerance=1.0E-12)
+        for name in ('states:x', 'states:y', 'states:v', 'controls:theta'):
+            assert_near_equal(results[name][0], expected[name], tolerance=1.0E-6)
+
+        # The dynamics do not depend on x, so perturbing its initial value shifts its history.
+        assert_near_equal(results['states:x'][1], expected['states:x'] + 1.0, tolerance=1.0E-6)
+        assert_near_equal(results['states:v'][1], expected['states:v'], tolerance=1.0E-6)
+
+        # Perturbed parameters and controls match a simulation of the phase with those values.
+        p.set_val('phase0.parameters:g', 9.80665 - 1.0)
+        p.run_model()
+        expected = self._simulate(phase)
+        for name in ('states:x', 'states:y', 'states:v'):
+            assert_near_equal(results[name][2], expected[name], tolerance=1.0E-6)
+
+        p.set_val('phase0.parameters:g', 9.80665)
+        p.set_val('phase0.controls:theta', p.get_val('phase0.controls:theta') + 2.0)
+        p.run_model()
+        expected = self._simulate(phase)
+        for name in ('states:x', 'states:y', 'states:v', 'controls:theta'):
+            assert_near_equal(results[name][3], expected[name], tolerance=1.0E-6)
+
+    def test_simulate_ensemble_error_control(self):
+        p, phase = self._make_problem()
+        names = ('states:x', 'states:y', 'states:v')
+
+        reference = phase.simulate(times_per_seg=10, atol=1.0E-12, rtol=1.0E-12)
+        standalone = phase.simulate(times_per_seg=10, atol=1.0E-6, rtol=1.0E-6)
+
+        # Without gravity the other members do not move, so their errors are zero and would dilute
+        # the error of the first member if the tolerances applied to the ensemble as a whole.
+        g_deltas = np.full(400, -9.80665)
+        g_deltas[0] = 0.0
+        results = phase.simulate_ensemble(parameters={'g': g_deltas}, times_per_seg=10, atol=1.0E-6, rtol=1.0E-6)
+
+        for name in names:
+            with self.subTest(name=name):
+                expected = reference.get_val(f'phase0.timeseries.{name}')
+                standalone_error = np.max(np.abs(standalone.get_val(f'phase0.timeseries.{name}') - expected))
+                ensemble_error = np.max(np.abs(results[name][0] - expected))
+                self.assertLess(ensemble_error, 1.5 * standalone_error)
+
+    def test_simulate_ensemble_errors(self):
+        p, phase = self._make_problem()
+
+        with self.assertRaises(ValueError) as e:
+            phase.simulate_ensemble(initial_states={'x': np.zeros(3)}, parameters={'g': np.zeros(4)})
+        self.assertIn('same number of members', str(e.exception))
+
+        with self.assertRaises(ValueError) as e:
+            phase.simulate_ensemble(initial_states={'z': np.zeros(3)})
+        self.assertIn('It is not a state of the phase.', str(e.exception))
+
+        with self.assertRaises(ValueError) as e:
+            phase.simulate_ensemble(initial_states={'x': np.zeros(3)}, method='Radau')
+        self.assertIn('requires an explicit integration method', str(e.exception))
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,12 +1,10 @@
+import os
 import warnings
 
 import openmdao.api as om
 from openmdao.recorders.case import Case
-from dymos.trajectory.trajectory import Trajectory
 from dymos.load_case import load_case
-from dymos.visualization.timeseries_plots import timeseries_plots
-
-from .grid_refinement.refinement import _refine_iter
+from dymos.options import options as dymos_options
 
 
 def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_driver=True,
@@ -18,6 +16,7 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
                 case_prefix=None,
                 reset_iter_counts=True,
                 simulate_kwargs=None,
+                results_dir=None,
                 ):
     """
     A Dymos-specific interface to execute an OpenMDAO problem containing Dymos Trajectories or
@@ -38,14 +37,17 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
     simulate : bool
         If True, perform a simulation of any Trajectories found in the Problem model after the driver
         has been run and grid refinement is complete.
-    restart : str, Case, or None
+    restart : str, Case, ResultsReader, or None
         If given as a dict returned by om.CaseReader.get_case, automatically load the states, controls, and
         parameters as given in the provided case as the initial guess for the next run.
         If given as a string, assume the user is providing the path to a CaseRecorder file that contains a case named
-        "final" that the user wants to use as the guess for the case.
+        "final" that the user wants to use as the guess for the case, or the path to a results store directory.
+        If given as a ResultsReader, load the guess from its results store.
     make_plots : bool
         If True, automatically generate plots of all timeseries outputs.
-        These are stored in the reports subdirectory generated by OpenMDAO.
+        These are stored in the reports subdirectory generated by OpenMDAO.  The number of
+        processes in which they are made and whether unchanged plots are skipped are given by the
+        'plot_workers' and 'incremental_plots' dymos options.
     solution_record_file : str
         Path to case recorder file use to store results from solution.
     simulation_record_file : str
@@ -58,15 +60,23 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
         Prefix to prepend to coordinates when recording.
     reset_iter_counts : bool
         If True and model has been run previously, reset all iteration counters.
+    results_dir : str or None
+        If given, the directory in which the solution and simulation are saved as results stores, in
+        its 'solution' and 'simulation' subdirectories.  Plots are then made from the results stores
+        rather than the case recorder files.
     """
     if restart is not None:
-        if isinstance(restart, str):
+        from dymos.utils.results_store import is_results_store, ResultsReader
+        if isinstance(restart, str) and is_results_store(restart):
+            case = ResultsReader(restart)
+        elif isinstance(restart, str):
             case = om.CaseReader(restart).get_case('final')
-        elif isinstance(restart, Case):
+        elif isinstance(restart, (Case, ResultsReader)):
             case = restart
         else:
             raise ValueError('If given, option restart must specify a string to the filepath of a valid dymos '
-                             'output case, or a case dictionary returned from om.CaseReader.get_case.')
+                             'output case or results store, a case dictionary returned from '
+                             'om.CaseReader.get_case, or a ResultsReader.')
 
     if solution_record_file not in [rec._filepath for rec in iter(problem._rec_mgr)]:
         recorder = om.SqliteRecorder(solution_record_file)
@@ -78,10 +88,16 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
 
     problem.final_setup()
 
+    if dymos_options['profiling']:
+        from dymos.utils.profiling import instrument_problem, reset_profile
+        reset_profile()
+        instrument_problem(problem)
+
     if restart is not None:
         load_case(problem, case)
 
     if run_driver:
+        from .grid_refinement.refinement import _refine_iter
         failed = _refine_iter(problem, refine_iteration_limit, refine_method, case_prefix=case_prefix,
                               reset_iter_counts=reset_iter_counts)
     else:
@@ -93,6 +109,12 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
     problem.record(f'{_case_prefix}final')  # save case for potential restart
     problem.cleanup()
 
+    if results_dir is not None:
+        from dymos.utils.results_store import save_results
+        solution_results = os.path.join(results_dir, 'solution')
+        simulation_results = os.path.join(results_dir, 'simulation')
+        save_results(problem, solution_results)
+
     if simulate:
         _simulate_kwargs = simulate_kwargs if simulate_kwargs is not None else {}
         if 'record_file' in _simulate_kwargs:
@@ -101,13 +123,31 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
         if 'case_prefix' in _simulate_kwargs:
             raise ValueError('Key "case_prefix" was found in simulate_kwargs but should instead by provided by the '
                              'argument "case_prefix", not part of the simulate_kwargs dictionary.')
+        from dymos.trajectory.trajectory import Trajectory
+        num_simulated = 0
         for subsys in problem.model.system_iter(include_self=True, recurse=True):
             if isinstance(subsys, Trajectory):
-                subsys.simulate(record_file=simulation_record_file, case_prefix=case_prefix, **_simulate_kwargs)
+                sim_prob = subsys.simulate(record_file=simulation_record_file, case_prefix=case_prefix,
+                                           **_simulate_kwargs)
+                if results_dir is not None:
+                    # Each trajectory is simulated in its own problem, so their results are accumulated.
+                    save_results(sim_prob, simulation_results, append=num_simulated > 0)
+                num_simulated += 1
 
     if make_plots:
-        _sim_record_file = None if not simulate else simulation_record_file
-        timeseries_plots(solution_record_file, simulation_record_file=_sim_record_file,
-                         plot_dir=plot_dir, problem=problem)
+        from dymos.visualization.timeseries_plots import timeseries_plots
+        if results_dir is not None:
+            _sol_record_file = solution_results
+            _sim_record_file = None if not simulate else simulation_results
+        else:
+            _sol_record_file = solution_record_file
+            _sim_record_file = None if not simulate else simulation_record_file
+        timeseries_plots(_sol_record_file, simulation_record_file=_sim_record_file,
+                         plot_dir=plot_dir, problem=problem, num_workers=dymos_options['plot_workers'],
+                         incremental=dymos_options['incremental_plots'])
+
+    if dymos_options['profiling']:
+        from dymos.utils.profiling import save_profile_report, write_profile_report
+        write_profile_report(save_profile_report(problem))
 
     return failed
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import unittest
+
+import dymos as dm
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_dymos_is_lazy(self):
+        script = 'import sys; import dymos; print(" ".join(sorted(sys.modules)))'
+        modules = subprocess.check_output([sys.executable, '-c', script], text=True).split()
+
+        dymos_modules = {m for m in modules if m.startswith('dymos')}
+        self.assertEqual(dymos_modules, {'dymos', 'dymos.load_case', 'dymos.options', 'dymos.run_problem'})
+
+        self.assertNotIn('bokeh', modules)
+
+    def test_lazy_attributes(self):
+        self.assertIs(dm.Phase, dm.phase.Phase)
+        self.assertIs(dm.AnalyticPhase, dm.phase.AnalyticPhase)
+        self.assertIs(dm.Radau, dm.transcriptions.Radau)
+        self.assertIs(dm.GaussLobatto, dm.transcriptions.GaussLobatto)
+        self.assertIs(dm.ExplicitShooting, dm.transcriptions.ExplicitShooting)
+        self.assertIs(dm.Analytic, dm.transcriptions.Analytic)
+        self.assertIs(dm.Trajectory, dm.trajectory.trajectory.Trajectory)
+        self.assertIs(dm.ResultsReader, dm.utils.results_store.ResultsReader)
+
+        # The functions of the same name take precedence over their modules.
+        self.assertTrue(callable(dm.run_problem))
+        self.assertTrue(callable(dm.load_case))
+
+        self.assertIn('Trajectory', dir(dm))
+
+        with self.assertRaises(AttributeError) as e:
+            dm.foo
+
+        self.assertEqual(str(e.exception), "module 'dymos' has no attribute 'foo'")
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
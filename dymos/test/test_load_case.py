@@ -259,6 +259,23 @@ class TestLoadCase(unittest.TestCase):
         with assert_warning(UserWarning, msg):
             dm.load_case(q, case)
 
+    def test_suffix_index(self):
+        from dymos.load_case import _build_suffix_index
+
+        index = _build_suffix_index(['traj.phases.phase0.states:x',
+                                     'traj.phases.phase0.timeseries.states:x',
+                                     'traj.phases.phase10.states:x'])
+
+        self.assertEqual(index['phase0.states:x'], 'traj.phases.phase0.states:x')
+        self.assertEqual(index['phase0.timeseries.states:x'], 'traj.phases.phase0.timeseries.states:x')
+        self.assertEqual(index['phase10.states:x'], 'traj.phases.phase10.states:x')
+
+        # Suffixes are only matched at a dot, so phase0 does not match phase10 or vice-versa.
+        self.assertNotIn('hase0.states:x', index)
+
+        # When more than one variable has the same suffix, the first one is used.
+        self.assertEqual(index['states:x'], 'traj.phases.phase0.states:x')
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
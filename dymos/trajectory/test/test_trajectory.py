@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -8,6 +9,7 @@ from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
 import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
 from dymos.examples.finite_burn_orbit_raise.finite_burn_eom import FiniteBurnODE
 
 
@@ -149,6 +151,74 @@ class TestTrajectory(unittest.TestCase):
         accel_link_error = self.p.get_val('linkages.burn1:accel_final|burn2:accel_initial')
         assert_near_equal(accel_link_error, burn1_accel[-1]-burn2_accel[0])
 
+    def test_simulate_num_workers(self):
+        serial_prob = self.traj.simulate(times_per_seg=5)
+        parallel_prob = self.traj.simulate(times_per_seg=5, num_workers=3, record_file='parallel_sim.db',
+                                           case_prefix='parallel')
+
+        case = om.CaseReader('parallel_sim.db').get_case('parallel_final')
+
+        for phase_name in ('burn1', 'coast', 'burn2'):
+            for var in ('time', 'states:r', 'states:theta', 'states:deltav', 'controls:u1'):
+                path = f'sim_traj.phases.{phase_name}.timeseries.{var}'
+                expected = serial_prob.get_val(path)
+                assert_near_equal(parallel_prob.get_val(path), expected, tolerance=1.0E-12)
+                assert_near_equal(case.get_val(path), expected, tolerance=1.0E-12)
+
+    def test_simulate_num_workers_no_fork(self):
+        serial_prob = self.traj.simulate(times_per_seg=5)
+
+        with mock.patch('dymos.trajectory.trajectory.multiprocessing.get_all_start_methods',
+                        return_value=['spawn']):
+            with self.assertWarns(UserWarning) as w:
+                fallback_prob = self.traj.simulate(times_per_seg=5, num_workers=3)
+
+        self.assertIn('the phases will be simulated serially', str(w.warning))
+
+        path = 'sim_traj.phases.coast.timeseries.states:r'
+        assert_near_equal(fallback_prob.get_val(path), serial_prob.get_val(path), tolerance=1.0E-12)
+
+    def test_simulate_num_workers_traj_parameter(self):
+        p = om.Problem()
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+        traj.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+
+        for name in ('phase0', 'phase1'):
+            phase = traj.add_phase(name, dm.Phase(ode_class=BrachistochroneODE,
+                                                  transcription=dm.Radau(num_segments=4, order=3)))
+            phase.set_time_options(fix_initial=True, fix_duration=True)
+            phase.add_state('x')
+            phase.add_state('y')
+            phase.add_state('v')
+            phase.add_control('theta', units='deg')
+            phase.add_parameter('g', units='m/s**2')
+
+        p.setup()
+
+        for name, (t0, x, y, v, theta) in (('phase0', (0.0, [0, 2], [10, 8], [0, 6], [5, 50])),
+                                           ('phase1', (0.8, [2, 10], [8, 5], [6, 9.9], [50, 100]))):
+            phase = traj.phases._get_subsystem(name)
+            p.set_val(f'traj.{name}.t_initial', t0)
+            p.set_val(f'traj.{name}.t_duration', 0.9)
+            p.set_val(f'traj.{name}.states:x', phase.interp('x', x))
+            p.set_val(f'traj.{name}.states:y', phase.interp('y', y))
+            p.set_val(f'traj.{name}.states:v', phase.interp('v', v))
+            p.set_val(f'traj.{name}.controls:theta', phase.interp('theta', theta))
+
+        p.set_val('traj.parameters:g', 1.62)
+        p.run_model()
+
+        serial_prob = traj.simulate(times_per_seg=5)
+        parallel_prob = traj.simulate(times_per_seg=5, num_workers=2)
+
+        for name in ('phase0', 'phase1'):
+            for var in ('time', 'states:x', 'states:y', 'states:v', 'parameters:g'):
+                with self.subTest(phase=name, var=var):
+                    path = f'traj.phases.{name}.timeseries.{var}'
+                    assert_near_equal(parallel_prob.get_val(path), serial_prob.get_val(path), tolerance=1.0E-12)
+
+        assert_near_equal(parallel_prob.get_val('traj.phases.phase1.timeseries.parameters:g')[0], 1.62)
+
 
 @use_tempdirs
 class TestLinkages(unittest.TestCase):
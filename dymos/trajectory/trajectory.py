@@ -1,7 +1,9 @@
 from collections import OrderedDict
 from collections.abc import Sequence
+import concurrent.futures
 from copy import deepcopy
 import itertools
+import multiprocessing
 import sys
 import warnings
 try:
@@ -19,10 +21,82 @@ from ..utils.constants import INF_BOUND
 from .options import LinkageOptionsDictionary
 from .phase_linkage_comp import PhaseLinkageComp
 from ..phase.analytic_phase import AnalyticPhase
+from ..phase.phase import Phase
 from ..phase.options import TrajParameterOptionsDictionary
 from ..transcriptions.common import ParameterComp
 from ..utils.misc import get_rate_units, _unspecified
 from ..utils.introspection import get_promoted_vars, get_source_metadata
+from ..utils.profiling import profile_section
+from ..utils.results_store import save_results
+
+
+# The simulation problem and settings used by the subprocesses of a parallel simulation.  The
+# subprocesses are forked, so they inherit the set up problem rather than setting up their own.
+_parallel_simulation_context = {}
+
+
+def _get_parallel_simulation_mp_context():
+    """
+    Return the multiprocessing context used to simulate the phases of a trajectory in parallel.
+
+    The subprocesses of a parallel simulation must be forked so that they inherit the simulation
+    problem set up by the parent process.
+
+    Returns
+    -------
+    multiprocessing.context.BaseContext or None
+        The fork context, or None if processes cannot be forked on this platform or under MPI.
+    """
+    if MPI or 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context('fork')
+
+
+def _run_outside_phases(group):
+    """
+    Run the systems of the given group which are not phases, and pass their outputs to the phases.
+
+    Groups which contain phases are recursed into, so that afterwards each phase has the values
+    of its inputs and can be run on its own.
+
+    Parameters
+    ----------
+    group : Group
+        The group whose systems are run.
+    """
+    for subsys in group._subsystems_myproc:
+        group._transfer('nonlinear', 'fwd', subsys.name)
+        if isinstance(subsys, Phase):
+            continue
+        elif isinstance(subsys, om.Group) and any(True for _ in subsys.system_iter(recurse=True, typ=Phase)):
+            _run_outside_phases(subsys)
+        else:
+            subsys.run_solve_nonlinear()
+
+
+def _simulate_phase_in_subprocess(phase_path):
+    """
+    Simulate a single phase of the simulation problem in _parallel_simulation_context.
+
+    Parameters
+    ----------
+    phase_path : str
+        The pathname of the phase to be simulated.
+
+    Returns
+    -------
+    dict
+        A dictionary with keys 'inputs' and 'outputs', each mapping the absolute name of each
+        variable of the phase to its value.
+    """
+    sim_prob = _parallel_simulation_context['sim_prob']
+    model = sim_prob.model
+
+    model._get_subsystem(phase_path).run_solve_nonlinear()
+
+    prefix = f'{phase_path}.'
+    return {'inputs': {name: val.copy() for name, val in model._inputs.items() if name.startswith(prefix)},
+            'outputs': {name: val.copy() for name, val in model._outputs.items() if name.startswith(prefix)}}
 
 
 class Trajectory(om.Group):
@@ -1130,11 +1204,11 @@ class Trajectory(om.Group):
 
         printer('', file=outstream)
 
-    def simulate(self, times_per_seg=10, method=_unspecified, atol=_unspecified, rtol=_unspecified,
-                 first_step=_unspecified, max_step=_unspecified, record_file=None, case_prefix=None,
-                 reset_iter_counts=True, reports=False):
+    def _setup_simulation_problem(self, times_per_seg=10, method=_unspecified,
+                                  atol=_unspecified, rtol=_unspecified, first_step=_unspecified,
+                                  max_step=_unspecified, record_file=None, reports=False):
         """
-        Simulate the Trajectory using scipy.integrate.solve_ivp.
+        Build, setup, and initialize a problem which simulates the phases of this Trajectory.
 
         Parameters
         ----------
@@ -1154,19 +1228,13 @@ class Trajectory(om.Group):
         record_file : str or None
             If a string, the file to which the result of the simulation will be saved.
             If None, no record of the simulation will be saved.
-        case_prefix : str or None
-            Prefix to prepend to coordinates when recording.
-        reset_iter_counts : bool
-            If True and model has been run previously, reset all iteration counters.
         reports : bool or None or str or Sequence
             Reports setting for the subproblems run under simualate.
 
         Returns
         -------
         problem
-            An OpenMDAO Problem in which the simulation is implemented.  This Problem interface
-            can be interrogated to obtain timeseries outputs in the same manner as other Phases
-            to obtain results at the requested times.
+            The OpenMDAO Problem in which the simulation is implemented, ready to be run.
         """
         sim_traj = Trajectory(sim_mode=True)
 
@@ -1208,12 +1276,133 @@ class Trajectory(om.Group):
             phs.initialize_values_from_phase(sim_prob, self._phases[phase_name],
                                              phase_path=traj_name)
 
+        return sim_prob
+
+    def _run_simulation_in_parallel(self, sim_prob, num_workers, mp_context, case_prefix=None,
+                                    reset_iter_counts=True):
+        """
+        Simulate each phase of sim_prob in a separate process and gather the results into sim_prob.
+
+        The phases of a simulation are each initialized from the solved trajectory and are not
+        linked, so they can be integrated independently.  The systems outside of the phases are
+        run in this process, and each forked subprocess then runs one phase of the already set
+        up problem.
+
+        Parameters
+        ----------
+        sim_prob : om.Problem
+            The simulation problem of all phases, after final_setup.
+        num_workers : int
+            The maximum number of processes used to simulate the phases.
+        mp_context : multiprocessing.context.BaseContext
+            The fork context in which the subprocesses are started.
+        case_prefix : str or None
+            Prefix to prepend to coordinates when recording.
+        reset_iter_counts : bool
+            If True and model has been run previously, reset all iteration counters.
+        """
+        model = sim_prob.model
+        traj_name = self.name if self.name else 'sim_traj'
+        phase_paths = [phs.pathname for phs in model._get_subsystem(traj_name)._phases.values()]
+
+        # Mirror the handling of case_prefix and reset_iter_counts by Problem.run_model.
+        old_prefix = sim_prob._recording_iter.prefix
+        if case_prefix is not None:
+            sim_prob._recording_iter.prefix = case_prefix
+
+        try:
+            if model.iter_count > 0 and reset_iter_counts:
+                sim_prob.driver.iter_count = 0
+                model._reset_iter_counts()
+
+            _run_outside_phases(model)
+
+            _parallel_simulation_context['sim_prob'] = sim_prob
+            try:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=min(num_workers, len(phase_paths)),
+                                                            mp_context=mp_context) as ex:
+                    results = list(ex.map(_simulate_phase_in_subprocess, phase_paths))
+            finally:
+                _parallel_simulation_context.clear()
+        finally:
+            sim_prob._recording_iter.prefix = old_prefix
+
+        for io, vec in (('input', model._inputs), ('output', model._outputs)):
+            for phase_results in results:
+                for name, val in phase_results[f'{io}s'].items():
+                    vec[name] = val
+
+    def simulate(self, times_per_seg=10, method=_unspecified, atol=_unspecified, rtol=_unspecified,
+                 first_step=_unspecified, max_step=_unspecified, record_file=None, case_prefix=None,
+                 reset_iter_counts=True, reports=False, num_workers=1, results_dir=None):
+        """
+        Simulate the Trajectory using scipy.integrate.solve_ivp.
+
+        Parameters
+        ----------
+        times_per_seg : int or None
+            Number of equally spaced times per segment at which output is requested.  If None,
+            output will be provided at all Nodes.
+        method : str
+            The scipy.integrate.solve_ivp integration method.
+        atol : float
+            Absolute convergence tolerance for scipy.integrate.solve_ivp.
+        rtol : float
+            Relative convergence tolerance for scipy.integrate.solve_ivp.
+        first_step : float
+            Initial step size for the integration.
+        max_step : float
+            Maximum step size for the integration.
+        record_file : str or None
+            If a string, the file to which the result of the simulation will be saved.
+            If None, no record of the simulation will be saved.
+        case_prefix : str or None
+            Prefix to prepend to coordinates when recording.
+        reset_iter_counts : bool
+            If True and model has been run previously, reset all iteration counters.
+        reports : bool or None or str or Sequence
+            Reports setting for the subproblems run under simualate.
+        num_workers : int
+            The number of processes in which the phases are simulated.  If greater than 1, each
+            phase is simulated in a forked subprocess and the results are gathered into the
+            returned problem.  This is not available under MPI or on platforms which do not
+            support forking processes, where the phases are simulated serially with a warning.
+        results_dir : str or None
+            If given, the directory to which the result of the simulation is saved as a results store.
+
+        Returns
+        -------
+        problem
+            An OpenMDAO Problem in which the simulation is implemented.  This Problem interface
+            can be interrogated to obtain timeseries outputs in the same manner as other Phases
+            to obtain results at the requested times.
+        """
+        sim_kwargs = {'times_per_seg': times_per_seg, 'method': method, 'atol': atol, 'rtol': rtol,
+                      'first_step': first_step, 'max_step': max_step, 'reports': reports}
+
+        sim_prob = self._setup_simulation_problem(record_file=record_file, **sim_kwargs)
+
+        mp_context = None
+        if num_workers > 1:
+            mp_context = _get_parallel_simulation_mp_context()
+            if mp_context is None:
+                warnings.warn(f'Trajectory `{self.pathname}` cannot simulate phases in subprocesses on this '
+                              f'platform, the phases will be simulated serially.')
+
         print(f'\nSimulating trajectory {self.pathname}')
-        sim_prob.run_model(case_prefix=case_prefix, reset_iter_counts=reset_iter_counts)
+        with profile_section(self.pathname, 'simulate'):
+            if mp_context is not None:
+                sim_prob.final_setup()
+                self._run_simulation_in_parallel(sim_prob, num_workers, mp_context, case_prefix=case_prefix,
+                                                 reset_iter_counts=reset_iter_counts)
+            else:
+                sim_prob.run_model(case_prefix=case_prefix, reset_iter_counts=reset_iter_counts)
         print(f'Done simulating trajectory {self.pathname}')
         if record_file:
             _case_prefix = '' if case_prefix is None else f'{case_prefix}_'
             sim_prob.record(f'{_case_prefix}final')
+        if results_dir is not None:
+            save_results(sim_prob, results_dir)
         sim_prob.cleanup()
 
         return sim_prob
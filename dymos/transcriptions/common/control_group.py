@@ -73,6 +73,11 @@ class ControlInterpComp(om.ExplicitComponent):
         num_control_input_nodes = self.options['grid_data'].subset_num_nodes['control_input']
         time_units = self.options['time_units']
 
+        # All controls are interpolated together as columns of a single block of shape
+        # (num_control_input_nodes, total_size), in which each control occupies a slice of columns.
+        self._control_slices = {}
+        total_size = 0
+
         for name, options in control_options.items():
             self._input_names[name] = f'controls:{name}'
             self._output_val_names[name] = f'control_values:{name}'
@@ -97,6 +102,9 @@ class ControlInterpComp(om.ExplicitComponent):
 
             size = np.prod(shape)
             self.sizes[name] = size
+            self._output_shapes[name] = output_shape
+            self._control_slices[name] = slice(total_size, total_size + size)
+            total_size += size
 
             # The partial of interpolated value wrt the control input values is linear
             # and can be computed as the kronecker product of the interpolation matrix (L)
@@ -136,6 +144,81 @@ class ControlInterpComp(om.ExplicitComponent):
                                   wrt=self._input_names[name],
                                   rows=rs, cols=cs)
 
+        self._u_stacked = np.zeros((num_control_input_nodes, total_size))
+        self._configure_rate_jac_data()
+
+    def _configure_rate_jac_data(self):
+        """
+        Preallocate the partials of the control rates with respect to the control values.
+
+        The nonzero values of the partials of the rates and second derivatives of all controls are
+        stored contiguously, along with the node to which each nonzero belongs, so that they can be
+        scaled by dstau_dt in a single operation at each linearization.
+        """
+        self._rate_jac_data, self._rate_jac_nodes, self._rate_jac_slices = \
+            self._stack_jac_data(self.rate_jacs)
+        self._rate2_jac_data, self._rate2_jac_nodes, self._rate2_jac_slices = \
+            self._stack_jac_data(self.rate2_jacs)
+
+        self._rate_jac_scaled = np.zeros_like(self._rate_jac_data)
+        self._rate2_jac_scaled = np.zeros_like(self._rate2_jac_data)
+
+    def _stack_jac_data(self, jacs):
+        """
+        Concatenate the nonzero values of the given sparse partials of each control.
+
+        Parameters
+        ----------
+        jacs : dict of {str: sp.csr_matrix}
+            The partials of an output with respect to the values of each control.
+
+        Returns
+        -------
+        np.array
+            The nonzero values of the partials of all controls, in the order declared.
+        np.array
+            The index of the node to which each nonzero value belongs.
+        dict of {str: slice}
+            The slice of the nonzero values belonging to each control.
+        """
+        data = [np.zeros(0)]
+        nodes = [np.zeros(0, dtype=int)]
+        slices = {}
+        offset = 0
+
+        for name, jac in jacs.items():
+            rs, cs = jac.nonzero()
+            data.append(np.asarray(jac[rs, cs]).ravel())
+            nodes.append(rs // self.sizes[name])
+            slices[name] = slice(offset, offset + len(rs))
+            offset += len(rs)
+
+        return np.concatenate(data), np.concatenate(nodes), slices
+
+    def _stack_controls(self, inputs):
+        """
+        Gather the values of all controls at the control input nodes into a single block.
+
+        Parameters
+        ----------
+        inputs : `Vector`
+            `Vector` containing inputs.
+
+        Returns
+        -------
+        np.array
+            The control values, of shape (num_control_input_nodes, total_size).
+        """
+        if self.under_complex_step:
+            u = np.zeros(self._u_stacked.shape, dtype=complex)
+        else:
+            u = self._u_stacked
+
+        for name, sl in self._control_slices.items():
+            u[:, sl] = np.reshape(inputs[self._input_names[name]], (u.shape[0], -1))
+
+        return u
+
     def configure_io(self):
         """
         I/O creation is delayed until configure so we can determine shape and units for the states.
@@ -149,6 +232,7 @@ class ControlInterpComp(om.ExplicitComponent):
         self.rate_jacs = {}
         self.rate2_jacs = {}
         self.sizes = {}
+        self._output_shapes = {}
 
         num_disc_nodes = gd.subset_num_nodes['control_disc']
         num_input_nodes = gd.subset_num_nodes['control_input']
@@ -188,30 +272,18 @@ class ControlInterpComp(om.ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        control_options = self.options['control_options']
-        num_nodes = self.options['grid_data'].num_nodes
-        num_control_input_nodes = self.options['grid_data'].subset_num_nodes['control_input']
-
-        for name, options in control_options.items():
-            size = np.prod(options['shape'])
-
-            u_flat = np.reshape(inputs[self._input_names[name]],
-                                newshape=(num_control_input_nodes, size))
+        u = self._stack_controls(inputs)
+        dt_dstau = inputs['dt_dstau'][:, np.newaxis]
 
-            a = self.D.dot(u_flat)
-            b = self.D2.dot(u_flat)
+        val = self.L.dot(u)
+        rate = self.D.dot(u) / dt_dstau
+        rate2 = self.D2.dot(u) / dt_dstau ** 2
 
-            val = np.reshape(self.L.dot(u_flat), (num_nodes,) + options['shape'])
-
-            rate = a / inputs['dt_dstau'][:, np.newaxis]
-            rate = np.reshape(rate, (num_nodes,) + options['shape'])
-
-            rate2 = b / inputs['dt_dstau'][:, np.newaxis] ** 2
-            rate2 = np.reshape(rate2, (num_nodes,) + options['shape'])
-
-            outputs[self._output_val_names[name]] = val
-            outputs[self._output_rate_names[name]] = rate
-            outputs[self._output_rate2_names[name]] = rate2
+        for name, sl in self._control_slices.items():
+            output_shape = self._output_shapes[name]
+            outputs[self._output_val_names[name]] = np.reshape(val[:, sl], output_shape)
+            outputs[self._output_rate_names[name]] = np.reshape(rate[:, sl], output_shape)
+            outputs[self._output_rate2_names[name]] = np.reshape(rate2[:, sl], output_shape)
 
     def compute_partials(self, inputs, partials):
         """
@@ -224,32 +296,33 @@ class ControlInterpComp(om.ExplicitComponent):
         partials : Jacobian
             Subjac components written to partials[output_name, input_name].
         """
-        control_options = self.options['control_options']
-        num_input_nodes = self.options['grid_data'].subset_num_nodes['control_input']
+        u = self._stack_controls(inputs)
 
         dstau_dt = np.reciprocal(inputs['dt_dstau'])
-        dstau_dt2 = (dstau_dt ** 2)[:, np.newaxis]
-        dstau_dt3 = (dstau_dt ** 3)[:, np.newaxis]
+        dstau_dt2 = dstau_dt ** 2
 
-        for name in control_options:
-            control_name = self._input_names[name]
+        a = self.D.dot(u) * -dstau_dt2[:, np.newaxis]
+        b = self.D2.dot(u) * (-2.0 * dstau_dt2 * dstau_dt)[:, np.newaxis]
 
-            size = self.sizes[name]
+        if self.under_complex_step:
+            rate_jac = self._rate_jac_data * dstau_dt[self._rate_jac_nodes]
+            rate2_jac = self._rate2_jac_data * dstau_dt2[self._rate2_jac_nodes]
+        else:
+            rate_jac = np.multiply(self._rate_jac_data, dstau_dt[self._rate_jac_nodes],
+                                   out=self._rate_jac_scaled)
+            rate2_jac = np.multiply(self._rate2_jac_data, dstau_dt2[self._rate2_jac_nodes],
+                                    out=self._rate2_jac_scaled)
+
+        for name, sl in self._control_slices.items():
+            control_name = self._input_names[name]
             rate_name = self._output_rate_names[name]
             rate2_name = self._output_rate2_names[name]
 
-            # Unroll shaped controls into an array at each node
-            u_flat = np.reshape(inputs[control_name], (num_input_nodes, size))
-
-            partials[rate_name, 'dt_dstau'] = (-self.D.dot(u_flat) * dstau_dt2).ravel()
-            partials[rate2_name, 'dt_dstau'] = (-2.0 * self.D2.dot(u_flat) * dstau_dt3).ravel()
-
-            dstau_dt_x_size = np.repeat(dstau_dt, size)[:, np.newaxis]
-            dstau_dt2_x_size = np.repeat(dstau_dt2, size)[:, np.newaxis]
-
-            partials[rate_name, control_name] = self.rate_jacs[name].multiply(dstau_dt_x_size).data
+            partials[rate_name, 'dt_dstau'] = a[:, sl].ravel()
+            partials[rate2_name, 'dt_dstau'] = b[:, sl].ravel()
 
-            partials[rate2_name, control_name] = self.rate2_jacs[name].multiply(dstau_dt2_x_size).data
+            partials[rate_name, control_name] = rate_jac[self._rate_jac_slices[name]]
+            partials[rate2_name, control_name] = rate2_jac[self._rate2_jac_slices[name]]
 
 
 class ControlGroup(om.Group):
@@ -478,6 +478,83 @@ class TestControlRateComp(unittest.TestCase):
 
                 assert_check_partials(cpd)
 
+    def test_control_interp_mixed_shapes(self):
+        param_list = itertools.product(['gauss-lobatto', 'radau-ps'],  # transcription
+                                       [True, False],  # compressed
+                                       )
+        for transcription, compressed in param_list:
+            with self.subTest():
+                segends = np.array([0.0, 3.0, 10.0])
+
+                gd = GridData(num_segments=2,
+                              transcription_order=5,
+                              segment_ends=segends,
+                              transcription=transcription,
+                              compressed=compressed)
+
+                p = om.Problem(model=om.Group())
+
+                # Controls of different shapes are interpolated together as a single block.
+                controls = {'a': {'units': 'm', 'shape': (1,), 'dynamic': True},
+                            'b': {'units': 'm', 'shape': (3,), 'dynamic': True},
+                            'c': {'units': 'm', 'shape': (2, 2), 'dynamic': True}}
+
+                ivc = om.IndepVarComp()
+                p.model.add_subsystem('ivc', ivc, promotes_outputs=['*'])
+
+                num_input_nodes = gd.subset_num_nodes['control_input']
+                for name, options in controls.items():
+                    ivc.add_output(f'controls:{name}', val=np.zeros((num_input_nodes,) + options['shape']),
+                                   units='m')
+                ivc.add_output('t_initial', val=0.0, units='s')
+                ivc.add_output('t_duration', val=10.0, units='s')
+
+                p.model.add_subsystem('time_comp',
+                                      subsys=TimeComp(num_nodes=gd.num_nodes, node_ptau=gd.node_ptau,
+                                                      node_dptau_dstau=gd.node_dptau_dstau, units='s'),
+                                      promotes_inputs=['t_initial', 't_duration'],
+                                      promotes_outputs=['time', 'dt_dstau'])
+
+                p.model.add_subsystem('control_interp_comp',
+                                      subsys=ControlInterpComp(grid_data=gd,
+                                                               control_options=controls,
+                                                               time_units='s'),
+                                      promotes_inputs=['controls:*'])
+
+                p.model.connect('dt_dstau', 'control_interp_comp.dt_dstau')
+
+                p.setup(force_alloc_complex=True)
+
+                p['t_initial'] = 0.0
+                p['t_duration'] = 3.0
+
+                p.run_model()
+
+                t = p['time']
+                t_input = t[gd.subset_node_indices['control_input']]
+                funcs = {'a': [(f_a, f1_a, f2_a)],
+                         'b': [(f_b, f1_b, f2_b), (f_c, f1_c, f2_c), (f_d, f1_d, f2_d)],
+                         'c': [(f_d, f1_d, f2_d), (f_c, f1_c, f2_c), (f_b, f1_b, f2_b), (f_a, f1_a, f2_a)]}
+
+                for name, name_funcs in funcs.items():
+                    p[f'controls:{name}'] = np.stack([f(t_input) for f, _, _ in name_funcs], axis=-1).reshape(
+                        (num_input_nodes,) + controls[name]['shape'])
+
+                p.run_model()
+
+                for name, name_funcs in funcs.items():
+                    val = p[f'control_interp_comp.control_values:{name}'].reshape((gd.num_nodes, -1))
+                    rate = p[f'control_interp_comp.control_rates:{name}_rate'].reshape((gd.num_nodes, -1))
+                    rate2 = p[f'control_interp_comp.control_rates:{name}_rate2'].reshape((gd.num_nodes, -1))
+
+                    for i, (f, f1, f2) in enumerate(name_funcs):
+                        assert_almost_equal(val[:, i], f(t))
+                        assert_almost_equal(rate[:, i], f1(t))
+                        assert_almost_equal(rate2[:, i], f2(t))
+
+                cpd = p.check_partials(compact_print=True, method='cs', out_stream=None)
+                assert_check_partials(cpd)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
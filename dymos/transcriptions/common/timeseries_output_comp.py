@@ -1,3 +1,6 @@
+import numpy as np
+import scipy.sparse as sp
+
 import openmdao.api as om
 
 from ...transcriptions.grid_data import GridData
@@ -44,6 +47,10 @@ class TimeseriesOutputCompBase(om.ExplicitComponent):
         self._units = {}
         self._conversion_factors = {}
 
+        # Sparsity pattern and values of the jacobian of an output wrt its input, keyed by the
+        # name of the matrix which maps the input to the output and the size of the variable.
+        self._jac_cache = {}
+
     def initialize(self):
         """
         Declare component options.
@@ -62,3 +69,39 @@ class TimeseriesOutputCompBase(om.ExplicitComponent):
                              types=str,
                              default='all',
                              desc='Name of the node subset at which outputs are desired.')
+
+    def _get_output_jacobian(self, mat_name, size):
+        """
+        Return the sparse jacobian of an output with respect to its input.
+
+        The jacobian is the Kronecker product of the matrix which maps input nodes to output
+        nodes with an identity matrix of the size of the variable.  It is cached so that outputs
+        of the same size share it.
+
+        Parameters
+        ----------
+        mat_name : str
+            The name of the attribute holding the matrix which maps the values at the input
+            nodes to the values at the output nodes.
+        size : int
+            The size of the variable at each node.
+
+        Returns
+        -------
+        rows : ndarray of int
+            The row index of each nonzero in the jacobian.
+        cols : ndarray of int
+            The column index of each nonzero in the jacobian.
+        vals : ndarray
+            The value of each nonzero in the jacobian.
+        """
+        key = (mat_name, size)
+
+        if key not in self._jac_cache:
+            jac = sp.kron(sp.csr_matrix(getattr(self, mat_name)), sp.eye(size), format='csr')
+            jac.eliminate_zeros()
+            jac.sort_indices()
+            jac = jac.tocoo()
+            self._jac_cache[key] = jac.row, jac.col, jac.data
+
+        return self._jac_cache[key]
@@ -6,7 +6,7 @@ from .explicit_timeseries_comp import ExplicitTimeseriesComp
 from .explicit_shooting_continuity_comp import ExplicitShootingContinuityComp
 from ..transcription_base import TranscriptionBase
 from ..grid_data import GridData
-from .rk_integration_comp import RKIntegrationComp, rk_methods
+from .rk_integration_comp import RKIntegrationComp, AdjointRKIntegrationComp, rk_methods
 from ...utils.misc import get_rate_units, CoerceDesvar
 from ...utils.introspection import get_promoted_vars, get_source_metadata
 from ...utils.constants import INF_BOUND
@@ -40,7 +40,38 @@ class ExplicitShooting(TranscriptionBase):
                              desc='The explicit Runge-Kutta scheme to use. One of' +
                                   str(list(rk_methods.keys())))
         self.options.declare('num_steps_per_segment', types=int,
-                             default=10, desc='Number of integration steps in each segment')
+                             default=10, desc='Number of integration steps in each segment.  If '
+                                              'adaptive is True, the maximum number of steps in '
+                                              'each segment.')
+        self.options.declare('adaptive', types=bool, default=False,
+                             desc='If True, choose the integration step sizes in each segment '
+                                  'using the error estimate of an embedded Runge-Kutta method. '
+                                  'The step sizes are held fixed when computing derivatives.')
+        self.options.declare('atol', types=float, default=1.0E-6,
+                             desc='Absolute error tolerance for adaptive step size control.')
+        self.options.declare('rtol', types=float, default=1.0E-3,
+                             desc='Relative error tolerance for adaptive step size control.')
+        self.options.declare('derivative_mode', values=('forward', 'adjoint'), default='forward',
+                             desc='If \'forward\', the sensitivities of the integration are '
+                                  'propagated wrt every input and the partials are assembled '
+                                  'explicitly.  If \'adjoint\', the integration provides '
+                                  'matrix-free derivatives whose cost in reverse mode scales with '
+                                  'the number of outputs rather than the number of inputs.')
+        self.options.declare('multiple_shooting', types=bool, default=False,
+                             desc='If True, the initial state of each segment is a design variable '
+                                  'and the continuity of the states between segments is enforced '
+                                  'by constraints.  The segments are then propagated simultaneously '
+                                  'rather than one after another.')
+        self.options.declare('checkpointing', types=bool, default=False,
+                             desc='If True, the sensitivities of the integration are stored only at the '
+                                  'segment boundaries rather than at every integration step, reducing the '
+                                  'memory required for derivatives.  In adjoint derivative_mode, the '
+                                  'partials of the ODE at steps which do not fit within checkpoint_memory '
+                                  'are recomputed during each derivative computation.')
+        self.options.declare('checkpoint_memory', types=(int, float), default=None, allow_none=True,
+                             desc='The maximum number of bytes used to cache the partials of the ODE at '
+                                  'each integration step when checkpointing in adjoint mode.  If None, '
+                                  'the partials at every step are cached.')
         self.options.declare('subprob_reports', default=False,
                              desc='Controls the reports made when running the subproblems for ExplicitShooting')
 
@@ -139,11 +170,28 @@ class ExplicitShooting(TranscriptionBase):
         integrator_comp._configure_states_io()
 
         # Add the appropriate design parameters
+        num_seg = self.grid_data.num_segments
         for state_name, options in phase.state_options.items():
             if options['fix_final']:
                 raise ValueError('fix_final is not a valid option for states when using the '
                                  'ExplicitShooting transcription.')
-            if options['opt'] and not options['fix_initial']:
+            if not options['opt']:
+                continue
+
+            if self.options['multiple_shooting']:
+                # The initial state of each segment is a design variable, except that of the first
+                # segment when the initial state is fixed.
+                if options['fix_initial'] and num_seg == 1:
+                    continue
+                phase.add_design_var(name=f'states:{state_name}',
+                                     lower=options['lower'],
+                                     upper=options['upper'],
+                                     scaler=options['scaler'],
+                                     adder=options['adder'],
+                                     ref0=options['ref0'],
+                                     ref=options['ref'],
+                                     indices=om.slicer[1:, ...] if options['fix_initial'] else None)
+            elif not options['fix_initial']:
                 phase.add_design_var(name=f'states:{state_name}',
                                      lower=options['lower'],
                                      upper=options['upper'],
@@ -167,19 +215,30 @@ class ExplicitShooting(TranscriptionBase):
         phase : dymos.Phase
             The phase object to which this transcription instance applies.
         """
-        integrator_comp = RKIntegrationComp(ode_class=phase.options['ode_class'],
-                                            time_options=phase.time_options,
-                                            state_options=phase.state_options,
-                                            parameter_options=phase.parameter_options,
-                                            control_options=phase.control_options,
-                                            polynomial_control_options=phase.polynomial_control_options,
-                                            timeseries_options=phase._timeseries,
-                                            method=self.options['method'],
-                                            num_steps_per_segment=self.options['num_steps_per_segment'],
-                                            grid_data=self.grid_data,
-                                            ode_init_kwargs=phase.options['ode_init_kwargs'],
-                                            standalone_mode=False,
-                                            reports=self.options['subprob_reports'])
+        if self.options['derivative_mode'] == 'adjoint':
+            integrator_class = AdjointRKIntegrationComp
+        else:
+            integrator_class = RKIntegrationComp
+
+        integrator_comp = integrator_class(ode_class=phase.options['ode_class'],
+                                           time_options=phase.time_options,
+                                           state_options=phase.state_options,
+                                           parameter_options=phase.parameter_options,
+                                           control_options=phase.control_options,
+                                           polynomial_control_options=phase.polynomial_control_options,
+                                           timeseries_options=phase._timeseries,
+                                           method=self.options['method'],
+                                           num_steps_per_segment=self.options['num_steps_per_segment'],
+                                           adaptive=self.options['adaptive'],
+                                           atol=self.options['atol'],
+                                           rtol=self.options['rtol'],
+                                           multiple_shooting=self.options['multiple_shooting'],
+                                           checkpointing=self.options['checkpointing'],
+                                           checkpoint_memory=self.options['checkpoint_memory'],
+                                           grid_data=self.grid_data,
+                                           ode_init_kwargs=phase.options['ode_init_kwargs'],
+                                           standalone_mode=False,
+                                           reports=self.options['subprob_reports'])
 
         phase.add_subsystem(name='integrator', subsys=integrator_comp, promotes_inputs=['*'])
 
@@ -332,7 +391,8 @@ class ExplicitShooting(TranscriptionBase):
                                 ExplicitShootingContinuityComp(grid_data=self.grid_data,
                                                                state_options=phase.state_options,
                                                                control_options=phase.control_options,
-                                                               time_units=phase.time_options['units']))
+                                                               time_units=phase.time_options['units'],
+                                                               multiple_shooting=self.options['multiple_shooting']))
 
     def configure_defects(self, phase):
         """
@@ -348,6 +408,11 @@ class ExplicitShooting(TranscriptionBase):
         if any((any_state_cnty, any_control_cnty, any_rate_cnty)):
             phase.continuity_comp.configure_io()
 
+        for state_name, options in phase.state_options.items():
+            if options['continuity'] and any_state_cnty:
+                phase.connect(f'integrator.states_out:{state_name}',
+                              f'continuity_comp.states:{state_name}')
+
         for control_name, options in phase.control_options.items():
             if options['continuity'] and any_control_cnty:
                 phase.connect(f'timeseries.controls:{control_name}',
@@ -573,7 +638,8 @@ class ExplicitShooting(TranscriptionBase):
         num_seg = self.grid_data.num_segments
         compressed = self.grid_data.compressed
 
-        state_continuity = False
+        state_continuity = any([opts['continuity'] for opts in phase.state_options.values()])
+        state_continuity = state_continuity and num_seg > 1 and self.options['multiple_shooting']
         any_control_continuity = any([opts['continuity'] for opts in phase.control_options.values()])
         any_control_continuity = any_control_continuity and num_seg > 1 and not compressed
         any_rate_continuity = any([opts['rate_continuity'] or opts['rate2_continuity']
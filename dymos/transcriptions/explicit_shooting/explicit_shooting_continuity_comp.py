@@ -1,3 +1,5 @@
+import numpy as np
+
 from ..common.continuity_comp import ContinuityCompBase
 
 
@@ -10,24 +12,67 @@ class ExplicitShootingContinuityComp(ContinuityCompBase):
     **kwargs : dict
         Dictionary of optional arguments.
     """
+    def initialize(self):
+        """
+        Declare component options.
+        """
+        super().initialize()
+        self.options.declare('multiple_shooting', types=bool, default=False,
+                             desc='If True, the initial state of each segment is independent and '
+                                  'the state continuity between segments is enforced by this component.')
+
     def _configure_state_continuity(self):
-        # TODO This method will be used when multiple shooting is implemented.
-        pass
-
-        # state_options = self.options['state_options']
-        # num_segments = self.options['grid_data'].num_segments
-        # compressed = self.options['grid_data'].compressed
-        #
-        # if num_segments <= 1:
-        #     return
-        #
-        # super(ExplicitShootingContinuityComp, self)._configure_state_continuity()
-        #
-        # for state_name, options in state_options.items():
-        #     if options['continuity'] and not compressed:
-        #         # State continuity is nonlinear in (TBD) explicit multiple shooting phases
-        #         self.add_constraint(name=f'defect_states:{state_name}',
-        #                             equals=0.0, scaler=1.0, linear=False)
+        state_options = self.options['state_options']
+        num_segend_nodes = self.options['grid_data'].subset_num_nodes['segment_ends']
+        num_segments = self.options['grid_data'].num_segments
+
+        # Without multiple shooting, the final state of each segment is the initial state of the
+        # next and no constraints are necessary.  The grid being compressed has no bearing on this.
+        if num_segments <= 1 or not self.options['multiple_shooting']:
+            return
+
+        for state_name, options in state_options.items():
+            if not options['continuity']:
+                continue
+
+            shape = options['shape']
+            size = np.prod(shape)
+            units = options['units']
+
+            self.name_maps[state_name] = {}
+
+            self.name_maps[state_name]['value_names'] = \
+                (f'states:{state_name}', f'defect_states:{state_name}')
+
+            self.add_input(name=f'states:{state_name}',
+                           shape=(num_segend_nodes,) + shape,
+                           desc=f'Values of state {state_name} at segment endpoint nodes',
+                           units=units)
+
+            self.add_output(name=f'defect_states:{state_name}',
+                            shape=(num_segments - 1,) + shape,
+                            desc=f'Consistency constraint values for state {state_name}',
+                            units=units)
+
+            rs_size1 = np.repeat(np.arange(num_segments - 1, dtype=int), 2)
+            cs_size1 = np.arange(1, num_segend_nodes - 1, dtype=int)
+
+            template = np.zeros((num_segments - 1, num_segend_nodes))
+            template[rs_size1, cs_size1] = 1.0
+            template = np.kron(template, np.eye(size))
+            rs, cs = template.nonzero()
+
+            vals = np.zeros(len(rs), dtype=float)
+            vals[0::2] = -1.0
+            vals[1::2] = 1.0
+
+            self.declare_partials(f'defect_states:{state_name}', f'states:{state_name}',
+                                  val=vals, rows=rs, cols=cs)
+
+            # State continuity is nonlinear in multiple shooting since the final state of each
+            # segment is the result of the integration.
+            self.add_constraint(name=f'defect_states:{state_name}',
+                                equals=0.0, scaler=1.0, linear=False)
 
     def _configure_control_continuity(self):
         super()._configure_control_continuity()
@@ -65,4 +110,10 @@ class ExplicitShootingContinuityComp(ContinuityCompBase):
                                     linear=False)
 
     def _compute_state_continuity(self, inputs, outputs):
-        pass
+        for state_name in self.options['state_options']:
+            if state_name not in self.name_maps:
+                continue
+            input_name, output_name = self.name_maps[state_name]['value_names']
+            end_vals = inputs[input_name][1:-1:2, ...]
+            start_vals = inputs[input_name][2:-1:2, ...]
+            outputs[output_name] = start_vals - end_vals
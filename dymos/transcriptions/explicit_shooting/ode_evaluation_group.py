@@ -37,13 +37,17 @@ class ODEEvaluationGroup(om.Group):
         The number of nodes at which the ODE is simultaneously evaluated. This is related to the
         number of stages in the chosen shooting method and not associated with the number of
         nodes in the GridData.
+    segment_index : int or np.ndarray or None
+        If given, the segment of each of the vec_size nodes is fixed to this value, and the
+        control interpolation declares partials only wrt the control input nodes of that segment.
+        Otherwise the segment is set with set_segment_index before each evaluation.
     **kwargs : dict
         Additional keyword arguments passed to Group.
     """
 
     def __init__(self, ode_class, time_options, state_options, parameter_options, control_options,
                  polynomial_control_options, ode_init_kwargs=None,
-                 grid_data=None, vec_size=1, **kwargs):
+                 grid_data=None, vec_size=1, segment_index=None, **kwargs):
         super().__init__(**kwargs)
 
         # Get the state vector.  This isn't necessarily ordered
@@ -58,6 +62,7 @@ class ODEEvaluationGroup(om.Group):
         self.ode_class = ode_class
         self.grid_data = grid_data
         self.vec_size = vec_size
+        self.segment_index = segment_index
         self.ode_init_kwargs = {} if ode_init_kwargs is None else ode_init_kwargs
 
     def set_segment_index(self, seg_idx):
@@ -66,8 +71,9 @@ class ODEEvaluationGroup(om.Group):
 
         Parameters
         ----------
-        seg_idx : int
-            The index of the current segment.
+        seg_idx : int or np.ndarray
+            The index of the current segment, or an array of the segment index of each of the
+            vec_size nodes when they lie in different segments.
         """
         self._get_subsystem('tau_comp').options['segment_index'] = seg_idx
 
@@ -87,11 +93,13 @@ class ODEEvaluationGroup(om.Group):
         self._ivc = self.add_subsystem('ivc', om.IndepVarComp(), promotes_outputs=['*'])
 
         # Add a component to compute the current non-dimensional phase time.
-        self.add_subsystem('tau_comp', TauComp(grid_data=self.grid_data,
-                                               vec_size=self.vec_size,
-                                               time_units=self.time_options['units']),
-                           promotes_inputs=['time', 't_initial', 't_duration'],
-                           promotes_outputs=['stau', 'ptau', 'dstau_dt', 'time_phase'])
+        tau_comp = self.add_subsystem('tau_comp', TauComp(grid_data=self.grid_data,
+                                                          vec_size=self.vec_size,
+                                                          time_units=self.time_options['units']),
+                                      promotes_inputs=['time', 't_initial', 't_duration'],
+                                      promotes_outputs=['stau', 'ptau', 'dstau_dt', 'time_phase'])
+        if self.segment_index is not None:
+            tau_comp.options['segment_index'] = self.segment_index
 
         if self.control_options or self.polynomial_control_options:
             c_options = self.control_options
@@ -105,6 +113,9 @@ class ODEEvaluationGroup(om.Group):
                                                                                  polynomial_control_options=pc_options,
                                                                                  time_units=self.time_options['units']),
                                                     promotes_inputs=['ptau', 'stau', 't_duration', 'dstau_dt'])
+            if self.segment_index is not None:
+                self._control_comp.options['segment_index'] = self.segment_index
+                self._control_comp.options['static_segment_index'] = True
 
         self.add_subsystem('ode', self.ode_class(num_nodes=self.vec_size, **self.ode_init_kwargs))
 
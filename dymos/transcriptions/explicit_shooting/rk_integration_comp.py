@@ -1,4 +1,5 @@
 import numpy as np
+import openmdao
 import openmdao.api as om
 
 from ...options import options as dymos_options
@@ -7,6 +8,15 @@ from .ode_evaluation_group import ODEEvaluationGroup
 from ...utils.misc import get_rate_units
 from ...utils.introspection import filter_outputs, get_promoted_vars
 
+om_version = tuple(int(s) for s in openmdao.__version__.split('-')[0].split('.'))
+
+# Reusing the total jacobian information of the subproblems between evaluations relies on the
+# private _TotalJacInfo of OpenMDAO, whose interface changed in version 3.27.  Other versions use
+# the public compute_totals of the subproblem.
+if (3, 20) <= om_version < (3, 27):
+    from openmdao.core.total_jac import _TotalJacInfo
+else:  # pragma: no cover
+    _TotalJacInfo = None
 
 rk_methods = {'rk4': {'a': np.array([[0.0, 0.0, 0.0, 0.0],
                                      [0.5, 0.0, 0.0, 0.0],
@@ -45,10 +55,10 @@ rk_methods = {'rk4': {'a': np.array([[0.0, 0.0, 0.0, 0.0],
                                       [3/40, 9/40, 0, 0, 0],
                                       [3/10, -9/10, 6/5, 0, 0],
                                       [-11/54, 5/2, -70/27, 35/27, 0],
-                                      [1631/55296, 175/512, 575/13828, 44275/110592, 253/4096]]),
+                                      [1631/55296, 175/512, 575/13824, 44275/110592, 253/4096]]),
                        'c': np.array([0, 1/5, 3/10, 3/5, 1, 7/8]),
                        'b': np.array([2825/27648, 0, 18575/48384, 13525/55296, 277/14336, 1/4]),
-                       'b_star': np.array([37/378, 0, 250/621, 125/594, 512/1771, 0])},
+                       'b_star': np.array([37/378, 0, 250/621, 125/594, 0, 512/1771])},
 
               'dopri': {'a': np.array([[0,  0,  0,  0,  0, 0],
                                        [1/5, 0, 0, 0, 0, 0],
@@ -104,6 +114,10 @@ class RKIntegrationComp(om.ExplicitComponent):
     This code includes the following unicode symbols:
     θ:  U+03B8
     """
+    # If True, the propagation records the stages of each step for matrix-free derivatives rather
+    # than propagating the total derivatives wrt every input.
+    _record_steps = False
+
     def __init__(self, ode_class, time_options=None,
                  state_options=None, parameter_options=None, control_options=None,
                  polynomial_control_options=None, timeseries_options=None,
@@ -118,6 +132,8 @@ class RKIntegrationComp(om.ExplicitComponent):
         self.timeseries_options = timeseries_options or {}
         self._eval_subprob = None
         self._deriv_subprob = None
+        self._eval_plans = {}
+        self._totals_plans = {}
         self._grid_data = grid_data
         self._DTYPE = float
         self._reports = reports
@@ -125,6 +141,7 @@ class RKIntegrationComp(om.ExplicitComponent):
         self._inputs_cache = None
 
         self.x_size = 0
+        self.x0_size = 0
         self.p_size = 0
         self.u_size = 0
         self.up_size = 0
@@ -149,13 +166,50 @@ class RKIntegrationComp(om.ExplicitComponent):
         self.options.declare('method', types=(str,), default='rk4',
                              desc='The explicit Runge-Kutta scheme to use. One of' +
                                   str(list(rk_methods.keys())))
-        self.options.declare('num_steps_per_segment', types=(int,), default=10)
+        self.options.declare('num_steps_per_segment', types=(int,), default=10,
+                             desc='The number of integration steps in each segment.  If adaptive '
+                                  'is True, this is the maximum number of steps in each segment.')
         self.options.declare('ode_init_kwargs', types=dict, allow_none=True, default=None)
+        self.options.declare('adaptive', types=bool, default=False,
+                             desc='If True, choose the step sizes in each segment using the error '
+                                  'estimate of an embedded Runge-Kutta method (one of '
+                                  f'{[m for m in rk_methods if "b_star" in rk_methods[m]]}).')
+        self.options.declare('atol', types=float, default=1.0E-6,
+                             desc='Absolute error tolerance for adaptive step size control.')
+        self.options.declare('rtol', types=float, default=1.0E-3,
+                             desc='Relative error tolerance for adaptive step size control.')
+        self.options.declare('multiple_shooting', types=bool, default=False,
+                             desc='If True, the initial state of each segment is an input rather '
+                                  'than the final state of the previous segment.  The segments '
+                                  'are then independent and are propagated simultaneously, with '
+                                  'the ODE evaluated at the same stage of every segment in a '
+                                  'single vectorized call.')
+        self.options.declare('checkpointing', types=bool, default=False,
+                             desc='If True, the sensitivities of the integration are stored only at the '
+                                  'segment boundaries, which are the rows output by the integration, '
+                                  'rather than at every step.  The steps within each segment are '
+                                  'propagated through a small working buffer.  In an '
+                                  'AdjointRKIntegrationComp the ODE partials of the steps are cached only '
+                                  'up to checkpoint_memory, and those of the remaining steps are '
+                                  'recomputed from their stored stage values during each derivative sweep.')
+        self.options.declare('checkpoint_memory', types=(int, float), default=None, allow_none=True,
+                             desc='The maximum number of bytes used to cache the ODE partials of the '
+                                  'integration steps when checkpointing in an AdjointRKIntegrationComp.  '
+                                  'If None, the partials of every step are cached.')
 
     def _setup_subprob(self):
         rk = rk_methods[self.options['method']]
         num_stages = len(rk['b'])
 
+        # In multiple shooting mode, each subproblem evaluates the ODE in every segment at once, and
+        # the segment of each node is fixed so that the control interpolation partials are segment-local.
+        if self.options['multiple_shooting']:
+            num_seg = self._grid_data.num_segments
+            seg_idxs = np.arange(num_seg, dtype=int)
+        else:
+            num_seg = 1
+            seg_idxs = None
+
         self._eval_subprob = p = om.Problem(comm=self.comm, reports=self._reports)
         p.model.add_subsystem('ode_eval',
                               ODEEvaluationGroup(self.ode_class, self.time_options,
@@ -164,7 +218,9 @@ class RKIntegrationComp(om.ExplicitComponent):
                                                  self.control_options,
                                                  self.polynomial_control_options,
                                                  ode_init_kwargs=self.options['ode_init_kwargs'],
-                                                 grid_data=self._grid_data),
+                                                 grid_data=self._grid_data,
+                                                 vec_size=num_seg,
+                                                 segment_index=seg_idxs),
                               promotes_inputs=['*'],
                               promotes_outputs=['*'])
 
@@ -180,7 +236,9 @@ class RKIntegrationComp(om.ExplicitComponent):
                                                  self.polynomial_control_options,
                                                  ode_init_kwargs=self.options['ode_init_kwargs'],
                                                  grid_data=self._grid_data,
-                                                 vec_size=num_stages),
+                                                 vec_size=num_seg * num_stages,
+                                                 segment_index=None if seg_idxs is None else
+                                                 np.repeat(seg_idxs, num_stages)),
                               promotes_inputs=['*'],
                               promotes_outputs=['*'])
 
@@ -189,6 +247,107 @@ class RKIntegrationComp(om.ExplicitComponent):
         p.setup(force_alloc_complex=False)
         p.final_setup()
 
+    def _build_eval_plan(self, subprob):
+        """
+        Resolve the locations of the inputs and outputs of the given subproblem in its vectors.
+
+        Moving data through the subproblem vectors avoids the name resolution and unit handling
+        of set_val and get_val on each evaluation of the ODE.  The resulting views are invalidated
+        when the subproblem is set up again or its complex step mode is changed.
+
+        Parameters
+        ----------
+        subprob : om.Problem
+            The subproblem whose inputs and outputs are to be resolved.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the flat views of the time inputs and lists of (idxs, view)
+            pairs mapping slices of x, θ, f, and y to the corresponding subproblem variables.
+        """
+        model = subprob.model
+        prom2abs_out = model._var_allprocs_prom2abs_list['output']
+        prom2abs_in = model._var_allprocs_prom2abs_list['input']
+
+        def _get_view(name):
+            # name may be promoted or absolute, and may be an input if it is not connected.
+            if name in prom2abs_out:
+                return model._outputs._abs_get_val(prom2abs_out[name][0])
+            elif name in model._var_allprocs_abs2meta['output']:
+                return model._outputs._abs_get_val(name)
+            elif name in prom2abs_in:
+                return model._inputs._abs_get_val(prom2abs_in[name][0])
+            return model._inputs._abs_get_val(name)
+
+        plan = {'time': _get_view('time'),
+                't_initial': _get_view('t_initial'),
+                't_duration': _get_view('t_duration'),
+                'x': [], 'θ': [], 'f': [], 'y': []}
+
+        for name in self.state_options:
+            plan['x'].append((self.state_idxs[name], _get_view(self._state_input_names[name])))
+            plan['f'].append((self.state_idxs[name],
+                              _get_view(f'state_rate_collector.state_rates:{name}_rate')))
+
+        for name in self.parameter_options:
+            plan['θ'].append((self._parameter_idxs_in_θ[name], _get_view(self._param_input_names[name])))
+
+        for name in self.control_options:
+            plan['θ'].append((self._control_idxs_in_θ[name], _get_view(self._control_input_names[name])))
+            plan['y'].append((self._control_idxs_in_y[name], _get_view(self._control_output_names[name])))
+            plan['y'].append((self._control_rate_idxs_in_y[name], _get_view(self._control_rate_names[name])))
+            plan['y'].append((self._control_rate2_idxs_in_y[name], _get_view(self._control_rate2_names[name])))
+
+        for name in self.polynomial_control_options:
+            plan['θ'].append((self._polynomial_control_idxs_in_θ[name],
+                              _get_view(self._polynomial_control_input_names[name])))
+            plan['y'].append((self._polynomial_control_idxs_in_y[name],
+                              _get_view(self._polynomial_control_output_names[name])))
+            plan['y'].append((self._polynomial_control_rate_idxs_in_y[name],
+                              _get_view(self._polynomial_control_rate_names[name])))
+            plan['y'].append((self._polynomial_control_rate2_idxs_in_y[name],
+                              _get_view(self._polynomial_control_rate2_names[name])))
+
+        for output_name, options in self._filtered_timeseries_outputs.items():
+            plan['y'].append((self._timeseries_idxs_in_y[output_name], _get_view(options['path'])))
+
+        return plan
+
+    def _compute_subprob_totals(self, subprob, of):
+        """
+        Compute the total derivatives of the given subproblem, reusing the layout of the totals.
+
+        Where the version of OpenMDAO allows, the total jacobian information (the index maps of
+        the of and wrt variables and the storage of the jacobian) is created on the first call for
+        each subproblem and set of of variables.  Subsequent calls only linearize the subproblem
+        and perform the linear solves.  Otherwise the public compute_totals of the subproblem
+        is used.
+
+        Parameters
+        ----------
+        subprob : om.Problem
+            The subproblem whose total derivatives are to be computed.
+        of : list of str
+            The promoted names of the variables whose derivatives are requested.
+
+        Returns
+        -------
+        dict
+            The total derivatives keyed by (of, wrt).  The values may be views into storage which
+            is overwritten by the next call for the same subproblem and of variables.
+        """
+        if _TotalJacInfo is None:
+            return subprob.compute_totals(of=of, wrt=self._totals_wrt_names, return_format='flat_dict',
+                                          driver_scaling=False)
+
+        key = (subprob is self._deriv_subprob, tuple(of))
+        if key not in self._totals_plans:
+            self._totals_plans[key] = _TotalJacInfo(subprob, of, self._totals_wrt_names,
+                                                    use_abs_names=False, return_format='flat_dict',
+                                                    driver_scaling=False)
+        return self._totals_plans[key].compute_totals()
+
     def _set_complex_step_mode(self, active):
         """
         Sets complex step mode on this component, adjust the complex step mode of the evaluation
@@ -207,18 +366,60 @@ class RKIntegrationComp(om.ExplicitComponent):
         self._eval_subprob.final_setup()
         self._eval_subprob.set_complex_step_mode(active)
 
+        self._totals_plans.clear()
+        self._eval_plans['eval'] = self._build_eval_plan(self._eval_subprob)
+
+        # The reallocated storage holds no sensitivities, so they are propagated anew when needed.
         self._allocate_storage()
+        self._inputs_cache = None
+
+    def _get_sensitivity_rows(self):
+        """
+        Return the row of the sensitivity storage in which the sensitivities of each row are kept.
+
+        Without checkpointing every row has its own storage.  With checkpointing only the output
+        rows at the segment boundaries are kept, and the remaining rows of each segment alternate
+        between two working rows, since each step only refers to the row at its start.
+
+        Returns
+        -------
+        np.array
+            The index in the sensitivity storage of each row of the integration.
+        """
+        num_rows = self._num_rows
+
+        if not self.options['checkpointing']:
+            return np.arange(num_rows, dtype=int)
 
-    def _allocate_storage(self):
         N = self.options['num_steps_per_segment']
+        rows = np.arange(num_rows, dtype=int)
+        is_output = np.zeros(num_rows, dtype=bool)
+        is_output[self._output_src_idxs] = True
+
+        storage_rows = np.empty(num_rows, dtype=int)
+        storage_rows[is_output] = np.arange(self._num_output_rows, dtype=int)
+        work_rows = rows[~is_output]
+        storage_rows[~is_output] = self._num_output_rows + 2 * (work_rows // (N + 1)) + work_rows % 2
+
+        return storage_rows
+
+    def _allocate_storage(self):
         rk = rk_methods[self.options['method']]
         num_rows = self._num_rows
         num_stages = len(rk['b'])
         num_x = self.x_size
+        num_x0 = self.x0_size
         num_θ = self.θ_size
-        num_z = num_x + num_θ
+        num_z = num_x0 + num_θ
         num_y = self.y_size
 
+        # In multiple shooting mode the stages of all segments are evaluated together.
+        if self.options['multiple_shooting']:
+            seg_shape = (self._grid_data.num_segments,)
+        else:
+            seg_shape = ()
+        num_nodes = np.prod(seg_shape + (num_stages,), dtype=int)
+
         # The contiguous vector of state values
         self._x = np.zeros((num_rows, self.x_size, 1), dtype=self._DTYPE)
 
@@ -236,34 +437,34 @@ class RKIntegrationComp(om.ExplicitComponent):
 
         # The derivatives of the state rates wrt the current time
         self._f_t = np.zeros((self.x_size, 1), dtype=self._DTYPE)
-        self._f_t_vec = np.zeros((num_stages, self.x_size, 1), dtype=self._DTYPE)
+        self._f_t_vec = np.zeros((num_nodes, self.x_size, 1), dtype=self._DTYPE)
 
         # The derivatives of the state rates wrt the current state
         self._f_x = np.zeros((self.x_size, self.x_size), dtype=self._DTYPE)
-        self._f_x_vec = np.zeros((num_stages, self.x_size, self.x_size), dtype=self._DTYPE)
+        self._f_x_vec = np.zeros((num_nodes, self.x_size, self.x_size), dtype=self._DTYPE)
 
         # The derivatives of the state rates wrt the parameters
         self._f_θ = np.zeros((self.x_size, self.θ_size), dtype=self._DTYPE)
-        self._f_θ_vec = np.zeros((num_stages, self.x_size, self.θ_size), dtype=self._DTYPE)
+        self._f_θ_vec = np.zeros((num_nodes, self.x_size, self.θ_size), dtype=self._DTYPE)
 
         # The derivatives of the state rates wrt the current time
         self._y_t = np.zeros((self.y_size, 1), dtype=self._DTYPE)
-        self._y_t_vec = np.zeros((num_stages, self.y_size, 1), dtype=self._DTYPE)
+        self._y_t_vec = np.zeros((num_nodes, self.y_size, 1), dtype=self._DTYPE)
 
         # The derivatives of the state rates wrt the current state
         self._y_x = np.zeros((self.y_size, self.x_size), dtype=self._DTYPE)
-        self._y_x_vec = np.zeros((num_stages, self.y_size, self.x_size), dtype=self._DTYPE)
+        self._y_x_vec = np.zeros((num_nodes, self.y_size, self.x_size), dtype=self._DTYPE)
 
         # The derivatives of the state rates wrt the parameters
         self._y_θ = np.zeros((self.y_size, self.θ_size), dtype=self._DTYPE)
-        self._y_θ_vec = np.zeros((num_stages, self.y_size, self.θ_size), dtype=self._DTYPE)
+        self._y_θ_vec = np.zeros((num_nodes, self.y_size, self.θ_size), dtype=self._DTYPE)
 
         # Intermediate state rate storage
-        self._k_q = np.zeros((num_stages, self.x_size, 1), dtype=self._DTYPE)
+        self._k_q = np.zeros(seg_shape + (num_stages, self.x_size, 1), dtype=self._DTYPE)
 
         # Intermediate time and states
-        self._T_i = np.zeros((num_stages, 1), dtype=self._DTYPE)
-        self._X_i = np.zeros((num_stages, self.x_size, 1), dtype=self._DTYPE)
+        self._T_i = np.zeros(seg_shape + (num_stages, 1), dtype=self._DTYPE)
+        self._X_i = np.zeros(seg_shape + (num_stages, self.x_size, 1), dtype=self._DTYPE)
 
         # The partial derivative of the final state vector wrt time from state update equation.
         self.px_pt = np.zeros((self.x_size, 1), dtype=self._DTYPE)
@@ -275,23 +476,38 @@ class RKIntegrationComp(om.ExplicitComponent):
         # Derivatives pertaining to the stage ODE evaluations
         self._dTi_dZ = np.zeros((1, num_z), dtype=self._DTYPE)
         self._dXi_dZ = np.zeros((num_x, num_z), dtype=self._DTYPE)
-        self._dkq_dZ = np.zeros((num_stages, num_x, num_z), dtype=self._DTYPE)
+        self._dkq_dZ = np.zeros(seg_shape + (num_stages, num_x, num_z), dtype=self._DTYPE)
 
         # The ODE parameter derivatives wrt the integration parameters
         self._dθ_dZ = np.zeros((num_θ, num_z), dtype=self._DTYPE)
-        self._dθ_dZ[:, num_x:] = np.eye(num_θ, dtype=self._DTYPE)
+        self._dθ_dZ[:, num_x0:] = np.eye(num_θ, dtype=self._DTYPE)
+
+        # The sensitivities of row i are kept in row _sensitivity_rows[i] of the storage.
+        self._sensitivity_rows = self._get_sensitivity_rows()
+
+        self._allocate_sensitivity_storage()
+
+    def _allocate_sensitivity_storage(self):
+        """
+        Allocate the storage of the total derivatives propagated through the integration.
+        """
+        N = self.options['num_steps_per_segment']
+        num_x = self.x_size
+        num_z = self.x0_size + self.θ_size
+        num_y = self.y_size
 
         # Total derivatives of evolving quantities (x, t, h) wrt the integration parameters.
         # Let Z be [x0.ravel() t0 tp p.ravel() u.ravel()]
-        self._dx_dZ = np.zeros((num_rows, num_x, num_z), dtype=self._DTYPE)
+        num_storage_rows = np.max(self._sensitivity_rows) + 1
+        self._dx_dZ = np.zeros((num_storage_rows, num_x, num_z), dtype=self._DTYPE)
         self._dx_dZ[:, :, :num_x] = np.eye(num_x, dtype=self._DTYPE)
-        self._dt_dZ = np.zeros((num_rows, 1, num_z), dtype=self._DTYPE)
-        self._dt_dZ[:, 0, num_x] = 1.0
-        self._dh_dZ = np.zeros((num_rows, 1, num_z), dtype=self._DTYPE)
-        self._dh_dZ[:, 0, num_x+1] = 1.0 / N
+        self._dt_dZ = np.zeros((num_storage_rows, 1, num_z), dtype=self._DTYPE)
+        self._dt_dZ[:, 0, self.x0_size] = 1.0
+        self._dh_dZ = np.zeros((num_storage_rows, 1, num_z), dtype=self._DTYPE)
+        self._dh_dZ[:, 0, self.x0_size+1] = 1.0 / N
 
         # Total derivatives of ODE outputs (y) wrt the integration parameters.
-        self._dy_dZ = np.zeros((num_rows, num_y, num_z), dtype=self._DTYPE)
+        self._dy_dZ = np.zeros((num_storage_rows, num_y, num_z), dtype=self._DTYPE)
 
     def _setup_time(self):
         if self._standalone_mode:
@@ -309,18 +525,14 @@ class RKIntegrationComp(om.ExplicitComponent):
         self.add_output('time', shape=(num_output_rows, 1), units=self.time_options['units'])
         self.add_output('time_phase', shape=(num_output_rows, 1), units=self.time_options['units'])
 
-        self.declare_partials('t_final', 't_initial', val=1.0)
-        self.declare_partials('t_final', 't_duration', val=1.0)
-        self.declare_partials('time', 't_initial', val=1.0)
-        self.declare_partials('time', 't_duration', val=1.0)
-        self.declare_partials('time_phase', 't_duration', val=1.0)
-
     def _setup_states(self):
         if self._standalone_mode:
             self._configure_states_io()
 
     def _configure_states_io(self):
         num_output_rows = self._num_output_rows
+        multiple_shooting = self.options['multiple_shooting']
+        num_seg = self._grid_data.num_segments
 
         # The total size of the entire state vector
         self.x_size = 0
@@ -343,10 +555,16 @@ class RKIntegrationComp(om.ExplicitComponent):
             self._state_rate_of_names.append(f'state_rate_collector.state_rates:{state_name}_rate')
             self._totals_wrt_names.append(self._state_input_names[state_name])
 
-            self.add_input(self._state_input_names[state_name],
-                           shape=options['shape'],
-                           units=options['units'],
-                           desc=f'initial value of state {state_name}')
+            if multiple_shooting:
+                self.add_input(self._state_input_names[state_name],
+                               shape=(num_seg,) + options['shape'],
+                               units=options['units'],
+                               desc=f'initial value of state {state_name} in each segment')
+            else:
+                self.add_input(self._state_input_names[state_name],
+                               shape=options['shape'],
+                               units=options['units'],
+                               desc=f'initial value of state {state_name}')
             self.add_output(self._state_output_names[state_name],
                             shape=(num_output_rows,) + options['shape'],
                             units=options['units'],
@@ -358,27 +576,8 @@ class RKIntegrationComp(om.ExplicitComponent):
             self.state_idxs[state_name] = np.s_[self.x_size:self.x_size + state_size]
             self.x_size += state_size
 
-            self.declare_partials(of=self._state_output_names[state_name],
-                                  wrt='t_initial')
-
-            self.declare_partials(of=self._state_output_names[state_name],
-                                  wrt='t_duration')
-
-            for state_name_wrt in self.state_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'states:{state_name_wrt}')
-
-            for param_name_wrt in self.parameter_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'parameters:{param_name_wrt}')
-
-            for control_name_wrt in self.control_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'controls:{control_name_wrt}')
-
-            for control_name_wrt in self.polynomial_control_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'polynomial_controls:{control_name_wrt}')
+        # The size of the initial states in Z
+        self.x0_size = self.x_size * num_seg if multiple_shooting else self.x_size
 
     def _setup_parameters(self):
         if self._standalone_mode:
@@ -461,26 +660,6 @@ class RKIntegrationComp(om.ExplicitComponent):
                             units=get_rate_units(options['units'], time_units, deriv=2),
                             desc=f'values for second derivative rate of control {control_name} at output nodes')
 
-            self.declare_partials(of=self._control_output_names[control_name],
-                                  wrt=self._control_input_names[control_name],
-                                  val=1.0)
-
-            self.declare_partials(of=self._control_rate_names[control_name],
-                                  wrt=self._control_input_names[control_name],
-                                  val=1.0)
-
-            self.declare_partials(of=self._control_rate2_names[control_name],
-                                  wrt=self._control_input_names[control_name],
-                                  val=1.0)
-
-            self.declare_partials(of=self._control_rate_names[control_name],
-                                  wrt='t_duration',
-                                  val=1.0)
-
-            self.declare_partials(of=self._control_rate2_names[control_name],
-                                  wrt='t_duration',
-                                  val=1.0)
-
             self.control_idxs[control_name] = np.s_[self.u_size:self.u_size+control_param_size]
             self.u_size += control_param_size
 
@@ -535,26 +714,6 @@ class RKIntegrationComp(om.ExplicitComponent):
                             units=get_rate_units(options['units'], time_units, deriv=2),
                             desc=f'values for second derivative rate of control {name} at output nodes')
 
-            self.declare_partials(of=self._polynomial_control_output_names[name],
-                                  wrt=self._polynomial_control_input_names[name],
-                                  val=1.0)
-
-            self.declare_partials(of=self._polynomial_control_rate_names[name],
-                                  wrt=self._polynomial_control_input_names[name],
-                                  val=1.0)
-
-            self.declare_partials(of=self._polynomial_control_rate2_names[name],
-                                  wrt=self._polynomial_control_input_names[name],
-                                  val=1.0)
-
-            self.declare_partials(of=self._polynomial_control_rate_names[name],
-                                  wrt='t_duration',
-                                  val=1.0)
-
-            self.declare_partials(of=self._polynomial_control_rate2_names[name],
-                                  wrt='t_duration',
-                                  val=1.0)
-
             self.polynomial_control_idxs[name] = np.s_[self.up_size:self.up_size+control_param_size]
             self.up_size += control_param_size
 
@@ -615,28 +774,6 @@ class RKIntegrationComp(om.ExplicitComponent):
                                 units=units,
                                 desc=f'values for timeseries output {output_name} at output nodes')
 
-                self.declare_partials(of=self._timeseries_output_names[output_name],
-                                      wrt='t_initial')
-
-                self.declare_partials(of=self._timeseries_output_names[output_name],
-                                      wrt='t_duration')
-
-                for state_name_wrt in self.state_options:
-                    self.declare_partials(of=self._timeseries_output_names[output_name],
-                                          wrt=self._state_input_names[state_name_wrt])
-
-                for param_name_wrt in self.parameter_options:
-                    self.declare_partials(of=self._timeseries_output_names[output_name],
-                                          wrt=self._param_input_names[param_name_wrt])
-
-                for control_name_wrt in self.control_options:
-                    self.declare_partials(of=self._timeseries_output_names[output_name],
-                                          wrt=self._control_input_names[control_name_wrt])
-
-                for control_name_wrt in self.polynomial_control_options:
-                    self.declare_partials(of=self._timeseries_output_names[output_name],
-                                          wrt=self._polynomial_control_input_names[control_name_wrt])
-
     def _setup_storage(self):
         if self._standalone_mode:
             self._configure_storage()
@@ -649,7 +786,7 @@ class RKIntegrationComp(om.ExplicitComponent):
         self.θ_size = 2 + self.p_size + self.u_size + self.up_size
 
         # allocate the integration parameter vector
-        self.Z_size = self.x_size + self.θ_size
+        self.Z_size = self.x0_size + self.θ_size
 
         # allocate the algebraic outputs vector
         self.y_size = 3 * self.u_size
@@ -657,10 +794,16 @@ class RKIntegrationComp(om.ExplicitComponent):
         start_Z = 0
         for state_name, options in self.state_options.items():
             state_size = np.prod(options['shape'], dtype=int)
-            self._state_idxs_in_Z[state_name] = np.s_[start_Z: start_Z+state_size]
+            if self.options['multiple_shooting']:
+                # The initial states of each segment are stored contiguously in Z.
+                seg_offsets = self.x_size * np.arange(gd.num_segments, dtype=int)
+                self._state_idxs_in_Z[state_name] = \
+                    (seg_offsets[:, np.newaxis] + np.arange(start_Z, start_Z+state_size)).ravel()
+            else:
+                self._state_idxs_in_Z[state_name] = np.s_[start_Z: start_Z+state_size]
             start_Z += state_size
 
-        start_Z = self.x_size + 2
+        start_Z = self.x0_size + 2
         start_θ = 2
         for param_name, options in self.parameter_options.items():
             param_size = np.prod(options['shape'], dtype=int)
@@ -669,7 +812,7 @@ class RKIntegrationComp(om.ExplicitComponent):
             start_Z += param_size
             start_θ += param_size
 
-        start_Z = self.x_size + 2 + self.p_size
+        start_Z = self.x0_size + 2 + self.p_size
         start_θ = 2 + self.p_size
         start_y = 0
         for control_name, options in self.control_options.items():
@@ -687,7 +830,7 @@ class RKIntegrationComp(om.ExplicitComponent):
             start_Z += control_param_size
             start_θ += control_param_size
 
-        start_Z = self.x_size + 2 + self.p_size + self.u_size
+        start_Z = self.x0_size + 2 + self.p_size + self.u_size
         start_θ = 2 + self.p_size + self.u_size
         for name, options in self.polynomial_control_options.items():
             control_size = np.prod(options['shape'], dtype=int)
@@ -713,6 +856,53 @@ class RKIntegrationComp(om.ExplicitComponent):
 
         self._allocate_storage()
 
+        # Now that the layout of x, θ, and y is known, resolve their locations in the subproblems.
+        self._totals_plans.clear()
+        self._eval_plans['eval'] = self._build_eval_plan(self._eval_subprob)
+        self._eval_plans['deriv'] = self._build_eval_plan(self._deriv_subprob)
+
+    def setup_partials(self):
+        """
+        Declare the partials of the outputs of the integration wrt its inputs.
+
+        These are declared once the inputs and outputs are known, which is after configure
+        when the component is not in standalone mode.
+        """
+        self.declare_partials('t_final', 't_initial', val=1.0)
+        self.declare_partials('t_final', 't_duration', val=1.0)
+        self.declare_partials('time', 't_initial', val=1.0)
+        self.declare_partials('time', 't_duration', val=1.0)
+        self.declare_partials('time_phase', 't_duration', val=1.0)
+
+        # The states and timeseries outputs depend on every input.
+        wrt_names = ['t_initial', 't_duration']
+        wrt_names.extend(self._state_input_names[name] for name in self.state_options)
+        wrt_names.extend(self._param_input_names[name] for name in self.parameter_options)
+        wrt_names.extend(self._control_input_names[name] for name in self.control_options)
+        wrt_names.extend(self._polynomial_control_input_names[name] for name in self.polynomial_control_options)
+
+        for name in self.state_options:
+            for wrt in wrt_names:
+                self.declare_partials(of=self._state_output_names[name], wrt=wrt)
+
+        for name in self.control_options:
+            for of in (self._control_output_names[name], self._control_rate_names[name],
+                       self._control_rate2_names[name]):
+                self.declare_partials(of=of, wrt=self._control_input_names[name], val=1.0)
+            self.declare_partials(of=self._control_rate_names[name], wrt='t_duration', val=1.0)
+            self.declare_partials(of=self._control_rate2_names[name], wrt='t_duration', val=1.0)
+
+        for name in self.polynomial_control_options:
+            for of in (self._polynomial_control_output_names[name], self._polynomial_control_rate_names[name],
+                       self._polynomial_control_rate2_names[name]):
+                self.declare_partials(of=of, wrt=self._polynomial_control_input_names[name], val=1.0)
+            self.declare_partials(of=self._polynomial_control_rate_names[name], wrt='t_duration', val=1.0)
+            self.declare_partials(of=self._polynomial_control_rate2_names[name], wrt='t_duration', val=1.0)
+
+        for name in self._filtered_timeseries_outputs:
+            for wrt in wrt_names:
+                self.declare_partials(of=self._timeseries_output_names[name], wrt=wrt)
+
     def setup(self):
         """
         Add the necessary I/O and storage for the RKIntegrationComp.
@@ -720,6 +910,24 @@ class RKIntegrationComp(om.ExplicitComponent):
         gd = self._grid_data
         N = self.options['num_steps_per_segment']
 
+        if self.options['adaptive'] and 'b_star' not in rk_methods[self.options['method']]:
+            raise ValueError(f'{self.msginfo}: Adaptive step size control requires an embedded '
+                             f'Runge-Kutta method but method \'{self.options["method"]}\' does not '
+                             f'provide an error estimate. Use one of '
+                             f'{[m for m in rk_methods if "b_star" in rk_methods[m]]}.')
+
+        if self.options['multiple_shooting']:
+            if self.options['adaptive']:
+                raise ValueError(f'{self.msginfo}: Multiple shooting requires a fixed number of '
+                                 f'steps in each segment and does not support adaptive step size '
+                                 f'control.')
+
+        # The step sizes in each segment as a fraction of the segment duration.  Steps with a
+        # fraction of zero are not taken.  When adaptive, these are chosen during compute and
+        # then held fixed while computing the partials, so that the derivatives are those of
+        # the accepted discretization.
+        self._step_fractions = np.full((gd.num_segments, N), 1.0 / N)
+
         # Indices to map the rows to output rows
         temp = np.zeros((gd.num_segments, N+1))
         temp[:, 0] = 1
@@ -783,9 +991,10 @@ class RKIntegrationComp(om.ExplicitComponent):
 
             if derivs:
                 # The 3 arrays of propagated derivatives need to copy over previous values
-                self._dx_dZ[row, ...] = self._dx_dZ[row-1, ...]
-                self._dt_dZ[row, ...] = self._dt_dZ[row-1, ...]
-                self._dh_dZ[row, ...] = self._dh_dZ[row-1, ...]
+                s_row, s_rm1 = self._sensitivity_rows[row], self._sensitivity_rows[row-1]
+                self._dx_dZ[s_row, ...] = self._dx_dZ[s_rm1, ...]
+                self._dt_dZ[s_row, ...] = self._dt_dZ[s_rm1, ...]
+                self._dh_dZ[s_row, ...] = self._dh_dZ[s_rm1, ...]
 
                 # Derivatives of the internal calls are just reset
                 self._dTi_dZ[...] = 0.0  # np.zeros((1, num_z), dtype=self._DTYPE)
@@ -818,35 +1027,28 @@ class RKIntegrationComp(om.ExplicitComponent):
         if subprob is None:
             subprob = self._deriv_subprob
 
-        # transcribe time
-        subprob.set_val('time', t, units=self.time_options['units'])
-        subprob.set_val('t_initial', θ[0, 0], units=self.time_options['units'])
-        subprob.set_val('t_duration', θ[1, 0], units=self.time_options['units'])
-
-        # transcribe states
-        for name in self.state_options:
-            input_name = self._state_input_names[name]
-            if subprob is self._deriv_subprob:
-                subprob.set_val(input_name, x[:, self.state_idxs[name], :])
-            else:
-                subprob.set_val(input_name, x[self.state_idxs[name], :])
+        plan = self._eval_plans['deriv' if subprob is self._deriv_subprob else 'eval']
 
-        # transcribe parameters
-        for name in self.parameter_options:
-            input_name = self._param_input_names[name]
-            subprob.set_val(input_name, θ[self._parameter_idxs_in_θ[name], 0])
-
-        # transcribe controls
-        for name in self.control_options:
-            input_name = self._control_input_names[name]
-            subprob.set_val(input_name, θ[self._control_idxs_in_θ[name], 0])
+        # transcribe time
+        plan['time'][:] = np.ravel(t)
+        plan['t_initial'][:] = θ[0, 0]
+        plan['t_duration'][:] = θ[1, 0]
+
+        # transcribe states, given at a single node or at each node of a vectorized subproblem
+        if x.ndim == 3:
+            for idxs, view in plan['x']:
+                view[:] = x[:, idxs, 0].ravel()
+        else:
+            for idxs, view in plan['x']:
+                view[:] = x[idxs, 0]
 
-        for name in self.polynomial_control_options:
-            input_name = self._polynomial_control_input_names[name]
-            subprob.set_val(input_name, θ[self._polynomial_control_idxs_in_θ[name], 0])
+        # transcribe parameters, controls, and polynomial controls
+        for idxs, view in plan['θ']:
+            view[:] = θ[idxs, 0]
 
-        # Re-run in case the inputs have changed.
-        subprob.run_model()
+        # Re-run in case the inputs have changed.  The subproblem is already set up, so bypass the
+        # setup checks and recording of Problem.run_model.
+        subprob.model.run_solve_nonlinear()
 
         if linearize:
             subprob.model._linearize(None)
@@ -873,34 +1075,49 @@ class RKIntegrationComp(om.ExplicitComponent):
         """
         self._subprob_run_model(x, t, θ, linearize=False, subprob=self._eval_subprob)
 
+        plan = self._eval_plans['eval']
+
         # pack the resulting array
-        for name in self.state_options:
-            f[self.state_idxs[name]] = self._eval_subprob.get_val(f'state_rate_collector.state_rates:{name}_rate').ravel()
+        for idxs, view in plan['f']:
+            f[idxs, 0] = view
+
+        if y is not None:
+            # pack any control values and rates, polynomial control values and rates, and
+            # timeseries outputs into y
+            for idxs, view in plan['y']:
+                y[idxs, 0] = view
+
+    def eval_f_vectorized(self, x, t, θ, f, y=None):
+        """
+        Evaluate the ODE at the corresponding node of each segment in a single call.
+
+        This is used in multiple shooting mode, where the evaluation subproblem is vectorized
+        across the segments of the phase.
+
+        Parameters
+        ----------
+        x : np.ndarray (num_segments, num_states, 1)
+            The state values in each segment.
+        t : np.ndarray (num_segments,)
+            The time in each segment.
+        θ : np.ndarray
+            A flattened, contiguous vector of the ODE parameter values.
+        f : np.ndarray (num_segments, num_states, 1)
+            The state rates in each segment.
+        y : np.ndarray (num_segments, num_y, 1) or None
+            The auxiliary ODE outputs in each segment, if desired.
+        """
+        self._subprob_run_model(x, t, θ, linearize=False, subprob=self._eval_subprob)
+
+        plan = self._eval_plans['eval']
+        num_nodes = x.shape[0]
+
+        for idxs, view in plan['f']:
+            f[:, idxs, 0] = view.reshape((num_nodes, -1))
 
         if y is not None:
-            # pack any control values and rates into y
-            for name in self.control_options:
-                output_name = self._control_output_names[name]
-                rate_name = self._control_rate_names[name]
-                rate2_name = self._control_rate2_names[name]
-                y[self._control_idxs_in_y[name]] = self._eval_subprob.get_val(output_name).ravel()
-                y[self._control_rate_idxs_in_y[name]] = self._eval_subprob.get_val(rate_name).ravel()
-                y[self._control_rate2_idxs_in_y[name]] = self._eval_subprob.get_val(rate2_name).ravel()
-
-            # pack any polynomial control values and rates into y
-            for name in self.polynomial_control_options:
-                output_name = self._polynomial_control_output_names[name]
-                rate_name = self._polynomial_control_rate_names[name]
-                rate2_name = self._polynomial_control_rate2_names[name]
-                y[self._polynomial_control_idxs_in_y[name]] = self._eval_subprob.get_val(output_name).ravel()
-                y[self._polynomial_control_rate_idxs_in_y[name]] = self._eval_subprob.get_val(rate_name).ravel()
-                y[self._polynomial_control_rate2_idxs_in_y[name]] = self._eval_subprob.get_val(rate2_name).ravel()
-
-            # pack any polynomial control values and rates into y
-
-            for output_name, options in self._filtered_timeseries_outputs.items():
-                path = options['path']
-                y[self._timeseries_idxs_in_y[output_name]] = self._eval_subprob.get_val(path).ravel()
+            for idxs, view in plan['y']:
+                y[:, idxs, 0] = view.reshape((num_nodes, -1))
 
     def eval_f_derivs(self, x, t, θ, f_x=None, f_t=None, f_θ=None, y_x=None, y_t=None, y_θ=None):
         """
@@ -939,11 +1156,9 @@ class RKIntegrationComp(om.ExplicitComponent):
 
         totals_of_names = self._totals_of_names
         if eval_state_rate_derivs:
-            totals_of_names += self._state_rate_of_names
+            totals_of_names = totals_of_names + self._state_rate_of_names
 
-        totals = self._eval_subprob.compute_totals(of=totals_of_names,
-                                                   wrt=self._totals_wrt_names,
-                                                   use_abs_names=False)
+        totals = self._compute_subprob_totals(self._eval_subprob, totals_of_names)
         if eval_state_rate_derivs:
             for state_name in self.state_options:
                 of_name = f'state_rate_collector.state_rates:{state_name}_rate'
@@ -993,6 +1208,10 @@ class RKIntegrationComp(om.ExplicitComponent):
                 y_t[of_rate_idxs, 0] = totals[of_rate_name, 'time']
                 y_t[of_rate2_idxs, 0] = totals[of_rate2_name, 'time']
 
+                y_θ[of_idxs, 0] = totals[of_name, 't_initial']
+                y_θ[of_rate_idxs, 0] = totals[of_rate_name, 't_initial']
+                y_θ[of_rate2_idxs, 0] = totals[of_rate2_name, 't_initial']
+
                 y_θ[of_idxs, 1] = totals[of_name, 't_duration']
                 y_θ[of_rate_idxs, 1] = totals[of_rate_name, 't_duration']
                 y_θ[of_rate2_idxs, 1] = totals[of_rate2_name, 't_duration']
@@ -1016,6 +1235,10 @@ class RKIntegrationComp(om.ExplicitComponent):
                 y_t[of_rate_idxs, 0] = totals[of_rate_name, 'time']
                 y_t[of_rate2_idxs, 0] = totals[of_rate2_name, 'time']
 
+                y_θ[of_idxs, 0] = totals[of_name, 't_initial']
+                y_θ[of_rate_idxs, 0] = totals[of_rate_name, 't_initial']
+                y_θ[of_rate2_idxs, 0] = totals[of_rate2_name, 't_initial']
+
                 y_θ[of_idxs, 1] = totals[of_name, 't_duration']
                 y_θ[of_rate_idxs, 1] = totals[of_rate_name, 't_duration']
                 y_θ[of_rate2_idxs, 1] = totals[of_rate2_name, 't_duration']
@@ -1053,7 +1276,8 @@ class RKIntegrationComp(om.ExplicitComponent):
                     py_puhat = totals[of_name, self._polynomial_control_input_names[pc_name_wrt]]
                     y_θ[idxs_of, idxs_wrt] = py_puhat.ravel()
 
-    def eval_f_derivs_vectorized(self, x, t, θ, f_x, f_t, f_θ, y_x=None, y_t=None, y_θ=None):
+    def eval_f_derivs_vectorized(self, x, t, θ, f_x, f_t, f_θ, y_x=None, y_t=None, y_θ=None,
+                                 subprob=None):
         """
         Evaluate the derivative of the ODE output rates wrt the inputs.
 
@@ -1065,68 +1289,76 @@ class RKIntegrationComp(om.ExplicitComponent):
 
         Parameters
         ----------
-        x : np.ndarray
-            A flattened, contiguous vector of the state values.
-        t : float
-            The current time of the integration.
+        x : np.ndarray (num_nodes, num_states, 1)
+            The state values at each node.
+        t : np.ndarray
+            The time at each node.
         θ : np.ndarray
             A flattened, contiguous vector of the ODE parameter values.
-        f_x : np.ndarray (num_stages, num_states, num_states)
+        f_x : np.ndarray (num_nodes, num_states, num_states) or None
             A matrix of the derivative of each element of the rates `f` wrt each value in `x`.
-        f_t : np.ndarray (num_stages, num_states, 1)
+        f_t : np.ndarray (num_nodes, num_states, 1) or None
             A matrix of the derivatives of each element of the rates `f` wrt `time`.
-        f_θ : np.ndarray (num_stages, num_states, num_θ)
+        f_θ : np.ndarray (num_nodes, num_states, num_θ) or None
             A matrix of the derivatives of each element of the rates `f` wrt the parameters `θ`.
-        y_x : np.ndarray (num_stages, num_y, num_states)
+        y_x : np.ndarray (num_nodes, num_y, num_states)
             A matrix of the derivative of each element of the outputs `y` wrt each value in `x`.
-        y_t : np.ndarray (num_stages, num_y, 1)
+        y_t : np.ndarray (num_nodes, num_y, 1)
             A matrix of the derivatives of each element of the outputs `y` wrt `time`.
-        y_θ : np.ndarray (num_stages, num_y, num_θ)
+        y_θ : np.ndarray (num_nodes, num_y, num_θ)
             A matrix of the derivatives of each element of the outputs `y` wrt the parameters `θ`.
+        subprob : om.Problem or None
+            The vectorized subproblem with num_nodes nodes to be evaluated.  If None, use
+            self._deriv_subprob, whose nodes are the stages of a step.
         """
-        rk = rk_methods[self.options['method']]
-        num_stages = len(rk['b'])
-        subprob = self._deriv_subprob
+        num_nodes = x.shape[0]
+        if subprob is None:
+            subprob = self._deriv_subprob
         ncin = self._num_control_input_nodes
 
-        self._subprob_run_model(x, t, θ, linearize=False)
+        self._subprob_run_model(x, t, θ, linearize=False, subprob=subprob)
 
-        totals = subprob.compute_totals(of=self._totals_of_names + self._state_rate_of_names,
-                                        wrt=self._totals_wrt_names,
-                                        use_abs_names=False)
+        eval_state_rate_derivs = f_x is not None and f_t is not None and f_θ is not None
 
-        for state_name, options in self.state_options.items():
-            size = np.prod(options['shape'])
-            name_of = f'state_rate_collector.state_rates:{state_name}_rate'
-            idxs_of = self.state_idxs[state_name]
-            f_t[:, idxs_of, 0] = np.diagonal(totals[name_of, 'time']).reshape((num_stages, size))
-
-            for state_name_wrt, options_wrt in self.state_options.items():
-                size_wrt = np.prod(options_wrt['shape'])
-                idxs_wrt = self.state_idxs[state_name_wrt]
-                px_px = totals[name_of, self._state_input_names[state_name_wrt]]
-                f_x[:, idxs_of, idxs_wrt] = np.diagonal(px_px).reshape((num_stages, size, size_wrt))
-
-            f_θ[:, idxs_of, 0] = totals[name_of, 't_initial']
-            f_θ[:, idxs_of, 1] = totals[name_of, 't_duration']
-
-            for param_name_wrt, options_wrt in self.parameter_options.items():
-                size_wrt = np.prod(options_wrt['shape'])
-                idxs_wrt = self._parameter_idxs_in_θ[param_name_wrt]
-                px_pp = totals[name_of, self._param_input_names[param_name_wrt]]
-                f_θ[:, idxs_of, idxs_wrt] = px_pp.reshape((num_stages, size, size_wrt))
-
-            for control_name_wrt, options_wrt in self.control_options.items():
-                size_wrt = np.prod(options_wrt['shape']) * ncin
-                idxs_wrt = self._control_idxs_in_θ[control_name_wrt]
-                px_puhat = totals[name_of, self._control_input_names[control_name_wrt]]
-                f_θ[:, idxs_of, idxs_wrt] = px_puhat.reshape((num_stages, size, size_wrt))
-
-            for pc_name_wrt, options_wrt in self.polynomial_control_options.items():
-                size_wrt = np.prod(options_wrt['shape']) * (options_wrt['order'] + 1)
-                idxs_wrt = self._polynomial_control_idxs_in_θ[pc_name_wrt]
-                px_puhat = totals[name_of, self._polynomial_control_input_names[pc_name_wrt]]
-                f_θ[:, idxs_of, idxs_wrt] = px_puhat.reshape((num_stages, size, size_wrt))
+        totals_of_names = self._totals_of_names
+        if eval_state_rate_derivs:
+            totals_of_names = totals_of_names + self._state_rate_of_names
+
+        totals = self._compute_subprob_totals(subprob, totals_of_names)
+
+        if eval_state_rate_derivs:
+            for state_name, options in self.state_options.items():
+                size = np.prod(options['shape'])
+                name_of = f'state_rate_collector.state_rates:{state_name}_rate'
+                idxs_of = self.state_idxs[state_name]
+                f_t[:, idxs_of, 0] = np.diagonal(totals[name_of, 'time']).reshape((num_nodes, size))
+
+                for state_name_wrt, options_wrt in self.state_options.items():
+                    size_wrt = np.prod(options_wrt['shape'])
+                    idxs_wrt = self.state_idxs[state_name_wrt]
+                    px_px = totals[name_of, self._state_input_names[state_name_wrt]]
+                    f_x[:, idxs_of, idxs_wrt] = np.diagonal(px_px).reshape((num_nodes, size, size_wrt))
+
+                f_θ[:, idxs_of, 0] = totals[name_of, 't_initial']
+                f_θ[:, idxs_of, 1] = totals[name_of, 't_duration']
+
+                for param_name_wrt, options_wrt in self.parameter_options.items():
+                    size_wrt = np.prod(options_wrt['shape'])
+                    idxs_wrt = self._parameter_idxs_in_θ[param_name_wrt]
+                    px_pp = totals[name_of, self._param_input_names[param_name_wrt]]
+                    f_θ[:, idxs_of, idxs_wrt] = px_pp.reshape((num_nodes, size, size_wrt))
+
+                for control_name_wrt, options_wrt in self.control_options.items():
+                    size_wrt = np.prod(options_wrt['shape']) * ncin
+                    idxs_wrt = self._control_idxs_in_θ[control_name_wrt]
+                    px_puhat = totals[name_of, self._control_input_names[control_name_wrt]]
+                    f_θ[:, idxs_of, idxs_wrt] = px_puhat.reshape((num_nodes, size, size_wrt))
+
+                for pc_name_wrt, options_wrt in self.polynomial_control_options.items():
+                    size_wrt = np.prod(options_wrt['shape']) * (options_wrt['order'] + 1)
+                    idxs_wrt = self._polynomial_control_idxs_in_θ[pc_name_wrt]
+                    px_puhat = totals[name_of, self._polynomial_control_input_names[pc_name_wrt]]
+                    f_θ[:, idxs_of, idxs_wrt] = px_puhat.reshape((num_nodes, size, size_wrt))
 
         if y_x is not None and y_t is not None and y_θ is not None:
             for control_name, options in self.control_options.items():
@@ -1141,17 +1373,21 @@ class RKIntegrationComp(om.ExplicitComponent):
                 idxs_of_rate = self._control_rate_idxs_in_y[control_name]
                 idxs_of_rate2 = self._control_rate2_idxs_in_y[control_name]
 
-                y_t[:, idxs_of, 0] = np.diagonal(totals[name_of, 'time']).reshape((num_stages, size_of))
-                y_t[:, idxs_of_rate, 0] = np.diagonal(totals[of_rate_name, 'time']).reshape((num_stages, size_of))
-                y_t[:, idxs_of_rate2, 0] = np.diagonal(totals[of_rate2_name, 'time']).reshape((num_stages, size_of))
+                y_t[:, idxs_of, 0] = np.diagonal(totals[name_of, 'time']).reshape((num_nodes, size_of))
+                y_t[:, idxs_of_rate, 0] = np.diagonal(totals[of_rate_name, 'time']).reshape((num_nodes, size_of))
+                y_t[:, idxs_of_rate2, 0] = np.diagonal(totals[of_rate2_name, 'time']).reshape((num_nodes, size_of))
+
+                y_θ[:, idxs_of, 0] = totals[name_of, 't_initial'].reshape((num_nodes, size_of))
+                y_θ[:, idxs_of_rate, 0] = totals[of_rate_name, 't_initial'].reshape((num_nodes, size_of))
+                y_θ[:, idxs_of_rate2, 0] = totals[of_rate2_name, 't_initial'].reshape((num_nodes, size_of))
 
-                y_θ[:, idxs_of, 1] = np.diagonal(totals[name_of, 't_duration'])
-                y_θ[:, idxs_of_rate, 1] = np.diagonal(totals[of_rate_name, 't_duration'])
-                y_θ[:, idxs_of_rate2, 1] = np.diagonal(totals[of_rate2_name, 't_duration'])
+                y_θ[:, idxs_of, 1] = totals[name_of, 't_duration'].reshape((num_nodes, size_of))
+                y_θ[:, idxs_of_rate, 1] = totals[of_rate_name, 't_duration'].reshape((num_nodes, size_of))
+                y_θ[:, idxs_of_rate2, 1] = totals[of_rate2_name, 't_duration'].reshape((num_nodes, size_of))
 
-                y_θ[:, idxs_of, idxs_wrt] = totals[name_of, wrt_name].reshape((num_stages, size_of, ncin))
-                y_θ[:, idxs_of_rate, idxs_wrt] = totals[of_rate_name, wrt_name].reshape((num_stages, size_of, ncin))
-                y_θ[:, idxs_of_rate2, idxs_wrt] = totals[of_rate2_name, wrt_name].reshape((num_stages, size_of, ncin))
+                y_θ[:, idxs_of, idxs_wrt] = totals[name_of, wrt_name].reshape((num_nodes, size_of, ncin))
+                y_θ[:, idxs_of_rate, idxs_wrt] = totals[of_rate_name, wrt_name].reshape((num_nodes, size_of, ncin))
+                y_θ[:, idxs_of_rate2, idxs_wrt] = totals[of_rate2_name, wrt_name].reshape((num_nodes, size_of, ncin))
 
             for polynomial_control_name, options in self.polynomial_control_options.items():
                 wrt_name = self._polynomial_control_input_names[polynomial_control_name]
@@ -1166,24 +1402,28 @@ class RKIntegrationComp(om.ExplicitComponent):
                 idxs_of_rate = self._polynomial_control_rate_idxs_in_y[polynomial_control_name]
                 idxs_of_rate2 = self._polynomial_control_rate2_idxs_in_y[polynomial_control_name]
 
-                y_t[:, idxs_of, 0] = np.diagonal(totals[name_of, 'time']).reshape((num_stages, size_of))
-                y_t[:, idxs_of_rate, 0] = np.diagonal(totals[of_rate_name, 'time']).reshape((num_stages, size_of))
-                y_t[:, idxs_of_rate2, 0] = np.diagonal(totals[of_rate2_name, 'time']).reshape((num_stages, size_of))
+                y_t[:, idxs_of, 0] = np.diagonal(totals[name_of, 'time']).reshape((num_nodes, size_of))
+                y_t[:, idxs_of_rate, 0] = np.diagonal(totals[of_rate_name, 'time']).reshape((num_nodes, size_of))
+                y_t[:, idxs_of_rate2, 0] = np.diagonal(totals[of_rate2_name, 'time']).reshape((num_nodes, size_of))
+
+                y_θ[:, idxs_of, 0] = totals[name_of, 't_initial']
+                y_θ[:, idxs_of_rate, 0] = totals[of_rate_name, 't_initial']
+                y_θ[:, idxs_of_rate2, 0] = totals[of_rate2_name, 't_initial']
 
                 y_θ[:, idxs_of, 1] = totals[name_of, 't_duration']
                 y_θ[:, idxs_of_rate, 1] = totals[of_rate_name, 't_duration']
                 y_θ[:, idxs_of_rate2, 1] = totals[of_rate2_name, 't_duration']
 
-                y_θ[:, idxs_of, idxs_wrt] = totals[name_of, wrt_name].reshape((num_stages, size_of, order + 1))
-                y_θ[:, idxs_of_rate, idxs_wrt] = totals[of_rate_name, wrt_name].reshape((num_stages, size_of, order + 1))
-                y_θ[:, idxs_of_rate2, idxs_wrt] = totals[of_rate2_name, wrt_name].reshape((num_stages, size_of, order + 1))
+                y_θ[:, idxs_of, idxs_wrt] = totals[name_of, wrt_name].reshape((num_nodes, size_of, order + 1))
+                y_θ[:, idxs_of_rate, idxs_wrt] = totals[of_rate_name, wrt_name].reshape((num_nodes, size_of, order + 1))
+                y_θ[:, idxs_of_rate2, idxs_wrt] = totals[of_rate2_name, wrt_name].reshape((num_nodes, size_of, order + 1))
 
             for name, options in self._filtered_timeseries_outputs.items():
                 idxs_of = self._timeseries_idxs_in_y[name]
                 name_of = options['path']
                 size_of = np.prod(options['shape'], dtype=int)
 
-                y_t[:, idxs_of, 0] = np.diagonal(totals[options['path'], 'time']).reshape((num_stages, size_of))
+                y_t[:, idxs_of, 0] = np.diagonal(totals[options['path'], 'time']).reshape((num_nodes, size_of))
 
                 y_θ[:, idxs_of, 0] = totals[name_of, 't_initial']
                 y_θ[:, idxs_of, 1] = totals[name_of, 't_duration']
@@ -1192,26 +1432,26 @@ class RKIntegrationComp(om.ExplicitComponent):
                     idxs_wrt = self.state_idxs[state_name_wrt]
                     size_wrt = np.prod(wrt_options['shape'], dtype=int)
                     py_px = totals[name_of, self._state_input_names[state_name_wrt]]
-                    y_x[:, idxs_of, idxs_wrt] = np.diagonal(py_px).reshape((num_stages, size_of, size_wrt))
+                    y_x[:, idxs_of, idxs_wrt] = np.diagonal(py_px).reshape((num_nodes, size_of, size_wrt))
 
                 for param_name_wrt, wrt_options in self.parameter_options.items():
                     idxs_wrt = self._parameter_idxs_in_θ[param_name_wrt]
                     size_wrt = np.prod(wrt_options['shape'], dtype=int)
                     py_pp = totals[name_of, self._param_input_names[param_name_wrt]]
-                    y_θ[:, idxs_of, idxs_wrt] = py_pp.reshape((num_stages, size_of, size_wrt))
+                    y_θ[:, idxs_of, idxs_wrt] = py_pp.reshape((num_nodes, size_of, size_wrt))
 
                 for control_name_wrt, wrt_options in self.control_options.items():
                     size_wrt = np.prod(wrt_options['shape']) * ncin
                     idxs_wrt = self._control_idxs_in_θ[control_name_wrt]
                     py_puhat = totals[name_of, self._control_input_names[control_name_wrt]]
-                    y_θ[:, idxs_of, idxs_wrt] = py_puhat.reshape((num_stages, size_of, size_wrt))
+                    y_θ[:, idxs_of, idxs_wrt] = py_puhat.reshape((num_nodes, size_of, size_wrt))
 
                 for pc_name_wrt, wrt_options in self.polynomial_control_options.items():
                     idxs_wrt = self._polynomial_control_idxs_in_θ[pc_name_wrt]
                     order = wrt_options['order']
                     size_wrt = np.prod(options_wrt['shape']) * (order + 1)
                     py_puhat = totals[name_of, self._polynomial_control_input_names[pc_name_wrt]]
-                    y_θ[:, idxs_of, idxs_wrt] = py_puhat.reshape((num_stages, size_of, order + 1))
+                    y_θ[:, idxs_of, idxs_wrt] = py_puhat.reshape((num_nodes, size_of, order + 1))
 
     def _propagate(self, inputs, derivs=None):
         """
@@ -1269,6 +1509,7 @@ class RKIntegrationComp(om.ExplicitComponent):
         dh_dZ = self._dh_dZ
         dXi_dZ = self._dXi_dZ
         dTi_dZ = self._dTi_dZ
+        sens = self._sensitivity_rows
 
         k_q = self._k_q
 
@@ -1303,12 +1544,15 @@ class RKIntegrationComp(om.ExplicitComponent):
             # On each segment, the total derivative of the stepsize h is a function of
             # the duration of the phase (the second element of the parameter vector after states)
             if derivs:
-                dh_dZ[row:row+N+1, 0, self.x_size+1] = seg_durations[seg_i] / θ[1] / N
+                dh_dZ[sens[row:row+N+1], 0, self.x_size+1] = seg_durations[seg_i] / θ[1] / N
 
             rm1 = row
             row = row + 1
 
             for q in range(N):
+                # The rows of the sensitivity storage at the start and end of the step.
+                s_rm1, s_row = sens[rm1], sens[row]
+
                 # Compute the state rates and their partials at the start of the step
                 self.eval_f(x[rm1, ...], t[rm1, 0], θ, k_q[0, ...], y=self._y[rm1, ...])
 
@@ -1318,8 +1562,8 @@ class RKIntegrationComp(om.ExplicitComponent):
                                        f_x, f_t, f_θ,
                                        y_x, y_t, y_θ)
 
-                    dkq_dZ[0, ...] = f_t @ dt_dZ[rm1, ...] + f_x @ dx_dZ[rm1, ...] + f_θ @ dθ_dZ
-                    dy_dZ[rm1, ...] = y_x @ dx_dZ[rm1, ...] + y_t @ dt_dZ[rm1, ...] + y_θ @ dθ_dZ
+                    dkq_dZ[0, ...] = f_t @ dt_dZ[s_rm1, ...] + f_x @ dx_dZ[s_rm1, ...] + f_θ @ dθ_dZ
+                    dy_dZ[s_rm1, ...] = y_x @ dx_dZ[s_rm1, ...] + y_t @ dt_dZ[s_rm1, ...] + y_θ @ dθ_dZ
 
                 for i in range(1, num_stages):
                     T_i = t[rm1, ...] + c[i] * h
@@ -1330,10 +1574,10 @@ class RKIntegrationComp(om.ExplicitComponent):
 
                     if derivs:
                         self.eval_f_derivs(X_i, T_i, θ, f_x, f_t, f_θ)
-                        dTi_dZ[...] = dt_dZ[row - 1, ...] + c[i] * dh_dZ[rm1, ...]
+                        dTi_dZ[...] = dt_dZ[s_rm1, ...] + c[i] * dh_dZ[s_rm1, ...]
                         a_tdot_dkqdz = np.tensordot(a[i, :i], dkq_dZ[:i, ...], axes=(0, 0))
                         # a_tdot_dkqdz = np.einsum('i,ijk->jk', a[i, :i], dkq_dZ[:i, ...])
-                        dXi_dZ[...] = dx_dZ[rm1, ...] + a_tdot_k @ dh_dZ[rm1, ...] + h * a_tdot_dkqdz
+                        dXi_dZ[...] = dx_dZ[s_rm1, ...] + a_tdot_k @ dh_dZ[s_rm1, ...] + h * a_tdot_dkqdz
                         dkq_dZ[i, ...] = f_t @ dTi_dZ + f_x @ dXi_dZ + f_θ @ dθ_dZ
 
                 b_tdot_kq = np.tensordot(b, k_q, axes=(0, 0))
@@ -1344,20 +1588,22 @@ class RKIntegrationComp(om.ExplicitComponent):
                 if derivs:
                     b_tdot_dkqdz = np.tensordot(b, dkq_dZ, axes=(0, 0))
                     # b_tdot_dkqdz = np.einsum('i,ijk->jk', b, dkq_dZ)
-                    dx_dZ[row, ...] = dx_dZ[rm1, ...] + b_tdot_kq @ dh_dZ[rm1, ...] + h * b_tdot_dkqdz
-                    dt_dZ[row, ...] = dt_dZ[rm1, ...] + dh_dZ[rm1, ...]
+                    dx_dZ[s_row, ...] = dx_dZ[s_rm1, ...] + b_tdot_kq @ dh_dZ[s_rm1, ...] + h * b_tdot_dkqdz
+                    dt_dZ[s_row, ...] = dt_dZ[s_rm1, ...] + dh_dZ[s_rm1, ...]
 
                 rm1 = row
                 row = row + 1
 
+            s_rm1 = sens[rm1]
+
             # Evaluate the ODE at the last point in the segment (with the final times and states)
             self.eval_f(x[rm1, ...], t[rm1, 0], θ, k_q[0, ...], y=y[rm1, ...])
 
             if derivs:
                 self.eval_f_derivs(x[rm1, ...], t[rm1, 0], θ, f_x, f_t, f_θ, y_x, y_t, y_θ)
-                dy_dZ[rm1, ...] = y_x @ dx_dZ[rm1, ...] + y_t @ dt_dZ[rm1, ...] + y_θ @ dθ_dZ
+                dy_dZ[s_rm1, ...] = y_x @ dx_dZ[s_rm1, ...] + y_t @ dt_dZ[s_rm1, ...] + y_θ @ dθ_dZ
 
-    def _propagate_vectorized_derivs(self, inputs):
+    def _propagate_vectorized_derivs(self, inputs, adapt=True, derivs=True):
         """
         Propagate the states from t_initial to t_initial + t_duration, optionally computing
         the derivatives along the way and caching the current time and state values.
@@ -1369,12 +1615,13 @@ class RKIntegrationComp(om.ExplicitComponent):
         ----------
         inputs : vector
             The inputs from the compute call to the RKIntegrationComp.
-        outputs : vector
-            The outputs from the compute call to the RKIntegrationComp.
-        derivs : vector or None
-            If derivatives are to be calculated in a forward mode, this is the vector of partials
-            from the compute_partials call to this component.  If derivatives are not to be
-            computed, this should be None.
+        adapt : bool
+            If True and the adaptive option is set, choose new step sizes in each segment.
+            Otherwise, use the step sizes from the last propagation.
+        derivs : bool
+            If True, propagate the total derivatives of the states wrt the integration
+            parameters.  When False in an AdjointRKIntegrationComp, the stage values of each
+            step are recorded for the derivative sweeps instead.
         """
         gd = self._grid_data
         N = self.options['num_steps_per_segment']
@@ -1414,12 +1661,17 @@ class RKIntegrationComp(om.ExplicitComponent):
         dh_dZ = self._dh_dZ
         dXi_dZ = self._dXi_dZ
         dTi_dZ = self._dTi_dZ
+        sens = self._sensitivity_rows
 
         k_q = self._k_q
 
         T_i = self._T_i
         X_i = self._X_i
 
+        record_steps = self._record_steps
+        if record_steps:
+            self._step_dh_dtd[...] = 0.0
+
         # Cache the tensordot product of a and k_q when integrating through each stage.
         a_tdot_k = {}
 
@@ -1437,6 +1689,14 @@ class RKIntegrationComp(om.ExplicitComponent):
 
         seg_durations = θ[1] * np.diff(gd.segment_ends) / 2.0
 
+        adaptive = self.options['adaptive']
+        if adaptive:
+            # The error estimate of each of the embedded pairs is fourth order.
+            b_err = b - rk['b_star']
+            atol = self.options['atol']
+            rtol = self.options['rtol']
+        step_fracs = self._step_fractions
+
         # step counter
         row = 0
 
@@ -1445,52 +1705,116 @@ class RKIntegrationComp(om.ExplicitComponent):
             self._deriv_subprob.model._get_subsystem('ode_eval').set_segment_index(seg_i)
 
             # Initialize, t, x, h, and derivatives for the start of the current segment
-            self._initialize_segment(row, inputs, derivs=True)
+            self._initialize_segment(row, inputs, derivs=derivs)
 
-            h = np.asarray(seg_durations[seg_i] / N, dtype=self._DTYPE)
-            # On each segment, the total derivative of the stepsize h is a function of
-            # the duration of the phase (the second element of the parameter vector after states)
-            dh_dZ[row:row+N+1, 0, self.x_size+1] = seg_durations[seg_i] / θ[1] / N
+            if adaptive and adapt:
+                step_fracs[seg_i, :] = 0.0
+                seg_frac_done = 0.0
+                h_frac_next = 1.0 / N
 
             rm1 = row
             row = row + 1
 
             for q in range(N):
+                # The rows of the sensitivity storage at the start and end of the step.
+                s_rm1, s_row = sens[rm1], sens[row]
+
+                if adaptive and adapt and seg_frac_done < 1.0:
+                    # Never take a step so small that the remainder of the segment cannot
+                    # be covered by the remaining steps.
+                    h_frac_min = (1.0 - seg_frac_done) / (N - q)
+                    h_frac = min(max(h_frac_next, h_frac_min), 1.0 - seg_frac_done)
+                    if 1.0 - seg_frac_done - h_frac < 1.0E-10:
+                        h_frac = 1.0 - seg_frac_done
+                elif adaptive:
+                    h_frac = step_fracs[seg_i, q]
+                else:
+                    h_frac = 1.0 / N
+
+                if h_frac == 0.0:
+                    # The segment was completed in fewer than N steps, carry the final values
+                    # through the unused rows.
+                    x[row, ...] = x[rm1, ...]
+                    t[row, ...] = t[rm1, ...]
+                    if derivs:
+                        dx_dZ[s_row, ...] = dx_dZ[s_rm1, ...]
+                        dt_dZ[s_row, ...] = dt_dZ[s_rm1, ...]
+                    rm1 = row
+                    row = row + 1
+                    continue
+
                 # Compute the state rates and their partials at the start of the step
                 T_i[0, 0] = t[rm1, 0]
                 X_i[0, ...] = x[rm1, ...]
 
                 self.eval_f(X_i[0, ...], T_i[0, 0], θ, k_q[0, ...], y=y[rm1, ...])
 
-                # Now evaluate the ODE at each stage of the step.
-                # States in subsequent ODE calls depend on the results of prior calls, so
-                # the state values cannot be vectorized.
-                for i in range(1, num_stages):
-                    T_i[i, ...] = t[rm1, ...] + c[i] * h
-
-                    a_tdot_k[i] = np.tensordot(a[i, :i], k_q[:i, ...], axes=(0, 0))
-                    # a_tdot_k = np.einsum('i,ijk->jk', a[i, :i], self._k_q[:i, ...])
-                    X_i[i, ...] = x[rm1, ...] + h * a_tdot_k[i]
+                while True:
+                    h = np.asarray(h_frac * seg_durations[seg_i], dtype=self._DTYPE)
+
+                    # Now evaluate the ODE at each stage of the step.
+                    # States in subsequent ODE calls depend on the results of prior calls, so
+                    # the state values cannot be vectorized.
+                    for i in range(1, num_stages):
+                        T_i[i, ...] = t[rm1, ...] + c[i] * h
+
+                        a_tdot_k[i] = np.tensordot(a[i, :i], k_q[:i, ...], axes=(0, 0))
+                        # a_tdot_k = np.einsum('i,ijk->jk', a[i, :i], self._k_q[:i, ...])
+                        X_i[i, ...] = x[rm1, ...] + h * a_tdot_k[i]
+
+                        self.eval_f(X_i[i, ...], T_i[i, 0], θ, k_q[i, ...])
+
+                    if not (adaptive and adapt):
+                        break
+
+                    # Estimate the local error of the step and the step size to be used next.
+                    x_new = x[rm1, ...] + h * np.tensordot(b, k_q, axes=(0, 0))
+                    err_scale = atol + rtol * np.maximum(np.abs(x[rm1, ...].real), np.abs(x_new.real))
+                    err = h.real * np.tensordot(b_err, k_q.real, axes=(0, 0)) / err_scale
+                    err_norm = np.sqrt(np.mean(err ** 2)) if err.size > 0 else 0.0
+                    factor = 5.0 if err_norm == 0.0 else min(5.0, max(0.2, 0.9 * err_norm ** -0.2))
+
+                    if err_norm <= 1.0 or h_frac <= h_frac_min:
+                        step_fracs[seg_i, q] = h_frac
+                        seg_frac_done += h_frac
+                        if seg_frac_done > 1.0 - 1.0E-12:
+                            seg_frac_done = 1.0
+                        h_frac_next = h_frac * factor
+                        break
+
+                    h_frac = max(h_frac * factor, h_frac_min)
+
+                if record_steps:
+                    # Store the stages of the accepted step for the linearization and reverse sweep.
+                    self._step_X[rm1, ...] = X_i
+                    self._step_T[rm1, ...] = T_i
+                    self._step_k[rm1, ...] = k_q
+                    self._step_h[rm1] = h
+                    self._step_dh_dtd[rm1] = 0.5 * (gd.segment_ends[seg_i + 1] - gd.segment_ends[seg_i]) * h_frac
 
-                    self.eval_f(X_i[i, ...], T_i[i, 0], θ, k_q[i, ...])
+                if derivs:
+                    # On each segment, the total derivative of the stepsize h is a function of the
+                    # duration of the phase (the second element of the parameter vector after states)
+                    dh_dZ[s_rm1, 0, self.x_size+1] = seg_durations[seg_i] / θ[1] * h_frac
 
-                # Now make a single vectorized derivs call to evaluate the derivatives at all stages
-                self.eval_f_derivs_vectorized(X_i, T_i, θ,
-                                              f_x, f_t, f_θ,
-                                              y_x, y_t, y_θ)
+                    # Now make a single vectorized derivs call to evaluate the derivatives at all stages
+                    self.eval_f_derivs_vectorized(X_i, T_i, θ,
+                                                  f_x, f_t, f_θ,
+                                                  y_x, y_t, y_θ)
 
-                # Accumulate the derivatives through the stages
-                dkq_dZ[0, ...] = f_t[0, ...] @ dt_dZ[rm1, ...] + f_x[0, ...] @ dx_dZ[rm1, ...] + f_θ[0, ...] @ dθ_dZ
+                    # Accumulate the derivatives through the stages
+                    dkq_dZ[0, ...] = f_t[0, ...] @ dt_dZ[s_rm1, ...] + f_x[0, ...] @ dx_dZ[s_rm1, ...] + f_θ[0, ...] @ dθ_dZ
 
-                if num_y > 0:
-                    dy_dZ[rm1, ...] = y_x[0, ...] @ dx_dZ[rm1, ...] + y_t[0, ...] @ dt_dZ[rm1, ...] + y_θ[0, ...] @ dθ_dZ
+                    if num_y > 0:
+                        dy_dZ[s_rm1, ...] = y_x[0, ...] @ dx_dZ[s_rm1, ...] + y_t[0, ...] @ dt_dZ[s_rm1, ...] + \
+                            y_θ[0, ...] @ dθ_dZ
 
-                for i in range(1, num_stages):
-                    dTi_dZ[...] = dt_dZ[rm1, ...] + c[i] * dh_dZ[rm1, ...]
-                    a_tdot_dkqdz = np.tensordot(a[i, :i], dkq_dZ[:i, ...], axes=(0, 0))
-                    # a_tdot_dkqdz = np.einsum('i,ijk->jk', a[i, :i], self._dkq_dZ[:i, ...])
-                    dXi_dZ[...] = dx_dZ[rm1, ...] + a_tdot_k[i] @ dh_dZ[rm1, ...] + h * a_tdot_dkqdz
-                    dkq_dZ[i, ...] = f_t[i, ...] @ dTi_dZ + f_x[i, ...] @ dXi_dZ + f_θ[i, ...] @ dθ_dZ
+                    for i in range(1, num_stages):
+                        dTi_dZ[...] = dt_dZ[s_rm1, ...] + c[i] * dh_dZ[s_rm1, ...]
+                        a_tdot_dkqdz = np.tensordot(a[i, :i], dkq_dZ[:i, ...], axes=(0, 0))
+                        # a_tdot_dkqdz = np.einsum('i,ijk->jk', a[i, :i], self._dkq_dZ[:i, ...])
+                        dXi_dZ[...] = dx_dZ[s_rm1, ...] + a_tdot_k[i] @ dh_dZ[s_rm1, ...] + h * a_tdot_dkqdz
+                        dkq_dZ[i, ...] = f_t[i, ...] @ dTi_dZ + f_x[i, ...] @ dXi_dZ + f_θ[i, ...] @ dθ_dZ
 
                 # Compute x and t at the end of the step.
                 b_tdot_kq = np.tensordot(b, k_q, axes=(0, 0))
@@ -1498,21 +1822,181 @@ class RKIntegrationComp(om.ExplicitComponent):
                 x[row, ...] = x[rm1, ...] + h * b_tdot_kq
                 t[row, 0] = t[rm1, 0] + h
 
-                # Compute the derivatives of x and t wrt Z at the end of the step.
-                b_tdot_dkqdz = np.tensordot(b, self._dkq_dZ, axes=(0, 0))
-                # b_tdot_dkqdz = np.einsum('i,ijk->jk', b, self._dkq_dZ)
-                dx_dZ[row, ...] = dx_dZ[rm1, ...] + b_tdot_kq @ dh_dZ[rm1, ...] + h * b_tdot_dkqdz
-                dt_dZ[row, ...] = dt_dZ[rm1, ...] + dh_dZ[rm1, ...]
+                if derivs:
+                    # Compute the derivatives of x and t wrt Z at the end of the step.
+                    b_tdot_dkqdz = np.tensordot(b, self._dkq_dZ, axes=(0, 0))
+                    # b_tdot_dkqdz = np.einsum('i,ijk->jk', b, self._dkq_dZ)
+                    dx_dZ[s_row, ...] = dx_dZ[s_rm1, ...] + b_tdot_kq @ dh_dZ[s_rm1, ...] + h * b_tdot_dkqdz
+                    dt_dZ[s_row, ...] = dt_dZ[s_rm1, ...] + dh_dZ[s_rm1, ...]
 
                 rm1 = row
                 row = row + 1
 
+            s_rm1 = sens[rm1]
+
             # Evaluate the ODE at the last point in the segment (with the final times and states)
             self.eval_f(x[rm1, ...], t[rm1, 0], θ, k_q[0, ...], y=y[rm1, ...])
-            self.eval_f_derivs(x[rm1, ...], t[rm1, 0], θ,
-                               f_x=None, f_t=None, f_θ=None,
-                               y_x=y_x[0, ...], y_t=y_t[0, ...], y_θ=y_θ[0, ...])
-            dy_dZ[rm1, ...] = y_x[0, ...] @ dx_dZ[rm1, ...] + y_t[0, ...] @ dt_dZ[rm1, ...] + y_θ[0, ...] @ dθ_dZ
+
+            if derivs:
+                self.eval_f_derivs(x[rm1, ...], t[rm1, 0], θ,
+                                   f_x=None, f_t=None, f_θ=None,
+                                   y_x=y_x[0, ...], y_t=y_t[0, ...], y_θ=y_θ[0, ...])
+                dy_dZ[s_rm1, ...] = y_x[0, ...] @ dx_dZ[s_rm1, ...] + y_t[0, ...] @ dt_dZ[s_rm1, ...] + \
+                    y_θ[0, ...] @ dθ_dZ
+
+    def _propagate_multiple_shooting(self, inputs, derivs=True):
+        """
+        Propagate the states of all segments simultaneously from their given initial values.
+
+        In multiple shooting mode the segments are independent of each other.  Each step is
+        taken in every segment at once, so that the ODE is evaluated at a given stage in all
+        segments with a single call to the vectorized evaluation subproblem, and the derivatives
+        at all stages of all segments are obtained with a single call to the derivative
+        subproblem.
+
+        Parameters
+        ----------
+        inputs : vector
+            The inputs from the compute call to the RKIntegrationComp.
+        derivs : bool
+            If True, propagate the total derivatives of the states wrt the integration
+            parameters.
+        """
+        gd = self._grid_data
+        N = self.options['num_steps_per_segment']
+        num_seg = gd.num_segments
+
+        # RK Constants
+        rk = rk_methods[self.options['method']]
+        a = rk['a']
+        b = rk['b']
+        c = rk['c']
+        num_stages = len(b)
+        num_nodes = num_seg * num_stages
+
+        # The rows of the segments are contiguous, so view the storage as (segment, step).
+        seg_shape = (num_seg, N + 1)
+        x = self._x.reshape(seg_shape + self._x.shape[1:])
+        t = self._t.reshape(seg_shape)
+        y = self._y.reshape(seg_shape + self._y.shape[1:])
+        θ = self._θ
+        num_y = self.y_size
+
+        θ[0] = inputs['t_initial'].copy()
+        θ[1] = inputs['t_duration'].copy()
+
+        for name in self.parameter_options:
+            θ[self._parameter_idxs_in_θ[name], 0] = inputs[f'parameters:{name}'].ravel()
+
+        for name in self.control_options:
+            θ[self._control_idxs_in_θ[name], 0] = inputs[f'controls:{name}'].ravel()
+
+        for name in self.polynomial_control_options:
+            θ[self._polynomial_control_idxs_in_θ[name], 0] = inputs[f'polynomial_controls:{name}'].ravel()
+
+        # The nodes of the evaluation subproblem are the segments, and those of the derivative
+        # subproblem are the stages of each segment.
+        seg_idxs = np.arange(num_seg, dtype=int)
+        self._eval_subprob.model._get_subsystem('ode_eval').set_segment_index(seg_idxs)
+        self._deriv_subprob.model._get_subsystem('ode_eval').set_segment_index(np.repeat(seg_idxs, num_stages))
+
+        # The start time of each segment as a fraction of the phase duration, and the step sizes.
+        seg_start_frac = 0.5 * (gd.segment_ends[:-1] - gd.segment_ends[0])
+        seg_durations = θ[1] * np.diff(gd.segment_ends) / 2.0
+        h = seg_durations / N
+        h_col = h[:, np.newaxis, np.newaxis]
+
+        for name in self.state_options:
+            x[:, 0, self.state_idxs[name], 0] = inputs[self._state_input_names[name]].reshape((num_seg, -1))
+        t[:, 0] = θ[0, 0] + θ[1, 0] * seg_start_frac
+
+        k_q = self._k_q
+        T_i = self._T_i[..., 0]
+        X_i = self._X_i
+        a_tdot_k = {}
+
+        if derivs:
+            num_x = self.x_size
+            x0_size = self.x0_size
+            dx_dZ = self._dx_dZ
+            dt_dZ = self._dt_dZ
+            dy_dZ = self._dy_dZ
+
+            # The rows of the sensitivity storage of each step of each segment.
+            sens = self._sensitivity_rows.reshape(seg_shape)
+            dθ_dZ = self._dθ_dZ
+            dkq_dZ = self._dkq_dZ
+
+            # The initial state of each segment depends only on its own block of Z.
+            dx_dZ[...] = 0.0
+            for seg_i in range(num_seg):
+                dx_dZ[sens[seg_i, 0], :, seg_i * num_x:(seg_i + 1) * num_x] = np.eye(num_x, dtype=self._DTYPE)
+            dt_dZ[...] = 0.0
+            dt_dZ[sens[:, 0], 0, x0_size] = 1.0
+            dt_dZ[sens[:, 0], 0, x0_size+1] = seg_start_frac
+
+            # The step size in each segment is a function of t_duration only.
+            dh_dZ = np.zeros((num_seg, 1, self.Z_size), dtype=self._DTYPE)
+            dh_dZ[:, 0, x0_size+1] = h / θ[1, 0]
+
+            f_x = self._f_x_vec.reshape((num_seg, num_stages) + self._f_x_vec.shape[1:])
+            f_t = self._f_t_vec.reshape((num_seg, num_stages) + self._f_t_vec.shape[1:])
+            f_θ = self._f_θ_vec.reshape((num_seg, num_stages) + self._f_θ_vec.shape[1:])
+            y_x = self._y_x_vec.reshape((num_seg, num_stages) + self._y_x_vec.shape[1:])
+            y_t = self._y_t_vec.reshape((num_seg, num_stages) + self._y_t_vec.shape[1:])
+            y_θ = self._y_θ_vec.reshape((num_seg, num_stages) + self._y_θ_vec.shape[1:])
+
+        for q in range(N):
+            # Evaluate each stage in all segments at once.
+            T_i[:, 0] = t[:, q]
+            X_i[:, 0, ...] = x[:, q, ...]
+            self.eval_f_vectorized(X_i[:, 0, ...], T_i[:, 0], θ, k_q[:, 0, ...], y=y[:, q, ...])
+
+            for i in range(1, num_stages):
+                T_i[:, i] = t[:, q] + c[i] * h
+                a_tdot_k[i] = np.tensordot(k_q[:, :i, ...], a[i, :i], axes=(1, 0))
+                X_i[:, i, ...] = x[:, q, ...] + h_col * a_tdot_k[i]
+                self.eval_f_vectorized(X_i[:, i, ...], T_i[:, i], θ, k_q[:, i, ...])
+
+            if derivs:
+                # Evaluate the derivatives at every stage of every segment in a single call.
+                self.eval_f_derivs_vectorized(X_i.reshape((num_nodes,) + X_i.shape[2:]), T_i.ravel(), θ,
+                                              self._f_x_vec, self._f_t_vec, self._f_θ_vec,
+                                              self._y_x_vec, self._y_t_vec, self._y_θ_vec)
+
+                dkq_dZ[:, 0, ...] = f_t[:, 0, ...] @ dt_dZ[sens[:, q], ...] + f_x[:, 0, ...] @ dx_dZ[sens[:, q], ...] + \
+                    f_θ[:, 0, ...] @ dθ_dZ
+
+                if num_y > 0:
+                    dy_dZ[sens[:, q], ...] = y_x[:, 0, ...] @ dx_dZ[sens[:, q], ...] + y_t[:, 0, ...] @ dt_dZ[sens[:, q], ...] + \
+                        y_θ[:, 0, ...] @ dθ_dZ
+
+                for i in range(1, num_stages):
+                    dTi_dZ = dt_dZ[sens[:, q], ...] + c[i] * dh_dZ
+                    a_tdot_dkqdz = np.tensordot(dkq_dZ[:, :i, ...], a[i, :i], axes=(1, 0))
+                    dXi_dZ = dx_dZ[sens[:, q], ...] + a_tdot_k[i] @ dh_dZ + h_col * a_tdot_dkqdz
+                    dkq_dZ[:, i, ...] = f_t[:, i, ...] @ dTi_dZ + f_x[:, i, ...] @ dXi_dZ + f_θ[:, i, ...] @ dθ_dZ
+
+            # Compute x and t at the end of the step in each segment.
+            b_tdot_kq = np.tensordot(k_q, b, axes=(1, 0))
+            x[:, q+1, ...] = x[:, q, ...] + h_col * b_tdot_kq
+            t[:, q+1] = t[:, q] + h
+
+            if derivs:
+                b_tdot_dkqdz = np.tensordot(dkq_dZ, b, axes=(1, 0))
+                dx_dZ[sens[:, q+1], ...] = dx_dZ[sens[:, q], ...] + b_tdot_kq @ dh_dZ + h_col * b_tdot_dkqdz
+                dt_dZ[sens[:, q+1], ...] = dt_dZ[sens[:, q], ...] + dh_dZ
+
+        # Evaluate the ODE at the last point in each segment (with the final times and states)
+        self.eval_f_vectorized(x[:, N, ...], t[:, N], θ, k_q[:, 0, ...], y=y[:, N, ...])
+
+        if derivs and num_y > 0:
+            y_x = self._y_x_vec[:num_seg, ...]
+            y_t = self._y_t_vec[:num_seg, ...]
+            y_θ = self._y_θ_vec[:num_seg, ...]
+            self.eval_f_derivs_vectorized(x[:, N, ...], t[:, N], θ, f_x=None, f_t=None, f_θ=None,
+                                          y_x=y_x, y_t=y_t, y_θ=y_θ, subprob=self._eval_subprob)
+            dy_dZ[sens[:, N], ...] = y_x @ dx_dZ[sens[:, N], ...] + y_t @ dt_dZ[sens[:, N], ...] + y_θ @ dθ_dZ
 
     def compute(self, inputs, outputs):
         """
@@ -1525,9 +2009,18 @@ class RKIntegrationComp(om.ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        self._inputs_cache = inputs.asarray()
-        # self._propagate(inputs)
-        self._propagate_vectorized_derivs(inputs)
+        # The derivative subproblem is real-valued, so under complex step the sensitivities are
+        # not propagated.  They are propagated by compute_partials once complex step is done.
+        if self.under_complex_step:
+            derivs = False
+        else:
+            derivs = not self._record_steps
+            self._inputs_cache = inputs.asarray(copy=True)
+
+        if self.options['multiple_shooting']:
+            self._propagate_multiple_shooting(inputs, derivs=derivs)
+        else:
+            self._propagate_vectorized_derivs(inputs, derivs=derivs)
 
         # Unpack the outputs
         idxs = self._output_src_idxs
@@ -1565,6 +2058,22 @@ class RKIntegrationComp(om.ExplicitComponent):
             oname = self._timeseries_output_names[name]
             outputs[oname] = self._y[idxs, self._timeseries_idxs_in_y[name]]
 
+    def _inputs_changed(self, inputs):
+        """
+        Return True if the inputs differ from those of the last propagation of the sensitivities.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+
+        Returns
+        -------
+        bool
+            True if the propagation must be repeated before computing the derivatives.
+        """
+        return self._inputs_cache is None or np.max(np.abs(self._inputs_cache - inputs.asarray())) > 1.0E-16
+
     def compute_partials(self, inputs, partials):
         """
         Compute derivatives of propagated states wrt the inputs.
@@ -1580,12 +2089,18 @@ class RKIntegrationComp(om.ExplicitComponent):
         dx_dZ = self._dx_dZ
         dy_dZ = self._dy_dZ
 
-        if np.max(np.abs(self._inputs_cache - inputs.asarray())) > 1.0E-16:
-            self._propagate_vectorized_derivs(inputs)
+        if self._inputs_changed(inputs):
+            self._inputs_cache = inputs.asarray(copy=True)
+            if self.options['multiple_shooting']:
+                self._propagate_multiple_shooting(inputs)
+            else:
+                self._propagate_vectorized_derivs(inputs, adapt=False)
 
-        idxs = self._output_src_idxs
-        partials['time', 't_duration'] = dt_dZ[idxs, 0, self.x_size+1]
-        partials['time_phase', 't_duration'] = dt_dZ[idxs, 0, self.x_size+1]
+        # The rows of the sensitivity storage of the output rows
+        idxs = self._sensitivity_rows[self._output_src_idxs]
+        x0_size = self.x0_size
+        partials['time', 't_duration'] = dt_dZ[idxs, 0, x0_size+1]
+        partials['time_phase', 't_duration'] = dt_dZ[idxs, 0, x0_size+1]
 
         for state_name in self.state_options:
             of = self._state_output_names[state_name]
@@ -1593,13 +2108,13 @@ class RKIntegrationComp(om.ExplicitComponent):
             # Unpack the derivatives
             of_rows = self.state_idxs[state_name]
 
-            partials[of, 't_initial'] = dx_dZ[idxs, of_rows, self.x_size]
-            partials[of, 't_duration'] = dx_dZ[idxs, of_rows, self.x_size+1]
+            partials[of, 't_initial'] = dx_dZ[idxs, of_rows, x0_size]
+            partials[of, 't_duration'] = dx_dZ[idxs, of_rows, x0_size+1]
 
             for wrt_state_name in self.state_options:
                 wrt = self._state_input_names[wrt_state_name]
                 wrt_cols = self._state_idxs_in_Z[wrt_state_name]
-                partials[of, wrt] = dx_dZ[idxs, of_rows, wrt_cols]
+                partials[of, wrt] = dx_dZ[idxs, of_rows][..., wrt_cols]
 
             for wrt_param_name in self.parameter_options:
                 wrt = self._param_input_names[wrt_param_name]
@@ -1626,7 +2141,7 @@ class RKIntegrationComp(om.ExplicitComponent):
             of_rate_rows = self._control_rate_idxs_in_y[control_name]
             of_rate2_rows = self._control_rate2_idxs_in_y[control_name]
 
-            wrt_cols = self.x_size + 1
+            wrt_cols = x0_size + 1
             partials[of_rate, 't_duration'] = dy_dZ[idxs, of_rate_rows, wrt_cols]
             partials[of_rate2, 't_duration'] = dy_dZ[idxs, of_rate2_rows, wrt_cols]
 
@@ -1647,7 +2162,7 @@ class RKIntegrationComp(om.ExplicitComponent):
             of_rate_rows = self._polynomial_control_rate_idxs_in_y[name]
             of_rate2_rows = self._polynomial_control_rate2_idxs_in_y[name]
 
-            wrt_cols = self.x_size + 1
+            wrt_cols = x0_size + 1
             partials[of_rate, 't_duration'] = dy_dZ[idxs, of_rate_rows, wrt_cols]
             partials[of_rate2, 't_duration'] = dy_dZ[idxs, of_rate2_rows, wrt_cols]
 
@@ -1662,13 +2177,13 @@ class RKIntegrationComp(om.ExplicitComponent):
             of = self._timeseries_output_names[name]
             of_rows = self._timeseries_idxs_in_y[name]
 
-            partials[of, 't_initial'] = dy_dZ[idxs, of_rows, self.x_size]
-            partials[of, 't_duration'] = dy_dZ[idxs, of_rows, self.x_size+1]
+            partials[of, 't_initial'] = dy_dZ[idxs, of_rows, x0_size]
+            partials[of, 't_duration'] = dy_dZ[idxs, of_rows, x0_size+1]
 
             for wrt_state_name in self.state_options:
                 wrt = self._state_input_names[wrt_state_name]
                 wrt_cols = self._state_idxs_in_Z[wrt_state_name]
-                partials[of, wrt] = dy_dZ[idxs, of_rows, wrt_cols]
+                partials[of, wrt] = dy_dZ[idxs, of_rows][..., wrt_cols]
 
             for wrt_param_name in self.parameter_options:
                 wrt = self._param_input_names[wrt_param_name]
@@ -1684,3 +2199,471 @@ class RKIntegrationComp(om.ExplicitComponent):
                 wrt = self._polynomial_control_input_names[wrt_pc_name]
                 wrt_cols = self._polynomial_control_idxs_in_Z[wrt_pc_name]
                 partials[of, wrt] = dy_dZ[idxs, of_rows, wrt_cols]
+
+
+class AdjointRKIntegrationComp(RKIntegrationComp):
+    """
+    An RKIntegrationComp which provides its derivatives through matrix-free products.
+
+    The integration records the stages of each accepted step, the linearization caches the
+    partials of the ODE at those stages, and compute_jacvec_product propagates tangents forward
+    or seeds backward through the steps.  Reverse products are a single backward sweep, so their
+    cost scales with the number of outputs rather than the number of inputs, and the total
+    derivatives wrt every input are never propagated or stored.
+
+    Parameters
+    ----------
+    ode_class : class
+        The class of the OpenMDAO system to be used to evaluate the ODE in this Group.
+    time_options : OptionsDictionary
+        OptionsDictionary of time options.
+    state_options : dict of {str: OptionsDictionary}
+        For each state variable, a dictionary of its options, keyed by name.
+    parameter_options : dict of {str: OptionsDictionary}
+        For each parameter, a dictionary of its options, keyed by name.
+    control_options : dict of {str: OptionsDictionary}
+        For each control variable, a dictionary of its options, keyed by name.
+    polynomial_control_options : dict of {str: OptionsDictionary}
+        For each polynomial variable, a dictionary of its options, keyed by name.
+    timeseries_options : dict
+        The timeseries options associated with the parent phase.
+    grid_data : GridData
+        The GridData instance pertaining to the phase to which this component belongs.
+    standalone_mode : bool
+        When True, this component will perform its configuration during setup.
+    reports : bool or None or str or Sequence
+        Controls the reports generated by the subproblems used during the integration.
+    **kwargs : dict
+        Additional keyword arguments passed to RKIntegrationComp.
+    """
+    _record_steps = True
+
+    def setup(self):
+        """
+        Add the necessary I/O and storage for the AdjointRKIntegrationComp.
+        """
+        if self.options['multiple_shooting']:
+            raise ValueError(f'{self.msginfo}: Multiple shooting is not supported with adjoint '
+                             f'derivatives.  Use a derivative_mode of \'forward\'.')
+        super().setup()
+
+    def setup_partials(self):
+        """
+        Declare no partials, since the derivatives of this component are provided matrix-free.
+        """
+        pass
+
+    def _get_segment_θ_idxs(self):
+        """
+        Return the indices of the ODE parameters on which the ODE depends within each segment.
+
+        The control values interpolated within a segment depend only on the control input nodes
+        of that segment, so the partials of the ODE wrt the other control input nodes are zero
+        there and are not stored.
+
+        Returns
+        -------
+        list of np.array
+            The indices in θ of the ODE parameters of each segment.
+        """
+        gd = self._grid_data
+        disc_to_input = gd.input_maps['dynamic_control_input_to_disc']
+
+        # The ODE depends on t_initial, t_duration, the parameters, and the polynomial controls
+        # in every segment.
+        common_idxs = np.arange(2 + self.p_size, dtype=int)
+        pc_idxs = [np.arange(self.θ_size)[self._polynomial_control_idxs_in_θ[name]]
+                   for name in self.polynomial_control_options]
+
+        seg_θ_idxs = []
+        for seg_i in range(gd.num_segments):
+            i1, i2 = gd.subset_segment_indices['control_disc'][seg_i]
+            input_nodes = np.unique(disc_to_input[i1:i2])
+            idxs = [common_idxs]
+            for name, options in self.control_options.items():
+                size = np.prod(options['shape'], dtype=int)
+                start = self._control_idxs_in_θ[name].start
+                idxs.append((start + size * input_nodes[:, np.newaxis] + np.arange(size, dtype=int)).ravel())
+            seg_θ_idxs.append(np.concatenate(idxs + pc_idxs))
+
+        return seg_θ_idxs
+
+    def _get_step_partial_rows(self, row_bytes):
+        """
+        Return the row of the step partials cache in which the partials of the step at each row are kept.
+
+        Parameters
+        ----------
+        row_bytes : int
+            The number of bytes of the cached partials of each step.
+
+        Returns
+        -------
+        np.array
+            The index in the cache of the partials of the step starting at each row, or -1 for rows
+            from which no step is taken and for steps whose partials are recomputed when needed.
+        """
+        num_rows = self._num_rows
+        budget = self.options['checkpoint_memory']
+        N = self.options['num_steps_per_segment']
+
+        # The last row of each segment is the start of no step.
+        step_rows = np.where(np.arange(num_rows) % (N + 1) < N)[0]
+
+        if self.options['checkpointing'] and budget is not None:
+            num_cached = min(step_rows.size, int(budget // max(row_bytes, 1)))
+        else:
+            num_cached = step_rows.size
+
+        cache_rows = np.full(num_rows, -1, dtype=int)
+        cache_rows[step_rows[:num_cached]] = np.arange(num_cached, dtype=int)
+
+        return cache_rows
+
+    def _allocate_sensitivity_storage(self):
+        """
+        Allocate the storage of the stages and ODE partials of each step used by the derivative sweeps.
+        """
+        rk = rk_methods[self.options['method']]
+        num_rows = self._num_rows
+        num_output_rows = self._num_output_rows
+        num_stages = len(rk['b'])
+        num_x = self.x_size
+        num_θ = self.θ_size
+        num_y = self.y_size
+
+        # The stage times, states, and rates of the step starting at each row, and the step
+        # size and its derivative wrt t_duration.  Rows from which no step is taken have a
+        # zero derivative of the step size.
+        self._step_T = np.zeros((num_rows, num_stages, 1), dtype=self._DTYPE)
+        self._step_X = np.zeros((num_rows, num_stages, num_x, 1), dtype=self._DTYPE)
+        self._step_k = np.zeros((num_rows, num_stages, num_x, 1), dtype=self._DTYPE)
+        self._step_h = np.zeros(num_rows, dtype=self._DTYPE)
+        self._step_dh_dtd = np.zeros(num_rows, dtype=self._DTYPE)
+
+        # The partials of the ODE at each stage of each step, cached during linearization.  Only
+        # the partials wrt the ODE parameters of the segment of each step are kept.  When
+        # checkpointing with a memory budget, only the partials of some steps are cached.
+        self._seg_θ_idxs = self._get_segment_θ_idxs()
+        num_θ_seg = max(len(idxs) for idxs in self._seg_θ_idxs)
+        row_bytes = num_stages * num_x * (1 + num_x + num_θ_seg) * np.dtype(self._DTYPE).itemsize
+        self._step_partial_rows = self._get_step_partial_rows(row_bytes)
+        num_cached = np.count_nonzero(self._step_partial_rows >= 0)
+        self._step_f_t = np.zeros((num_cached, num_stages, num_x, 1), dtype=self._DTYPE)
+        self._step_f_x = np.zeros((num_cached, num_stages, num_x, num_x), dtype=self._DTYPE)
+        self._step_f_θ = np.zeros((num_cached, num_stages, num_x, num_θ_seg), dtype=self._DTYPE)
+
+        # The partials of the ODE outputs at each output row.
+        self._out_y_t = np.zeros((num_output_rows, num_y, 1), dtype=self._DTYPE)
+        self._out_y_x = np.zeros((num_output_rows, num_y, num_x), dtype=self._DTYPE)
+        self._out_y_θ = np.zeros((num_output_rows, num_y, num_θ), dtype=self._DTYPE)
+
+        # The propagated total derivatives are not needed.
+        self._dx_dZ = self._dt_dZ = self._dh_dZ = self._dy_dZ = None
+
+    def _get_adjoint_io_map(self):
+        """
+        Get the names of the inputs and outputs of this component and their indices in the
+        contiguous vectors used by the integration.
+
+        Returns
+        -------
+        x_inputs : list of (str, slice)
+            The name of each state input and its indices in x.
+        θ_inputs : list of (str, slice)
+            The name of each parameter, control, and polynomial control input and its indices in θ.
+        x_outputs : list of (str, slice)
+            The name of each state output and its indices in x.
+        y_outputs : list of (str, slice)
+            The name of each control, polynomial control, and timeseries output and its indices in y.
+        """
+        x_inputs = [(self._state_input_names[name], self.state_idxs[name]) for name in self.state_options]
+        x_outputs = [(self._state_output_names[name], self.state_idxs[name]) for name in self.state_options]
+
+        θ_inputs = [('t_initial', np.s_[0:1]), ('t_duration', np.s_[1:2])]
+        θ_inputs.extend((self._param_input_names[name], self._parameter_idxs_in_θ[name])
+                        for name in self.parameter_options)
+        θ_inputs.extend((self._control_input_names[name], self._control_idxs_in_θ[name])
+                        for name in self.control_options)
+        θ_inputs.extend((self._polynomial_control_input_names[name], self._polynomial_control_idxs_in_θ[name])
+                        for name in self.polynomial_control_options)
+
+        y_outputs = []
+        for name in self.control_options:
+            y_outputs.append((self._control_output_names[name], self._control_idxs_in_y[name]))
+            y_outputs.append((self._control_rate_names[name], self._control_rate_idxs_in_y[name]))
+            y_outputs.append((self._control_rate2_names[name], self._control_rate2_idxs_in_y[name]))
+        for name in self.polynomial_control_options:
+            y_outputs.append((self._polynomial_control_output_names[name],
+                              self._polynomial_control_idxs_in_y[name]))
+            y_outputs.append((self._polynomial_control_rate_names[name],
+                              self._polynomial_control_rate_idxs_in_y[name]))
+            y_outputs.append((self._polynomial_control_rate2_names[name],
+                              self._polynomial_control_rate2_idxs_in_y[name]))
+        for name in self._filtered_timeseries_outputs:
+            y_outputs.append((self._timeseries_output_names[name], self._timeseries_idxs_in_y[name]))
+
+        return x_inputs, θ_inputs, x_outputs, y_outputs
+
+    def compute_partials(self, inputs, partials):
+        """
+        Cache the partials of the ODE at each stage of each step taken during the propagation.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        partials : Jacobian
+            Not used, since no partials are declared.
+        """
+        gd = self._grid_data
+        N = self.options['num_steps_per_segment']
+
+        if self._inputs_changed(inputs):
+            self._propagate_vectorized_derivs(inputs, adapt=False, derivs=False)
+            self._inputs_cache = inputs.asarray(copy=True)
+
+        θ = self._θ
+        f_x = self._f_x_vec
+        f_t = self._f_t_vec
+        f_θ = self._f_θ_vec
+        y_x = self._y_x_vec
+        y_t = self._y_t_vec
+        y_θ = self._y_θ_vec
+
+        for seg_i in range(gd.num_segments):
+            self._eval_subprob.model._get_subsystem('ode_eval').set_segment_index(seg_i)
+            self._deriv_subprob.model._get_subsystem('ode_eval').set_segment_index(seg_i)
+            θ_idxs = self._seg_θ_idxs[seg_i]
+
+            first_row = seg_i * (N + 1)
+            last_row = first_row + N
+
+            for row in range(first_row, last_row):
+                if self._step_dh_dtd[row] == 0.0:
+                    continue
+
+                # The partials of the outputs at the start of the segment are always cached, even
+                # if those of the step are recomputed when needed.
+                cache_row = self._step_partial_rows[row]
+                if cache_row >= 0 or row == first_row:
+                    self.eval_f_derivs_vectorized(self._step_X[row, ...], self._step_T[row, ...], θ,
+                                                  f_x, f_t, f_θ, y_x, y_t, y_θ)
+
+                if cache_row >= 0:
+                    self._step_f_t[cache_row, ...] = f_t
+                    self._step_f_x[cache_row, ...] = f_x
+                    self._step_f_θ[cache_row, ..., :len(θ_idxs)] = f_θ[..., θ_idxs]
+
+                if row == first_row:
+                    self._out_y_x[2 * seg_i, ...] = y_x[0, ...]
+                    self._out_y_t[2 * seg_i, ...] = y_t[0, ...]
+                    self._out_y_θ[2 * seg_i, ...] = y_θ[0, ...]
+
+            self.eval_f_derivs(self._x[last_row, ...], self._t[last_row, 0], θ,
+                               f_x=None, f_t=None, f_θ=None,
+                               y_x=self._out_y_x[2 * seg_i + 1, ...],
+                               y_t=self._out_y_t[2 * seg_i + 1, ...],
+                               y_θ=self._out_y_θ[2 * seg_i + 1, ...])
+
+    def _get_step_partials(self, row):
+        """
+        Return the partials of the ODE at each stage of the step starting at the given row.
+
+        The partials are taken from the cache filled during linearization if the step is cached,
+        and are otherwise recomputed from the stage values recorded during the propagation.
+
+        Parameters
+        ----------
+        row : int
+            The row at the start of the step.
+
+        Returns
+        -------
+        f_t : np.array
+            The partials of the state rates wrt time at each stage, of shape (num_stages, num_x).
+        f_x : np.array
+            The partials of the state rates wrt the states at each stage.
+        f_θ : np.array
+            The partials of the state rates wrt the ODE parameters of the segment at each stage.
+        θ_idxs : np.array
+            The indices in θ of the ODE parameters of the segment.
+        """
+        N = self.options['num_steps_per_segment']
+        seg_i = row // (N + 1)
+        θ_idxs = self._seg_θ_idxs[seg_i]
+
+        cache_row = self._step_partial_rows[row]
+        if cache_row >= 0:
+            return self._step_f_t[cache_row, ..., 0], self._step_f_x[cache_row], \
+                self._step_f_θ[cache_row, ..., :len(θ_idxs)], θ_idxs
+
+        self._deriv_subprob.model._get_subsystem('ode_eval').set_segment_index(seg_i)
+        self.eval_f_derivs_vectorized(self._step_X[row, ...], self._step_T[row, ...], self._θ,
+                                      self._f_x_vec, self._f_t_vec, self._f_θ_vec)
+        return self._f_t_vec[..., 0], self._f_x_vec, self._f_θ_vec[..., θ_idxs], θ_idxs
+
+    def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+        """
+        Compute the matrix-vector product of the Jacobian of the integration.
+
+        In forward mode the tangent of the integration is propagated through each step.  In
+        reverse mode the seeds of the outputs are propagated backwards from the end of the phase
+        using the stage partials cached during linearization, so that the cost of each product
+        is that of a single sweep regardless of the number of inputs.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        d_inputs : Vector
+            See inputs; product must be computed only if var_name in d_inputs.
+        d_outputs : Vector
+            See outputs; product must be computed only if var_name in d_outputs.
+        mode : str
+            Either 'fwd' or 'rev'.
+        """
+        rk = rk_methods[self.options['method']]
+        a = rk['a']
+        b = rk['b']
+        c = rk['c']
+        num_stages = len(b)
+
+        num_rows = self._num_rows
+        num_output_rows = self._num_output_rows
+        idxs = self._output_src_idxs
+        x_inputs, θ_inputs, x_outputs, y_outputs = self._get_adjoint_io_map()
+
+        step_k = self._step_k[..., 0]
+        out_y_t = self._out_y_t[..., 0]
+        out_y_x = self._out_y_x
+        out_y_θ = self._out_y_θ
+
+        if mode == 'fwd':
+            dx = np.zeros(self.x_size, dtype=self._DTYPE)
+            dθ = np.zeros(self.θ_size, dtype=self._DTYPE)
+
+            for name, x_idxs in x_inputs:
+                if name in d_inputs:
+                    dx[x_idxs] = d_inputs[name].ravel()
+            for name, θ_idxs in θ_inputs:
+                if name in d_inputs:
+                    dθ[θ_idxs] = d_inputs[name].ravel()
+
+            dt = dθ[0]
+            dx_out = np.zeros((num_output_rows, self.x_size), dtype=self._DTYPE)
+            dt_out = np.zeros(num_output_rows, dtype=self._DTYPE)
+            dk = np.zeros((num_stages, self.x_size), dtype=self._DTYPE)
+            out_i = 0
+
+            for row in range(num_rows):
+                rm1 = row - 1
+                if row > 0 and self._step_dh_dtd[rm1] != 0.0:
+                    h = self._step_h[rm1]
+                    dh = self._step_dh_dtd[rm1] * dθ[1]
+                    k = step_k[rm1]
+                    f_t, f_x, f_θ, θ_idxs = self._get_step_partials(rm1)
+                    dθ_seg = dθ[θ_idxs]
+                    for i in range(num_stages):
+                        dX_i = dx + a[i, :i] @ (dh * k[:i, :] + h * dk[:i, :])
+                        dk[i, :] = f_t[i] * (dt + c[i] * dh) + f_x[i] @ dX_i + f_θ[i] @ dθ_seg
+                    dx = dx + b @ (dh * k + h * dk)
+                    dt = dt + dh
+
+                if out_i < num_output_rows and row == idxs[out_i]:
+                    dx_out[out_i, :] = dx
+                    dt_out[out_i] = dt
+                    out_i += 1
+
+            if 't_final' in d_outputs:
+                d_outputs['t_final'] += dt_out[-1]
+            if 'time' in d_outputs:
+                d_outputs['time'] += dt_out[:, np.newaxis]
+            if 'time_phase' in d_outputs:
+                d_outputs['time_phase'] += dt_out[:, np.newaxis] - dθ[0]
+
+            for name, x_idxs in x_outputs:
+                if name in d_outputs:
+                    d_outputs[name] += dx_out[:, x_idxs].reshape(d_outputs[name].shape)
+
+            if y_outputs:
+                dy_out = np.einsum('ijk,ik->ij', out_y_x, dx_out) + out_y_t * dt_out[:, np.newaxis] + \
+                    out_y_θ @ dθ
+                for name, y_idxs in y_outputs:
+                    if name in d_outputs:
+                        d_outputs[name] += dy_out[:, y_idxs].reshape(d_outputs[name].shape)
+
+        else:
+            x_bar_out = np.zeros((num_output_rows, self.x_size), dtype=self._DTYPE)
+            t_bar_out = np.zeros(num_output_rows, dtype=self._DTYPE)
+            θ_bar = np.zeros(self.θ_size, dtype=self._DTYPE)
+
+            if 't_final' in d_outputs:
+                t_bar_out[-1] += d_outputs['t_final'][0]
+            if 'time' in d_outputs:
+                t_bar_out += d_outputs['time'].ravel()
+            if 'time_phase' in d_outputs:
+                t_bar_out += d_outputs['time_phase'].ravel()
+                θ_bar[0] -= np.sum(d_outputs['time_phase'])
+
+            for name, x_idxs in x_outputs:
+                if name in d_outputs:
+                    x_bar_out[:, x_idxs] += d_outputs[name].reshape((num_output_rows, -1))
+
+            if y_outputs:
+                y_bar_out = np.zeros((num_output_rows, self.y_size), dtype=self._DTYPE)
+                for name, y_idxs in y_outputs:
+                    if name in d_outputs:
+                        y_bar_out[:, y_idxs] = d_outputs[name].reshape((num_output_rows, -1))
+                x_bar_out += np.einsum('ijk,ij->ik', out_y_x, y_bar_out)
+                t_bar_out += np.sum(out_y_t * y_bar_out, axis=-1)
+                θ_bar += np.einsum('ijk,ij->k', out_y_θ, y_bar_out)
+
+            x_bar = np.zeros(self.x_size, dtype=self._DTYPE)
+            t_bar = 0.0
+            k_bar = np.zeros((num_stages, self.x_size), dtype=self._DTYPE)
+            out_i = num_output_rows - 1
+
+            for row in range(num_rows - 1, -1, -1):
+                if out_i >= 0 and row == idxs[out_i]:
+                    x_bar = x_bar + x_bar_out[out_i, :]
+                    t_bar = t_bar + t_bar_out[out_i]
+                    out_i -= 1
+
+                rm1 = row - 1
+                if row == 0 or self._step_dh_dtd[rm1] == 0.0:
+                    continue
+
+                # Reverse the step x[row] = x[rm1] + h * sum(b_i * k_i), t[row] = t[rm1] + h
+                h = self._step_h[rm1]
+                k = step_k[rm1]
+                f_t, f_x, f_θ, θ_idxs = self._get_step_partials(rm1)
+                θ_bar_seg = np.zeros(len(θ_idxs), dtype=self._DTYPE)
+                h_bar = t_bar + x_bar @ (b @ k)
+                k_bar[...] = h * np.outer(b, x_bar)
+
+                # Reverse the stages, k_i = f(X_i, T_i, θ) with X_i = x[rm1] + h * sum(a_ij * k_j)
+                # and T_i = t[rm1] + c_i * h
+                for i in range(num_stages - 1, -1, -1):
+                    T_i_bar = f_t[i] @ k_bar[i, :]
+                    X_i_bar = k_bar[i, :] @ f_x[i]
+                    θ_bar_seg += k_bar[i, :] @ f_θ[i]
+                    t_bar = t_bar + T_i_bar
+                    h_bar = h_bar + c[i] * T_i_bar
+                    x_bar = x_bar + X_i_bar
+                    if i > 0:
+                        h_bar = h_bar + X_i_bar @ (a[i, :i] @ k[:i, :])
+                        k_bar[:i, :] += h * np.outer(a[i, :i], X_i_bar)
+
+                θ_bar[θ_idxs] += θ_bar_seg
+                θ_bar[1] += h_bar * self._step_dh_dtd[rm1]
+
+            # The initial time of the integration is t_initial
+            θ_bar[0] += t_bar
+
+            for name, x_idxs in x_inputs:
+                if name in d_inputs:
+                    d_inputs[name] += x_bar[x_idxs].reshape(d_inputs[name].shape)
+            for name, θ_idxs in θ_inputs:
+                if name in d_inputs:
+                    d_inputs[name] += θ_bar[θ_idxs].reshape(d_inputs[name].shape)
@@ -28,7 +28,9 @@ class TauComp(om.ExplicitComponent):
         Declare component options.
         """
         self.options.declare('vec_size', types=int, default=1, desc='number of nodes at which to compute time')
-        self.options.declare('segment_index', types=int, desc='index of the current segment')
+        self.options.declare('segment_index', types=(int, np.ndarray),
+                             desc='index of the current segment, or an array of vec_size segment '
+                                  'indices if the nodes lie in different segments')
         self.options.declare('time_units', default=None, allow_none=True, types=str,
                              desc='Units of time (or the integration variable)')
 
@@ -44,7 +46,7 @@ class TauComp(om.ExplicitComponent):
         self.add_input('time', shape=(vec_size,), units=time_units)
         self.add_output('ptau', units=None, shape=(vec_size,))
         self.add_output('stau', units=None, shape=(vec_size,))
-        self.add_output('dstau_dt', units=f'1/{time_units}', val=1.0)
+        self.add_output('dstau_dt', units=f'1/{time_units}', shape=(vec_size,), val=1.0)
         self.add_output('time_phase', units=time_units, shape=(vec_size,))
         # self.add_discrete_output('segment_index', val=0)
 
@@ -61,7 +63,28 @@ class TauComp(om.ExplicitComponent):
         self.declare_partials(of='time_phase', wrt='time', rows=ar, cols=ar, val=1.0)
         self.declare_partials(of='time_phase', wrt='t_initial', val=-1.0)
 
-        self.declare_partials(of='dstau_dt', wrt='t_duration', val=1.0)
+        self.declare_partials(of='dstau_dt', wrt='t_duration')
+
+    def _get_segment_bounds(self, seg_idx):
+        """
+        Return the phase tau at the start of the given segment(s) and their span in phase tau.
+
+        Parameters
+        ----------
+        seg_idx : int or np.ndarray
+            The index of the segment, or an array of the segment index at each node.
+
+        Returns
+        -------
+        ptau0_seg : float or np.ndarray
+            The phase tau at the start of each segment.
+        td_seg : float or np.ndarray
+            The span of each segment in phase tau.
+        """
+        segment_ends = self._grid_data.segment_ends
+        ptau0_seg = segment_ends[seg_idx]
+        td_seg = segment_ends[seg_idx + 1] - ptau0_seg
+        return ptau0_seg, td_seg
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
@@ -78,7 +101,6 @@ class TauComp(om.ExplicitComponent):
         discrete_outputs : `Vector`
             `Vector` containing discrete outputs.
         """
-        gd = self._grid_data
         seg_idx = self.options['segment_index']
 
         time = inputs['time']
@@ -87,10 +109,7 @@ class TauComp(om.ExplicitComponent):
 
         outputs['ptau'] = ptau = 2.0 * (time - t_initial) / t_duration - 1.0
 
-        ptau0_seg = gd.segment_ends[seg_idx]
-        ptauf_seg = gd.segment_ends[seg_idx + 1]
-
-        td_seg = ptauf_seg - ptau0_seg
+        ptau0_seg, td_seg = self._get_segment_bounds(seg_idx)
 
         outputs['stau'] = 2.0 * (ptau - ptau0_seg) / td_seg - 1.0
         outputs['dstau_dt'] = 4 / (t_duration * td_seg)
@@ -107,28 +126,24 @@ class TauComp(om.ExplicitComponent):
         partials : Jacobian
             Subjac components written to partials[output_name, input_name].
         """
-        gd = self._grid_data
         seg_idx = self.options['segment_index']
 
         time = inputs['time']
         t_initial = inputs['t_initial']
         t_duration = inputs['t_duration']
 
-        ptau0_seg = gd.segment_ends[seg_idx]
-        ptauf_seg = gd.segment_ends[seg_idx + 1]
-
-        td_seg = ptauf_seg - ptau0_seg
+        _, td_seg = self._get_segment_bounds(seg_idx)
 
         partials['ptau', 'time'] = 2.0 / t_duration
         partials['ptau', 't_initial'] = -2.0 / t_duration
         partials['ptau', 't_duration'] = -2.0 * (time - t_initial) / (t_duration ** 2)
 
-        dstau_dptau = 2.0 / td_seg
+        dstau_dptau = np.broadcast_to(2.0 / td_seg, time.shape)
 
         # Note that these derivatives ignore the effect of changing segments.
         # The derivatives of stau are discontinuous at segment boundaries.
         partials['stau', 'time'] = dstau_dptau * partials['ptau', 'time']
-        partials['stau', 't_initial'] = dstau_dptau * partials['ptau', 't_initial']
-        partials['stau', 't_duration'] = dstau_dptau * partials['ptau', 't_duration']
+        partials['stau', 't_initial'] = dstau_dptau * partials['ptau', 't_initial'].ravel()
+        partials['stau', 't_duration'] = dstau_dptau * partials['ptau', 't_duration'].ravel()
 
-        partials['dstau_dt', 't_duration'] = -4 / (t_duration**2 * td_seg)
+        partials['dstau_dt', 't_duration'] = -2 * dstau_dptau / t_duration**2
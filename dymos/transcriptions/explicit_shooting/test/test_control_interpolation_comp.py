@@ -479,6 +479,133 @@ class TestPolynomialControlInterpolation(unittest.TestCase):
             cpd = p.check_partials(compact_print=False, method='cs')
             assert_check_partials(cpd, atol=_TOL, rtol=_TOL)
 
+    def test_eval_control_gl_compressed_multiple_segments(self):
+        grid_data = dm.transcriptions.grid_data.GridData(num_segments=2, transcription='gauss-lobatto',
+                                                         transcription_order=[3, 5], compressed=True)
+
+        control_options = {'u1': dm.phase.options.ControlOptionsDictionary()}
+
+        control_options['u1']['shape'] = (1,)
+        control_options['u1']['units'] = 'rad'
+
+        p = om.Problem()
+        interp_comp = p.model.add_subsystem('interp',
+                                            VandermondeControlInterpComp(grid_data=grid_data,
+                                                                         vec_size=4,
+                                                                         control_options=control_options,
+                                                                         standalone_mode=True,
+                                                                         time_units='s'))
+        p.setup(force_alloc_complex=True)
+
+        # Evaluate the first two nodes in the first segment and the last two in the second.
+        interp_comp.options['segment_index'] = np.array([0, 0, 1, 1])
+        p.set_val('interp.controls:u1', [0.0, 3.0, 0.0, 4.0, 3.0, 4.0, 3.0])
+        p.set_val('interp.dstau_dt', [0.5, 0.5, 0.25, 0.25])
+
+        p.set_val('interp.stau', [-1.0, 0.0, 0.0, 1.0])
+        p.run_model()
+        assert_near_equal(p.get_val('interp.control_values:u1'), [[0.0], [3.0], [3.0], [3.0]], tolerance=_TOL)
+
+        p.set_val('interp.stau', [-0.3, 0.2, 0.1, 0.7])
+        p.run_model()
+
+        with np.printoptions(linewidth=1024):
+            cpd = p.check_partials(compact_print=False, method='cs')
+            assert_check_partials(cpd, atol=_TOL, rtol=_TOL)
+
+    def test_eval_control_static_segment_index(self):
+        grid_data = dm.transcriptions.grid_data.GridData(num_segments=3, transcription='radau-ps',
+                                                         transcription_order=[3, 5, 4], compressed=True)
+
+        control_options = {'u1': dm.phase.options.ControlOptionsDictionary()}
+
+        control_options['u1']['shape'] = (2,)
+        control_options['u1']['units'] = 'rad'
+
+        def _make_problem(static):
+            p = om.Problem()
+            interp_comp = VandermondeControlInterpComp(grid_data=grid_data, vec_size=5,
+                                                       control_options=control_options,
+                                                       standalone_mode=True, time_units='s')
+            p.model.add_subsystem('interp', interp_comp)
+            interp_comp.options['segment_index'] = np.array([0, 1, 1, 2, 2])
+            interp_comp.options['static_segment_index'] = static
+            p.setup(force_alloc_complex=True)
+
+            num_input_nodes = grid_data.subset_num_nodes['control_input']
+            p.set_val('interp.controls:u1', np.random.RandomState(0).rand(num_input_nodes, 2))
+            p.set_val('interp.stau', [0.3, -0.5, 0.9, -1.0, 0.2])
+            p.set_val('interp.dstau_dt', [0.5, 0.25, 0.25, 0.75, 0.75])
+            p.run_model()
+            return p, interp_comp
+
+        p, interp_comp = _make_problem(static=True)
+        p_dynamic, _ = _make_problem(static=False)
+
+        for name in ('control_values:u1', 'control_rates:u1_rate', 'control_rates:u1_rate2'):
+            assert_near_equal(p.get_val(f'interp.{name}'), p_dynamic.get_val(f'interp.{name}'), tolerance=_TOL)
+
+        # Each element of each node depends only on the same element of the input nodes of its segment.
+        subjacs = interp_comp._subjacs_info
+        for name in ('control_values:u1', 'control_rates:u1_rate', 'control_rates:u1_rate2'):
+            rows = subjacs[f'interp.{name}', 'interp.controls:u1']['rows']
+            cols = subjacs[f'interp.{name}', 'interp.controls:u1']['cols']
+            for node, seg_idx in enumerate([0, 1, 1, 2, 2]):
+                input_idxs = interp_comp._input_node_idxs_by_segment[seg_idx]
+                for k in range(2):
+                    expected_cols = input_idxs * 2 + k
+                    assert_near_equal(np.sort(cols[rows == node * 2 + k]), expected_cols)
+
+        with np.printoptions(linewidth=1024):
+            cpd = p.check_partials(compact_print=False, method='cs', out_stream=None)
+            assert_check_partials(cpd, atol=_TOL, rtol=_TOL)
+
+        interp_comp.options['segment_index'] = np.array([0, 0, 1, 1, 2])
+        with self.assertRaises(ValueError) as e:
+            p.run_model()
+
+        self.assertEqual(str(e.exception), "'interp' <class VandermondeControlInterpComp>: segment_index may "
+                                           "not change after setup when static_segment_index is True.")
+
+    def test_eval_polycontrol_high_order(self):
+        grid_data = dm.transcriptions.grid_data.GridData(num_segments=1, transcription='gauss-lobatto',
+                                                         transcription_order=3, compressed=True)
+
+        order = 30
+        pc_options = {'u1': dm.phase.options.PolynomialControlOptionsDictionary()}
+
+        pc_options['u1']['shape'] = (1,)
+        pc_options['u1']['units'] = 'rad'
+        pc_options['u1']['order'] = order
+
+        p = om.Problem()
+        interp_comp = p.model.add_subsystem('interp',
+                                            VandermondeControlInterpComp(grid_data=grid_data,
+                                                                         vec_size=7,
+                                                                         polynomial_control_options=pc_options,
+                                                                         standalone_mode=True,
+                                                                         time_units='s'))
+        p.setup(force_alloc_complex=True)
+        interp_comp.options['segment_index'] = 0
+
+        # A polynomial of the same order is recovered exactly, where a Vandermonde matrix of this
+        # order is too poorly conditioned to be inverted accurately.
+        nodes, _ = dm.utils.lgl.lgl(order + 1)
+        ptau = np.linspace(-1, 1, 7)
+        coeffs = np.zeros(order + 1)
+        coeffs[-1] = 1.0
+        legendre = np.polynomial.legendre.Legendre(coeffs)
+
+        p.set_val('interp.t_duration', 2.0)
+        p.set_val('interp.polynomial_controls:u1', legendre(nodes))
+        p.set_val('interp.ptau', ptau)
+        p.run_model()
+
+        assert_near_equal(p.get_val('interp.polynomial_control_values:u1').ravel(), legendre(ptau),
+                          tolerance=1.0E-10)
+        assert_near_equal(p.get_val('interp.polynomial_control_rates:u1_rate').ravel(), legendre.deriv()(ptau),
+                          tolerance=1.0E-9)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
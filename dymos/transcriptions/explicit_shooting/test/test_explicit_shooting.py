@@ -229,6 +229,64 @@ class TestExplicitShooting(unittest.TestCase):
                         cpd = prob.check_partials(compact_print=True, method='cs', out_stream=None)
                         assert_check_partials(cpd, atol=1.0E-5, rtol=1.0E-5)
 
+    def test_brachistochrone_explicit_shooting_multiple_shooting(self):
+        prob = om.Problem()
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+
+        tx = dm.ExplicitShooting(num_segments=3, grid='gauss-lobatto', method='rk4', order=3,
+                                 num_steps_per_segment=5, compressed=True, multiple_shooting=True)
+
+        phase = dm.Phase(ode_class=BrachistochroneODE, transcription=tx)
+
+        phase.set_time_options(units='s', fix_initial=True, duration_bounds=(1.0, 10.0))
+
+        # automatically discover states
+        phase.set_state_options('x', fix_initial=True)
+        phase.set_state_options('y', fix_initial=True)
+        phase.set_state_options('v', fix_initial=True)
+
+        phase.add_parameter('g', val=9.80665, units='m/s**2', opt=False)
+        phase.add_control('theta', val=45.0, units='deg', opt=True, lower=1.0E-6, upper=179.9)
+
+        phase.add_boundary_constraint('x', loc='final', equals=10.0)
+        phase.add_boundary_constraint('y', loc='final', equals=5.0)
+
+        prob.model.add_subsystem('phase0', phase)
+
+        phase.add_objective('time', loc='final')
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val('phase0.t_initial', 0.0)
+        prob.set_val('phase0.t_duration', 2)
+        prob.set_val('phase0.states:x', phase.interp('x', [0, 10]))
+        prob.set_val('phase0.states:y', phase.interp('y', [10, 5]))
+        prob.set_val('phase0.states:v', phase.interp('v', [0, 9.9]))
+        prob.set_val('phase0.controls:theta', phase.interp('theta', ys=[0.01, 90]), units='deg')
+
+        # One initial state value is provided for each segment.
+        self.assertEqual(prob.get_val('phase0.states:x').shape, (3, 1))
+
+        dm.run_problem(prob, run_driver=True, simulate=False)
+
+        x = prob.get_val('phase0.timeseries.states:x')
+        y = prob.get_val('phase0.timeseries.states:y')
+        t = prob.get_val('phase0.timeseries.time')
+
+        assert_near_equal(x[-1, ...], 10.0, tolerance=1.0E-3)
+        assert_near_equal(y[-1, ...], 5.0, tolerance=1.0E-3)
+        assert_near_equal(t[-1, ...], 1.8016, tolerance=1.0E-2)
+
+        # The state defects between segments are driven to zero.
+        for name in ('x', 'y', 'v'):
+            assert_near_equal(prob.get_val(f'phase0.continuity_comp.defect_states:{name}'),
+                              np.zeros((2, 1)), tolerance=1.0E-6)
+
+        with np.printoptions(linewidth=1024):
+            cpd = prob.check_partials(compact_print=True, method='cs', out_stream=None)
+            assert_check_partials(cpd, atol=1.0E-5, rtol=1.0E-5)
+
     @require_pyoptsparse(optimizer='SLSQP')
     def test_brachistochrone_explicit_shooting_path_constraint(self):
 
@@ -1,12 +1,16 @@
 import unittest
+from unittest import mock
+import warnings
 
 import numpy as np
 import openmdao.api as om
 import dymos as dm
 
-from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.assert_utils import assert_near_equal
+from dymos.utils.testing_utils import assert_check_partials
 from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
-from dymos.transcriptions.explicit_shooting.rk_integration_comp import RKIntegrationComp
+from dymos.transcriptions.explicit_shooting import rk_integration_comp
+from dymos.transcriptions.explicit_shooting.rk_integration_comp import RKIntegrationComp, AdjointRKIntegrationComp
 
 from openmdao.utils.testing_utils import require_pyoptsparse
 
@@ -44,6 +48,13 @@ class SimpleODE(om.ExplicitComponent):
 
 class TestRKIntegrationComp(unittest.TestCase):
 
+    def setUp(self):
+        self._include_check_partials = dm.options['include_check_partials']
+        dm.options['include_check_partials'] = True
+
+    def tearDown(self):
+        dm.options['include_check_partials'] = self._include_check_partials
+
     def test_eval_f_scalar(self):
         gd = dm.transcriptions.grid_data.GridData(num_segments=10, transcription='gauss-lobatto',
                                                   transcription_order=3)
@@ -228,7 +239,7 @@ class TestRKIntegrationComp(unittest.TestCase):
             cpd = p.check_partials(method='cs', compact_print=True)
             assert_check_partials(cpd)
 
-    def test_fwd_parameters_controls(self):
+    def _make_brachistochrone_problem(self, comp_class=RKIntegrationComp, **kwargs):
         gd = dm.transcriptions.grid_data.GridData(num_segments=5, transcription='gauss-lobatto',
                                                   transcription_order=5, compressed=True)
 
@@ -272,15 +283,16 @@ class TestRKIntegrationComp(unittest.TestCase):
         p = om.Problem()
 
         p.model.add_subsystem('fixed_step_integrator',
-                              RKIntegrationComp(ode_class=BrachistochroneODE,
-                                                time_options=time_options,
-                                                state_options=state_options,
-                                                parameter_options=param_options,
-                                                control_options=control_options,
-                                                polynomial_control_options=polynomial_control_options,
-                                                num_steps_per_segment=10,
-                                                grid_data=gd,
-                                                ode_init_kwargs=None))
+                              comp_class(ode_class=BrachistochroneODE,
+                                         time_options=time_options,
+                                         state_options=state_options,
+                                         parameter_options=param_options,
+                                         control_options=control_options,
+                                         polynomial_control_options=polynomial_control_options,
+                                         num_steps_per_segment=10,
+                                         grid_data=gd,
+                                         ode_init_kwargs=None,
+                                         **kwargs))
 
         p.setup(mode='fwd', force_alloc_complex=True)
 
@@ -293,6 +305,11 @@ class TestRKIntegrationComp(unittest.TestCase):
 
         p.set_val('fixed_step_integrator.controls:theta', np.linspace(0.01, 100.0, 21), units='deg')
 
+        return p
+
+    def test_fwd_parameters_controls(self):
+        p = self._make_brachistochrone_problem()
+
         p.run_model()
 
         x = p.get_val('fixed_step_integrator.states_out:x')
@@ -309,6 +326,328 @@ class TestRKIntegrationComp(unittest.TestCase):
             cpd = p.check_partials(compact_print=True, method='cs', show_only_incorrect=True)
             assert_check_partials(cpd)
 
+    def test_fwd_parameters_controls_public_totals(self):
+        of = ['fixed_step_integrator.states_out:x', 'fixed_step_integrator.time',
+              'fixed_step_integrator.control_rates:theta_rate']
+        wrt = ['fixed_step_integrator.t_duration', 'fixed_step_integrator.parameters:g',
+               'fixed_step_integrator.controls:theta']
+
+        p = self._make_brachistochrone_problem()
+        p.run_model()
+        J = p.compute_totals(of=of, wrt=wrt)
+
+        # Without the reuse of the private total jacobian information of the subproblems, the
+        # totals are computed with the public compute_totals of each subproblem.
+        with mock.patch.object(rk_integration_comp, '_TotalJacInfo', None):
+            p_public = self._make_brachistochrone_problem()
+            p_public.run_model()
+            J_public = p_public.compute_totals(of=of, wrt=wrt)
+
+        for key, subjac in J.items():
+            assert_near_equal(J_public[key], subjac, tolerance=1.0E-12)
+
+    def test_complex_step_no_complex_warning(self):
+        p = self._make_brachistochrone_problem()
+        p.run_model()
+
+        # The real-valued subproblems are never given complex values under complex step.
+        complex_warning = getattr(np, 'exceptions', np).ComplexWarning
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', complex_warning)
+            cpd = p.check_partials(method='cs', out_stream=None)
+
+        assert_check_partials(cpd)
+
+    def _make_simple_ode_problem(self, comp_class=RKIntegrationComp, **kwargs):
+        time_options = dm.phase.options.TimeOptionsDictionary()
+
+        time_options['targets'] = 't'
+        time_options['units'] = 's'
+
+        state_options = {'x': dm.phase.options.StateOptionsDictionary()}
+
+        state_options['x']['shape'] = (1,)
+        state_options['x']['units'] = 's**2'
+        state_options['x']['rate_source'] = 'x_dot'
+        state_options['x']['targets'] = ['x']
+
+        param_options = {'p': dm.phase.options.ParameterOptionsDictionary()}
+
+        param_options['p']['shape'] = (1,)
+        param_options['p']['units'] = 's**2'
+        param_options['p']['targets'] = ['p']
+
+        p = om.Problem()
+
+        gd = dm.transcriptions.grid_data.GridData(num_segments=4,
+                                                  transcription='gauss-lobatto',
+                                                  transcription_order=3,
+                                                  compressed=True)
+
+        p.model.add_subsystem('integrator', comp_class(SimpleODE, time_options, state_options,
+                                                       param_options, {}, {},
+                                                       grid_data=gd,
+                                                       ode_init_kwargs=None,
+                                                       **kwargs))
+        p.setup(mode='fwd', force_alloc_complex=True)
+
+        p.set_val('integrator.states:x', 0.5)
+        p.set_val('integrator.t_initial', 0.0)
+        p.set_val('integrator.t_duration', 2.0)
+        p.set_val('integrator.parameters:p', 1.0)
+
+        return p
+
+    def test_fwd_parameters_adaptive(self):
+        p = self._make_simple_ode_problem(method='dopri', num_steps_per_segment=20, adaptive=True,
+                                          atol=1.0E-10, rtol=1.0E-10)
+        p.run_model()
+
+        t = p.get_val('integrator.time')
+        x = p.get_val('integrator.states_out:x')
+
+        assert_near_equal(t[-1, ...], 2, tolerance=1.0E-12)
+        assert_near_equal(x[-1, ...], 5.305471950534675, tolerance=1.0E-9)
+
+        # The tolerances are met in fewer steps than the maximum in each segment.
+        step_fracs = p.model.integrator._step_fractions
+        assert_near_equal(np.sum(step_fracs, axis=1), np.ones(4), tolerance=1.0E-12)
+        self.assertTrue(np.all(np.count_nonzero(step_fracs, axis=1) < 20))
+
+        with np.printoptions(linewidth=1024):
+            cpd = p.check_partials(method='cs', compact_print=True)
+            assert_check_partials(cpd)
+
+    def test_adaptive_loose_tolerance_takes_fewer_steps(self):
+        p_tight = self._make_simple_ode_problem(method='rkck', num_steps_per_segment=50,
+                                                adaptive=True, atol=1.0E-10, rtol=1.0E-10)
+        p_tight.run_model()
+
+        p_loose = self._make_simple_ode_problem(method='rkck', num_steps_per_segment=50,
+                                                adaptive=True, atol=1.0E-4, rtol=1.0E-4)
+        p_loose.run_model()
+
+        num_steps_tight = np.count_nonzero(p_tight.model.integrator._step_fractions)
+        num_steps_loose = np.count_nonzero(p_loose.model.integrator._step_fractions)
+        self.assertLess(num_steps_loose, num_steps_tight)
+
+        assert_near_equal(p_loose.get_val('integrator.states_out:x')[-1, ...],
+                          5.305471950534675, tolerance=1.0E-4)
+
+    def test_adaptive_requires_embedded_method(self):
+        with self.assertRaises(ValueError) as e:
+            self._make_simple_ode_problem(method='rk4', adaptive=True)
+
+        self.assertIn("Adaptive step size control requires an embedded Runge-Kutta method but "
+                      "method 'rk4' does not provide an error estimate.", str(e.exception))
+
+    def test_adjoint_parameters_controls(self):
+        p_fwd = self._make_brachistochrone_problem()
+        p_fwd.run_model()
+
+        p = self._make_brachistochrone_problem(comp_class=AdjointRKIntegrationComp)
+        p.run_model()
+
+        self.assertTrue(p.model.fixed_step_integrator.matrix_free)
+
+        of = ['fixed_step_integrator.states_out:x', 'fixed_step_integrator.states_out:v',
+              'fixed_step_integrator.time_phase', 'fixed_step_integrator.control_rates:theta_rate']
+        wrt = ['fixed_step_integrator.states:y', 'fixed_step_integrator.t_initial',
+               'fixed_step_integrator.t_duration', 'fixed_step_integrator.parameters:g',
+               'fixed_step_integrator.controls:theta']
+
+        J_fwd = p_fwd.compute_totals(of=of, wrt=wrt)
+        J_adj = p.compute_totals(of=of, wrt=wrt)
+
+        for key, subjac in J_fwd.items():
+            assert_near_equal(J_adj[key], subjac, tolerance=1.0E-9)
+
+        # Several of these partials are zero to within roundoff, so the relative error of the
+        # reverse products is not meaningful.  Check the absolute error of each instead.
+        cpd = p.check_partials(method='cs', out_stream=None)
+        for (of_name, wrt_name), data in cpd['fixed_step_integrator'].items():
+            with self.subTest(of=of_name, wrt=wrt_name):
+                self.assertLess(data['abs error'].forward, 1.0E-9)
+                self.assertLess(data['abs error'].reverse, 1.0E-9)
+
+    def test_adjoint_parameters_adaptive(self):
+        p = self._make_simple_ode_problem(method='dopri', num_steps_per_segment=20, adaptive=True,
+                                          atol=1.0E-8, rtol=1.0E-8,
+                                          comp_class=AdjointRKIntegrationComp)
+        p.run_model()
+
+        assert_near_equal(p.get_val('integrator.states_out:x')[-1, ...], 5.305471950534675,
+                          tolerance=1.0E-7)
+
+        with np.printoptions(linewidth=1024):
+            cpd = p.check_partials(method='cs', compact_print=True)
+            assert_check_partials(cpd)
+
+    def test_adjoint_multiple_shooting(self):
+        with self.assertRaises(ValueError) as e:
+            self._make_brachistochrone_problem(comp_class=AdjointRKIntegrationComp, multiple_shooting=True)
+
+        self.assertIn('Multiple shooting is not supported with adjoint derivatives.', str(e.exception))
+
+    def test_adjoint_memory(self):
+        p_fwd = self._make_brachistochrone_problem()
+        p_fwd.run_model()
+
+        p = self._make_brachistochrone_problem(comp_class=AdjointRKIntegrationComp)
+        p.run_model()
+        p.compute_totals(of=['fixed_step_integrator.states_out:x'], wrt=['fixed_step_integrator.controls:theta'])
+
+        fwd = p_fwd.model.fixed_step_integrator
+        adj = p.model.fixed_step_integrator
+
+        # The adjoint caches only the partials of each step wrt the ODE parameters of its own
+        # segment, which takes less memory than the forward propagation of the total derivatives.
+        fwd_bytes = sum(arr.nbytes for arr in (fwd._dx_dZ, fwd._dt_dZ, fwd._dh_dZ, fwd._dy_dZ))
+        adj_bytes = sum(arr.nbytes for arr in (adj._step_f_t, adj._step_f_x, adj._step_f_θ))
+
+        self.assertEqual(adj._step_f_θ.shape[-1], 8)
+        self.assertLess(adj_bytes, fwd_bytes)
+
+    def test_fwd_multiple_shooting(self):
+        p_ss = self._make_brachistochrone_problem()
+        p_ss.run_model()
+
+        p = self._make_brachistochrone_problem(multiple_shooting=True)
+
+        # Start each segment from the single-shooting solution at the segment boundaries.
+        for name in ('x', 'y', 'v'):
+            p.set_val(f'fixed_step_integrator.states:{name}',
+                      p_ss.get_val(f'fixed_step_integrator.states_out:{name}')[0::2, ...])
+
+        p.run_model()
+
+        for name in ('states_out:x', 'states_out:y', 'states_out:v', 'time',
+                     'control_values:theta', 'control_rates:theta_rate'):
+            with self.subTest(output=name):
+                assert_near_equal(p.get_val(f'fixed_step_integrator.{name}'),
+                                  p_ss.get_val(f'fixed_step_integrator.{name}'),
+                                  tolerance=1.0E-12)
+
+        with np.printoptions(linewidth=1024):
+            cpd = p.check_partials(method='cs', compact_print=True, show_only_incorrect=True)
+            assert_check_partials(cpd)
+
+    def test_multiple_shooting_segment_local_control_partials(self):
+        p_ss = self._make_brachistochrone_problem()
+        p = self._make_brachistochrone_problem(multiple_shooting=True)
+        p.run_model()
+
+        # In multiple shooting the segment of each node of the derivative subproblem is fixed, so
+        # each of its 4 stages in each of the 5 segments depends only on the 5 control input nodes
+        # of its segment.  The single shooting subproblem moves between segments, so its partials
+        # span all 21 control input nodes.
+        key = ('ode_eval.control_interp.control_values:theta', 'ode_eval.control_interp.controls:theta')
+        ms_subjac = p.model.fixed_step_integrator._deriv_subprob.model.ode_eval.control_interp._subjacs_info[key]
+        ss_subjac = p_ss.model.fixed_step_integrator._deriv_subprob.model.ode_eval.control_interp._subjacs_info[key]
+        self.assertEqual(len(ms_subjac['rows']), 20 * 5)
+        self.assertEqual(len(ss_subjac['rows']), 4 * 21)
+
+        # The partials of the state rates wrt the control input nodes of the other segments are zero.
+        f_θ = p.model.fixed_step_integrator._f_θ_vec.reshape((5, 4, 3, -1))
+        for seg_i in range(5):
+            with self.subTest(segment=seg_i):
+                seg_cols = 3 + np.arange(4 * seg_i, 4 * seg_i + 5)
+                other_cols = np.setdiff1d(np.arange(3, 24), seg_cols)
+                self.assertTrue(np.any(f_θ[seg_i][..., seg_cols] != 0.0))
+                assert_near_equal(f_θ[seg_i][..., other_cols], np.zeros((4, 3, 16)))
+
+    def test_multiple_shooting_not_adaptive(self):
+        with self.assertRaises(ValueError) as e:
+            self._make_simple_ode_problem(method='dopri', adaptive=True, multiple_shooting=True)
+
+        self.assertIn('does not support adaptive step size control.', str(e.exception))
+
+    def test_fwd_checkpointing(self):
+        of = ['fixed_step_integrator.states_out:x', 'fixed_step_integrator.states_out:v',
+              'fixed_step_integrator.time', 'fixed_step_integrator.control_rates:theta_rate']
+        wrt = ['fixed_step_integrator.states:y', 'fixed_step_integrator.t_initial',
+               'fixed_step_integrator.t_duration', 'fixed_step_integrator.parameters:g',
+               'fixed_step_integrator.controls:theta']
+
+        for multiple_shooting in (False, True):
+            with self.subTest(multiple_shooting=multiple_shooting):
+                p_full = self._make_brachistochrone_problem(multiple_shooting=multiple_shooting)
+                p_full.run_model()
+
+                p = self._make_brachistochrone_problem(multiple_shooting=multiple_shooting, checkpointing=True)
+                p.run_model()
+
+                # Only the two output rows and two working rows of each of the 5 segments are stored.
+                integrator = p.model.fixed_step_integrator
+                self.assertEqual(integrator._dx_dZ.shape[0], 20)
+                self.assertEqual(p_full.model.fixed_step_integrator._dx_dZ.shape[0], 55)
+
+                J_full = p_full.compute_totals(of=of, wrt=wrt)
+                J = p.compute_totals(of=of, wrt=wrt)
+
+                for key, subjac in J_full.items():
+                    assert_near_equal(J[key], subjac, tolerance=1.0E-12)
+
+    def test_fwd_checkpointing_adaptive(self):
+        of = ['integrator.states_out:x', 'integrator.time']
+        wrt = ['integrator.states:x', 'integrator.t_duration', 'integrator.parameters:p']
+
+        p_full = self._make_simple_ode_problem(method='dopri', num_steps_per_segment=20, adaptive=True,
+                                               atol=1.0E-10, rtol=1.0E-10)
+        p_full.run_model()
+        J_full = p_full.compute_totals(of=of, wrt=wrt)
+
+        p = self._make_simple_ode_problem(method='dopri', num_steps_per_segment=20, adaptive=True,
+                                          atol=1.0E-10, rtol=1.0E-10, checkpointing=True)
+        p.run_model()
+
+        assert_near_equal(p.get_val('integrator.states_out:x')[-1, ...], 5.305471950534675, tolerance=1.0E-9)
+
+        # The checkpointed sensitivities match those of the full storage of the accepted steps.
+        J = p.compute_totals(of=of, wrt=wrt)
+        for key, subjac in J_full.items():
+            assert_near_equal(J[key], subjac, tolerance=1.0E-12)
+
+        # The integrator is only included in check_partials when include_check_partials is set.
+        dm.options['include_check_partials'] = True
+        p = self._make_simple_ode_problem(method='dopri', num_steps_per_segment=20, adaptive=True,
+                                          atol=1.0E-10, rtol=1.0E-10, checkpointing=True)
+        p.run_model()
+
+        with np.printoptions(linewidth=1024):
+            cpd = p.check_partials(method='cs', compact_print=True, out_stream=None)
+            self.assertIn(('states_out:x', 'parameters:p'), cpd['integrator'])
+            self.assertIn(('states_out:x', 't_duration'), cpd['integrator'])
+            assert_check_partials(cpd)
+
+    def test_adjoint_checkpointing(self):
+        of = ['fixed_step_integrator.states_out:x', 'fixed_step_integrator.states_out:v',
+              'fixed_step_integrator.time_phase', 'fixed_step_integrator.control_rates:theta_rate']
+        wrt = ['fixed_step_integrator.states:y', 'fixed_step_integrator.t_duration',
+               'fixed_step_integrator.parameters:g', 'fixed_step_integrator.controls:theta']
+
+        p_fwd = self._make_brachistochrone_problem()
+        p_fwd.run_model()
+        J_fwd = p_fwd.compute_totals(of=of, wrt=wrt)
+
+        # Each segment depends on t_initial, t_duration, g, and its 5 control input nodes.
+        integrator = p_fwd.model.fixed_step_integrator
+        row_bytes = 4 * integrator.x_size * (1 + integrator.x_size + 8) * 8
+
+        # Cache the partials of none, some, or all of the 50 steps.
+        for num_cached in (0, 17, 50):
+            with self.subTest(num_cached=num_cached):
+                p = self._make_brachistochrone_problem(comp_class=AdjointRKIntegrationComp, checkpointing=True,
+                                                       checkpoint_memory=int(num_cached * row_bytes))
+                p.run_model()
+
+                self.assertEqual(p.model.fixed_step_integrator._step_f_θ.shape[0], num_cached)
+
+                J_adj = p.compute_totals(of=of, wrt=wrt)
+
+                for key, subjac in J_fwd.items():
+                    assert_near_equal(J_adj[key], subjac, tolerance=1.0E-9)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -58,3 +58,26 @@ class TestTauComp(unittest.TestCase):
 
         cpd = p.check_partials(method='cs')
         assert_check_partials(cpd)
+
+    def test_eval_multiple_segments(self):
+        grid_data = dm.transcriptions.grid_data.GridData(num_segments=3, transcription='gauss-lobatto',
+                                                         transcription_order=3)
+
+        p = om.Problem()
+        tau_comp = p.model.add_subsystem('tau_comp', TauComp(vec_size=3, grid_data=grid_data, time_units='s'))
+        p.setup(force_alloc_complex=True)
+
+        tau_comp.options['segment_index'] = np.array([0, 1, 2])
+
+        p.set_val('tau_comp.t_initial', 0)
+        p.set_val('tau_comp.t_duration', 15)
+
+        # The midpoint of each segment
+        p.set_val('tau_comp.time', [2.5, 7.5, 12.5])
+        p.run_model()
+
+        assert_near_equal(p.get_val('tau_comp.stau'), np.zeros(3), tolerance=1.0E-12)
+        assert_near_equal(p.get_val('tau_comp.dstau_dt'), 0.4 * np.ones(3), tolerance=1.0E-12)
+
+        cpd = p.check_partials(method='cs')
+        assert_check_partials(cpd)
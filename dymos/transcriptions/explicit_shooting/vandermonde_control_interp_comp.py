@@ -5,9 +5,39 @@ from ...transcriptions.grid_data import GridData
 from ...utils.lgl import lgl
 
 
+def _barycentric_basis(x, nodes, w_b):
+    """
+    Return the values of the Lagrange basis polynomials on the given nodes at the points x.
+
+    The basis is evaluated with the first (modified Lagrange) form of the barycentric formula,
+    l_j(x) = w_j prod_{k != j} (x - x_k), which is numerically stable for nodes clustered at the ends
+    of the interval such as the LGL and LGR nodes.  Unlike the second form it involves no division
+    by x - x_j, so it is exact at the nodes and accurate under complex step.
+
+    Parameters
+    ----------
+    x : np.array
+        The points at which the basis is evaluated, of shape (m,).
+    nodes : np.array
+        The nodes of the basis polynomials, of shape (n,).
+    w_b : np.array
+        The barycentric weights of the nodes, of shape (n,).
+
+    Returns
+    -------
+    np.array
+        An (m, n) matrix which, when post-multiplied by values at the nodes, returns the values
+        of the interpolating polynomial at x.
+    """
+    n = len(nodes)
+    diff = np.repeat((x[:, np.newaxis] - nodes[np.newaxis, :])[:, np.newaxis, :], n, axis=1)
+    diff[:, np.arange(n), np.arange(n)] = 1.0
+    return w_b * np.prod(diff, axis=2)
+
+
 class VandermondeControlInterpComp(om.ExplicitComponent):
     """
-    A component which interpolates control values in 1D using Vandermonde interpolation.
+    A component which interpolates control values in 1D using Lagrange interpolation.
 
     Takes training values for control variables at given _input_ nodes,
     broadcaasts them to _discretization_ nodes, and then interpolates the discretization values
@@ -20,6 +50,17 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
     size of the control input nodes when we evaluate different segments. Instead, this component
     will take in the control values of all segments and internally use the appropriate one.
 
+    The interpolating polynomials are evaluated with the barycentric form of the Lagrange basis
+    rather than by inverting a Vandermonde matrix, which is poorly conditioned at high order.  The
+    derivatives of the interpolating polynomial of degree n - 1 are themselves interpolated exactly
+    by its n nodes, so the rates are given by the same basis applied to the differentiation
+    matrices of the nodes.
+
+    If the segment of each node is fixed with the static_segment_index option, the partials of
+    each node wrt the control inputs are declared only for the input nodes of its segment.
+    Otherwise the segment may change between evaluations and the partials are declared for all
+    input nodes.
+
     Parameters
     ----------
     grid_data : GridData
@@ -45,23 +86,16 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
         self._time_units = time_units
         self._standalone_mode = standalone_mode
 
-        # Storage for the Vandermonde matrix and its inverse for each control
-        self._V_hat = {}
-        self._V_hat_inv = {}
-
-        # Storage for factors used in the derivatives of Vandermonde matrices.
-        self._fac = {}
+        # Storage for the nodes, barycentric weights, and stacked differentiation matrices of the
+        # control segments and polynomial controls, keyed by the number of nodes.
+        self._control_bases = {}
+        self._polynomial_control_bases = {}
 
         # Cache formatted strings: { control_name : (input_name, output_name) }
         self._control_io_names = {}
 
-        # The Lagrange interpolation matrix L_id maps control values as given at the input nodes
-        # to values at the discretization nodes.
-        num_disc_nodes = grid_data.subset_num_nodes['control_disc']
-        num_input_nodes = grid_data.subset_num_nodes['control_input']
-        self._L_id = np.zeros((num_disc_nodes, num_input_nodes), dtype=float)
-        self._L_id[np.arange(num_disc_nodes, dtype=int),
-                   self._grid_data.input_maps['dynamic_control_input_to_disc']] = 1.0
+        # The segment index of each node when it is fixed at setup, otherwise None.
+        self._static_segment_index = None
 
         super().__init__(**kwargs)
 
@@ -69,19 +103,111 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
         """
         Declare component options.
         """
-        self.options.declare('segment_index', types=int, desc='index of the current segment')
+        self.options.declare('segment_index', types=(int, np.ndarray),
+                             desc='index of the current segment, or an array of vec_size segment '
+                                  'indices if the nodes lie in different segments')
         self.options.declare('vec_size', types=int, default=1,
                              desc='number of points at which the control will be evaluated. This is not'
                                   'necessarily the same as the number of nodes in the GridData.')
+        self.options.declare('static_segment_index', types=bool, default=False,
+                             desc='If True, the segment of each node is given by segment_index at setup '
+                                  'and may not change afterwards.  The partials of each node wrt the '
+                                  'control inputs are then declared only for the input nodes of its segment.')
+
+    @staticmethod
+    def _make_basis(nodes):
+        """
+        Return the data needed to interpolate values and derivatives on the given nodes.
+
+        Parameters
+        ----------
+        nodes : np.array
+            The nodes of the interpolating polynomial.
+
+        Returns
+        -------
+        nodes : np.array
+            The nodes of the interpolating polynomial.
+        w_b : np.array
+            The barycentric weights of the nodes.
+        D_stack : np.array
+            The identity and the first, second, and third differentiation matrices of the nodes,
+            stacked horizontally into an (n, 4n) matrix.
+        """
+        n = len(nodes)
+        diff = nodes[:, np.newaxis] - nodes[np.newaxis, :]
+        np.fill_diagonal(diff, 1.0)
+        w_b = 1.0 / np.prod(diff, axis=1)
+
+        D = (w_b[np.newaxis, :] / w_b[:, np.newaxis]) / diff
+        np.fill_diagonal(D, 0.0)
+        np.fill_diagonal(D, -np.sum(D, axis=1))
+        D2 = D @ D
+
+        return nodes, w_b, np.hstack((np.eye(n), D, D2, D2 @ D))
+
+    @staticmethod
+    def _eval_basis(x, basis):
+        """
+        Return the matrices interpolating the value and first three derivatives at the points x.
+
+        Parameters
+        ----------
+        x : np.array
+            The points at which the interpolating polynomial is evaluated, of shape (m,).
+        basis : tuple
+            The nodes, barycentric weights, and stacked differentiation matrices of the polynomial.
+
+        Returns
+        -------
+        np.array
+            An (m, 4, n) array whose slices along the second axis, when post-multiplied by values at
+            the nodes, return the value and the first, second, and third derivatives of the
+            interpolating polynomial at x.
+        """
+        nodes, w_b, D_stack = basis
+        L = _barycentric_basis(x, nodes, w_b)
+        return (L @ D_stack).reshape((len(x), 4, len(nodes)))
+
+    def _get_jac_pattern(self, node_input_idxs, size):
+        """
+        Return the sparsity pattern of an output wrt its control input.
+
+        Parameters
+        ----------
+        node_input_idxs : list of np.array
+            The indices of the input nodes on which each output node depends.
+        size : int
+            The size of the control at each node.
+
+        Returns
+        -------
+        rows : np.array
+            The rows of the nonzero partials.
+        cols : np.array
+            The columns of the nonzero partials.
+        starts : np.array
+            The index of the first nonzero partial of each node.
+        """
+        ar_size = np.arange(size, dtype=int)
+        rows = []
+        cols = []
+        for i, idxs in enumerate(node_input_idxs):
+            # Ordered by input node and then by the element of the control.
+            cols.append((idxs[:, np.newaxis] * size + ar_size[np.newaxis, :]).ravel())
+            rows.append(np.tile(i * size + ar_size, len(idxs)))
+        nnz_per_node = np.array([len(c) for c in cols], dtype=int)
+        starts = np.concatenate(([0], np.cumsum(nnz_per_node)[:-1]))
+        return np.concatenate(rows), np.concatenate(cols), starts
 
     def _configure_controls(self):
         vec_size = self.options['vec_size']
         gd = self._grid_data
 
-        self._V_hat = {}
-        self._V_hat_inv = {}
+        self._control_bases = {}
         self._disc_node_idxs_by_segment = []
         self._input_node_idxs_by_segment = []
+        self._control_jac_starts = {}
 
         if not self._control_options:
             return
@@ -111,18 +237,24 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
             control_disc_seg_stau = control_disc_stau[control_disc_seg_idxs[0]:
                                                       control_disc_seg_idxs[1]]
 
-            seg_control_order = gd.transcription_order[seg_idx] - 1
-            if seg_control_order not in self._V_hat:
-                self._V_hat[seg_control_order] = np.vander(control_disc_seg_stau, increasing=True)
-                self._V_hat_inv[seg_control_order] = np.linalg.inv(self._V_hat[seg_control_order])
-            if seg_control_order + 1 not in self._fac:
-                self._fac[seg_control_order + 1] = np.arange(seg_control_order + 1, dtype=int)
+            n = gd.transcription_order[seg_idx]
+            if n not in self._control_bases:
+                self._control_bases[n] = self._make_basis(control_disc_seg_stau)
 
         num_uhat_nodes = gd.subset_num_nodes['control_input']
-        ar = np.arange(vec_size, dtype=int)
+
+        if self.options['static_segment_index']:
+            seg_idx = self.options['segment_index']
+            self._static_segment_index = np.broadcast_to(seg_idx, (vec_size,)).copy()
+            node_input_idxs = [self._input_node_idxs_by_segment[i] for i in self._static_segment_index]
+        else:
+            self._static_segment_index = None
+            node_input_idxs = vec_size * [np.arange(num_uhat_nodes, dtype=int)]
+
         for control_name, options in self._control_options.items():
             shape = options['shape']
             units = options['units']
+            size = np.prod(shape, dtype=int)
             input_name = f'controls:{control_name}'
             output_name = f'control_values:{control_name}'
             rate_name = f'control_rates:{control_name}_rate'
@@ -134,23 +266,31 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
             self.add_output(rate_name, shape=output_shape, units=units)
             self.add_output(rate2_name, shape=output_shape, units=units)
             self._control_io_names[control_name] = (input_name, output_name, rate_name, rate2_name)
-            self.declare_partials(of=output_name, wrt=input_name)
-            self.declare_partials(of=output_name, wrt='stau', rows=ar, cols=ar)
-            self.declare_partials(of=rate_name, wrt=input_name)
-            self.declare_partials(of=rate_name, wrt='stau', rows=ar, cols=ar)
-            self.declare_partials(of=rate_name, wrt='dstau_dt')
-            self.declare_partials(of=rate2_name, wrt=input_name)
-            self.declare_partials(of=rate2_name, wrt='stau', rows=ar, cols=ar)
-            self.declare_partials(of=rate2_name, wrt='dstau_dt')
+
+            rows, cols, self._control_jac_starts[control_name] = \
+                self._get_jac_pattern(node_input_idxs, size)
+            ar = np.arange(vec_size * size, dtype=int)
+            node_cols = np.repeat(np.arange(vec_size, dtype=int), size)
+
+            self.declare_partials(of=output_name, wrt=input_name, rows=rows, cols=cols)
+            self.declare_partials(of=output_name, wrt='stau', rows=ar, cols=node_cols)
+            self.declare_partials(of=rate_name, wrt=input_name, rows=rows, cols=cols)
+            self.declare_partials(of=rate_name, wrt='stau', rows=ar, cols=node_cols)
+            self.declare_partials(of=rate_name, wrt='dstau_dt', rows=ar, cols=node_cols)
+            self.declare_partials(of=rate2_name, wrt=input_name, rows=rows, cols=cols)
+            self.declare_partials(of=rate2_name, wrt='stau', rows=ar, cols=node_cols)
+            self.declare_partials(of=rate2_name, wrt='dstau_dt', rows=ar, cols=node_cols)
 
     def _configure_polynomial_controls(self):
         vec_size = self.options['vec_size']
-        ar = np.arange(vec_size, dtype=int)
+
+        self._polynomial_control_bases = {}
 
         for pc_name, options in self._polynomial_control_options.items():
             order = options['order']
             shape = options['shape']
             units = options['units']
+            size = np.prod(shape, dtype=int)
             input_name = f'polynomial_controls:{pc_name}'
             output_name = f'polynomial_control_values:{pc_name}'
             rate_name = f'polynomial_control_rates:{pc_name}_rate'
@@ -162,21 +302,23 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
             self.add_output(rate_name, shape=output_shape, units=units)
             self.add_output(rate2_name, shape=output_shape, units=units)
             self._control_io_names[pc_name] = (input_name, output_name, rate_name, rate2_name)
-            self.declare_partials(of=output_name, wrt=input_name)
-            self.declare_partials(of=output_name, wrt='ptau', rows=ar, cols=ar)
-            self.declare_partials(of=rate_name, wrt=input_name)
-            self.declare_partials(of=rate_name, wrt='ptau', rows=ar, cols=ar)
+
+            rows, cols, _ = self._get_jac_pattern(vec_size * [np.arange(order + 1, dtype=int)], size)
+            ar = np.arange(vec_size * size, dtype=int)
+            node_cols = np.repeat(np.arange(vec_size, dtype=int), size)
+
+            self.declare_partials(of=output_name, wrt=input_name, rows=rows, cols=cols)
+            self.declare_partials(of=output_name, wrt='ptau', rows=ar, cols=node_cols)
+            self.declare_partials(of=rate_name, wrt=input_name, rows=rows, cols=cols)
+            self.declare_partials(of=rate_name, wrt='ptau', rows=ar, cols=node_cols)
             self.declare_partials(of=rate_name, wrt='t_duration')
-            self.declare_partials(of=rate2_name, wrt=input_name)
-            self.declare_partials(of=rate2_name, wrt='ptau', rows=ar, cols=ar)
+            self.declare_partials(of=rate2_name, wrt=input_name, rows=rows, cols=cols)
+            self.declare_partials(of=rate2_name, wrt='ptau', rows=ar, cols=node_cols)
             self.declare_partials(of=rate2_name, wrt='t_duration')
 
-            if order not in self._V_hat:
+            if order + 1 not in self._polynomial_control_bases:
                 pc_disc_seg_ptau, _ = lgl(order + 1)
-                self._V_hat[order] = np.vander(pc_disc_seg_ptau, increasing=True)
-                self._V_hat_inv[order] = np.linalg.inv(self._V_hat[order])
-            if order + 1 not in self._fac:
-                self._fac[order + 1] = np.arange(order + 1, dtype=int)
+                self._polynomial_control_bases[order + 1] = self._make_basis(pc_disc_seg_ptau)
 
     def setup(self):
         """
@@ -191,52 +333,35 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
         """
         vec_size = self.options['vec_size']
 
-        self._V_hat = {}
-        self._V_hat_inv = {}
-
         # self.add_discrete_input('segment_index', val=0, desc='index of the segment')
         self.add_input('stau', shape=(vec_size,), units=None)
-        self.add_input('dstau_dt', val=1.0, units=f'1/{self._time_units}')
+        self.add_input('dstau_dt', shape=(vec_size,), val=1.0, units=f'1/{self._time_units}')
         self.add_input('t_duration', val=1.0, units=self._time_units)
         self.add_input('ptau', shape=(vec_size,), units=None)
 
         self._configure_controls()
         self._configure_polynomial_controls()
 
-    def _dvander(self, v):
+    def _get_segment_nodes(self):
         """
-        Return the derivative of a Vandermonde matrix wrt the independent variable _in increasing order_.
-
-        Parameters
-        ----------
-        v : np.array
-            The Vandermonde matrix for which the derivatives are requested.
+        Group the nodes at which the controls are evaluated by the segment in which they lie.
 
         Returns
         -------
-        dV : np.array
-            The derivative of v with respect to the independent variable.
-        dv2 : np.array
-            The second derivative of v wrt the independent variable.
-        dv3 : np.array
-            The third derivative of v wrt the independent variable.
+        list of (int, slice or np.ndarray)
+            The index of each segment containing nodes, and the indices of those nodes.
         """
-        p, n = v.shape
-        dv = np.zeros_like(v)
-        dv2 = dv.copy()
-        dv3 = dv.copy()
-        dv[:, 1:] = v[:, :-1]
-        dv2[:, 2:] = v[:, :-2]
-        dv3[:, 3:] = v[:, :-3]
-
-        fac = self._fac[n]
-        fac2 = fac[:-1]
-        fac3 = fac[:-2]
-
-        dv[:, :] = dv * fac[np.newaxis, :]
-        dv2[:, 1:] = dv2[:, 1:] * fac2[np.newaxis, :] * fac[np.newaxis, 1:]
-        dv3[:, 2:] = dv3[:, 2:] * fac3[np.newaxis, :] * fac2[np.newaxis, 1:] * fac[np.newaxis, 2:]
-        return dv, dv2, dv3
+        seg_idx = self.options['segment_index']
+
+        if self._static_segment_index is not None and \
+                not np.array_equal(np.broadcast_to(seg_idx, self._static_segment_index.shape),
+                                   self._static_segment_index):
+            raise ValueError(f'{self.msginfo}: segment_index may not change after setup when '
+                             f'static_segment_index is True.')
+
+        if np.ndim(seg_idx) == 0:
+            return [(seg_idx, np.arange(self.options['vec_size'], dtype=int))]
+        return [(i, np.where(seg_idx == i)[0]) for i in np.unique(seg_idx)]
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
@@ -253,40 +378,37 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
         discrete_outputs : `Vector`
             `Vector` containing discrete_outputs.
         """
-        seg_idx = self.options['segment_index']
-        n = self._grid_data.transcription_order[seg_idx]
         stau = inputs['stau']
         dstau_dt = inputs['dstau_dt']
         ptau = inputs['ptau']
         dptau_dt = 2 / inputs['t_duration']
 
         if self._control_options:
-            seg_order = n - 1
-            disc_node_idxs = self._disc_node_idxs_by_segment[seg_idx]
-            input_node_idxs = self._input_node_idxs_by_segment[seg_idx]
-            V_stau = np.vander(stau, N=n, increasing=True)
-            dV_stau, dV2_stau, _ = self._dvander(V_stau)
-
-            L_seg = self._L_id[disc_node_idxs[0]:disc_node_idxs[0] + len(disc_node_idxs),
-                               input_node_idxs[0]:input_node_idxs[0] + len(input_node_idxs)]
-
-            for control_name, options in self._control_options.items():
-                input_name, output_name, rate_name, rate2_name = self._control_io_names[control_name]
-                u_hat = np.dot(L_seg, inputs[input_name][input_node_idxs])
-                a = np.atleast_2d(self._V_hat_inv[seg_order] @ u_hat)
-                outputs[output_name] = V_stau @ a
-                outputs[rate_name] = dstau_dt * (dV_stau @ a)
-                outputs[rate2_name] = dstau_dt**2 * (dV2_stau @ a)
+            for seg_idx, nodes in self._get_segment_nodes():
+                n = self._grid_data.transcription_order[seg_idx]
+                input_node_idxs = self._input_node_idxs_by_segment[seg_idx]
+                B = self._eval_basis(stau[nodes], self._control_bases[n])
+                dstau_dt_seg = dstau_dt[nodes, np.newaxis]
+
+                for control_name in self._control_options:
+                    input_name, output_name, rate_name, rate2_name = self._control_io_names[control_name]
+                    u_hat = inputs[input_name][input_node_idxs].reshape((n, -1))
+                    u, u_rate, u_rate2 = (B[:, :3, :] @ u_hat).transpose((1, 0, 2))
+                    out_shape = outputs[output_name][nodes].shape
+                    outputs[output_name][nodes] = u.reshape(out_shape)
+                    outputs[rate_name][nodes] = (dstau_dt_seg * u_rate).reshape(out_shape)
+                    outputs[rate2_name][nodes] = (dstau_dt_seg**2 * u_rate2).reshape(out_shape)
 
         for pc_name, options in self._polynomial_control_options.items():
             input_name, output_name, rate_name, rate2_name = self._control_io_names[pc_name]
-            order = options['order']
-            V_ptau = np.vander(ptau, N=order+1, increasing=True)
-            dV_ptau, dV2_ptau, _ = self._dvander(V_ptau)
-            a = np.atleast_2d(self._V_hat_inv[order] @ inputs[input_name])
-            outputs[output_name] = V_ptau @ a
-            outputs[rate_name] = dptau_dt * (dV_ptau @ a)
-            outputs[rate2_name] = dptau_dt**2 * (dV2_ptau @ a)
+            n = options['order'] + 1
+            B = self._eval_basis(ptau, self._polynomial_control_bases[n])
+            u_hat = inputs[input_name].reshape((n, -1))
+            u, u_rate, u_rate2 = (B[:, :3, :] @ u_hat).transpose((1, 0, 2))
+            out_shape = outputs[output_name].shape
+            outputs[output_name] = u.reshape(out_shape)
+            outputs[rate_name] = (dptau_dt * u_rate).reshape(out_shape)
+            outputs[rate2_name] = (dptau_dt**2 * u_rate2).reshape(out_shape)
 
     def compute_partials(self, inputs, partials, discrete_inputs=None):
         """
@@ -301,8 +423,6 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
         discrete_inputs : Vector
             Unscaled, discrete input variables keyed by variable name.
         """
-        seg_idx = self.options['segment_index']
-        n = self._grid_data.transcription_order[seg_idx]
         stau = inputs['stau'].real
         dstau_dt = inputs['dstau_dt'].real
         ptau = inputs['ptau'].real
@@ -311,72 +431,61 @@ class VandermondeControlInterpComp(om.ExplicitComponent):
         ddptau_dt_dtduration = -2.0 / t_duration**2
 
         if self._control_options:
-            u_idxs = self._input_node_idxs_by_segment[seg_idx]
-            seg_order = self._grid_data.transcription_order[seg_idx] - 1
-
-            V_stau = np.vander(stau, N=n, increasing=True)
-            dV_stau, dV2_stau, dV3_stau = self._dvander(V_stau)
-
-            disc_node_idxs = self._disc_node_idxs_by_segment[seg_idx]
-            input_node_idxs = self._input_node_idxs_by_segment[seg_idx]
-
-            L_seg = self._L_id[disc_node_idxs[0]:disc_node_idxs[0] + len(disc_node_idxs),
-                               input_node_idxs[0]:input_node_idxs[0] + len(input_node_idxs)]
-
-            for control_name, options in self._control_options.items():
-                input_name, output_name, rate_name, rate2_name = self._control_io_names[control_name]
-
-                u_hat = np.dot(L_seg, inputs[input_name][input_node_idxs].real)
-                a = self._V_hat_inv[seg_order] @ u_hat
-
-                da_duhat = self._V_hat_inv[seg_order] @ L_seg
-                dV_a = dV_stau @ a
-                dV2_a = dV2_stau @ a
-                dV3_a = dV3_stau @ a
-
-                partials[output_name, input_name][...] = 0.0
-                partials[output_name, input_name][..., u_idxs] = V_stau @ da_duhat
-                partials[output_name, 'stau'] = dV_a.ravel()
-
-                pudot_pa = dstau_dt * dV_stau
-                pa_puhat = self._V_hat_inv[seg_order]
-                partials[rate_name, input_name][...] = 0.0
-                partials[rate_name, input_name][..., u_idxs] = pudot_pa @ pa_puhat
-                partials[rate_name, 'dstau_dt'][...] = dV_a
-                partials[rate_name, 'stau'][...] = dV2_a.ravel()
-
-                pu2dot_pa = dstau_dt**2 * dV2_stau
-                partials[rate2_name, input_name][...] = 0.0
-                partials[rate2_name, input_name][..., u_idxs] = pu2dot_pa @ pa_puhat
-                partials[rate2_name, 'dstau_dt'][...] = 2 * dstau_dt * dV2_a
-                partials[rate2_name, 'stau'][...] = dV3_a.ravel()
+            if self._static_segment_index is None:
+                # The partials wrt input nodes outside the current segment of each node are zero.
+                for control_name in self._control_options:
+                    input_name, output_name, rate_name, rate2_name = self._control_io_names[control_name]
+                    partials[output_name, input_name][...] = 0.0
+                    partials[rate_name, input_name][...] = 0.0
+                    partials[rate2_name, input_name][...] = 0.0
+
+            for seg_idx, nodes in self._get_segment_nodes():
+                n = self._grid_data.transcription_order[seg_idx]
+                input_node_idxs = self._input_node_idxs_by_segment[seg_idx]
+                B = self._eval_basis(stau[nodes], self._control_bases[n])
+                dstau_dt_seg = dstau_dt[nodes, np.newaxis]
+
+                # Within the data of each node, the partials of the segment begin at the first input
+                # node of the segment, unless only the input nodes of the segment are declared.
+                first_col = 0 if self._static_segment_index is not None else input_node_idxs[0]
+
+                for control_name in self._control_options:
+                    input_name, output_name, rate_name, rate2_name = self._control_io_names[control_name]
+                    u_hat = inputs[input_name][input_node_idxs].real.reshape((n, -1))
+                    size = u_hat.shape[1]
+
+                    # The partials wrt the input nodes, repeated for each element of the control.
+                    data_idxs = self._control_jac_starts[control_name][nodes, np.newaxis] + \
+                        first_col * size + np.arange(n * size, dtype=int)
+                    dB = np.repeat(B, size, axis=2)
+                    partials[output_name, input_name][data_idxs] = dB[:, 0, :]
+                    partials[rate_name, input_name][data_idxs] = dstau_dt_seg * dB[:, 1, :]
+                    partials[rate2_name, input_name][data_idxs] = dstau_dt_seg**2 * dB[:, 2, :]
+
+                    u_rate, u_rate2, u_rate3 = (B[:, 1:, :] @ u_hat).transpose((1, 0, 2))
+                    jac_idxs = (nodes[:, np.newaxis] * size + np.arange(size, dtype=int)).ravel()
+                    partials[output_name, 'stau'][jac_idxs] = u_rate.ravel()
+                    partials[rate_name, 'dstau_dt'][jac_idxs] = u_rate.ravel()
+                    partials[rate_name, 'stau'][jac_idxs] = (dstau_dt_seg * u_rate2).ravel()
+                    partials[rate2_name, 'dstau_dt'][jac_idxs] = (2 * dstau_dt_seg * u_rate2).ravel()
+                    partials[rate2_name, 'stau'][jac_idxs] = (dstau_dt_seg**2 * u_rate3).ravel()
 
         for pc_name, options in self._polynomial_control_options.items():
             input_name, output_name, rate_name, rate2_name = self._control_io_names[pc_name]
-            order = options['order']
-
-            V_ptau = np.vander(ptau, N=order+1, increasing=True)
-            dV_ptau, dV2_ptau, dV3_ptau = self._dvander(V_ptau)
-
-            u_hat = inputs[input_name].real
-            a = self._V_hat_inv[order] @ u_hat
-
-            dV_a = dV_ptau @ a
-            dV2_a = dV2_ptau @ a
-            dV3_a = dV3_ptau @ a
-
-            da_duhat = self._V_hat_inv[order]
-
-            partials[output_name, input_name][...] = V_ptau @ da_duhat
-            partials[output_name, 'ptau'][...] = dV_a.ravel()
-
-            pudot_pa = dptau_dt * dV_ptau
-            pa_puhat = self._V_hat_inv[order]
-            partials[rate_name, input_name][...] = pudot_pa @ pa_puhat
-            partials[rate_name, 't_duration'][...] = ddptau_dt_dtduration * dV_a
-            partials[rate_name, 'ptau'][...] = dptau_dt * dV2_a.ravel()
-
-            pu2dot_pa = dptau_dt ** 2 * dV2_ptau
-            partials[rate2_name, input_name][...] = pu2dot_pa @ pa_puhat
-            partials[rate2_name, 't_duration'][...] = 2 * dptau_dt * ddptau_dt_dtduration * dV2_a
-            partials[rate2_name, 'ptau'][...] = dptau_dt**2 * dV3_a.ravel()
+            n = options['order'] + 1
+            B = self._eval_basis(ptau, self._polynomial_control_bases[n])
+            u_hat = inputs[input_name].real.reshape((n, -1))
+            size = u_hat.shape[1]
+
+            dB = np.repeat(B, size, axis=2)
+            partials[output_name, input_name][...] = dB[:, 0, :].ravel()
+            partials[rate_name, input_name][...] = dptau_dt * dB[:, 1, :].ravel()
+            partials[rate2_name, input_name][...] = dptau_dt**2 * dB[:, 2, :].ravel()
+
+            u_rate, u_rate2, u_rate3 = (B[:, 1:, :] @ u_hat).transpose((1, 0, 2))
+            partials[output_name, 'ptau'][...] = u_rate.ravel()
+            partials[rate_name, 't_duration'][...] = ddptau_dt_dtduration * u_rate.reshape((-1, 1))
+            partials[rate_name, 'ptau'][...] = dptau_dt * u_rate2.ravel()
+            partials[rate2_name, 't_duration'][...] = \
+                2 * dptau_dt * ddptau_dt_dtduration * u_rate2.reshape((-1, 1))
+            partials[rate2_name, 'ptau'][...] = dptau_dt**2 * u_rate3.ravel()
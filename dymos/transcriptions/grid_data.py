@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 
 from scipy.linalg import block_diag
@@ -122,13 +124,81 @@ def make_subset_map(from_subset_idxs, to_subset_idxs):
         An index map which, when applied to values in the from_subset, will provide values
         in the to_subset.
     """
-    offset = 0
-    subset_map = []
-    for i in range(len(to_subset_idxs)):
-        if to_subset_idxs[i] not in from_subset_idxs:
-            offset += 1
-        subset_map.append(i - offset)
-    return np.array(subset_map)
+    from_subset_idxs = np.asarray(from_subset_idxs)
+    to_subset_idxs = np.asarray(to_subset_idxs)
+    offset = np.cumsum(~np.isin(to_subset_idxs, from_subset_idxs))
+    return np.arange(len(to_subset_idxs), dtype=int) - offset
+
+
+@functools.lru_cache(maxsize=1024)
+def _segment_lagrange_matrices(nodes_given, nodes_eval):
+    """
+    Return the Lagrange matrices of a single segment, cached by the given and evaluation nodes.
+
+    Parameters
+    ----------
+    nodes_given : tuple of float
+        The nodes in segment tau space at which values are given.
+    nodes_eval : tuple of float
+        The nodes in segment tau space at which values and derivatives are to be evaluated.
+
+    Returns
+    -------
+    ndarray[num_eval, num_given]
+        Read-only matrix containing the values at the evaluation nodes.
+    ndarray[num_eval, num_given]
+        Read-only matrix containing the derivatives wrt segment tau at the evaluation nodes.
+    """
+    L, D = lagrange_matrices(np.array(nodes_given), np.array(nodes_eval))
+    L.flags.writeable = False
+    D.flags.writeable = False
+    return L, D
+
+
+@functools.lru_cache(maxsize=1024)
+def _segment_hermite_matrices(nodes_given, nodes_eval):
+    """
+    Return the Hermite matrices of a single segment, cached by the given and evaluation nodes.
+
+    Parameters
+    ----------
+    nodes_given : tuple of float
+        The nodes in segment tau space at which values and derivatives are given.
+    nodes_eval : tuple of float
+        The nodes in segment tau space at which values and derivatives are to be evaluated.
+
+    Returns
+    -------
+    tuple of ndarray[num_eval, num_given]
+        The read-only matrices A_i, B_i, A_d, and B_d of the segment.
+    """
+    mats = hermite_matrices(np.array(nodes_given), np.array(nodes_eval))
+    for mat in mats:
+        mat.flags.writeable = False
+    return mats
+
+
+def _assemble_block_diag(blocks, sparse=False):
+    """
+    Assemble the given segment blocks into a block diagonal phase matrix.
+
+    Parameters
+    ----------
+    blocks : list of ndarray
+        The matrix block of each segment.
+    sparse : bool
+        If True, assemble the blocks directly into a scipy CSR sparse matrix.
+
+    Returns
+    -------
+    ndarray or scipy.sparse.csr_matrix
+        The block diagonal matrix.
+    """
+    if sparse:
+        mat = sp.block_diag(blocks, format='csr')
+        mat.eliminate_zeros()
+        return mat
+    return block_diag(*blocks)
 
 
 class GridData(object):
@@ -277,59 +347,54 @@ class GridData(object):
         num_steps_per_segment = np.ones(num_segments, int) * num_steps_per_segment
         self.num_steps_per_segment = num_steps_per_segment
 
-        # Build up the arrays segment by segment
-        self.segment_indices[0, 0] = 0
-        ind0 = 0  # index of the first node in the segment
+        # Gather the subsets and nodes of each segment, then build the phase arrays in one pass.
+        seg_subsets = []
+        seg_nodes = []
         for iseg in range(num_segments):
             subsets_i, nodes_i = get_subsets_and_nodes(self.transcription_order[iseg],
                                                        seg_idx=iseg,
                                                        compressed=compressed)
+            seg_subsets.append(subsets_i)
+            seg_nodes.append(nodes_i)
 
-            if iseg == 0:
-                subset_ind0 = {name: 0 for name in subsets_i}
-                # index of the first node in the segment for each subset
-                subset_ind1 = subset_ind0.copy()
-                # index of the last node in the segment for each subset
+        num_nodes_per_seg = np.array([len(nodes_i) for nodes_i in seg_nodes], dtype=int)
+        seg_node_ends = np.cumsum(num_nodes_per_seg)
+        self.num_nodes = int(seg_node_ends[-1])
 
-            num_nodes_i = len(nodes_i)
-            self.num_nodes += num_nodes_i
+        self.segment_indices[:, 0] = seg_node_ends - num_nodes_per_seg
+        self.segment_indices[:, 1] = seg_node_ends
 
-            # Append our nodes in segment tau space
-            self.node_stau = np.concatenate((self.node_stau, nodes_i))
+        self.node_stau = np.empty(self.num_nodes)
+        self.node_ptau = np.empty(self.num_nodes)
+        self.node_dptau_dstau = np.empty(self.num_nodes)
 
-            # Append our nodes in phase tau space
+        for iseg, nodes_i in enumerate(seg_nodes):
+            ind0, ind1 = self.segment_indices[iseg, :]
             v0 = segment_ends[iseg]
             v1 = segment_ends[iseg + 1]
-            self.node_ptau = np.concatenate((self.node_ptau, v0 + 0.5 * (nodes_i + 1) * (v1 - v0)))
-            self.node_dptau_dstau = np.concatenate((self.node_dptau_dstau,
-                                                    0.5 * (v1 - v0) * np.ones_like(nodes_i)))
 
-            self.segment_indices[iseg, 1] = self.segment_indices[iseg, 0] + num_nodes_i
-            if iseg < num_segments - 1:
-                self.segment_indices[iseg + 1, 0] = self.segment_indices[iseg, 1]
+            # Our nodes in segment tau space and phase tau space
+            self.node_stau[ind0:ind1] = nodes_i
+            self.node_ptau[ind0:ind1] = v0 + 0.5 * (nodes_i + 1) * (v1 - v0)
+            self.node_dptau_dstau[ind0:ind1] = 0.5 * (v1 - v0)
 
-            for subset_name, subset_idxs_i in subsets_i.items():
-                if iseg == 0:
-                    self.subset_num_nodes[subset_name] = 0
-                    self.subset_num_nodes_per_segment[subset_name] = []
-                    self.subset_segment_indices[subset_name] = np.zeros((num_segments, 2),
-                                                                        dtype=int)
-                    self.subset_node_indices[subset_name] = np.empty(0, dtype=int)
+        for subset_name in seg_subsets[0]:
+            num_subset_nodes = np.array([len(subsets_i[subset_name]) for subsets_i in seg_subsets],
+                                        dtype=int)
+            subset_ends = np.cumsum(num_subset_nodes)
 
-                num_subset_nodes_i = len(subset_idxs_i)
+            self.subset_num_nodes[subset_name] = int(subset_ends[-1])
+            self.subset_num_nodes_per_segment[subset_name] = num_subset_nodes.tolist()
 
-                self.subset_num_nodes[subset_name] += num_subset_nodes_i
-                self.subset_num_nodes_per_segment[subset_name].append(num_subset_nodes_i)
-                subset_ind1[subset_name] += num_subset_nodes_i
+            self.subset_segment_indices[subset_name] = np.empty((num_segments, 2), dtype=int)
+            self.subset_segment_indices[subset_name][:, 0] = subset_ends - num_subset_nodes
+            self.subset_segment_indices[subset_name][:, 1] = subset_ends
 
-                self.subset_segment_indices[subset_name][iseg, 0] = subset_ind0[subset_name]
-                self.subset_segment_indices[subset_name][iseg, 1] = subset_ind1[subset_name]
-
-                self.subset_node_indices[subset_name] = \
-                    np.concatenate((self.subset_node_indices[subset_name], subset_idxs_i + ind0))
-                subset_ind0[subset_name] += num_subset_nodes_i
-
-            ind0 += num_nodes_i
+            self.subset_node_indices[subset_name] = np.empty(subset_ends[-1], dtype=int)
+            for iseg, subsets_i in enumerate(seg_subsets):
+                i1, i2 = self.subset_segment_indices[subset_name][iseg, :]
+                self.subset_node_indices[subset_name][i1:i2] = subsets_i[subset_name] + \
+                    self.segment_indices[iseg, 0]
 
         state_input_idxs = self.subset_node_indices['state_input']
         state_disc_idxs = self.subset_node_indices['state_disc']
@@ -389,17 +454,13 @@ class GridData(object):
             indices = self.subset_node_indices[eval_set_name][i1:i2]
             nodes_eval = self.node_stau[indices]
 
-            L_block, D_block = lagrange_matrices(nodes_given, nodes_eval)
+            L_block, D_block = _segment_lagrange_matrices(tuple(nodes_given), tuple(nodes_eval))
 
             L_blocks.append(L_block)
             D_blocks.append(D_block)
 
-        L = block_diag(*L_blocks)
-        D = block_diag(*D_blocks)
-
-        if sparse:
-            L = sp.csr_matrix(L)
-            D = sp.csr_matrix(D)
+        L = _assemble_block_diag(L_blocks, sparse=sparse)
+        D = _assemble_block_diag(D_blocks, sparse=sparse)
 
         return L, D
 
@@ -462,22 +523,17 @@ class GridData(object):
             indices = self.subset_node_indices[eval_set_name][i1:i2]
             nodes_eval = self.node_stau[indices]
 
-            Ai_seg, Bi_seg, Ad_seg, Bd_seg = hermite_matrices(nodes_given, nodes_eval)
+            Ai_seg, Bi_seg, Ad_seg, Bd_seg = _segment_hermite_matrices(tuple(nodes_given),
+                                                                       tuple(nodes_eval))
 
             Ai_list.append(Ai_seg)
             Bi_list.append(Bi_seg)
             Ad_list.append(Ad_seg)
             Bd_list.append(Bd_seg)
 
-        Ai = block_diag(*Ai_list)
-        Bi = block_diag(*Bi_list)
-        Ad = block_diag(*Ad_list)
-        Bd = block_diag(*Bd_list)
-
-        if sparse:
-            Ai = sp.csr_matrix(Ai)
-            Bi = sp.csr_matrix(Bi)
-            Ad = sp.csr_matrix(Ad)
-            Bd = sp.csr_matrix(Bd)
+        Ai = _assemble_block_diag(Ai_list, sparse=sparse)
+        Bi = _assemble_block_diag(Bi_list, sparse=sparse)
+        Ad = _assemble_block_diag(Ad_list, sparse=sparse)
+        Bd = _assemble_block_diag(Bd_list, sparse=sparse)
 
         return Ai, Bi, Ad, Bd
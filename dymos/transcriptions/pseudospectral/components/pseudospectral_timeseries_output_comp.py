@@ -93,6 +93,8 @@ class PseudospectralTimeseriesOutputComp(TimeseriesOutputCompBase):
             self.interpolation_matrix = block_diag(*L_blocks)
             self.differentiation_matrix = block_diag(*D_blocks)
 
+        self._jac_cache.clear()
+
         self.add_input('dt_dstau', shape=(self.input_num_nodes,), units=self.options['time_units'])
 
     def _add_output_configure(self, name, units, shape, desc='', src=None, rate=False):
@@ -150,35 +152,21 @@ class PseudospectralTimeseriesOutputComp(TimeseriesOutputCompBase):
         self._vars[name] = (input_name, output_name, shape, rate)
 
         size = np.prod(shape)
-        jac = np.zeros((output_num_nodes, size, input_num_nodes, size))
-
-        if rate:
-            mat = self.differentiation_matrix
-        else:
-            mat = self.interpolation_matrix
-
-        for i in range(size):
-            if _USE_SPARSE:
-                jac[:, i, :, i] = mat.toarray()
-            else:
-                jac[:, i, :, i] = mat
-
-        jac = jac.reshape((output_num_nodes * size, input_num_nodes * size), order='C')
-
-        jac_rows, jac_cols = np.nonzero(jac)
+        mat_name = 'differentiation_matrix' if rate else 'interpolation_matrix'
+        jac_rows, jac_cols, jac_vals = self._get_output_jacobian(mat_name, size)
 
         # There's a chance that the input for this output was pulled from another variable with
         # different units, so account for that with a conversion.
         if input_units is None or units is None:
             self.declare_partials(of=output_name, wrt=input_name,
-                                  rows=jac_rows, cols=jac_cols, val=jac[jac_rows, jac_cols])
+                                  rows=jac_rows, cols=jac_cols, val=jac_vals)
         else:
             scale, offset = unit_conversion(input_units, units)
             self._conversion_factors[output_name] = scale, offset
 
             self.declare_partials(of=output_name, wrt=input_name,
                                   rows=jac_rows, cols=jac_cols,
-                                  val=scale * jac[jac_rows, jac_cols])
+                                  val=scale * jac_vals)
 
         return added_source
 
@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from dymos.utils.testing_utils import assert_check_partials
+
+import dymos as dm
+from dymos.transcriptions.pseudospectral.components import PseudospectralTimeseriesOutputComp
+from dymos.transcriptions.grid_data import GridData
+
+
+class _TimeseriesGroup(om.Group):
+
+    def initialize(self):
+        self.options.declare('input_grid_data')
+        self.options.declare('output_grid_data')
+
+    def setup(self):
+        igd = self.options['input_grid_data']
+        ogd = self.options['output_grid_data']
+
+        ivc = self.add_subsystem('ivc', om.IndepVarComp(), promotes_outputs=['*'])
+        ivc.add_output('x', shape=(igd.num_nodes, 3), units='m')
+        ivc.add_output('y', shape=(igd.num_nodes, 3), units='m')
+        ivc.add_output('dt_dstau', shape=(igd.num_nodes,), units='s')
+
+        self.add_subsystem('timeseries',
+                           PseudospectralTimeseriesOutputComp(input_grid_data=igd,
+                                                              output_grid_data=ogd,
+                                                              time_units='s'))
+
+        self.connect('x', 'timeseries.input_values:x')
+        self.connect('y', 'timeseries.input_values:y')
+        self.connect('dt_dstau', 'timeseries.dt_dstau')
+
+    def configure(self):
+        ts = self.timeseries
+        ts._add_output_configure('x', units='m', shape=(3,), src='x')
+        ts._add_output_configure('y', units='ft', shape=(3,), src='y')
+
+
+class TestPseudospectralTimeseriesOutputComp(unittest.TestCase):
+
+    def setUp(self):
+        dm.options['include_check_partials'] = True
+
+    def tearDown(self):
+        dm.options['include_check_partials'] = False
+
+    def test_sparse_jacobian(self):
+        igd = GridData(num_segments=3, transcription='radau-ps', transcription_order=[3, 5, 4],
+                       segment_ends=np.array([-1.0, -0.2, 0.5, 1.0]))
+        ogd = GridData(num_segments=2, transcription='gauss-lobatto', transcription_order=5)
+
+        p = om.Problem(model=_TimeseriesGroup(input_grid_data=igd, output_grid_data=ogd))
+        p.setup(force_alloc_complex=True)
+
+        x = np.random.random((igd.num_nodes, 3))
+        y = np.random.random((igd.num_nodes, 3))
+        p.set_val('x', x)
+        p.set_val('y', y)
+        p.set_val('dt_dstau', np.random.random(igd.num_nodes))
+        p.run_model()
+
+        ts = p.model.timeseries
+        L = ts.interpolation_matrix.toarray()
+
+        # Both outputs have a size of 3, so they share the same cached sparsity pattern.
+        self.assertEqual(len(ts._jac_cache), 1)
+
+        assert_near_equal(p.get_val('timeseries.x'), L @ x, tolerance=1.0E-12)
+        assert_near_equal(p.get_val('timeseries.y', units='m'), L @ y, tolerance=1.0E-12)
+
+        J = p.compute_totals(of=['timeseries.x'], wrt=['x'], return_format='array')
+        assert_near_equal(J, np.kron(L, np.eye(3)), tolerance=1.0E-12)
+
+        cpd = p.check_partials(method='cs', compact_print=True, out_stream=None)
+        assert_check_partials(cpd)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -5,6 +5,7 @@ from ..transcription_base import TranscriptionBase
 from ..common import TimeComp
 from .components import StateIndependentsComp, StateInterpComp, CollocationComp, \
     PseudospectralTimeseriesOutputComp
+from .segment_block_solver import SegmentBlockSolver
 from ...utils.misc import CoerceDesvar, get_rate_units, reshape_val
 from ...utils.introspection import get_promoted_vars, get_source_metadata
 from ...utils.constants import INF_BOUND
@@ -469,7 +470,9 @@ class PseudospectralBase(TranscriptionBase):
         # even though you don't need a nl_solver for connections, you still ln_solver since its implicit
         if self.any_solved_segs or self.any_connected_opt_segs:
             if isinstance(phase.linear_solver, om.LinearRunOnce):
-                phase.linear_solver = om.DirectSolver()
+                directions = {options['solve_segments'] for options in phase.state_options.values()}
+                direction = 'backward' if directions == {'backward'} else 'forward'
+                phase.linear_solver = SegmentBlockSolver(grid_data=self.grid_data, direction=direction)
 
     def setup_timeseries_outputs(self, phase):
         """
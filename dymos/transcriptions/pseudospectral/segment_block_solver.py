@@ -0,0 +1,216 @@
+import numpy as np
+import scipy.sparse.linalg
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+import openmdao.api as om
+from openmdao.solvers.linear.direct import format_singular_error
+
+from ..grid_data import GridData
+
+
+# The node subsets against which the leading dimension of each variable is matched, in order of precedence.
+_NODE_SUBSETS = ('all', 'col', 'state_input', 'state_disc', 'control_input', 'control_disc', 'segment_ends')
+
+
+class _PermutedLU(object):
+    """
+    The LU factorization of a symmetrically permuted matrix, solving systems in the original ordering.
+
+    Parameters
+    ----------
+    lu : scipy.sparse.linalg.SuperLU
+        The factorization of matrix[perm][:, perm].
+    perm : np.array
+        The permutation of the rows and columns of the matrix.
+    """
+    def __init__(self, lu, perm):
+        self._lu = lu
+        self._perm = perm
+
+    def solve(self, rhs, trans='N'):
+        """
+        Solve the linear system with the original matrix, or its transpose.
+
+        Parameters
+        ----------
+        rhs : np.array
+            The right hand side of the system.
+        trans : str
+            'N' to solve the system with the matrix, or 'T' to solve it with its transpose.
+
+        Returns
+        -------
+        np.array
+            The solution of the system.
+        """
+        x = np.empty_like(rhs)
+        x[self._perm] = self._lu.solve(rhs[self._perm], trans)
+        return x
+
+
+class SegmentBlockSolver(om.DirectSolver):
+    """
+    A direct solver which factorizes the jacobian of a pseudospectral phase segment by segment.
+
+    The defects of each segment of a phase depend only on the variables of that segment and on
+    the states passed from the previous segment (for forward propagation) or the next segment
+    (for backward propagation), so the phase jacobian is block-bidiagonal when its rows and columns
+    are grouped by segment.  This solver orders the rows and columns by segment, in the direction of
+    propagation, followed by the variables which do not belong to any segment such as the phase
+    time and parameters.  The variables within each segment are ordered to reduce the bandwidth of
+    the diagonal block of the segment.  Factorizing the reordered matrix without further column
+    reordering is then a forward (or backward) block substitution along the segments, whose cost
+    grows linearly with the number of segments.
+
+    The ordering depends only on the sparsity of the jacobian, so it is computed at the first
+    factorization after setup and reused thereafter.  The segment of each variable is inferred from
+    the number of nodes in its leading dimension.  The ordering only affects the cost of the
+    factorization, not the solution.
+
+    Parameters
+    ----------
+    **kwargs : dict
+        Options dictionary.
+    """
+
+    SOLVER = 'LN: SegmentBlock'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._perm = None
+        self._perm_data_idxs = None
+        self._perm_indices = None
+        self._perm_indptr = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('grid_data', types=GridData,
+                             desc='Container object for the grid info of the phase.')
+        self.options.declare('direction', default='forward', values=('forward', 'backward'),
+                             desc='The direction of propagation along the segments.  If \'forward\', the '
+                                  'segments are eliminated from first to last, otherwise from last to first.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._perm = None
+
+    def _get_row_segments(self):
+        """
+        Return the segment of each output of the system.
+
+        Returns
+        -------
+        np.array
+            The index of the segment of each output of the system, or the number of segments for
+            outputs which do not belong to a segment.
+        """
+        gd = self.options['grid_data']
+        num_seg = gd.num_segments
+        seg_idxs = np.arange(num_seg, dtype=int)
+
+        # The segment of each node of each subset, with subsets of the same size taking precedence in order.
+        node_segments = {}
+        for subset in reversed(_NODE_SUBSETS):
+            node_segments[gd.subset_num_nodes[subset]] = \
+                np.repeat(seg_idxs, gd.subset_num_nodes_per_segment[subset])
+
+        # Values at the boundaries between segments, such as continuity defects, belong to the later segment.
+        node_segments.setdefault(num_seg - 1, seg_idxs[1:])
+
+        row_segments = [np.zeros(0, dtype=int)]
+        for meta in self._system()._var_abs2meta['output'].values():
+            shape = meta['shape']
+            size = meta['size']
+            if size == 0:
+                continue
+            num_nodes = shape[0] if shape else 1
+            if num_nodes in node_segments:
+                row_segments.append(np.repeat(node_segments[num_nodes], size // num_nodes))
+            else:
+                row_segments.append(np.full(size, num_seg, dtype=int))
+
+        row_segments = np.concatenate(row_segments)
+
+        if self.options['direction'] == 'backward':
+            row_segments = np.where(row_segments < num_seg, num_seg - 1 - row_segments, num_seg)
+
+        return row_segments
+
+    def _setup_ordering(self, matrix):
+        """
+        Compute the ordering of the rows and columns of the jacobian used in its factorization.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The assembled jacobian of the system.
+        """
+        row_segments = self._get_row_segments()
+
+        if row_segments.size != matrix.shape[0]:
+            # The outputs of the system do not match the jacobian, such as under MPI.
+            self._perm = np.zeros(0, dtype=int)
+            return
+
+        # Order the rows and columns by segment, in the order in which the segments are eliminated.
+        perm = np.argsort(row_segments, kind='stable')
+        row_segments = row_segments[perm]
+        mtx = matrix[perm, :][:, perm].tocoo()
+
+        # Within each segment, order the rows and columns to reduce the bandwidth of its diagonal block.
+        in_block = row_segments[mtx.row] == row_segments[mtx.col]
+        pattern = csr_matrix((np.ones(np.count_nonzero(in_block)), (mtx.row[in_block], mtx.col[in_block])),
+                             shape=mtx.shape)
+        block_order = reverse_cuthill_mckee(pattern + pattern.T, symmetric_mode=True)
+        block_order = block_order[np.argsort(row_segments[block_order], kind='stable')]
+
+        self._perm = perm[block_order]
+
+        # The sparsity of the jacobian is fixed, so record where each nonzero of the permuted
+        # matrix comes from to permute the values at each factorization.
+        idx_mtx = csc_matrix((np.arange(1, matrix.nnz + 1, dtype=float), matrix.indices, matrix.indptr),
+                             shape=matrix.shape)
+        idx_mtx = idx_mtx[self._perm, :][:, self._perm].tocsc()
+        idx_mtx.sort_indices()
+
+        self._perm_data_idxs = idx_mtx.data.astype(int) - 1
+        self._perm_indices = idx_mtx.indices
+        self._perm_indptr = idx_mtx.indptr
+
+    def _linearize(self):
+        """
+        Perform factorization.
+        """
+        matrix = self._assembled_jac._int_mtx._matrix if self._assembled_jac is not None else None
+
+        if isinstance(matrix, csc_matrix) and self._perm is None:
+            self._setup_ordering(matrix)
+
+        if not isinstance(matrix, csc_matrix) or self._perm.size != matrix.shape[0]:
+            super()._linearize()
+            return
+
+        perm_matrix = csc_matrix((matrix.data[self._perm_data_idxs], self._perm_indices, self._perm_indptr),
+                                 shape=matrix.shape)
+
+        try:
+            lu = scipy.sparse.linalg.splu(perm_matrix, permc_spec='NATURAL')
+        except RuntimeError:
+            raise RuntimeError(format_singular_error(self._system(), matrix))
+
+        self._lu = _PermutedLU(lu, self._perm)
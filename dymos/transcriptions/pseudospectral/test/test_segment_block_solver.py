@@ -0,0 +1,100 @@
+import itertools
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.transcriptions.pseudospectral.segment_block_solver import SegmentBlockSolver
+
+
+def _make_problem(transcription='radau-ps', compressed=True, direction='forward', linear_solver=None, mode='auto'):
+    p = om.Problem(model=om.Group())
+
+    tx_class = dm.Radau if transcription == 'radau-ps' else dm.GaussLobatto
+    tx = tx_class(num_segments=10, order=3, compressed=compressed, solve_segments=direction)
+
+    phase = p.model.add_subsystem('phase0', dm.Phase(ode_class=BrachistochroneODE, transcription=tx))
+
+    phase.set_time_options(fix_initial=True, fix_duration=True)
+    for name in ('x', 'y', 'v'):
+        phase.add_state(name, fix_initial=direction == 'forward', fix_final=direction == 'backward')
+    phase.add_control('theta', units='deg', lower=0.01, upper=179.9)
+    phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+
+    if linear_solver is not None:
+        phase.linear_solver = linear_solver
+
+    p.setup(mode=mode, force_alloc_complex=True)
+
+    phase.nonlinear_solver.options['iprint'] = -1
+
+    p.set_val('phase0.t_duration', 1.8016)
+    if direction == 'forward':
+        p.set_val('phase0.states:x', 0.0)
+        p.set_val('phase0.states:y', 10.0)
+        p.set_val('phase0.states:v', 0.0)
+    else:
+        p.set_val('phase0.states:x', 10.0)
+        p.set_val('phase0.states:y', 5.0)
+        p.set_val('phase0.states:v', 9.9)
+    p.set_val('phase0.controls:theta', phase.interp('theta', [5, 100.5]))
+
+    return p
+
+
+@use_tempdirs
+class TestSegmentBlockSolver(unittest.TestCase):
+
+    def test_solver_installed(self):
+        for direction in ('forward', 'backward'):
+            with self.subTest(direction=direction):
+                p = _make_problem(direction=direction)
+                solver = p.model.phase0.linear_solver
+                self.assertIsInstance(solver, SegmentBlockSolver)
+                self.assertEqual(solver.options['direction'], direction)
+
+    def test_segment_ordering(self):
+        for direction in ('forward', 'backward'):
+            with self.subTest(direction=direction):
+                p = _make_problem(direction=direction)
+                p.run_model()
+
+                solver = p.model.phase0.linear_solver
+                num_seg = solver.options['grid_data'].num_segments
+                ordered_segments = solver._get_row_segments()[solver._perm]
+
+                # The outputs are ordered by segment in the direction of propagation, with the outputs
+                # which belong to no segment last.
+                self.assertTrue(np.all(np.diff(ordered_segments) >= 0))
+                self.assertEqual(set(ordered_segments), set(range(num_seg + 1)))
+                self.assertEqual(np.sort(solver._perm).tolist(), list(range(solver._perm.size)))
+
+    def test_matches_direct_solver(self):
+        for tx, compressed, direction, mode in itertools.product(('radau-ps', 'gauss-lobatto'), (True, False),
+                                                                 ('forward', 'backward'), ('fwd', 'rev')):
+            with self.subTest(transcription=tx, compressed=compressed, direction=direction, mode=mode):
+                p = _make_problem(tx, compressed, direction, mode=mode)
+                p.run_model()
+
+                p_direct = _make_problem(tx, compressed, direction, linear_solver=om.DirectSolver(), mode=mode)
+                p_direct.run_model()
+
+                for name in ('x', 'y', 'v'):
+                    assert_near_equal(p.get_val(f'phase0.timeseries.states:{name}'),
+                                      p_direct.get_val(f'phase0.timeseries.states:{name}'),
+                                      tolerance=1.0E-9)
+
+                of = ['phase0.timeseries.states:x', 'phase0.timeseries.states:v']
+                wrt = ['phase0.controls:theta', 'phase0.t_duration']
+                totals = p.compute_totals(of=of, wrt=wrt, return_format='array')
+                totals_direct = p_direct.compute_totals(of=of, wrt=wrt, return_format='array')
+                assert_near_equal(totals, totals_direct, tolerance=1.0E-8)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
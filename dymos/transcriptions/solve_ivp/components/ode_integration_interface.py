@@ -10,10 +10,16 @@ class ODEIntegrationInterface(object):
     Given a system class, create a callable object with the signature required by scipy.integrate.ode.
 
     Internally, this is accomplished by constructing an OpenMDAO problem using the ODE with
-    a single node.  The interface populates the values of the time, states, and controls,
+    `num_nodes` nodes.  The interface populates the values of the time, states, and controls,
     and then calls `run_model()` on the problem.  The state rates generated by the ODE
     are then returned back to scipy ode, which continues the integration.
 
+    When called with a 2D state array (as scipy does when `vectorized=True`), each column
+    is a separate evaluation point.  If `batch_size` is greater than one, these points are
+    evaluated by a second problem whose ODE has `batch_size` nodes, up to `batch_size` points
+    per call to `run_model()`, while the ordinary one-point calls continue to use the
+    `num_nodes` problem.
+
     Parameters
     ----------
     ode_class : class
@@ -32,10 +38,23 @@ class ODEIntegrationInterface(object):
         Keyword argument dictionary passed to the ODE at initialization.
     reports : bool or None or str or Sequence
         The reports argument to be passed to the subproblems.  By default, no subproblem reports are generated.
+    num_nodes : int
+        The number of nodes with which the ODE of `prob` is instantiated.
+    ensemble : bool
+        If True, each node is a member of an ensemble with its own parameter and control values,
+        and the ensemble is integrated by passing `eval_ensemble` to scipy.
+    batch_size : int
+        The number of nodes of the ODE which evaluates the points of 2D state arrays.  If one,
+        those points are evaluated by `prob`.
+
+    Attributes
+    ----------
+    prob : om.Problem
+        The problem which evaluates the ODE at `num_nodes` nodes.
     """
     def __init__(self, ode_class, time_options, state_options, control_options,
                  polynomial_control_options, parameter_options, ode_init_kwargs=None,
-                 reports=False):
+                 reports=False, num_nodes=1, ensemble=False, batch_size=1):
 
         # Get the state vector.  This isn't necessarily ordered
         # so just pick the default ordering and go with it.
@@ -46,6 +65,8 @@ class ODEIntegrationInterface(object):
         self.parameter_options = parameter_options
         self.control_interpolants = {}
         self.polynomial_control_interpolants = {}
+        self.num_nodes = num_nodes
+        self.batch_size = batch_size
 
         pos = 0
 
@@ -59,21 +80,68 @@ class ODEIntegrationInterface(object):
             pos += self.state_options[state]['size']
 
         self._state_vec = np.zeros(pos, dtype=float)
-        self._state_rate_vec = np.zeros(pos, dtype=float)
+        self._state_rate_mat = np.zeros((num_nodes, pos), dtype=float)
+        self._batch_state_rate_mat = np.zeros((batch_size, pos), dtype=float)
+
+        # The names of the state rates and states of the single-node problem, in state vector
+        # order, whose total derivatives form the state-rate Jacobian.
+        self._jac_of = [f'state_rate_collector.state_rates:{state}_rate' for state in self.state_options]
+        self._jac_wrt = [f'states:{state}' for state in self.state_options]
 
         #
         # Build odeint problem interface
         #
-        self.prob = om.Problem(model=ODEIntegrationInterfaceSystem(ode_class=ode_class,
-                                                                   time_options=time_options,
-                                                                   state_options=state_options,
-                                                                   control_options=control_options,
-                                                                   polynomial_control_options=polynomial_control_options,
-                                                                   parameter_options=parameter_options,
-                                                                   ode_init_kwargs=ode_init_kwargs),
-                               reports=reports)
+        def make_problem(nn, ensemble):
+            return om.Problem(model=ODEIntegrationInterfaceSystem(num_nodes=nn,
+                                                                  ode_class=ode_class,
+                                                                  time_options=time_options,
+                                                                  state_options=state_options,
+                                                                  control_options=control_options,
+                                                                  polynomial_control_options=polynomial_control_options,
+                                                                  parameter_options=parameter_options,
+                                                                  ode_init_kwargs=ode_init_kwargs,
+                                                                  ensemble=ensemble),
+                              reports=reports)
+
+        self.prob = make_problem(num_nodes, ensemble)
+        self._batch_prob = make_problem(batch_size, False) if batch_size > 1 else None
+
+    @property
+    def _problems(self):
+        """
+        The problems of the interface.
+
+        Returns
+        -------
+        list of om.Problem
+            The problem evaluating one-point calls and, if there is one, the batch problem.
+        """
+        return [self.prob] if self._batch_prob is None else [self.prob, self._batch_prob]
+
+    def setup(self):
+        """
+        Setup the problems of the interface.
+        """
+        for prob in self._problems:
+            prob.setup(check=False)
+
+    def set_val(self, name, val, units=None):
+        """
+        Set the value of an input of the ODE, such as t_initial or a parameter, in every problem of the interface.
+
+        Parameters
+        ----------
+        name : str
+            The promoted name of the variable in the interface problem.
+        val : float or np.array
+            The value of the variable.
+        units : str or None
+            The units of the given value.
+        """
+        for prob in self._problems:
+            prob.set_val(name, val=val, units=units)
 
-    def _unpack_state_vec(self, x):
+    def _unpack_state_vec(self, x, prob):
         """
         Given the state vector in 1D, extract the values corresponding to
         each state into the ode integrators problem states.
@@ -81,7 +149,10 @@ class ODEIntegrationInterface(object):
         Parameters
         ----------
         x : np.array
-            The 1D state vector.
+            The 1D state vector, or a 2D array of shape (num_nodes, state_vec_size) giving
+            the state vector at each node.
+        prob : om.Problem
+            The problem whose states are set.
 
         Returns
         -------
@@ -91,24 +162,33 @@ class ODEIntegrationInterface(object):
         for state_name, state_options in self.state_options.items():
             pos = state_options['pos']
             size = state_options['size']
-            self.prob[f'states:{state_name}'][0, ...] = x[pos:pos + size]
+            prob[f'states:{state_name}'][...] = x[..., pos:pos + size]
 
-    def _pack_state_rate_vec(self):
+    def _pack_state_rate_vec(self, prob, state_rate_mat):
         """
         Pack the state rates into a 1D vector for use by scipy odeint.
 
+        Parameters
+        ----------
+        prob : om.Problem
+            The problem from which the state rates are taken.
+        state_rate_mat : np.array
+            The array into which the state rates of each node of the problem are packed.
+
         Returns
         -------
         dXdt : np.array
-            The 1D state-rate vector.
+            The state-rate array of shape (num_nodes, state_vec_size).
 
         """
+        num_nodes = state_rate_mat.shape[0]
         for state_name, state_options in self.state_options.items():
             pos = state_options['pos']
             size = state_options['size']
-            self._state_rate_vec[pos:pos + size] = \
-                np.ravel(self.prob[f'state_rate_collector.state_rates:{state_name}_rate'])
-        return self._state_rate_vec
+            state_rate_mat[:, pos:pos + size] = \
+                np.reshape(prob[f'state_rate_collector.state_rates:{state_name}_rate'],
+                           (num_nodes, size))
+        return state_rate_mat
 
     def set_interpolant(self, name, interp):
         """
@@ -121,7 +201,9 @@ class ODEIntegrationInterface(object):
         interp : LagrangeBarycentricInterpolant
             The LagrangeBarycentricInterpolant for the given control or polynomial control.
         """
-        self.prob.model.set_interpolant(name, interp)
+        # The problems share the interpolant, so setup_interpolant applies to each of them.
+        for prob in self._problems:
+            prob.model.set_interpolant(name, interp)
 
     def setup_interpolant(self, name, x0, xf, f_j):
         """
@@ -154,16 +236,112 @@ class ODEIntegrationInterface(object):
         t : float
             The current time, t.
         x : np.array
-            The 1D state vector.
+            The 1D state vector, or a 2D array of shape (state_vec_size, k) whose columns are
+            the state vectors at k evaluation points.
 
         Returns
         -------
         xdot : np.array
-            The 1D vector of state time-derivatives.
+            The 1D vector of state time-derivatives, or a 2D array of shape
+            (state_vec_size, k) if x is 2D.
         """
-        self.prob['time'] = t
-        self.prob['time_phase'] = t - self.prob['t_initial']
-        self._unpack_state_vec(x)
-        self.prob.run_model()
-        xdot = self._pack_state_rate_vec()
+        if np.ndim(x) == 1:
+            # scipy keeps references to the returned rates, so a new array is returned.
+            return self._eval_nodes(t, x[np.newaxis, :])[0, :].copy()
+
+        batch = self._batch_prob is not None
+        nn = self.batch_size if batch else self.num_nodes
+        num_points = x.shape[1]
+        xdot = np.empty_like(x, dtype=float)
+        t_pts = np.broadcast_to(t, (num_points,))
+
+        for i in range(0, num_points, nn):
+            j = min(i + nn, num_points)
+            xdot[:, i:j] = self._eval_nodes(t_pts[i:j], x[:, i:j].T, batch=batch).T
+
         return xdot
+
+    def eval_ensemble(self, t, x):
+        """
+        The function interface used by scipy.ode to integrate every member of an ensemble at once.
+
+        Parameters
+        ----------
+        t : float
+            The current time, t.
+        x : np.array
+            The 1D state vector of the ensemble, which is the state vector of each of the
+            num_nodes members concatenated.
+
+        Returns
+        -------
+        np.array
+            The 1D vector of state time-derivatives of the ensemble.
+        """
+        # scipy keeps references to the returned rates, so a new array is returned.
+        return self._eval_nodes(t, np.reshape(x, (self.num_nodes, -1))).flatten()
+
+    def jac(self, t, x):
+        """
+        The Jacobian of the state rates with respect to the states.
+
+        The Jacobian is computed from the partials declared by the ODE via `compute_totals`,
+        rather than by finite-differencing the ODE one state at a time.  It requires an
+        interface whose `prob` has a single node, so that only the given point is evaluated
+        and differentiated.
+
+        Parameters
+        ----------
+        t : float
+            The current time, t.
+        x : np.array
+            The 1D state vector.
+
+        Returns
+        -------
+        np.array
+            The Jacobian matrix of shape (state_vec_size, state_vec_size).
+        """
+        if self.num_nodes != 1:
+            raise RuntimeError('The Jacobian of the ODE is only available from an '
+                               f'ODEIntegrationInterface with a single node, not {self.num_nodes}.')
+        self._eval_nodes(t, np.reshape(x, (1, -1)))
+        return self.prob.compute_totals(of=self._jac_of, wrt=self._jac_wrt, return_format='array')
+
+    def _eval_nodes(self, t, x, batch=False):
+        """
+        Evaluate the state rates at up to num_nodes points with a single call to run_model.
+
+        Unused nodes are filled with the last given point.
+
+        Parameters
+        ----------
+        t : float or np.array
+            The time at each point.
+        x : np.array
+            The state vector at each point, with shape (num_points, state_vec_size).
+        batch : bool
+            If True, the points are evaluated by the batch problem, otherwise by `prob`.
+
+        Returns
+        -------
+        np.array
+            The state rates at each point, with shape (num_points, state_vec_size).
+        """
+        if batch:
+            prob, state_rate_mat = self._batch_prob, self._batch_state_rate_mat
+        else:
+            prob, state_rate_mat = self.prob, self._state_rate_mat
+        num_nodes = state_rate_mat.shape[0]
+
+        num_points = x.shape[0]
+        if num_points < num_nodes:
+            pad = num_nodes - num_points
+            x = np.concatenate((x, np.repeat(x[-1:, :], pad, axis=0)))
+            t = np.concatenate((np.broadcast_to(t, (num_points,)),
+                                np.broadcast_to(np.ravel(t)[-1], (pad,))))
+        prob['time'] = t
+        prob['time_phase'] = t - prob['t_initial']
+        self._unpack_state_vec(x, prob)
+        prob.run_model()
+        return self._pack_state_rate_vec(prob, state_rate_mat)[:num_points, :]
@@ -3,6 +3,7 @@ from .odeint_control_interpolation_comp import ODEIntControlInterpolationComp
 from .state_rate_collector_comp import StateRateCollectorComp
 from ....phase.options import TimeOptionsDictionary
 from ....utils.introspection import get_promoted_vars
+from ....utils.indexing import get_src_indices_by_row
 import openmdao.api as om
 
 
@@ -19,6 +20,13 @@ class ODEIntegrationInterfaceSystem(om.Group):
         """
         Declare group options.
         """
+        self.options.declare('num_nodes', types=int, default=1,
+                             desc='Number of nodes at which the ODE is evaluated simultaneously.')
+
+        self.options.declare('ensemble', types=bool, default=False,
+                             desc='If True, each node is a member of an ensemble evaluated at the same '
+                                  'time, with its own parameter and control values.')
+
         self.options.declare('time_options', types=TimeOptionsDictionary,
                              desc='Time options for the phase')
 
@@ -47,10 +55,11 @@ class ODEIntegrationInterfaceSystem(om.Group):
         Create the group hierarchy.
         """
         ivc = om.IndepVarComp()
+        nn = self.options['num_nodes']
         time_options = self.options['time_options']
         time_units = time_options['units']
-        ivc.add_output('time', val=0.0, units=time_units)
-        ivc.add_output('time_phase', val=-88.0, units=time_units)
+        ivc.add_output('time', val=np.zeros(nn), units=time_units)
+        ivc.add_output('time_phase', val=-88.0 * np.ones(nn), units=time_units)
         ivc.add_output('t_initial', val=-99.0, units=time_units)
         ivc.add_output('t_duration', val=-111.0, units=time_units)
 
@@ -66,7 +75,8 @@ class ODEIntegrationInterfaceSystem(om.Group):
 
         if self.options['control_options'] or self.options['polynomial_control_options']:
             self._interp_comp = \
-                ODEIntControlInterpolationComp(time_units=time_units,
+                ODEIntControlInterpolationComp(num_nodes=nn, time_units=time_units,
+                                               ensemble=self.options['ensemble'],
                                                control_options=self.options['control_options'],
                                                polynomial_control_options=self.options['polynomial_control_options'])
 
@@ -75,18 +85,20 @@ class ODEIntegrationInterfaceSystem(om.Group):
 
         # The ODE System
         if self.options['ode_class'] is not None:
-            self.add_subsystem('ode', subsys=self.options['ode_class'](num_nodes=1,
+            self.add_subsystem('ode', subsys=self.options['ode_class'](num_nodes=nn,
                                                                        **self.options['ode_init_kwargs']))
 
         # The state rate collector comp
         self.add_subsystem('state_rate_collector',
-                           StateRateCollectorComp(state_options=self.options['state_options'],
+                           StateRateCollectorComp(num_nodes=nn,
+                                                  state_options=self.options['state_options'],
                                                   time_units=time_options['units']))
 
     def configure(self):
         """
         Issue connections after introspection.
         """
+        nn = self.options['num_nodes']
         ivc = self._get_subsystem('ivc')
         ode = self._get_subsystem('ode')
         ode_inputs = get_promoted_vars(ode, 'input')
@@ -95,7 +107,7 @@ class ODEIntegrationInterfaceSystem(om.Group):
         for name, options in self.options['state_options'].items():
             size = np.prod(options['shape'])
             ivc.add_output(f'states:{name}',
-                           shape=(1, size),
+                           shape=(nn, size),
                            units=options['units'])
 
             rate_src = self._get_rate_source_path(name)
@@ -105,10 +117,7 @@ class ODEIntegrationInterfaceSystem(om.Group):
             if options['targets']:
                 for tgt in options['targets']:
                     tgt_shape = ode_inputs[tgt]['shape']
-                    if len(tgt_shape) == 1 and tgt_shape[0] == 1:
-                        src_idxs = np.arange(size, dtype=int).reshape(tgt_shape)
-                    else:
-                        src_idxs = np.arange(size, dtype=int).reshape((1,) + tgt_shape)
+                    src_idxs = np.arange(nn * size, dtype=int).reshape(tgt_shape)
                     self.connect(f'states:{name}', f'ode.{tgt}',
                                  src_indices=(src_idxs,), flat_src_indices=True)
 
@@ -140,11 +149,30 @@ class ODEIntegrationInterfaceSystem(om.Group):
 
         # Parameters
         if self.options['parameter_options']:
+            ensemble = self.options['ensemble']
             for name, options in self.options['parameter_options'].items():
-                ivc.add_output(f'parameters:{name}', shape=options['shape'], units=options['units'])
+                # In an ensemble, each member (node) has its own value of each parameter.
+                shape = (nn,) + options['shape'] if ensemble else options['shape']
+                ivc.add_output(f'parameters:{name}', shape=shape, units=options['units'])
                 if options['targets']:
-                    self.connect(f'parameters:{name}',
-                                 [f'ode.{tgt}' for tgt in options['targets']])
+                    size = np.prod(options['shape'])
+                    for tgt in options['targets']:
+                        if np.prod(ode_inputs[tgt]['shape']) == size:
+                            # Static target, or a dynamic target when only one node is evaluated.
+                            if ensemble:
+                                src_idxs = get_src_indices_by_row(np.zeros(1, dtype=int),
+                                                                  options['shape'])
+                                src_idxs = np.reshape(src_idxs, ode_inputs[tgt]['shape'])
+                                self.connect(f'parameters:{name}', f'ode.{tgt}',
+                                             src_indices=src_idxs, flat_src_indices=True)
+                            else:
+                                self.connect(f'parameters:{name}', f'ode.{tgt}')
+                        else:
+                            src_rows = np.arange(nn, dtype=int) if ensemble else np.zeros(nn, dtype=int)
+                            src_idxs = get_src_indices_by_row(src_rows, options['shape'])
+                            src_idxs = np.reshape(src_idxs, ode_inputs[tgt]['shape'])
+                            self.connect(f'parameters:{name}', f'ode.{tgt}',
+                                         src_indices=src_idxs, flat_src_indices=True)
 
     def _get_rate_source_path(self, state_var):
         var = self.options['state_options'][state_var]['rate_source']
@@ -1,3 +1,5 @@
+import numpy as np
+
 from dymos.utils.misc import get_rate_units
 import openmdao.api as om
 
@@ -19,12 +21,17 @@ class ODEIntControlInterpolationComp(om.ExplicitComponent):
         """
         Declare component options.
         """
+        self.options.declare('num_nodes', types=int, default=1,
+                             desc='Number of times at which the controls are interpolated.')
         self.options.declare('time_units', default='s', allow_none=True, types=str,
                              desc='Units of time')
         self.options.declare('control_options', types=dict, allow_none=True, default=None,
                              desc='Dictionary of options for the dynamic controls')
         self.options.declare('polynomial_control_options', types=dict, allow_none=True,
                              default=None, desc='Dictionary of options for the polynomial controls')
+        self.options.declare('ensemble', types=bool, default=False,
+                             desc='If True, each node is a member of an ensemble evaluated at the same time, '
+                                  'and each interpolant provides the values of every member.')
         self.options.declare('control_interpolants', types=dict, allow_none=True, default={},
                              desc='Dictionary of interpolants for the dynamic controls',
                              recordable=False)
@@ -37,11 +44,12 @@ class ODEIntControlInterpolationComp(om.ExplicitComponent):
         Create inputs/outputs for this component.
         """
         time_units = self.options['time_units']
+        nn = self.options['num_nodes']
 
-        self.add_input('time', val=1.0, units=time_units)
+        self.add_input('time', val=np.ones(nn), units=time_units)
 
         for control_name, options in self.options['control_options'].items():
-            shape = options['shape']
+            shape = (nn,) + options['shape']
             units = options['units']
             rate_units = get_rate_units(units, time_units, deriv=1)
             rate2_units = get_rate_units(units, time_units, deriv=2)
@@ -55,7 +63,7 @@ class ODEIntControlInterpolationComp(om.ExplicitComponent):
                             units=rate2_units)
 
         for control_name, options in self.options['polynomial_control_options'].items():
-            shape = options['shape']
+            shape = (nn,) + options['shape']
             units = options['units']
             rate_units = get_rate_units(units, time_units, deriv=1)
             rate2_units = get_rate_units(units, time_units, deriv=2)
@@ -80,7 +88,11 @@ class ODEIntControlInterpolationComp(om.ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        time = inputs['time']
+        if self.options['ensemble']:
+            # The interpolants provide the values of every member at once.
+            time = inputs['time'][0]
+        else:
+            time = inputs['time']
 
         for name in self.options['control_options']:
             if name not in self.options['control_interpolants']:
@@ -88,11 +100,11 @@ class ODEIntControlInterpolationComp(om.ExplicitComponent):
 
             interp = self.options['control_interpolants'][name]
 
-            outputs['controls:{0}'.format(name)] = interp.eval(time)
+            outputs['controls:{0}'.format(name)][...] = interp.eval(time)
 
-            outputs['control_rates:{0}_rate'.format(name)] = interp.eval_deriv(time)
+            outputs['control_rates:{0}_rate'.format(name)][...] = interp.eval_deriv(time)
 
-            outputs['control_rates:{0}_rate2'.format(name)] = interp.eval_deriv(time, der=2)
+            outputs['control_rates:{0}_rate2'.format(name)][...] = interp.eval_deriv(time, der=2)
 
         for name in self.options['polynomial_control_options']:
             if name not in self.options['polynomial_control_interpolants']:
@@ -100,8 +112,10 @@ class ODEIntControlInterpolationComp(om.ExplicitComponent):
 
             interp = self.options['polynomial_control_interpolants'][name]
 
-            outputs['polynomial_controls:{0}'.format(name)] = interp.eval(time)
+            outputs['polynomial_controls:{0}'.format(name)][...] = interp.eval(time)
 
-            outputs['polynomial_control_rates:{0}_rate'.format(name)] = interp.eval_deriv(time)
+            outputs['polynomial_control_rates:{0}_rate'.format(name)][...] = \
+                interp.eval_deriv(time)
 
-            outputs['polynomial_control_rates:{0}_rate2'.format(name)] = interp.eval_deriv(time, der=2)
+            outputs['polynomial_control_rates:{0}_rate2'.format(name)][...] = \
+                interp.eval_deriv(time, der=2)
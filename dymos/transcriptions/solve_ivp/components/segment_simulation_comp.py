@@ -13,6 +13,9 @@ from .ode_integration_interface import ODEIntegrationInterface
 from ....phase.options import TimeOptionsDictionary, SimulateOptionsDictionary
 
 
+_IMPLICIT_METHODS = ('BDF', 'Radau', 'LSODA')
+
+
 class SegmentSimulationComp(om.ExplicitComponent):
     """
     Class definition for SegmentSimulationComp.
@@ -100,8 +103,18 @@ class SegmentSimulationComp(om.ExplicitComponent):
         # Segment tau values for the control disc nodes in the current segment
         control_disc_seg_stau = control_disc_stau[control_disc_seg_idxs[0]:control_disc_seg_idxs[1]]
 
+        # Setup the initial state vector for integration
+        self.state_vec_size = 0
+        for name, options in self.options['state_options'].items():
+            self.state_vec_size += np.prod(options['shape'])
+
         if self.options['ode_integration_interface'] is None:
+            # When vectorized, scipy evaluates the ODE at up to one point per state vector
+            # element at once when approximating the Jacobian.  Only those evaluations use the
+            # batch ODE; the ordinary one-point evaluations use a single-node ODE.
+            batch_size = int(self.state_vec_size) if self.options['simulate_options']['vectorized'] else 1
             self.options['ode_integration_interface'] = ODEIntegrationInterface(
+                batch_size=batch_size,
                 ode_class=self.options['ode_class'],
                 time_options=self.options['time_options'],
                 state_options=self.options['state_options'],
@@ -125,10 +138,7 @@ class SegmentSimulationComp(om.ExplicitComponent):
         self.add_input(name='t_duration', val=1.0, units=self.options['time_options']['units'],
                        desc='Total time duration of the phase.')
 
-        # Setup the initial state vector for integration
-        self.state_vec_size = 0
         for name, options in self.options['state_options'].items():
-            self.state_vec_size += np.prod(options['shape'])
             self.add_input(name='initial_states:{0}'.format(name), val=np.ones((1,) + options['shape']),
                            units=options['units'], desc='initial values of state {0} '
                                                         'in the segment'.format(name))
@@ -139,7 +149,7 @@ class SegmentSimulationComp(om.ExplicitComponent):
 
         self.initial_state_vec = np.zeros(self.state_vec_size)
 
-        self.options['ode_integration_interface'].prob.setup(check=False)
+        self.options['ode_integration_interface'].setup()
 
         # Setup the control interpolants
         if self.options['control_options']:
@@ -178,7 +188,7 @@ class SegmentSimulationComp(om.ExplicitComponent):
         """
         idx = self.options['index']
         gd = self.options['grid_data']
-        iface_prob = self.options['ode_integration_interface'].prob
+        iface = self.options['ode_integration_interface']
 
         # Create the vector of initial state values
         self.initial_state_vec[:] = 0.0
@@ -212,21 +222,21 @@ class SegmentSimulationComp(om.ExplicitComponent):
                                                                             f_j=ctrl_vals)
 
         # Set the values of t_initial and t_duration
-        iface_prob.set_val('t_initial',
-                           val=inputs['t_initial'],
-                           units=self.options['time_options']['units'])
+        iface.set_val('t_initial',
+                      val=inputs['t_initial'],
+                      units=self.options['time_options']['units'])
 
-        iface_prob.set_val('t_duration',
-                           val=inputs['t_duration'],
-                           units=self.options['time_options']['units'])
+        iface.set_val('t_duration',
+                      val=inputs['t_duration'],
+                      units=self.options['time_options']['units'])
 
         # Set the values of the phase parameters
         if self.options['parameter_options']:
             for param_name, options in self.options['parameter_options'].items():
                 val = inputs['parameters:{0}'.format(param_name)]
-                iface_prob.set_val('parameters:{0}'.format(param_name),
-                                   val=val,
-                                   units=options['units'])
+                iface.set_val('parameters:{0}'.format(param_name),
+                              val=val,
+                              units=options['units'])
 
         # Setup the evaluation times.
         if self.options['output_nodes_per_seg'] is None:
@@ -243,7 +253,12 @@ class SegmentSimulationComp(om.ExplicitComponent):
                                  self.options['output_nodes_per_seg'])
 
         # Perform the integration using solve_ivp
-        sim_options = {key: val for key, val in self.options['simulate_options'].items()}
+        sim_options = {key: val for key, val in self.options['simulate_options'].items()
+                       if key != 'analytic_jac'}
+
+        if self.options['simulate_options']['analytic_jac'] and \
+                sim_options['method'] in _IMPLICIT_METHODS:
+            sim_options['jac'] = self.options['ode_integration_interface'].jac
 
         sol = solve_ivp(fun=self.options['ode_integration_interface'],
                         t_span=(inputs['time'][0], inputs['time'][-1]),
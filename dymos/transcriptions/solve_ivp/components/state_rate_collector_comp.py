@@ -21,6 +21,9 @@ class StateRateCollectorComp(om.ExplicitComponent):
         """
         Declare component options.
         """
+        self.options.declare(
+            'num_nodes', types=int, default=1,
+            desc='Number of nodes at which the state rates are collected.')
         self.options.declare(
             'state_options', types=dict,
             desc='Dictionary of options for the ODE state variables.')
@@ -36,15 +39,20 @@ class StateRateCollectorComp(om.ExplicitComponent):
         """
         state_options = self.options['state_options']
         time_units = self.options['time_units']
+        nn = self.options['num_nodes']
 
         for name, options in state_options.items():
-            shape = options['shape']
+            shape = (nn,) + options['shape']
             units = options['units']
 
             rate_units = get_rate_units(units, time_units)
 
             self.add_input(f'state_rates_in:{name}_rate', val=np.ones(shape), units=rate_units)
-            self.add_output( f'state_rates:{name}_rate', shape=shape, units=rate_units)
+            self.add_output(f'state_rates:{name}_rate', shape=shape, units=rate_units)
+
+            ar = np.arange(np.prod(shape), dtype=int)
+            self.declare_partials(of=f'state_rates:{name}_rate', wrt=f'state_rates_in:{name}_rate',
+                                  rows=ar, cols=ar, val=1.0)
 
     def compute(self, inputs, outputs):
         """
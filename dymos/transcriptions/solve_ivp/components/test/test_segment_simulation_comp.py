@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 import openmdao.api as om
@@ -9,6 +10,7 @@ from dymos.transcriptions.solve_ivp.components.segment_simulation_comp import Se
 from dymos.phase.options import TimeOptionsDictionary, StateOptionsDictionary, \
     SimulateOptionsDictionary
 from dymos.transcriptions.grid_data import GridData
+from dymos.examples.oscillator.oscillator_ode import OscillatorODE
 
 # Modify class so we can run it standalone.
 from dymos.utils.misc import CompWrapperConfig
@@ -75,6 +77,148 @@ class TestSegmentSimulationComp(unittest.TestCase):
                           1.425639364649936,
                           tolerance=1.0E-6)
 
+    def test_simple_integration_vectorized(self):
+
+        p = om.Problem(model=om.Group())
+
+        time_options = TimeOptionsDictionary()
+        time_options['units'] = 's'
+        time_options['targets'] = 't'
+
+        state_options = {}
+        state_options['y'] = StateOptionsDictionary()
+        state_options['y']['units'] = 'm'
+        state_options['y']['targets'] = 'y'
+        state_options['y']['rate_source'] = 'ydot'
+
+        # Non-standard way to assign state options, so we need this
+        state_options['y']['shape'] = (1, )
+
+        gd = GridData(num_segments=4, transcription='gauss-lobatto', transcription_order=3)
+
+        sim_options = SimulateOptionsDictionary()
+        sim_options['method'] = 'Radau'
+        sim_options['rtol'] = 1.0E-9
+        sim_options['atol'] = 1.0E-9
+        sim_options['vectorized'] = True
+        sim_options['analytic_jac'] = False
+
+        seg0_comp = SegmentSimulationComp(index=0, grid_data=gd, simulate_options=sim_options,
+                                          ode_class=TestODE, time_options=time_options,
+                                          state_options=state_options)
+
+        p.model.add_subsystem('segment_0', subsys=seg0_comp)
+
+        p.setup(check=True)
+
+        p.set_val('segment_0.time', [0, 0.25, 0.5])
+        p.set_val('segment_0.initial_states:y', 0.5)
+
+        p.run_model()
+
+        assert_near_equal(p.get_val('segment_0.states:y', units='m')[-1, ...],
+                          1.425639364649936,
+                          tolerance=1.0E-6)
+
+    def test_vectorized_batch_interface(self):
+        time_options = TimeOptionsDictionary()
+        time_options['units'] = 's'
+
+        state_options = {}
+        for name, units, rate_source in (('x', 'm', 'v'), ('v', 'm/s', 'v_dot')):
+            state_options[name] = StateOptionsDictionary()
+            state_options[name]['units'] = units
+            state_options[name]['targets'] = name
+            state_options[name]['rate_source'] = rate_source
+            state_options[name]['shape'] = (1, )
+
+        gd = GridData(num_segments=4, transcription='gauss-lobatto', transcription_order=3)
+
+        y_final = {}
+        for vectorized in (False, True):
+            sim_options = SimulateOptionsDictionary()
+            sim_options['method'] = 'Radau'
+            sim_options['rtol'] = 1.0E-9
+            sim_options['atol'] = 1.0E-9
+            sim_options['vectorized'] = vectorized
+
+            seg0_comp = SegmentSimulationComp(index=0, grid_data=gd, simulate_options=sim_options,
+                                              ode_class=OscillatorODE, time_options=time_options,
+                                              state_options=state_options)
+
+            p = om.Problem(model=om.Group())
+            p.model.add_subsystem('segment_0', subsys=seg0_comp)
+            p.setup()
+
+            p.set_val('segment_0.time', [0, 0.5, 1.0])
+            p.set_val('segment_0.initial_states:x', 1.0)
+            p.set_val('segment_0.initial_states:v', 0.0)
+
+            p.run_model()
+
+            y_final[vectorized] = np.array([p.get_val('segment_0.states:x')[-1, 0],
+                                            p.get_val('segment_0.states:v')[-1, 0]])
+
+        # Only the points of the finite-difference Jacobian are evaluated by the batch ODE, which has
+        # one node per state vector element.  The one-point evaluations use a single-node ODE.
+        iface = seg0_comp.options['ode_integration_interface']
+        self.assertEqual(iface.prob.model.ode.options['num_nodes'], 1)
+        self.assertEqual(iface._batch_prob.model.ode.options['num_nodes'], 2)
+
+        with mock.patch.object(iface._batch_prob, 'run_model') as batch_run_model:
+            iface(0.5, np.array([1.0, 0.0]))
+            self.assertEqual(batch_run_model.call_count, 0)
+
+        assert_near_equal(iface(0.5, np.array([[1.0, 0.5], [0.0, -1.0]])), [[0.0, -1.0], [-1.0, 0.5]])
+        assert_near_equal(y_final[True], y_final[False], tolerance=1.0E-9)
+
+    def test_simple_integration_analytic_jac(self):
+
+        p = om.Problem(model=om.Group())
+
+        time_options = TimeOptionsDictionary()
+        time_options['units'] = 's'
+        time_options['targets'] = 't'
+
+        state_options = {}
+        state_options['y'] = StateOptionsDictionary()
+        state_options['y']['units'] = 'm'
+        state_options['y']['targets'] = 'y'
+        state_options['y']['rate_source'] = 'ydot'
+
+        # Non-standard way to assign state options, so we need this
+        state_options['y']['shape'] = (1, )
+
+        gd = GridData(num_segments=4, transcription='gauss-lobatto', transcription_order=3)
+
+        sim_options = SimulateOptionsDictionary()
+        sim_options['method'] = 'BDF'
+        sim_options['rtol'] = 1.0E-9
+        sim_options['atol'] = 1.0E-9
+        sim_options['analytic_jac'] = True
+
+        seg0_comp = SegmentSimulationComp(index=0, grid_data=gd, simulate_options=sim_options,
+                                          ode_class=TestODE, time_options=time_options,
+                                          state_options=state_options)
+
+        p.model.add_subsystem('segment_0', subsys=seg0_comp)
+
+        p.setup(check=True)
+
+        p.set_val('segment_0.time', [0, 0.25, 0.5])
+        p.set_val('segment_0.initial_states:y', 0.5)
+
+        p.run_model()
+
+        # The Jacobian is evaluated at the given point only.
+        iface = seg0_comp.options['ode_integration_interface']
+        self.assertEqual(iface.prob.model.ode.options['num_nodes'], 1)
+        assert_near_equal(iface.jac(0.25, np.array([1.0])), [[1.0]], tolerance=1.0E-12)
+
+        assert_near_equal(p.get_val('segment_0.states:y', units='m')[-1, ...],
+                          1.425639364649936,
+                          tolerance=1.0E-6)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
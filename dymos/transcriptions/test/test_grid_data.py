@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_almost_equal, assert_array_equal
+
+from dymos.transcriptions.grid_data import GridData, make_subset_map, _segment_lagrange_matrices
+from dymos.utils.lagrange import lagrange_matrices
+
+
+class TestGridData(unittest.TestCase):
+
+    def test_subset_indices(self):
+        gd = GridData(num_segments=3, transcription='gauss-lobatto', transcription_order=[3, 5, 3],
+                      compressed=True)
+
+        self.assertEqual(gd.num_nodes, 11)
+        assert_array_equal(gd.segment_indices, [[0, 3], [3, 8], [8, 11]])
+        assert_array_equal(gd.subset_node_indices['state_disc'], [0, 2, 3, 5, 7, 8, 10])
+        assert_array_equal(gd.subset_node_indices['state_input'], [0, 2, 5, 7, 10])
+        assert_array_equal(gd.subset_segment_indices['state_input'], [[0, 2], [2, 4], [4, 5]])
+        self.assertEqual(gd.subset_num_nodes_per_segment['col'], [1, 2, 1])
+        assert_array_equal(gd.input_maps['state_input_to_disc'], [0, 1, 1, 2, 3, 3, 4])
+        assert_almost_equal(gd.node_ptau[gd.subset_node_indices['segment_ends']],
+                            [-1, -1 / 3, -1 / 3, 1 / 3, 1 / 3, 1])
+
+    def test_make_subset_map(self):
+        assert_array_equal(make_subset_map([0, 2, 5], [0, 2, 3, 5]), [0, 1, 1, 2])
+
+    def test_lagrange_matrices_cached(self):
+        _segment_lagrange_matrices.cache_clear()
+
+        gd = GridData(num_segments=20, transcription='radau-ps', transcription_order=3)
+        L, D = gd.phase_lagrange_matrices('state_disc', 'col')
+
+        # Every segment has the same nodes, so the segment matrices are only computed once.
+        info = _segment_lagrange_matrices.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 19)
+
+        # A new grid with the same segment order reuses the cached matrices.
+        gd2 = GridData(num_segments=10, transcription='radau-ps', transcription_order=3)
+        gd2.phase_lagrange_matrices('state_disc', 'col')
+        self.assertEqual(_segment_lagrange_matrices.cache_info().misses, 1)
+
+        nodes_disc = gd.node_stau[gd.subset_node_indices['state_disc'][:4]]
+        nodes_col = gd.node_stau[gd.subset_node_indices['col'][:3]]
+        L_seg, D_seg = lagrange_matrices(nodes_disc, nodes_col)
+        assert_almost_equal(L[:3, :4], L_seg)
+        assert_almost_equal(D[:3, :4], D_seg)
+
+        # The cached blocks may not be modified in place.
+        L_cached, _ = _segment_lagrange_matrices(tuple(nodes_disc), tuple(nodes_col))
+        self.assertFalse(L_cached.flags.writeable)
+
+    def test_sparse_matrices(self):
+        gd = GridData(num_segments=4, transcription='gauss-lobatto', transcription_order=[3, 5, 5, 3],
+                      compressed=True)
+
+        for sparse_mat, dense_mat in zip(gd.phase_lagrange_matrices('state_disc', 'col', sparse=True),
+                                         gd.phase_lagrange_matrices('state_disc', 'col', sparse=False)):
+            assert_almost_equal(sparse_mat.toarray(), dense_mat)
+
+        for sparse_mat, dense_mat in zip(gd.phase_hermite_matrices('state_disc', 'col', sparse=True),
+                                         gd.phase_hermite_matrices('state_disc', 'col', sparse=False)):
+            assert_almost_equal(sparse_mat.toarray(), dense_mat)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
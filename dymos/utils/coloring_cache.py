@@ -0,0 +1,271 @@
+from contextlib import contextmanager
+import hashlib
+import os
+
+import numpy as np
+
+from openmdao.core.component import Component
+from openmdao.utils.coloring import Coloring
+from openmdao.utils.mpi import MPI
+from openmdao.utils.om_warnings import issue_warning, DerivativesWarning
+
+from ..load_case import find_phases, find_trajectories
+from ..transcriptions.explicit_shooting.rk_integration_comp import RKIntegrationComp
+from ..options import options as dymos_options
+
+
+# The version of the coloring cache key.  Changing the contents of the key requires incrementing it.
+_CACHE_KEY_VERSION = 3
+
+# The options of states, controls, parameters, and time which only affect the values and scaling
+# of the variables, not the sparsity of the total jacobian, and so are excluded from the cache key.
+_VALUE_OPTIONS = {'val', 'lower', 'upper', 'ref', 'ref0', 'scaler', 'adder', 'defect_ref', 'defect_scaler',
+                  'initial_val', 'initial_bounds', 'initial_ref', 'initial_ref0', 'initial_scaler',
+                  'initial_adder', 'duration_val', 'duration_bounds', 'duration_ref', 'duration_ref0',
+                  'duration_scaler', 'duration_adder', 'desc'}
+
+
+def _update_hash(h, obj):
+    """
+    Update a hash with a description of the given object which does not depend on its identity.
+
+    Parameters
+    ----------
+    h : hashlib.sha256
+        The hash to be updated.
+    obj : object
+        The object to be hashed.  Dictionaries, sequences, arrays, classes, and functions are
+        hashed by their contents or qualified names, and other objects by their repr.
+    """
+    if isinstance(obj, dict) or hasattr(obj, '_dict'):
+        items = obj.items() if isinstance(obj, dict) else ((k, v['val']) for k, v in obj._dict.items())
+        h.update(b'{')
+        for key, val in sorted(items, key=lambda item: str(item[0])):
+            if key not in _VALUE_OPTIONS:
+                h.update(str(key).encode())
+                _update_hash(h, val)
+        h.update(b'}')
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'[')
+        for val in obj:
+            _update_hash(h, val)
+        h.update(b']')
+    elif isinstance(obj, np.ndarray):
+        h.update(f'{obj.dtype}{obj.shape}'.encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, type) or callable(obj):
+        h.update(f'{getattr(obj, "__module__", "")}.{getattr(obj, "__qualname__", repr(obj))}'.encode())
+    else:
+        h.update(repr(obj).encode())
+
+
+def _update_partials_hash(h, comp):
+    """
+    Update a hash with the declared partials of a component.
+
+    Parameters
+    ----------
+    h : hashlib.sha256
+        The hash to be updated.
+    comp : Component
+        The component whose declared partials are hashed.
+    """
+    prefix_len = len(comp.pathname) + 1
+    for (of, wrt), meta in sorted(comp._subjacs_info.items()):
+        _update_hash(h, (of[prefix_len:], wrt[prefix_len:], meta['shape'], meta.get('dependent'),
+                         meta.get('rows'), meta.get('cols')))
+
+
+def _get_phase_ode_systems(phase):
+    """
+    Return the instances of the ODE of the phase.
+
+    The ODE of an ExplicitShooting phase is not a subsystem of the phase, but is evaluated within
+    the derivative subproblem of its integration component, so the instances of the ODE are also
+    sought in the models of those subproblems.
+
+    Parameters
+    ----------
+    phase : Phase
+        The phase whose ODE systems are returned.
+
+    Returns
+    -------
+    list of System
+        The instances of the ODE class of the phase.
+    """
+    ode_class = phase.options['ode_class']
+    if ode_class is None:
+        return []
+
+    systems = [phase]
+    for comp in phase.system_iter(recurse=True, typ=RKIntegrationComp):
+        if comp._deriv_subprob is not None:
+            systems.append(comp._deriv_subprob.model)
+
+    return [s for system in systems for s in system.system_iter(recurse=True) if isinstance(s, ode_class)]
+
+
+def get_coloring_cache_key(problem):
+    """
+    Return the key of the total coloring of the given problem in the coloring cache.
+
+    The key is a hash of the transcription and grid of each phase, the options of its time,
+    states, controls, polynomial controls, and parameters which determine the structure of the
+    phase, its ODE class and the declared partials of its ODE, and the declared partials of its
+    integration components, if it has any.  It also includes the declared partials of the
+    components outside of any phase, the trajectory parameters and linkages, and the design
+    variables and nonlinear responses of the driver, so that any change to the structure of the
+    problem produces a different key.  The design variables and responses are hashed in the order
+    in which the driver orders the columns and rows of the total jacobian, along with whether each
+    constraint is an equality or inequality constraint.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The problem, after final_setup.
+
+    Returns
+    -------
+    str
+        The hex digest of the key.
+    """
+    model = problem.model
+    driver = problem.driver
+    h = hashlib.sha256()
+
+    _update_hash(h, (_CACHE_KEY_VERSION, problem._mode, driver.__class__))
+
+    phases = find_phases(model)
+    for phase_path, phase in sorted(phases.items()):
+        tx = phase.options['transcription']
+        _update_hash(h, (phase_path, tx.__class__, tx.options))
+
+        gd = getattr(tx, 'grid_data', None)
+        if gd is not None:
+            _update_hash(h, (gd.num_segments, np.asarray(gd.transcription_order), np.asarray(gd.segment_ends),
+                             gd.compressed))
+
+        _update_hash(h, (phase.time_options, phase.state_options, phase.control_options,
+                         phase.polynomial_control_options, phase.parameter_options,
+                         phase.options['ode_class']))
+
+        for comp in phase.system_iter(recurse=True, typ=RKIntegrationComp):
+            _update_hash(h, (comp.pathname[len(phase_path) + 1:], comp.__class__))
+            _update_partials_hash(h, comp)
+
+        for ode in _get_phase_ode_systems(phase):
+            _update_hash(h, ode.__class__)
+            for comp in ode.system_iter(include_self=True, recurse=True, typ=Component):
+                _update_partials_hash(h, comp)
+
+    for traj_path, traj in sorted(find_trajectories(model).items()):
+        _update_hash(h, (traj_path, traj.parameter_options, traj._linkages))
+
+    # The partials of the systems outside of the phases are not described by the phase options.
+    phase_prefixes = tuple(f'{phase_path}.' for phase_path in phases)
+    for comp in model.system_iter(recurse=True, typ=Component):
+        if not comp.pathname.startswith(phase_prefixes):
+            _update_hash(h, comp.pathname)
+            _update_partials_hash(h, comp)
+
+    for name, meta in driver._designvars.items():
+        indices = meta['indices']
+        _update_hash(h, (name, meta['source'], meta['size'], None if indices is None else indices.as_array()))
+
+    for name in driver._get_ordered_nl_responses():
+        meta = driver._responses[name]
+        indices = meta['indices']
+        if meta['type'] == 'con':
+            con_type = 'eq' if meta['equals'] is not None else 'ineq'
+        else:
+            con_type = None
+        _update_hash(h, (name, meta['source'], meta['size'], meta['type'], con_type,
+                         None if indices is None else indices.as_array()))
+
+    info = driver._coloring_info
+    _update_hash(h, [info[key] for key in ('num_full_jacs', 'tol', 'orders', 'perturb_size', 'min_improve_pct')])
+
+    return h.hexdigest()
+
+
+def _get_cached_coloring_path(problem):
+    """
+    Return the path of the cached total coloring of the problem, or None if it does not use one.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The problem, after final_setup.
+
+    Returns
+    -------
+    str or None
+        The path of the coloring file in the coloring cache, or None if the coloring cache is
+        disabled or the driver of the problem does not compute a dynamic total coloring.
+    """
+    cache_dir = dymos_options['coloring_cache_dir']
+    driver = problem.driver
+
+    if cache_dir is None or not driver.supports['simultaneous_derivatives'] or \
+            not driver._coloring_info['dynamic']:
+        return None
+
+    return os.path.join(cache_dir, f'{get_coloring_cache_key(problem)}.pkl')
+
+
+@contextmanager
+def cached_total_coloring(problem):
+    """
+    Run the driver of the problem within this context using the total coloring from the coloring cache.
+
+    If the coloring of the problem is cached, the driver uses it as a fixed coloring within the
+    context rather than computing it, and computes its coloring dynamically again afterwards so
+    that a later change to the problem is colored anew.  Otherwise, the coloring computed within
+    the context is saved to the cache.  A cached coloring whose design variables and responses
+    do not match those of the driver is not used, and is replaced by the coloring computed within
+    the context.  The context must be entered after final_setup, since that is when the design
+    variables and responses of the driver are known.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The problem, after final_setup.
+
+    Yields
+    ------
+    bool
+        True if the coloring was loaded from the cache.
+    """
+    path = _get_cached_coloring_path(problem)
+    info = problem.driver._coloring_info
+
+    coloring = None
+    if path is not None and os.path.exists(path):
+        coloring = Coloring.load(path)
+        try:
+            coloring._check_config_total(problem.driver)
+        except RuntimeError as err:
+            issue_warning(f'The cached total coloring {path} does not match the problem and will be '
+                          f'recomputed.\n{err}', category=DerivativesWarning)
+            coloring = None
+
+    if path is None:
+        yield False
+    elif coloring is not None:
+        info['static'] = coloring
+        info['dynamic'] = False
+        try:
+            yield True
+        finally:
+            info['static'] = None
+            info['dynamic'] = True
+    else:
+        yield False
+        if info['coloring'] is not None and not (MPI and problem.comm.rank != 0):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # Write to a temporary file first so that concurrent runs never read a partial coloring.
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            info['coloring'].save(tmp_path)
+            os.replace(tmp_path, path)
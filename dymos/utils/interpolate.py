@@ -36,6 +36,12 @@ class LagrangeBarycentricInterpolant(object):
     dx_dtau : float
         Half the span from x0 to xf.  The ratio of x-space to
         internal tau-space.
+    D : np.array
+        The differentiation matrix which maps values at the nodes to first derivatives
+        with respect to tau at the nodes.
+    D2 : np.array
+        The differentiation matrix which maps values at the nodes to second derivatives
+        with respect to tau at the nodes.
 
     Notes
     -----
@@ -54,6 +60,11 @@ class LagrangeBarycentricInterpolant(object):
     The singularity in the denominator of p(x) at x = x_n is cancelled
     by the the term (x-x_n) in l(x).
 
+    The interpolant is evaluated using the second (true) form of the barycentric formula,
+    Eq. 4.2 of [1]_, in which l(x) is eliminated by dividing by the interpolant of unity.
+    Derivatives are obtained by applying the same formula to the values of the derivatives
+    at the nodes, which are given by the differentiation matrices of Eq. 9.4 of [1]_.
+
     References
     ----------
     .. [1] Berrut, Jean-Paul, and Lloyd N. Trefethen.
@@ -65,7 +76,7 @@ class LagrangeBarycentricInterpolant(object):
         self.num_nodes = len(nodes)
         """ The number of nodes in the interpolated polynomial. """
 
-        self.tau_i = nodes
+        self.tau_i = np.asarray(nodes, dtype=float)
         """ The independent variable values at interpolation points. """
 
         _shape = (self.num_nodes,) + shape
@@ -73,14 +84,21 @@ class LagrangeBarycentricInterpolant(object):
         self.f_j = np.zeros(_shape)
         """ An array of values to be interpolated. """
 
-        self.w_b = np.ones(self.num_nodes)
+        # Barycentric Weights
+        diff = self.tau_i[:, np.newaxis] - self.tau_i[np.newaxis, :]
+        np.fill_diagonal(diff, 1.0)
+
+        self.w_b = 1.0 / np.prod(diff, axis=1)
         """ Barycentric weights for nodes in the interpolated polynomial."""
 
-        # Barycentric Weights
-        for j in range(self.num_nodes):
-            for k in range(self.num_nodes):
-                if k != j:
-                    self.w_b[j] /= (self.tau_i[j] - self.tau_i[k])
+        # Differentiation matrices of the polynomial at its nodes.
+        self.D = (self.w_b[np.newaxis, :] / self.w_b[:, np.newaxis]) / diff
+        """ Matrix mapping values at the nodes to first derivatives wrt tau at the nodes. """
+        np.fill_diagonal(self.D, 0.0)
+        np.fill_diagonal(self.D, -np.sum(self.D, axis=1))
+
+        self.D2 = self.D @ self.D
+        """ Matrix mapping values at the nodes to second derivatives wrt tau at the nodes. """
 
         self.wbfj = np.zeros(_shape)
         """ An array of the precomputed product of the interpolated
@@ -92,6 +110,10 @@ class LagrangeBarycentricInterpolant(object):
         self.wbfj_flat = np.reshape(self.wbfj, newshape=(n, m))
         """ A flattened view of wbfj"""
 
+        self._f_flat = np.reshape(self.f_j, newshape=(n, m))
+        self._df_dtau_flat = np.zeros((n, m))
+        self._d2f_dtau2_flat = np.zeros((n, m))
+
         self.x0 = -1.0
         """ The value of the independent axis corresponding to $\tau = -1$ """
 
@@ -157,38 +179,65 @@ class LagrangeBarycentricInterpolant(object):
 
         fjT = self.f_j.T
         self.wbfj[...] = (self.w_b * fjT).T
+
+        self._df_dtau_flat[...] = self.D @ self._f_flat
+        self._d2f_dtau2_flat[...] = self.D2 @ self._f_flat
         self._is_setup = True
 
+    def _eval_barycentric(self, x, f_flat):
+        """
+        Evaluate the polynomial with the given flattened values at the nodes.
+
+        Parameters
+        ----------
+        x : float or ndarray[:]
+            The independent variable value or values at which interpolation is requested.
+        f_flat : np.array
+            The values of the polynomial at its nodes, flattened to (num_nodes, size).
+
+        Returns
+        -------
+        np.array
+            The interpolated values, of shape `shape` for scalar x or (len(x),) + `shape`
+            for an array of x.
+        """
+        tau = np.atleast_1d(self.x_to_tau(np.asarray(x)))
+        diff = tau[:, np.newaxis] - self.tau_i[np.newaxis, :]
+
+        # Where x coincides with a node the interpolated value is the value at that node.
+        exact = diff == 0.0
+        on_node = np.any(exact, axis=1)
+        diff[exact] = 1.0
+
+        c = self.w_b / diff
+        c[on_node, :] = exact[on_node, :]
+        c /= np.sum(c, axis=1, keepdims=True)
+
+        result = c @ f_flat
+
+        if np.ndim(x) == 0:
+            return np.reshape(result, newshape=self.wbfj.shape[1:])
+        return np.reshape(result, newshape=tau.shape + self.wbfj.shape[1:])
+
     def eval(self, x):
         """
         Interpolate the LGL polynomial at x.
 
         Parameters
         ----------
-        x : float
-            The independent variable value at which interpolation
+        x : float or ndarray[:]
+            The independent variable value or values at which interpolation
             is requested.
 
         Returns
         -------
-        float
-            The interpolated value of the LGL polynomial at x.
+        np.array
+            The interpolated value of the LGL polynomial at x.  If x is an array, the first
+            axis of the result corresponds to the values of x.
         """
         if not self._is_setup:
             raise RuntimeError('LagrangeBarycentricInterpolant has not been setup')
-        tau = self.x_to_tau(x)
-
-        g = tau - self.tau_i
-        l = np.ones_like(g)
-
-        for i in range(self.num_nodes):
-            for j in range(self.num_nodes):
-                if j != i:
-                    l[i] *= g[j]
-
-        result = np.reshape(np.dot(l, self.wbfj_flat), newshape=self.wbfj.shape[1:])
-
-        return result
+        return self._eval_barycentric(x, self._f_flat)
 
     def eval_deriv(self, x, der=1):
         """
@@ -196,55 +245,24 @@ class LagrangeBarycentricInterpolant(object):
 
         Parameters
         ----------
-        x : float
-            The independent variable value at which the derivative
+        x : float or ndarray[:]
+            The independent variable value or values at which the derivative
             is requested.
         der : int
             Derivative order requested. Default is 1 for first derivatives.
 
         Returns
         -------
-        float
-            The first derivative of the polynomial at x.
+        np.array
+            The requested derivative of the polynomial at x.  If x is an array, the first
+            axis of the result corresponds to the values of x.
         """
         if not self._is_setup:
             raise RuntimeError('LagrangeBarycentricInterpolant has not been setup')
-        if der >= self.num_nodes:
-            return 0.0
-
-        n = self.num_nodes
-        tau = self.x_to_tau(x)
-        g = tau - self.tau_i
-        lprime = np.zeros(n)
-
         if der == 1:
-            for i in range(n):
-                for j in range(n):
-                    if j == i:
-                        continue
-                    prod = 1.0
-                    for k in range(n):
-                        if k != i and k != j:
-                            prod *= g[k]
-                    lprime[i] += prod
-            # df_dtau = np.dot(lprime, self.wbfj)
-            df_dtau = np.reshape(np.dot(lprime, self.wbfj_flat), newshape=self.wbfj.shape[1:])
-            return df_dtau / self.dx_dtau
+            return self._eval_barycentric(x, self._df_dtau_flat) / self.dx_dtau
         elif der == 2:
-            for i in range(n):
-                for j in range(n):
-                    if j == i:
-                        continue
-                    for k in range(n):
-                        if k == i or k == j:
-                            continue
-                        prod = 1.0
-                        for ii in range(n):
-                            if ii != i and ii != j and ii != k:
-                                prod *= g[ii]
-                        lprime[i] += prod
-            df_dtau = np.reshape(np.dot(lprime, self.wbfj_flat), newshape=self.wbfj.shape[1:])
-            return df_dtau / self.dx_dtau**2
+            return self._eval_barycentric(x, self._d2f_dtau2_flat) / self.dx_dtau**2
         else:
             raise ValueError('Barycentric interpolant currently only supports up to '
                              'second derivatives')
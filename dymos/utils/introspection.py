@@ -4,7 +4,6 @@ import fnmatch
 import openmdao.api as om
 from openmdao.utils.array_utils import shape_to_len
 from dymos.utils.misc import _unspecified
-from ..phase.options import StateOptionsDictionary, TimeseriesOutputOptionsDictionary
 from .misc import get_rate_units
 
 
@@ -566,6 +565,8 @@ def configure_states_discovery(state_options, ode):
     ode : System
         The System instance providing the ODE for the phase.
     """
+    from ..phase.options import StateOptionsDictionary
+
     out_meta = ode.get_io_metadata(iotypes='output', metadata_keys=['tags'],
                                    get_remote=True)
 
@@ -623,6 +624,8 @@ def configure_analytic_states_discovery(state_options, ode):
     ode : System
         The System instance providing the ODE for the phase.
     """
+    from ..phase.options import StateOptionsDictionary
+
     out_meta = ode.get_io_metadata(iotypes='output', metadata_keys=['tags'],
                                    get_remote=True)
 
@@ -670,6 +673,8 @@ def configure_timeseries_output_glob_expansion(phase):
     phase : Phase
         The phase object whose boundary and path constraints are to be introspected.
     """
+    from ..phase.options import TimeseriesOutputOptionsDictionary
+
     transcription = phase.options['transcription']
     ode = transcription._get_ode(phase)
     ode_outputs = get_promoted_vars(ode, 'output')
@@ -1,7 +1,10 @@
 import numpy as np
 
+_lgr_cache = {}
+""" Cache for the LGR nodes and weights, keyed by (n, include_endpoint, tol). """
 
-def lgr(n, include_endpoint=False, tol=1.0E-15):
+
+def _lgr(n, include_endpoint=False, tol=1.0E-15):
     """
     Returns the Legendre-Gauss-Radau nodes and weights for a Jacobi Polynomial with n abscissae.
 
@@ -118,3 +121,32 @@ def lgr(n, include_endpoint=False, tol=1.0E-15):
         w = np.concatenate([w, [0.0]])
 
     return x, w
+
+
+def lgr(n, include_endpoint=False, tol=1.0E-15):
+    """
+    Retrieve the lgr nodes and weights for n nodes.
+
+    Results are cached to avoid repeated calculation of nodes and weights for a given n.
+
+    Parameters
+    ----------
+    n : int
+        The number of LGR nodes are to be returned.  If include_endpoint=True we return n+1 values.
+    include_endpoint : bool
+        If True return the non-free abscissa at the right endpoint of the interval [-1, 1].
+        The weight associated with this endpoint is 0.
+    tol : float
+        The tolerance to which the location of the nodes should be converged.
+
+    Returns
+    -------
+    numpy.array
+        An array of the LGR nodes for a polynomial of the given order.
+    numpy.array
+        An array of the corresponding LGR weights at the nodes in x.
+    """
+    key = (n, include_endpoint, tol)
+    if key not in _lgr_cache:
+        _lgr_cache[key] = _lgr(n, include_endpoint=include_endpoint, tol=tol)
+    return _lgr_cache[key]
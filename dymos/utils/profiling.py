@@ -0,0 +1,231 @@
+from contextlib import contextmanager
+import functools
+import json
+import os
+import sys
+import time
+
+from ..options import options as dymos_options
+
+
+# The category of each of the subsystems of a phase which is instrumented, by subsystem name.
+_PHASE_SUBSYSTEM_CATEGORIES = {'rhs_all': 'ode',
+                               'rhs_disc': 'ode',
+                               'rhs_col': 'ode',
+                               'rhs': 'ode',
+                               'ode': 'ode',
+                               'integrator': 'ode',
+                               'segments': 'ode',
+                               'collocation_constraint': 'collocation',
+                               'continuity_comp': 'continuity',
+                               'state_interp': 'interpolation',
+                               'interleave_comp': 'interpolation',
+                               'state_mux_comp': 'interpolation',
+                               'control_group': 'interpolation',
+                               'polynomial_control_group': 'interpolation'}
+
+# The event recorded for each instrumented method of a system.
+_INSTRUMENTED_METHODS = {'_solve_nonlinear': 'compute',
+                         '_apply_nonlinear': 'compute',
+                         '_linearize': 'linearize'}
+
+# The number of calls and cumulative time of each event, keyed by (path, category, event).
+_profile_data = {}
+
+
+def reset_profile():
+    """
+    Discard all recorded profiling data.
+    """
+    _profile_data.clear()
+
+
+def _record(path, category, event, elapsed):
+    """
+    Add a call of the given duration to the profiling data of an event.
+
+    Parameters
+    ----------
+    path : str
+        The pathname of the system in which the event occurred.
+    category : str
+        The category of the event, such as 'ode' or 'simulate'.
+    event : str
+        The name of the event, such as 'compute' or 'linearize'.
+    elapsed : float
+        The wall time of the call, in seconds.
+    """
+    data = _profile_data.setdefault((path, category, event), [0, 0.0])
+    data[0] += 1
+    data[1] += elapsed
+
+
+def _instrument_method(system, method_name, path, category, event):
+    """
+    Replace a method of a system instance with one that records its calls and cumulative time.
+
+    Parameters
+    ----------
+    system : System
+        The system whose method is instrumented.
+    method_name : str
+        The name of the instrumented method.
+    path : str
+        The pathname under which the calls are recorded.
+    category : str
+        The category under which the calls are recorded.
+    event : str
+        The event under which the calls are recorded.
+    """
+    method = getattr(system, method_name)
+    if getattr(method, '_dymos_profiled', False):
+        return
+
+    @functools.wraps(method)
+    def _profiled_method(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _record(path, category, event, time.perf_counter() - t0)
+
+    _profiled_method._dymos_profiled = True
+    setattr(system, method_name, _profiled_method)
+
+
+def instrument_problem(problem):
+    """
+    Instrument the ODE, timeseries, continuity, collocation, and interpolation systems of each phase.
+
+    The instrumented systems record the number of calls and cumulative time of their evaluation and
+    linearization.  Systems are instrumented in place, so this must be repeated whenever the
+    problem is setup again.  When dymos.options['profiling'] is False, nothing is instrumented.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The problem whose phases are instrumented.
+    """
+    if not dymos_options['profiling']:
+        return
+
+    from ..load_case import find_phases
+
+    for phase_path, phase in find_phases(problem.model).items():
+        timeseries_names = set(phase._timeseries)
+        for subsys in phase.system_iter(recurse=False):
+            if subsys.name in timeseries_names:
+                category = 'timeseries'
+            else:
+                category = _PHASE_SUBSYSTEM_CATEGORIES.get(subsys.name)
+                if category is None:
+                    continue
+            for method_name, event in _INSTRUMENTED_METHODS.items():
+                _instrument_method(subsys, method_name, phase_path, category, event)
+
+
+@contextmanager
+def profile_section(path, category, event='run'):
+    """
+    Record the number of calls and cumulative time of a block of code, when profiling is enabled.
+
+    Parameters
+    ----------
+    path : str
+        The pathname of the system to which the block belongs.
+    category : str
+        The category of the block, such as 'simulate' or 'grid_refinement'.
+    event : str
+        The name of the event recorded for the block.
+
+    Yields
+    ------
+    None
+        Control is returned to the block being profiled.
+    """
+    if not dymos_options['profiling']:
+        yield
+        return
+
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(path, category, event, time.perf_counter() - t0)
+
+
+def get_profile_report():
+    """
+    Return the recorded profiling data as a nested dictionary.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping the path of each system to a dictionary mapping each category to a
+        dictionary mapping each event to a dictionary with keys 'calls' and 'time'.
+    """
+    report = {}
+    for (path, category, event), (calls, elapsed) in sorted(_profile_data.items()):
+        report.setdefault(path, {}).setdefault(category, {})[event] = {'calls': calls, 'time': elapsed}
+    return report
+
+
+def write_profile_report(report, stream=sys.stdout):
+    """
+    Write a table of the profiling data, from the most to the least time consuming event.
+
+    Parameters
+    ----------
+    report : dict
+        The profiling data, as returned by get_profile_report.
+    stream : file-like
+        The stream to which the table is written.
+    """
+    rows = [(path if path else '<model>', category, event, data['calls'], data['time'])
+            for path, categories in report.items()
+            for category, events in categories.items()
+            for event, data in events.items()]
+    rows.sort(key=lambda row: row[-1], reverse=True)
+
+    path_width = max([len(row[0]) for row in rows] + [4])
+    header = f'{"path":<{path_width}}  {"category":<16}{"event":<12}{"calls":>10}{"time (s)":>14}' \
+             f'{"time/call (ms)":>16}'
+
+    print(header, file=stream)
+    print(len(header) * '-', file=stream)
+    for path, category, event, calls, elapsed in rows:
+        print(f'{path:<{path_width}}  {category:<16}{event:<12}{calls:>10d}{elapsed:>14.4f}'
+              f'{1000 * elapsed / calls:>16.4f}', file=stream)
+
+
+def save_profile_report(problem, report=None):
+    """
+    Save the profiling data as dymos_profile.json and dymos_profile.txt in the reports directory.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The problem whose reports directory holds the files.
+    report : dict or None
+        The profiling data, as returned by get_profile_report.  If None, the current data is used.
+
+    Returns
+    -------
+    dict
+        The profiling data that was saved.
+    """
+    if report is None:
+        report = get_profile_report()
+
+    from .testing_utils import _get_reports_dir
+    report_dir = _get_reports_dir(problem)
+
+    os.makedirs(report_dir, exist_ok=True)
+
+    with open(os.path.join(report_dir, 'dymos_profile.json'), 'w') as f:
+        json.dump(report, f, indent=2)
+
+    with open(os.path.join(report_dir, 'dymos_profile.txt'), 'w') as f:
+        write_profile_report(report, stream=f)
+
+    return report
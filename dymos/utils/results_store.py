@@ -0,0 +1,392 @@
+from collections.abc import Mapping
+import json
+import os
+
+import numpy as np
+
+from openmdao.utils.mpi import MPI
+from openmdao.utils.units import convert_units
+
+from ..load_case import find_phases, find_trajectories, _build_suffix_index
+
+
+# The version of the results store layout written by save_results.
+_FORMAT_VERSION = 1
+
+# The name of the file in a results store which describes the stored variables.
+_METADATA_FILE = 'metadata.json'
+
+# The prefixes of the phase-relative promoted names of the variables, other than the timeseries
+# outputs, stored for each phase.
+_PHASE_VAR_PREFIXES = ('parameters:', 'polynomial_controls:')
+
+
+def is_results_store(path):
+    """
+    Return True if the given path is a dymos results store.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The path to be tested.
+
+    Returns
+    -------
+    bool
+        True if the path is a directory containing a results store.
+    """
+    return os.path.isfile(os.path.join(path, _METADATA_FILE))
+
+
+def _get_grid_metadata(phase):
+    """
+    Return a json-serializable description of the grid of the given phase.
+
+    Parameters
+    ----------
+    phase : Phase
+        The phase whose grid is described.
+
+    Returns
+    -------
+    dict
+        The transcription name and, if the transcription uses one, the number of segments,
+        segment ends, transcription order, and compression of the grid.
+    """
+    tx = phase.options['transcription']
+    meta = {'transcription': tx.__class__.__name__}
+
+    gd = getattr(tx, 'grid_data', None)
+    if gd is not None:
+        meta['num_segments'] = int(gd.num_segments)
+        meta['segment_ends'] = np.asarray(gd.segment_ends, dtype=float).tolist()
+        meta['transcription_order'] = np.asarray(gd.transcription_order, dtype=int).tolist()
+        meta['compressed'] = bool(gd.compressed)
+
+    return meta
+
+
+def _get_stored_vars(system, model, selected):
+    """
+    Return the variables of the given system which are to be stored.
+
+    Parameters
+    ----------
+    system : System
+        The phase or trajectory whose variables are stored.
+    model : Group
+        The model of the problem.
+    selected : callable
+        A function which returns True if the variable with the given promoted name, relative to
+        the system, is to be stored.
+
+    Returns
+    -------
+    dict
+        A mapping of the system-relative promoted name of each stored variable to a tuple of its
+        absolute name and promoted name in the model.
+    """
+    stored = {}
+    for io in ('output', 'input'):
+        model_abs2prom = model._var_allprocs_abs2prom[io]
+        for abs_name, prom_name in system._var_allprocs_abs2prom[io].items():
+            if prom_name not in stored and selected(prom_name):
+                stored[prom_name] = (abs_name, model_abs2prom[abs_name])
+    return stored
+
+
+def save_results(problem, path, append=False):
+    """
+    Save the timeseries, parameters, and grid of each dymos phase in the problem to a results store.
+
+    The results store is a directory holding one .npy file per variable, and a metadata file
+    giving the units and shape of each variable and the grid of each phase.  Because each
+    variable is stored contiguously in its own file, a ResultsReader loads only the variables
+    that are requested of it, and memory-maps them rather than reading them in full.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The problem containing dymos phases, after it has been run.
+    path : str or os.PathLike
+        The directory to which the results are written.  It is created if necessary.
+    append : bool
+        If True and the directory already contains a results store, the phases and trajectories
+        of the problem are added to it, otherwise any existing results store in the directory is
+        replaced.
+    """
+    model = problem.model
+    abs2meta = model._var_allprocs_abs2meta
+
+    phases = {}
+    trajectories = {}
+    values = {}
+    units = {}
+
+    def store(system, selected, meta):
+        stored = _get_stored_vars(system, model, selected)
+        meta['variables'] = {name: prom_name for name, (_, prom_name) in stored.items()}
+        for abs_name, prom_name in stored.values():
+            io = 'output' if abs_name in abs2meta['output'] else 'input'
+            # get_remote is collective under MPI, so every rank gathers the values.
+            values[prom_name] = np.asarray(problem.get_val(abs_name, get_remote=True))
+            units[prom_name] = abs2meta[io][abs_name]['units']
+
+    for phase_path, phase in find_phases(model).items():
+        ts_prefixes = tuple(f'{ts_name}.' for ts_name in phase._timeseries)
+        ts_inputs = tuple(f'{ts_name}.input_values:' for ts_name in phase._timeseries)
+
+        def phase_var(name):
+            if name.startswith(ts_prefixes):
+                return not name.startswith(ts_inputs)
+            return name.startswith(_PHASE_VAR_PREFIXES) or name in ('t_initial', 't_duration')
+
+        phases[phase_path] = {'grid': _get_grid_metadata(phase)}
+        store(phase, phase_var, phases[phase_path])
+
+    for traj_path, traj in find_trajectories(model).items():
+        trajectories[traj_path] = {}
+        store(traj, lambda name: name.startswith('parameters:'), trajectories[traj_path])
+
+    if MPI and problem.comm.rank != 0:
+        return
+
+    os.makedirs(path, exist_ok=True)
+
+    metadata = {'format_version': _FORMAT_VERSION, 'phases': {}, 'trajectories': {}, 'variables': {}}
+    if is_results_store(path):
+        with open(os.path.join(path, _METADATA_FILE)) as f:
+            old_metadata = json.load(f)
+        if append:
+            metadata = old_metadata
+        else:
+            os.remove(os.path.join(path, _METADATA_FILE))
+            for var_meta in old_metadata['variables'].values():
+                os.remove(os.path.join(path, var_meta['file']))
+
+    next_file = 1 + max([int(meta['file'].partition('.')[0]) for meta in metadata['variables'].values()],
+                        default=-1)
+
+    for prom_name, val in values.items():
+        old_meta = metadata['variables'].get(prom_name)
+        fname = old_meta['file'] if old_meta is not None else f'{next_file}.npy'
+        if old_meta is None:
+            next_file += 1
+        np.save(os.path.join(path, fname), val)
+        metadata['variables'][prom_name] = {'file': fname, 'units': units[prom_name], 'shape': list(val.shape)}
+
+    metadata['phases'].update(phases)
+    metadata['trajectories'].update(trajectories)
+
+    # The metadata is written last so that an interrupted save does not leave a readable store.
+    with open(os.path.join(path, _METADATA_FILE), 'w') as f:
+        json.dump(metadata, f, indent=1)
+
+
+class _LazyValues(Mapping):
+    """
+    A read-only mapping of the variables of a results store to their values, loaded on access.
+
+    This provides the 'outputs' interface of an OpenMDAO Case.
+
+    Parameters
+    ----------
+    reader : ResultsReader
+        The reader of the results store.
+    """
+    def __init__(self, reader):
+        self._reader = reader
+
+    def __getitem__(self, name):
+        return self._reader.get_val(name)
+
+    def __contains__(self, name):
+        return name in self._reader
+
+    def __iter__(self):
+        return iter(self._reader.list_vars())
+
+    def __len__(self):
+        return len(self._reader.list_vars())
+
+
+class ResultsReader(object):
+    """
+    Read the variables of a results store written by save_results.
+
+    Only the metadata of the store is read when the reader is created.  Each variable is
+    memory-mapped from its file the first time it is requested, so only the portions of the
+    values which are actually used are read from disk.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The directory of the results store.
+
+    Attributes
+    ----------
+    outputs : Mapping
+        A mapping of the name of each variable to its value, loaded on access, for compatibility
+        with the outputs of an OpenMDAO Case.
+    """
+    def __init__(self, path):
+        if not is_results_store(path):
+            raise FileNotFoundError(f'{path} is not a dymos results store.')
+
+        self._path = path
+        with open(os.path.join(path, _METADATA_FILE)) as f:
+            self._metadata = json.load(f)
+
+        if self._metadata['format_version'] > _FORMAT_VERSION:
+            raise ValueError(f'The results store at {path} has format version '
+                             f'{self._metadata["format_version"]}, but this version of dymos can only '
+                             f'read results stores up to version {_FORMAT_VERSION}.')
+
+        self._var_meta = self._metadata['variables']
+        self._index = _build_suffix_index(self._var_meta)
+        self._vals = {}
+        self.outputs = _LazyValues(self)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    @property
+    def phases(self):
+        """
+        The pathnames of the phases in the results store.
+
+        Returns
+        -------
+        list of str
+            The pathnames of the phases.
+        """
+        return list(self._metadata['phases'])
+
+    @property
+    def trajectories(self):
+        """
+        The pathnames of the trajectories in the results store.
+
+        Returns
+        -------
+        list of str
+            The pathnames of the trajectories.
+        """
+        return list(self._metadata['trajectories'])
+
+    def _resolve(self, name):
+        """
+        Return the promoted name of the stored variable with the given name or dotted suffix.
+
+        Parameters
+        ----------
+        name : str
+            The promoted name of the variable, or a dotted suffix of it such as 'phase0.timeseries.time'.
+
+        Returns
+        -------
+        str
+            The promoted name of the variable in the results store.
+        """
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError(f'Variable {name} was not found in the results store at {self._path}.')
+
+    def list_vars(self, phase=None):
+        """
+        Return the promoted names of the stored variables.
+
+        Parameters
+        ----------
+        phase : str or None
+            If given, the pathname of the phase whose variables are listed, otherwise the variables
+            of all phases and trajectories are listed.
+
+        Returns
+        -------
+        list of str
+            The promoted names of the variables.
+        """
+        if phase is None:
+            return list(self._var_meta)
+        return list(self._metadata['phases'][phase]['variables'].values())
+
+    def get_phase_vars(self, phase):
+        """
+        Return the stored variables of a phase, keyed by their promoted names relative to the phase.
+
+        Parameters
+        ----------
+        phase : str
+            The pathname of the phase.
+
+        Returns
+        -------
+        dict
+            A mapping of the phase-relative promoted name of each variable, such as
+            'timeseries.states:x', to its promoted name in the results store.
+        """
+        return dict(self._metadata['phases'][phase]['variables'])
+
+    def get_units(self, name):
+        """
+        Return the units of a stored variable.
+
+        Parameters
+        ----------
+        name : str
+            The promoted name of the variable, or a dotted suffix of it.
+
+        Returns
+        -------
+        str or None
+            The units of the variable.
+        """
+        return self._var_meta[self._resolve(name)]['units']
+
+    def get_grid(self, phase):
+        """
+        Return the grid of a phase.
+
+        Parameters
+        ----------
+        phase : str
+            The pathname of the phase.
+
+        Returns
+        -------
+        dict
+            The transcription of the phase and, for transcriptions which use one, the number of
+            segments, segment ends, transcription order, and compression of its grid.
+        """
+        return dict(self._metadata['phases'][phase]['grid'])
+
+    def get_val(self, name, units=None):
+        """
+        Return the value of a stored variable.
+
+        Parameters
+        ----------
+        name : str
+            The promoted name of the variable, or a dotted suffix of it.
+        units : str or None
+            If given, the units to which the value is converted.
+
+        Returns
+        -------
+        np.array
+            The value of the variable.  Unless converted, this is a read-only memory map of the
+            file in which the variable is stored.
+        """
+        prom_name = self._resolve(name)
+
+        if prom_name not in self._vals:
+            fpath = os.path.join(self._path, self._var_meta[prom_name]['file'])
+            self._vals[prom_name] = np.load(fpath, mmap_mode='r')
+
+        val = self._vals[prom_name]
+        if units is not None:
+            val = convert_units(val, self._var_meta[prom_name]['units'], units)
+
+        return val
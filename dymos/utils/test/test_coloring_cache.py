@@ -0,0 +1,223 @@
+import os
+import unittest
+from unittest import mock
+
+import openmdao.api as om
+import openmdao.utils.coloring as coloring_mod
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.om_warnings import DerivativesWarning
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.utils.coloring_cache import cached_total_coloring, get_coloring_cache_key, _get_phase_ode_systems
+
+
+_TRANSCRIPTIONS = ('radau', 'gauss-lobatto', 'explicit-shooting')
+
+
+class _DenseBrachistochroneODE(BrachistochroneODE):
+    """
+    The brachistochrone ODE, optionally with dense partials and so a different sparsity than BrachistochroneODE.
+    """
+    def initialize(self):
+        super().initialize()
+        self.options.declare('dense', types=bool, default=True)
+
+    def setup(self):
+        super().setup()
+        if self.options['dense']:
+            self.declare_partials('*', '*', method='cs')
+
+    def compute_partials(self, inputs, partials):
+        if not self.options['dense']:
+            super().compute_partials(inputs, partials)
+
+
+def _make_problem(num_segments=5, fix_final_v=False, theta_guess=100, constraints=(), transcription='radau',
+                  ode_class=BrachistochroneODE, ode_init_kwargs=None):
+    p = om.Problem(model=om.Group())
+    p.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+    p.driver.declare_coloring()
+
+    if transcription == 'radau':
+        tx = dm.Radau(num_segments=num_segments, order=3)
+    elif transcription == 'gauss-lobatto':
+        tx = dm.GaussLobatto(num_segments=num_segments, order=3)
+    else:
+        tx = dm.ExplicitShooting(num_segments=num_segments, grid='gauss-lobatto', order=3, num_steps_per_segment=5)
+    shooting = transcription == 'explicit-shooting'
+
+    traj = p.model.add_subsystem('traj', dm.Trajectory())
+    phase = traj.add_phase('phase0', dm.Phase(ode_class=ode_class, transcription=tx,
+                                              ode_init_kwargs=ode_init_kwargs or {}))
+
+    phase.set_time_options(fix_initial=True, duration_bounds=(0.5, 10))
+    phase.add_state('x', fix_initial=True, fix_final=not shooting)
+    phase.add_state('y', fix_initial=True, fix_final=not shooting)
+    phase.add_state('v', fix_initial=True, fix_final=fix_final_v and not shooting)
+    phase.add_control('theta', continuity=True, rate_continuity=True, units='deg', lower=0.01, upper=179.9)
+    phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+    phase.add_objective('time', loc='final')
+
+    # The final states of an explicitly shot phase are constrained rather than fixed.
+    if shooting:
+        phase.add_boundary_constraint('x', loc='final', equals=10.0)
+        phase.add_boundary_constraint('y', loc='final', equals=5.0)
+        if fix_final_v:
+            phase.add_boundary_constraint('v', loc='final', equals=9.9)
+
+    for name, loc, kwargs in constraints:
+        phase.add_boundary_constraint(name, loc=loc, **kwargs)
+
+    p.setup()
+
+    p.set_val('traj.phase0.t_duration', 2.0)
+    p.set_val('traj.phase0.states:x', phase.interp('x', [0, 10]))
+    p.set_val('traj.phase0.states:y', phase.interp('y', [10, 5]))
+    p.set_val('traj.phase0.states:v', phase.interp('v', [0, 9.9]))
+    p.set_val('traj.phase0.controls:theta', phase.interp('theta', [5, theta_guess]))
+
+    return p
+
+
+@use_tempdirs
+class TestColoringCache(unittest.TestCase):
+
+    def tearDown(self):
+        dm.options['coloring_cache_dir'] = None
+
+    def test_cache_key(self):
+        for transcription in _TRANSCRIPTIONS:
+            with self.subTest(transcription=transcription):
+                keys = {}
+                for name, kwargs in (('base', {}), ('same', {}), ('guess', {'theta_guess': 90}),
+                                     ('grid', {'num_segments': 6}), ('state', {'fix_final_v': True}),
+                                     ('ode', {'ode_class': _DenseBrachistochroneODE})):
+                    p = _make_problem(transcription=transcription, **kwargs)
+                    p.final_setup()
+                    keys[name] = get_coloring_cache_key(p)
+
+                # The ODE is found even when it is evaluated in a subproblem of the phase.
+                self.assertTrue(_get_phase_ode_systems(p.model.traj.phases.phase0))
+
+                # The key depends only on the structure of the problem, not on the values of its variables.
+                self.assertEqual(keys['base'], keys['same'])
+                self.assertEqual(keys['base'], keys['guess'])
+                self.assertNotEqual(keys['base'], keys['grid'])
+                self.assertNotEqual(keys['base'], keys['state'])
+                self.assertNotEqual(keys['base'], keys['ode'])
+
+    def test_cache_key_ode_partials(self):
+        # An ODE whose sparsity differs only in its declared partials produces a different key.
+        for transcription in _TRANSCRIPTIONS:
+            with self.subTest(transcription=transcription):
+                keys = []
+                for dense in (False, True):
+                    p = _make_problem(transcription=transcription, ode_class=_DenseBrachistochroneODE,
+                                      ode_init_kwargs={'dense': dense})
+                    p.final_setup()
+                    keys.append(get_coloring_cache_key(p))
+                self.assertNotEqual(keys[0], keys[1])
+
+    def test_cache_key_constraint_order(self):
+        v_con = ('v', 'final', {'lower': 9.0})
+        theta_con = ('theta', 'final', {'upper': 100.0, 'units': 'deg'})
+
+        keys = {}
+        for name, constraints in (('v_theta', (v_con, theta_con)), ('same', (v_con, theta_con)),
+                                  ('theta_v', (theta_con, v_con))):
+            p = _make_problem(constraints=constraints)
+            p.final_setup()
+            keys[name] = get_coloring_cache_key(p)
+
+        # The rows of the total jacobian follow the order of the constraints.
+        self.assertEqual(keys['v_theta'], keys['same'])
+        self.assertNotEqual(keys['v_theta'], keys['theta_v'])
+
+    def test_cache_key_constraint_type(self):
+        keys = {}
+        for name, kwargs in (('ineq', {'lower': 9.0}), ('eq', {'equals': 9.0})):
+            p = _make_problem(constraints=[('v', 'final', kwargs)])
+            p.final_setup()
+            keys[name] = get_coloring_cache_key(p)
+
+        self.assertNotEqual(keys['ineq'], keys['eq'])
+
+    def test_mismatched_coloring_recomputed(self):
+        dm.options['coloring_cache_dir'] = 'coloring_cache'
+
+        p = _make_problem(constraints=[('v', 'final', {'lower': 9.0})])
+        dm.run_problem(p)
+
+        # Store the coloring of a problem with a different constraint under the key of this problem.
+        p2 = _make_problem(constraints=[('theta', 'final', {'upper': 100.0, 'units': 'deg'})])
+        p2.final_setup()
+        p.final_setup()
+        os.replace(os.path.join('coloring_cache', f'{get_coloring_cache_key(p)}.pkl'),
+                   os.path.join('coloring_cache', f'{get_coloring_cache_key(p2)}.pkl'))
+
+        with mock.patch.object(coloring_mod, 'dynamic_total_coloring',
+                               wraps=coloring_mod.dynamic_total_coloring) as dynamic_coloring:
+            with self.assertWarns(DerivativesWarning) as w:
+                dm.run_problem(p2)
+            self.assertEqual(dynamic_coloring.call_count, 1)
+
+        self.assertIn('does not match the problem and will be recomputed', str(w.warning))
+
+        # The mismatched coloring is replaced by the one computed for the problem.
+        p3 = _make_problem(constraints=[('theta', 'final', {'upper': 100.0, 'units': 'deg'})])
+        with mock.patch.object(coloring_mod, 'dynamic_total_coloring',
+                               wraps=coloring_mod.dynamic_total_coloring) as dynamic_coloring:
+            dm.run_problem(p3)
+            self.assertEqual(dynamic_coloring.call_count, 0)
+
+    def test_coloring_reused(self):
+        # The total jacobian of the explicitly shot brachistochrone is dense, so OpenMDAO discards its
+        # coloring and there is nothing to cache.
+        for transcription in ('radau', 'gauss-lobatto'):
+            with self.subTest(transcription=transcription):
+                cache_dir = os.path.join('coloring_cache', transcription)
+                dm.options['coloring_cache_dir'] = cache_dir
+
+                p = _make_problem(transcription=transcription)
+                dm.run_problem(p)
+
+                p.final_setup()
+                cache_file = os.path.join(cache_dir, f'{get_coloring_cache_key(p)}.pkl')
+                self.assertTrue(os.path.exists(cache_file))
+
+                p2 = _make_problem(transcription=transcription)
+                with mock.patch.object(coloring_mod, 'dynamic_total_coloring',
+                                       wraps=coloring_mod.dynamic_total_coloring) as dynamic_coloring:
+                    dm.run_problem(p2)
+                    self.assertEqual(dynamic_coloring.call_count, 0)
+
+                # The driver computes its coloring again if the problem is set up anew.
+                self.assertTrue(p2.driver._coloring_info['dynamic'])
+
+                assert_near_equal(p2.get_val('traj.phase0.t_duration'), p.get_val('traj.phase0.t_duration'),
+                                  tolerance=1.0E-6)
+
+                # Problems with a different grid or ODE compute and cache their own colorings.
+                for kwargs in ({'num_segments': 6}, {'ode_class': _DenseBrachistochroneODE}):
+                    p3 = _make_problem(transcription=transcription, **kwargs)
+                    with mock.patch.object(coloring_mod, 'dynamic_total_coloring',
+                                           wraps=coloring_mod.dynamic_total_coloring) as dynamic_coloring:
+                        dm.run_problem(p3)
+                        self.assertEqual(dynamic_coloring.call_count, 1)
+
+                self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+    def test_cache_disabled(self):
+        p = _make_problem()
+        p.final_setup()
+        with cached_total_coloring(p) as cached:
+            self.assertFalse(cached)
+
+        dm.run_problem(p)
+        self.assertFalse(os.path.exists('coloring_cache'))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
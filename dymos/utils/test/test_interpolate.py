@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_almost_equal
+
+from dymos.utils.interpolate import LagrangeBarycentricInterpolant
+from dymos.utils.lgl import lgl
+
+
+class TestLagrangeBarycentricInterpolant(unittest.TestCase):
+
+    def setUp(self):
+        # A cubic polynomial is represented exactly by a polynomial on 5 LGL nodes.
+        self.x0 = 2.0
+        self.xf = 7.0
+        self.nodes, _ = lgl(5)
+        x_nodes = self.x0 + 0.5 * (self.nodes + 1) * (self.xf - self.x0)
+
+        self.f = lambda x: np.stack([x**3 - 2 * x, 0.5 * x**2], axis=-1)
+        self.f_dot = lambda x: np.stack([3 * x**2 - 2, x], axis=-1)
+        self.f_ddot = lambda x: np.stack([6 * x, np.ones_like(x)], axis=-1)
+
+        self.interp = LagrangeBarycentricInterpolant(self.nodes, shape=(2,))
+        self.interp.setup(x0=self.x0, xf=self.xf, f_j=self.f(x_nodes))
+
+    def test_eval_scalar(self):
+        for x in [2.0, 3.3, 4.5, 7.0]:
+            with self.subTest(x=x):
+                self.assertEqual(self.interp.eval(x).shape, (2,))
+                assert_almost_equal(self.interp.eval(x), self.f(x))
+                assert_almost_equal(self.interp.eval_deriv(x), self.f_dot(x))
+                assert_almost_equal(self.interp.eval_deriv(x, der=2), self.f_ddot(x))
+
+    def test_eval_vectorized(self):
+        # Include the nodes themselves, where the barycentric formula is singular.
+        x = np.concatenate((np.linspace(self.x0, self.xf, 20),
+                            self.x0 + 0.5 * (self.nodes + 1) * (self.xf - self.x0)))
+
+        self.assertEqual(self.interp.eval(x).shape, (25, 2))
+        assert_almost_equal(self.interp.eval(x), self.f(x))
+        assert_almost_equal(self.interp.eval_deriv(x), self.f_dot(x))
+        assert_almost_equal(self.interp.eval_deriv(x, der=2), self.f_ddot(x))
+
+    def test_eval_deriv_unsupported(self):
+        with self.assertRaises(ValueError) as e:
+            self.interp.eval_deriv(3.0, der=3)
+
+        self.assertEqual(str(e.exception),
+                         'Barycentric interpolant currently only supports up to second derivatives')
+
+    def test_not_setup(self):
+        interp = LagrangeBarycentricInterpolant(self.nodes, shape=(1,))
+
+        with self.assertRaises(RuntimeError) as e:
+            interp.eval(0.0)
+
+        self.assertEqual(str(e.exception), 'LagrangeBarycentricInterpolant has not been setup')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
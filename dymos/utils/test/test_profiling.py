@@ -0,0 +1,113 @@
+import io
+import json
+import os
+import unittest
+
+import openmdao.api as om
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.utils.profiling import get_profile_report, profile_section, reset_profile, write_profile_report
+from dymos.utils.testing_utils import _get_reports_dir
+
+
+def _make_problem(transcription):
+    p = om.Problem(model=om.Group())
+
+    traj = p.model.add_subsystem('traj', dm.Trajectory())
+    phase = traj.add_phase('phase0', dm.Phase(ode_class=BrachistochroneODE, transcription=transcription))
+
+    phase.set_time_options(fix_initial=True, duration_bounds=(0.5, 10))
+    phase.add_state('x', fix_initial=True, fix_final=True)
+    phase.add_state('y', fix_initial=True, fix_final=True)
+    phase.add_state('v', fix_initial=True, fix_final=False)
+    phase.add_control('theta', continuity=True, rate_continuity=True, units='deg', lower=0.01, upper=179.9)
+    phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+    phase.add_objective('time', loc='final')
+
+    p.setup()
+
+    p.set_val('traj.phase0.t_initial', 0.0)
+    p.set_val('traj.phase0.t_duration', 2.0)
+    p.set_val('traj.phase0.states:x', phase.interp('x', [0, 10]))
+    p.set_val('traj.phase0.states:y', phase.interp('y', [10, 5]))
+    p.set_val('traj.phase0.states:v', phase.interp('v', [0, 9.9]))
+    p.set_val('traj.phase0.controls:theta', phase.interp('theta', [5, 100]))
+
+    return p
+
+
+@use_tempdirs
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        reset_profile()
+
+    def tearDown(self):
+        dm.options['profiling'] = False
+        reset_profile()
+
+    def test_profiling_radau(self):
+        dm.options['profiling'] = True
+
+        p = _make_problem(dm.Radau(num_segments=5, order=3))
+        dm.run_problem(p, run_driver=False, simulate=True)
+
+        report = get_profile_report()
+        phase_report = report['traj.phases.phase0']
+
+        for category in ('ode', 'timeseries', 'continuity', 'collocation', 'interpolation'):
+            with self.subTest(category=category):
+                self.assertIn(category, phase_report)
+                self.assertGreaterEqual(phase_report[category]['compute']['calls'], 1)
+                self.assertGreaterEqual(phase_report[category]['compute']['time'], 0.0)
+
+        self.assertEqual(report['traj']['simulate']['run']['calls'], 1)
+
+        report_dir = _get_reports_dir(p)
+        with open(os.path.join(report_dir, 'dymos_profile.json')) as f:
+            self.assertEqual(json.load(f), report)
+        self.assertTrue(os.path.exists(os.path.join(report_dir, 'dymos_profile.txt')))
+
+    def test_profiling_gauss_lobatto(self):
+        dm.options['profiling'] = True
+
+        p = _make_problem(dm.GaussLobatto(num_segments=5, order=3))
+        dm.run_problem(p, run_driver=False)
+
+        phase_report = get_profile_report()['traj.phases.phase0']
+
+        # The ODE is evaluated at both the state discretization and collocation nodes, and the
+        # controls, state interpolation, and interleaving components are each run once.
+        self.assertEqual(phase_report['ode']['compute']['calls'], 2)
+        self.assertEqual(phase_report['interpolation']['compute']['calls'], 3)
+
+    def test_profiling_disabled(self):
+        p = _make_problem(dm.Radau(num_segments=5, order=3))
+        dm.run_problem(p, run_driver=False)
+
+        with profile_section('traj', 'simulate'):
+            pass
+
+        self.assertEqual(get_profile_report(), {})
+        self.assertNotIn('_solve_nonlinear', p.model.traj.phases.phase0.rhs_all.__dict__)
+        self.assertFalse(os.path.exists(os.path.join(_get_reports_dir(p), 'dymos_profile.json')))
+
+    def test_write_profile_report(self):
+        dm.options['profiling'] = True
+
+        for i in range(3):
+            with profile_section('traj.phases.phase0', 'simulate'):
+                pass
+
+        stream = io.StringIO()
+        write_profile_report(get_profile_report(), stream=stream)
+        lines = stream.getvalue().splitlines()
+
+        self.assertEqual(lines[0].split()[:4], ['path', 'category', 'event', 'calls'])
+        self.assertEqual(lines[2].split()[:4], ['traj.phases.phase0', 'simulate', 'run', '3'])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
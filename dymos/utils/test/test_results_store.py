@@ -0,0 +1,176 @@
+import json
+import os
+import pathlib
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.utils.results_store import is_results_store, save_results, ResultsReader
+from dymos.utils.testing_utils import _get_reports_dir
+
+
+def _make_problem(num_segments=5):
+    p = om.Problem(model=om.Group())
+
+    traj = p.model.add_subsystem('traj', dm.Trajectory())
+    phase = traj.add_phase('phase0', dm.Phase(ode_class=BrachistochroneODE,
+                                              transcription=dm.Radau(num_segments=num_segments, order=3)))
+
+    phase.set_time_options(fix_initial=True, duration_bounds=(0.5, 10))
+    phase.add_state('x', fix_initial=True, fix_final=True)
+    phase.add_state('y', fix_initial=True, fix_final=True)
+    phase.add_state('v', fix_initial=True, fix_final=False)
+    phase.add_control('theta', continuity=True, rate_continuity=True, units='deg', lower=0.01, upper=179.9)
+    phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+    phase.add_objective('time', loc='final')
+
+    p.setup()
+
+    p.set_val('traj.phase0.t_initial', 0.0)
+    p.set_val('traj.phase0.t_duration', 2.0)
+    p.set_val('traj.phase0.states:x', phase.interp('x', [0, 10]))
+    p.set_val('traj.phase0.states:y', phase.interp('y', [10, 5]))
+    p.set_val('traj.phase0.states:v', phase.interp('v', [0, 9.9]))
+    p.set_val('traj.phase0.controls:theta', phase.interp('theta', [5, 100]))
+
+    return p
+
+
+@use_tempdirs
+class TestResultsStore(unittest.TestCase):
+
+    def test_save_and_read(self):
+        p = _make_problem()
+        dm.run_problem(p, run_driver=False, simulate=True, results_dir='results')
+
+        self.assertTrue(is_results_store('results/solution'))
+        self.assertTrue(is_results_store('results/simulation'))
+
+        reader = ResultsReader('results/solution')
+        self.assertEqual(reader.phases, ['traj.phases.phase0'])
+        self.assertEqual(reader.trajectories, ['traj'])
+        self.assertEqual(len(reader.list_vars(phase='traj.phases.phase0')), 16)
+
+        for name in ('time', 'states:x', 'controls:theta', 'control_rates:theta_rate', 'parameters:g'):
+            with self.subTest(name=name):
+                val = reader.get_val(f'traj.phase0.timeseries.{name}')
+                self.assertIsInstance(val, np.memmap)
+                assert_near_equal(val, p.get_val(f'traj.phase0.timeseries.{name}'))
+
+        # Variables may be referenced by any dotted suffix of their promoted name.
+        assert_near_equal(reader.get_val('phase0.timeseries.states:x'), p.get_val('traj.phase0.timeseries.states:x'))
+        assert_near_equal(reader.get_val('traj.phase0.t_duration'), 2.0)
+        assert_near_equal(reader.get_val('traj.phase0.parameters:g'), 9.80665)
+        assert_near_equal(reader.get_val('traj.phase0.timeseries.controls:theta', units='rad'),
+                          p.get_val('traj.phase0.timeseries.controls:theta', units='rad'))
+        self.assertEqual(reader.get_units('timeseries.controls:theta'), 'deg')
+
+        grid = reader.get_grid('traj.phases.phase0')
+        self.assertEqual(grid['transcription'], 'Radau')
+        self.assertEqual(grid['num_segments'], 5)
+        self.assertEqual(grid['transcription_order'], 5 * [3])
+        assert_near_equal(np.array(grid['segment_ends']), np.linspace(-1, 1, 6))
+
+        self.assertNotIn('traj.phase0.timeseries.input_values:states:x', reader)
+        with self.assertRaises(KeyError):
+            reader.get_val('traj.phase0.timeseries.foo')
+
+        sim_reader = ResultsReader('results/simulation')
+        sim_time = sim_reader.get_val('traj.phase0.timeseries.time')
+        self.assertEqual(sim_time.shape, (50, 1))
+        assert_near_equal(sim_time[-1], 2.0)
+
+    def test_lazy_load(self):
+        p = _make_problem()
+        p.run_model()
+        save_results(p, 'results')
+
+        reader = ResultsReader('results')
+
+        with mock.patch('numpy.load', wraps=np.load) as np_load:
+            self.assertIn('traj.phase0.timeseries.states:x', reader.outputs)
+            self.assertEqual(np_load.call_count, 0)
+
+            reader.outputs['traj.phase0.timeseries.states:x']
+            reader.get_val('traj.phase0.timeseries.states:x', units='ft')
+            self.assertEqual(np_load.call_count, 1)
+
+            reader.get_val('traj.phase0.timeseries.states:y')
+            self.assertEqual(np_load.call_count, 2)
+
+    def test_overwrite_and_append(self):
+        p = _make_problem()
+        p.run_model()
+        save_results(p, 'results')
+        num_files = len(os.listdir('results'))
+
+        p.set_val('traj.phase0.t_duration', 3.0)
+        save_results(p, 'results')
+        self.assertEqual(len(os.listdir('results')), num_files)
+        assert_near_equal(ResultsReader('results').get_val('traj.phase0.t_duration'), 3.0)
+
+        p2 = om.Problem()
+        p2.model.add_subsystem('traj2', _make_problem().model.traj)
+        p2.setup()
+        p2.set_val('traj2.phase0.t_duration', 2.0)
+        p2.run_model()
+        save_results(p2, 'results', append=True)
+
+        reader = ResultsReader('results')
+        self.assertEqual(reader.phases, ['traj.phases.phase0', 'traj2.phases.phase0'])
+        assert_near_equal(reader.get_val('traj.phase0.t_duration'), 3.0)
+        assert_near_equal(reader.get_val('traj2.phase0.t_duration'), 2.0)
+
+    def test_format_version(self):
+        p = _make_problem()
+        p.run_model()
+        save_results(p, 'results')
+
+        with open('results/metadata.json') as f:
+            metadata = json.load(f)
+        metadata['format_version'] += 1
+        with open('results/metadata.json', 'w') as f:
+            json.dump(metadata, f)
+
+        with self.assertRaises(ValueError):
+            ResultsReader('results')
+
+        with self.assertRaises(FileNotFoundError):
+            ResultsReader('foo')
+
+    def test_restart(self):
+        p = _make_problem()
+        p.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+        dm.run_problem(p, results_dir='results')
+
+        p_store = _make_problem(num_segments=8)
+        dm.run_problem(p_store, run_driver=False, restart='results/solution',
+                       solution_record_file='restart_solution.db')
+
+        p_case = _make_problem(num_segments=8)
+        dm.run_problem(p_case, run_driver=False, restart='dymos_solution.db')
+
+        for name in ('t_duration', 'states:x', 'states:y', 'states:v', 'controls:theta'):
+            with self.subTest(name=name):
+                assert_near_equal(p_store.get_val(f'traj.phase0.{name}'), p_case.get_val(f'traj.phase0.{name}'))
+
+        assert_near_equal(p_store.get_val('traj.phase0.t_duration'), p.get_val('traj.phase0.t_duration'))
+
+    def test_make_plots(self):
+        p = _make_problem()
+        dm.run_problem(p, run_driver=False, simulate=True, make_plots=True, results_dir='results')
+
+        plot_dir = pathlib.Path(_get_reports_dir(p)).joinpath('plots')
+        for varname in ('states:x', 'states:y', 'state_rates:x', 'controls:theta', 'parameters:g'):
+            self.assertTrue(plot_dir.joinpath(f'{varname.replace(":", "_")}.png').exists())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,5 +1,7 @@
+import json
 import os
 import unittest
+from unittest import mock
 import pathlib
 
 import numpy as np
@@ -510,5 +512,80 @@ class TestTimeSeriesPlotsMultiPhase(unittest.TestCase):
             self.assertTrue(plot_dir.joinpath(varname.replace(":", "_") + '.png').exists())
 
 
+@use_tempdirs
+class TestTimeSeriesPlotsParallel(unittest.TestCase):
+
+    def setUp(self):
+        p = om.Problem(model=om.Group())
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+        phase = traj.add_phase('phase0', dm.Phase(ode_class=BrachistochroneODE,
+                                                  transcription=dm.Radau(num_segments=5, order=3)))
+
+        phase.set_time_options(fix_initial=True, duration_bounds=(.5, 10))
+        phase.add_state('x', fix_initial=True, fix_final=True)
+        phase.add_state('y', fix_initial=True, fix_final=True)
+        phase.add_state('v', fix_initial=True, fix_final=False)
+        phase.add_control('theta', continuity=True, rate_continuity=True, units='deg', lower=0.01, upper=179.9)
+        phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+        phase.add_objective('time', loc='final')
+
+        p.setup()
+
+        p.set_val('traj.phase0.t_duration', 2.0)
+        p.set_val('traj.phase0.states:x', phase.interp('x', [0, 10]))
+        p.set_val('traj.phase0.states:y', phase.interp('y', [10, 5]))
+        p.set_val('traj.phase0.states:v', phase.interp('v', [0, 9.9]))
+        p.set_val('traj.phase0.controls:theta', phase.interp('theta', [5, 100]))
+
+        self.p = p
+        self.varnames = ['time_phase', 'states:x', 'state_rates:x', 'states:y', 'state_rates:y', 'states:v',
+                         'state_rates:v', 'controls:theta', 'control_rates:theta_rate',
+                         'control_rates:theta_rate2', 'parameters:g']
+
+    def test_parallel_plots(self):
+        dm.run_problem(self.p, run_driver=False, simulate=True, results_dir='results')
+
+        for num_workers, plot_dir in ((1, 'serial'), (4, 'parallel')):
+            timeseries_plots('results/solution', simulation_record_file='results/simulation',
+                             plot_dir=plot_dir, problem=self.p, num_workers=num_workers)
+
+        plot_dir = pathlib.Path(_get_reports_dir(self.p))
+        for varname in self.varnames:
+            fname = f'{varname.replace(":", "_")}.png'
+            self.assertTrue(plot_dir.joinpath('serial', fname).exists())
+            self.assertTrue(plot_dir.joinpath('parallel', fname).exists())
+
+        with open(plot_dir.joinpath('serial', 'plot_hashes.json')) as f:
+            serial_hashes = json.load(f)
+        with open(plot_dir.joinpath('parallel', 'plot_hashes.json')) as f:
+            parallel_hashes = json.load(f)
+
+        self.assertTrue(set(self.varnames).issubset(serial_hashes['matplotlib']))
+        self.assertEqual(serial_hashes, parallel_hashes)
+
+    def test_incremental_plots(self):
+        import matplotlib.pyplot as plt
+
+        dm.run_problem(self.p, run_driver=False)
+        timeseries_plots('dymos_solution.db', problem=self.p, incremental=True)
+
+        with mock.patch.object(plt, 'savefig', wraps=plt.savefig) as savefig:
+            timeseries_plots('dymos_solution.db', problem=self.p, incremental=True)
+            self.assertEqual(savefig.call_count, 0)
+
+            # Only the plots of the variables which depend on gravity are made again.
+            self.p.set_val('traj.phase0.parameters:g', 9.0)
+            dm.run_problem(self.p, run_driver=False)
+            timeseries_plots('dymos_solution.db', problem=self.p, incremental=True)
+            self.assertEqual(savefig.call_count, 2)
+
+            timeseries_plots('dymos_solution.db', problem=self.p)
+
+        with open(pathlib.Path(_get_reports_dir(self.p)).joinpath('plots', 'plot_hashes.json')) as f:
+            num_plots = len(json.load(f)['matplotlib'])
+        self.assertEqual(savefig.call_count, 2 + num_plots)
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,15 +1,26 @@
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
 import os
 import warnings
 import pathlib
 
 import numpy as np
 
-import matplotlib.pyplot as plt
-import matplotlib.lines as mlines
-import matplotlib.patches as mpatches
-
 import openmdao.api as om
+from openmdao.utils.mpi import MPI
 from dymos.options import options as dymos_options
+from dymos.utils.results_store import is_results_store, ResultsReader
+
+
+# The name of the file in the plot directory which records the hash of the data of each plot.
+_PLOT_HASHES_FILE = 'plot_hashes.json'
+
+# The cases and settings used to make the plots.  The subprocesses which make the plots are
+# forked, so they inherit this rather than having the cases pickled, and each of them only
+# loads the variables it plots from the cases which support loading variables on demand.
+_plot_context = {}
 
 
 def _get_phases_node_in_problem_metadata(node, path=""):
@@ -51,105 +62,409 @@ def _get_phases_node_in_problem_metadata(node, path=""):
     return None, None
 
 
-def _mpl_timeseries_plots(time_units, var_units, phase_names, phases_node_path,
-                          last_solution_case, last_simulation_case, plot_dir_path):
-    # get ready to plot
-    backend_save = plt.get_backend()
-    plt.switch_backend('Agg')
-    # use a colormap with 20 values
-    cm = plt.cm.get_cmap('tab20')
-    plotfiles = []
+def _get_case_reader_plot_metadata(cr):
+    """
+    Get the phases and timeseries variables to be plotted from the problem metadata of a case recorder.
 
-    for var_name, var_unit in var_units.items():
-        # start a new plot
-        fig, ax = plt.subplots()
+    Parameters
+    ----------
+    cr : CaseReader
+        The reader of the case recorder file containing the solution.
 
-        # Get the labels
-        time_label = f'time ({time_units[var_name]})'
-        var_label = f'{var_name} ({var_unit})'
-        title = f'timeseries.{var_name}'
+    Returns
+    -------
+    str
+        The dotted path of the system containing the phases.
+    list of str
+        The names of the phases.
+    dict
+        The units of each timeseries variable to be plotted.
+    dict
+        The units of time against which each timeseries variable is plotted.
+    """
+    # we will use the problem metadata to get information about the phases and units
+    root_children = cr.problem_metadata['tree']['children']
 
-        # add labels, title, and legend
-        ax.set_xlabel(time_label)
-        ax.set_ylabel(var_label)
-        fig.suptitle(title)
+    # We have to key off the phases node. It will tell us
+    #  what the prefix is for the variable names before the phases part of the variables
+    #  and also let us know what the phase names are
+    phases_node, phases_node_path = _get_phases_node_in_problem_metadata(root_children)
 
-        # Plot each phase
-        for iphase, phase_name in enumerate(phase_names):
-            if phases_node_path:
-                var_name_full = f'{phases_node_path}.{phase_name}.timeseries.{var_name}'
-                time_name = f'{phases_node_path}.{phase_name}.timeseries.time'
-            else:
-                var_name_full = f'{phase_name}.timeseries.{var_name}'
-                time_name = f'{phase_name}.timeseries.time'
-
-            # Get values
-            if var_name_full not in last_solution_case.outputs:
-                continue
-
-            var_val = last_solution_case.outputs[var_name_full]
-            time_val = last_solution_case.outputs[time_name]
-
-            # Plot the data
-            color = cm.colors[iphase % 20]
-
-            ax.plot(time_val, var_val, marker='o', linestyle='None', label='solution', color=color)
-
-            # get simulation values, if plotting simulation
-            if last_simulation_case:
-                # if the phases_node_path is empty, need to pre-pend names with "sim_traj."
-                #   as that is pre-pended in Trajectory.simulate code
-                sim_prefix = "" if phases_node_path else "sim_traj."
-                var_val_simulate = last_simulation_case.outputs[sim_prefix + var_name_full]
-                time_val_simulate = last_simulation_case.outputs[sim_prefix + time_name]
-                ax.plot(time_val_simulate, var_val_simulate, linestyle='--', label='simulation',
-                        color=color)
-
-        # Create two legends
-        #   Solution/Simulation legend
-        solution_line = mlines.Line2D([], [], color='black', marker='o', linestyle='None',
-                                      label='Solution')
+    # get phase names
+    phase_names = [phase['name'] for phase in phases_node['children']]
+
+    # Get the units and var names along the way
+    var_units = {}
+    time_units = {}
+    for phase_node in phases_node['children']:  # Hopefully all phases have the same vars
+        for phase_node_child in phase_node['children']:  # find the timeseries node
+            if phase_node_child['name'] == 'timeseries':
+                timeseries_node = phase_node_child
+                break
+        # get the time units first so they can be associated with all the variables
+        for timeseries_node_child in timeseries_node['children']:
+            if timeseries_node_child['name'] == 'time':
+                units_for_time = timeseries_node_child['units']
+                break
+        for timeseries_node_child in timeseries_node['children']:
+            # plot everything in the timeseries except input_values. Also not time since that
+            #   is the independent variable in these plot
+            if not timeseries_node_child['name'].startswith("input_values:")\
+                    and not timeseries_node_child['name'] == 'time':
+                varname = timeseries_node_child['name']
+                var_units[varname] = timeseries_node_child['units']
+                time_units[varname] = units_for_time
+
+    return phases_node_path, phase_names, var_units, time_units
+
+
+def _get_results_store_plot_metadata(reader):
+    """
+    Get the phases and timeseries variables to be plotted from the metadata of a results store.
+
+    Parameters
+    ----------
+    reader : ResultsReader
+        The reader of the results store containing the solution.
+
+    Returns
+    -------
+    str
+        The dotted path of the system containing the phases.
+    list of str
+        The names of the phases.
+    dict
+        The units of each timeseries variable to be plotted.
+    dict
+        The units of time against which each timeseries variable is plotted.
+    """
+    phases_node_path = ''
+    phase_names = []
+    var_units = {}
+    time_units = {}
+
+    for phase_path in reader.phases:
+        phase_vars = reader.get_phase_vars(phase_path)
+        if 'timeseries.time' not in phase_vars:
+            continue
+
+        # The phase is addressed by its promoted path, which omits the phases group of a trajectory.
+        time_name = phase_vars['timeseries.time']
+        phases_node_path, _, phase_name = time_name[:-len('.timeseries.time')].rpartition('.')
+        phase_names.append(phase_name)
+        units_for_time = reader.get_units(time_name)
+
+        for name, prom_name in phase_vars.items():
+            if name.startswith('timeseries.') and name != 'timeseries.time':
+                varname = name[len('timeseries.'):]
+                var_units[varname] = reader.get_units(prom_name)
+                time_units[varname] = units_for_time
+
+    return phases_node_path, phase_names, var_units, time_units
+
+
+def _get_plot_data(var_name):
+    """
+    Get the values of a timeseries variable in each phase from the cases in _plot_context.
+
+    Parameters
+    ----------
+    var_name : str
+        The name of the timeseries variable.
+
+    Returns
+    -------
+    list of tuple
+        For each phase in which the variable is present, the index of the phase, the solution
+        time and values, and the simulation time and values, or None if there is no simulation.
+    """
+    phases_node_path = _plot_context['phases_node_path']
+    last_solution_case = _plot_context['solution_case']
+    last_simulation_case = _plot_context['simulation_case']
+
+    data = []
+    for iphase, phase_name in enumerate(_plot_context['phase_names']):
+        if phases_node_path:
+            var_name_full = f'{phases_node_path}.{phase_name}.timeseries.{var_name}'
+            time_name = f'{phases_node_path}.{phase_name}.timeseries.time'
+        else:
+            var_name_full = f'{phase_name}.timeseries.{var_name}'
+            time_name = f'{phase_name}.timeseries.time'
+
+        # Get values
+        if var_name_full not in last_solution_case.outputs:
+            continue
+
+        var_val = last_solution_case.outputs[var_name_full]
+        time_val = last_solution_case.outputs[time_name]
+
+        # get simulation values, if plotting simulation
         if last_simulation_case:
-            simulation_line = mlines.Line2D([], [], color='black', linestyle='--',
-                                            label='Simulation')
-            sol_sim_legend = plt.legend(handles=[solution_line, simulation_line],
-                                        loc='upper left', bbox_to_anchor=(-0.3, -0.12), shadow=True)
+            # if the phases_node_path is empty, need to pre-pend names with "sim_traj."
+            #   as that is pre-pended in Trajectory.simulate code
+            sim_prefix = "" if phases_node_path else "sim_traj."
+            var_val_simulate = last_simulation_case.outputs[sim_prefix + var_name_full]
+            time_val_simulate = last_simulation_case.outputs[sim_prefix + time_name]
         else:
-            sol_sim_legend = plt.legend(handles=[solution_line],
-                                        loc='upper left', bbox_to_anchor=(-0.3, -0.12),
-                                        shadow=True)
-        plt.gca().add_artist(sol_sim_legend)
+            var_val_simulate = time_val_simulate = None
+
+        data.append((iphase, time_val, var_val, time_val_simulate, var_val_simulate))
+
+    return data
+
+
+def _hash_plot_data(var_name, data):
+    """
+    Compute a hash of everything that is shown in the plot of a timeseries variable.
+
+    Parameters
+    ----------
+    var_name : str
+        The name of the timeseries variable.
+    data : list of tuple
+        The values of the variable in each phase, as returned by _get_plot_data.
+
+    Returns
+    -------
+    str
+        The hex digest of the hash.
+    """
+    h = hashlib.sha1()
+    h.update(json.dumps([var_name, _plot_context['var_units'][var_name], _plot_context['time_units'][var_name],
+                         _plot_context['phase_names']]).encode())
+    for iphase, *vals in data:
+        h.update(str(iphase).encode())
+        for val in vals:
+            if val is not None:
+                val = np.ascontiguousarray(val)
+                h.update(str(val.shape).encode())
+                h.update(val.tobytes())
+    return h.hexdigest()
+
+
+def _get_plot_data_and_hash(var_name):
+    """
+    Get the values of a timeseries variable in each phase, and their hash.
+
+    Parameters
+    ----------
+    var_name : str
+        The name of the timeseries variable.
+
+    Returns
+    -------
+    list of tuple
+        The values of the variable in each phase, as returned by _get_plot_data.
+    str
+        The hex digest of the hash of the plot of the variable.
+    """
+    data = _get_plot_data(var_name)
+    return data, _hash_plot_data(var_name, data)
+
+
+def _map_plot_vars(func, var_names, num_workers):
+    """
+    Apply a function to each timeseries variable, in forked subprocesses if possible.
+
+    Parameters
+    ----------
+    func : callable
+        The function applied to the name of each variable.  It is given the cases and plot
+        settings through _plot_context, which the subprocesses inherit.
+    var_names : list of str
+        The names of the timeseries variables.
+    num_workers : int
+        The number of processes in which the variables are processed.
+
+    Returns
+    -------
+    list
+        The result of the function for each variable.
+    """
+    if num_workers > 1 and (MPI or 'fork' not in multiprocessing.get_all_start_methods()):
+        warnings.warn('Timeseries plots cannot be made in subprocesses on this platform, the plots '
+                      'will be made serially.')
+        num_workers = 1
+
+    if num_workers > 1 and len(var_names) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(num_workers, len(var_names)),
+                                                    mp_context=multiprocessing.get_context('fork')) as ex:
+            return list(ex.map(func, var_names))
+
+    return [func(var_name) for var_name in var_names]
+
+
+def _mpl_timeseries_plot(var_name):
+    """
+    Make the matplotlib plot of a timeseries variable from the cases in _plot_context.
+
+    If plotting incrementally and the hash of the plot matches that of the existing plot file,
+    the plot is not made again.
+
+    Parameters
+    ----------
+    var_name : str
+        The name of the timeseries variable.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the plot file.
+    str
+        The hex digest of the hash of the plot.
+    """
+    import matplotlib.pyplot as plt
+    import matplotlib.lines as mlines
+    import matplotlib.patches as mpatches
+
+    phase_names = _plot_context['phase_names']
+    plot_file_path = _plot_context['plot_dir_path'].joinpath(f'{var_name.replace(":","_")}.png')
+
+    data, data_hash = _get_plot_data_and_hash(var_name)
+
+    if _plot_context['incremental'] and _plot_context['prev_hashes'].get(var_name) == data_hash \
+            and plot_file_path.exists():
+        return plot_file_path, data_hash
+
+    # use a colormap with 20 values
+    cm = plt.cm.get_cmap('tab20')
+
+    # start a new plot
+    fig, ax = plt.subplots()
+
+    # Get the labels
+    time_label = f'time ({_plot_context["time_units"][var_name]})'
+    var_label = f'{var_name} ({_plot_context["var_units"][var_name]})'
+    title = f'timeseries.{var_name}'
+
+    # add labels, title, and legend
+    ax.set_xlabel(time_label)
+    ax.set_ylabel(var_label)
+    fig.suptitle(title)
+
+    # Plot each phase
+    for iphase, time_val, var_val, time_val_simulate, var_val_simulate in data:
+        color = cm.colors[iphase % 20]
+
+        ax.plot(time_val, var_val, marker='o', linestyle='None', label='solution', color=color)
+
+        if var_val_simulate is not None:
+            ax.plot(time_val_simulate, var_val_simulate, linestyle='--', label='simulation',
+                    color=color)
+
+    # Create two legends
+    #   Solution/Simulation legend
+    solution_line = mlines.Line2D([], [], color='black', marker='o', linestyle='None',
+                                  label='Solution')
+    if _plot_context['simulation_case']:
+        simulation_line = mlines.Line2D([], [], color='black', linestyle='--',
+                                        label='Simulation')
+        sol_sim_legend = plt.legend(handles=[solution_line, simulation_line],
+                                    loc='upper left', bbox_to_anchor=(-0.3, -0.12), shadow=True)
+    else:
+        sol_sim_legend = plt.legend(handles=[solution_line],
+                                    loc='upper left', bbox_to_anchor=(-0.3, -0.12),
+                                    shadow=True)
+    plt.gca().add_artist(sol_sim_legend)
+
+    #   Phases legend
+    handles = []
+    for iphase, phase_name in enumerate(phase_names):
+        patch = mpatches.Patch(color=cm.colors[iphase], label=phase_name)
+        handles.append(patch)
+    plt.legend(handles=handles, loc='upper right', ncol=len(phase_names), shadow=True,
+               bbox_to_anchor=(1.15, -0.12), title='Phases')
+
+    plt.subplots_adjust(bottom=0.23, top=0.9, left=0.2)
+
+    # save to file
+    plt.savefig(plot_file_path)
+    plt.close(fig)
+
+    return plot_file_path, data_hash
+
+
+def _mpl_timeseries_plots(num_workers=1):
+    """
+    Make the matplotlib plots of the timeseries variables in _plot_context.
+
+    Parameters
+    ----------
+    num_workers : int
+        The number of processes in which the plots are made.
+
+    Returns
+    -------
+    list of pathlib.Path
+        The paths of the plot files.
+    dict
+        The hex digest of the hash of the plot of each variable.
+    """
+    import matplotlib.pyplot as plt
+
+    # get ready to plot
+    backend_save = plt.get_backend()
+    plt.switch_backend('Agg')
 
-        #   Phases legend
-        handles = []
-        for iphase, phase_name in enumerate(phase_names):
-            patch = mpatches.Patch(color=cm.colors[iphase], label=phase_name)
-            handles.append(patch)
-        plt.legend(handles=handles, loc='upper right', ncol=len(phase_names), shadow=True,
-                   bbox_to_anchor=(1.15, -0.12), title='Phases')
+    var_names = list(_plot_context['var_units'])
+    try:
+        results = _map_plot_vars(_mpl_timeseries_plot, var_names, num_workers)
+    finally:
+        plt.switch_backend(backend_save)
 
-        plt.subplots_adjust(bottom=0.23, top=0.9, left=0.2)
+    plotfiles = [plot_file_path for plot_file_path, _ in results]
+    hashes = {var_name: data_hash for var_name, (_, data_hash) in zip(var_names, results)}
 
-        # save to file
-        plot_file_path = plot_dir_path.joinpath(f'{var_name.replace(":","_")}.png')
-        plt.savefig(plot_file_path)
-        plt.close(fig)
-        plotfiles.append(plot_file_path)
+    return plotfiles, hashes
 
-    plt.switch_backend(backend_save)
 
-    return plotfiles
+def _bokeh_timeseries_plots(num_workers=1, num_cols=2, bg_fill_color='#282828', grid_line_color='#666666',
+                            open_browser=False):
+    """
+    Make the bokeh plots of the timeseries variables in _plot_context.
+
+    All of the plots are saved to a single html file, so the data of the variables is gathered in
+    the subprocesses and the page is assembled in this process.  If plotting incrementally and the
+    hashes of all of the plots match those of the existing page, the page is not made again.
 
+    Parameters
+    ----------
+    num_workers : int
+        The number of processes in which the data of the variables is gathered.
+    num_cols : int
+        The number of columns of plots.
+    bg_fill_color : str
+        The background color of the plots.
+    grid_line_color : str
+        The color of the grid lines of the plots.
+    open_browser : bool
+        If True, show the plots in a browser rather than saving them.
 
-def _bokeh_timeseries_plots(time_units, var_units, phase_names, phases_node_path,
-                            last_solution_case, last_simulation_case, plot_dir_path, num_cols=2,
-                            bg_fill_color='#282828', grid_line_color='#666666', open_browser=False):
+    Returns
+    -------
+    dict
+        The hex digest of the hash of the plot of each variable.
+    """
     from bokeh.io import output_notebook, output_file, save, show
     from bokeh.layouts import gridplot, column
     from bokeh.models import Legend
     from bokeh.plotting import figure
     import bokeh.palettes as bp
 
+    phase_names = _plot_context['phase_names']
+    phases_node_path = _plot_context['phases_node_path']
+    last_solution_case = _plot_context['solution_case']
+    plot_dir_path = _plot_context['plot_dir_path']
+
+    var_names = list(_plot_context['var_units'])
+    results = _map_plot_vars(_get_plot_data_and_hash, var_names, num_workers)
+    hashes = {var_name: data_hash for var_name, (_, data_hash) in zip(var_names, results)}
+
+    show_plots = dymos_options['notebook_mode'] or open_browser
+    if not show_plots and _plot_context['incremental'] and hashes == _plot_context['prev_hashes'] \
+            and os.path.exists(os.path.join(plot_dir_path, 'plots.html')):
+        return hashes
+
     if dymos_options['notebook_mode']:
         output_notebook()
     else:
@@ -176,10 +491,10 @@ def _bokeh_timeseries_plots(time_units, var_units, phase_names, phases_node_path
         max_time = max(max_time, np.max(last_solution_case.outputs[time_name]))
         colors[phase_name] = cmap[iphase]
 
-    for var_name, var_unit in var_units.items():
+    for var_name, (data, _) in zip(var_names, results):
         # Get the labels
-        time_label = f'time ({time_units[var_name]})'
-        var_label = f'{var_name} ({var_unit})'
+        time_label = f'time ({_plot_context["time_units"][var_name]})'
+        var_label = f'{var_name} ({_plot_context["var_units"][var_name]})'
         title = f'timeseries.{var_name}'
 
         # add labels, title, and legend
@@ -193,36 +508,17 @@ def _bokeh_timeseries_plots(time_units, var_units, phase_names, phases_node_path
         fig.ygrid.grid_line_color = grid_line_color
 
         # Plot each phase
-        for iphase, phase_name in enumerate(phase_names):
+        for iphase, time_val, var_val, time_val_simulate, var_val_simulate in data:
+            phase_name = phase_names[iphase]
             sol_color = cmap[iphase]
             sim_color = cmap[iphase]
 
-            if phases_node_path:
-                var_name_full = f'{phases_node_path}.{phase_name}.timeseries.{var_name}'
-                time_name = f'{phases_node_path}.{phase_name}.timeseries.time'
-            else:
-                var_name_full = f'{phase_name}.timeseries.{var_name}'
-                time_name = f'{phase_name}.timeseries.time'
-
-            # Get values
-            if var_name_full not in last_solution_case.outputs:
-                continue
-
-            var_val = last_solution_case.outputs[var_name_full]
-            time_val = last_solution_case.outputs[time_name]
-
             for idxs, i in np.ndenumerate(np.zeros(var_val.shape[1:])):
                 var_val_i = var_val[:, idxs].ravel()
                 sol_plots[phase_name] = fig.circle(time_val.ravel(), var_val_i, size=5,
                                                    color=sol_color, name='sol:' + phase_name)
 
-            # get simulation values, if plotting simulation
-            if last_simulation_case:
-                # if the phases_node_path is empty, need to pre-pend names with "sim_traj."
-                #   as that is pre-pended in Trajectory.simulate code
-                sim_prefix = '' if phases_node_path else 'sim_traj.'
-                var_val_simulate = last_simulation_case.outputs[sim_prefix + var_name_full]
-                time_val_simulate = last_simulation_case.outputs[sim_prefix + time_name]
+            if var_val_simulate is not None:
                 for idxs, i in np.ndenumerate(np.zeros(var_val_simulate.shape[1:])):
                     var_val_i = var_val_simulate[:, idxs].ravel()
                     sim_plots[phase_name] = fig.line(time_val_simulate.ravel(), var_val_i,
@@ -274,6 +570,8 @@ def _bokeh_timeseries_plots(time_units, var_units, phase_names, phases_node_path
     else:
         save(plots)
 
+    return hashes
+
 
 try:
     from openmdao.utils.file_utils import image2html
@@ -324,7 +622,7 @@ except ImportError:
 
 
 def timeseries_plots(solution_recorder_filename, simulation_record_file=None, plot_dir="plots",
-                     problem=None):
+                     problem=None, num_workers=1, incremental=False):
     """
     Create plots of the timeseries.
 
@@ -334,15 +632,24 @@ def timeseries_plots(solution_recorder_filename, simulation_record_file=None, pl
     Parameters
     ----------
     solution_recorder_filename : str
-        The path to the case recorder file containing solution data.
+        The path to the case recorder file or results store containing solution data.
     simulation_record_file : str or None (default:None)
-        The path to the case recorder file containing simulation data. If not None,
+        The path to the case recorder file or results store containing simulation data. If not None,
         this implies that the data from it should be plotted.
     plot_dir : str
         The path to the directory to which the plot files will be written.
     problem : Problem or None
         If not None, this is the owning Problem, and the plot_dir will be relative to the reports
         directory for this Problem.
+    num_workers : int
+        The number of processes in which the plots are made.  If greater than 1, the plots are
+        made in forked subprocesses, each of which loads only the variables it plots.  This is not
+        available under MPI or on platforms which do not support forking processes, where the plots
+        are made serially.
+    incremental : bool
+        If True, only remake the plots whose data differs from that of the plots previously made
+        in plot_dir.  With the bokeh backend, all plots are on one page, which is remade if the
+        data of any plot differs.
     """
     # get ready to generate plot files
 
@@ -357,74 +664,67 @@ def timeseries_plots(solution_recorder_filename, simulation_record_file=None, pl
                 repdir = get_reports_dir(problem)
             plot_dir_path = pathlib.Path(repdir).joinpath(plot_dir)
     else:
-        plot_dir_path = plot_dir
+        plot_dir_path = pathlib.Path(plot_dir)
 
     plot_dir_path.mkdir(parents=True, exist_ok=True)
 
-    cr = om.CaseReader(solution_recorder_filename)
+    if is_results_store(solution_recorder_filename):
+        last_solution_case = ResultsReader(solution_recorder_filename)
+        phases_node_path, phase_names, var_units, time_units = \
+            _get_results_store_plot_metadata(last_solution_case)
+    else:
+        cr = om.CaseReader(solution_recorder_filename)
+
+        # get outputs from the solution
+        solution_cases = cr.list_cases('problem', out_stream=None)
+        last_solution_case = cr.get_case(solution_cases[-1])
 
-    # get outputs from the solution
-    solution_cases = cr.list_cases('problem', out_stream=None)
-    last_solution_case = cr.get_case(solution_cases[-1])
+        phases_node_path, phase_names, var_units, time_units = _get_case_reader_plot_metadata(cr)
 
     # If plotting simulation results, get the values for those variables
-    if simulation_record_file:
+    if simulation_record_file and is_results_store(simulation_record_file):
+        last_simulation_case = ResultsReader(simulation_record_file)
+    elif simulation_record_file:
         cr_simulate = om.CaseReader(simulation_record_file)
         system_simulation_cases = cr_simulate.list_cases('problem', out_stream=None)
         last_simulation_case = cr_simulate.get_case(system_simulation_cases[-1])
     else:
         last_simulation_case = None
 
-    # we will use the problem metadata to get information about the phases and units
-    root_children = cr.problem_metadata['tree']['children']
-
-    # We have to key off the phases node. It will tell us
-    #  what the prefix is for the variable names before the phases part of the variables
-    #  and also let us know what the phase names are
-    phases_node, phases_node_path = _get_phases_node_in_problem_metadata(root_children)
-
-    # get phase names
-    phase_names = [phase['name'] for phase in phases_node['children']]
-
-    # Get the units and var names along the way
-    var_units = {}
-    time_units = {}
-    for phase_node in phases_node['children']:  # Hopefully all phases have the same vars
-        for phase_node_child in phase_node['children']:  # find the timeseries node
-            if phase_node_child['name'] == 'timeseries':
-                timeseries_node = phase_node_child
-                break
-        # get the time units first so they can be associated with all the variables
-        for timeseries_node_child in timeseries_node['children']:
-            if timeseries_node_child['name'] == 'time':
-                units_for_time = timeseries_node_child['units']
-                break
-        for timeseries_node_child in timeseries_node['children']:
-            # plot everything in the timeseries except input_values. Also not time since that
-            #   is the independent variable in these plot
-            if not timeseries_node_child['name'].startswith("input_values:")\
-                    and not timeseries_node_child['name'] == 'time':
-                varname = timeseries_node_child['name']
-                var_units[varname] = timeseries_node_child['units']
-                time_units[varname] = units_for_time
-
     # Check to see if there is anything to plot
     if len(var_units) == 0:
         warnings.warn('There are no timeseries variables to plot', RuntimeWarning)
         return
 
-    if dymos_options['plots'] == 'bokeh':
-        _bokeh_timeseries_plots(time_units, var_units, phase_names, phases_node_path,
-                                last_solution_case, last_simulation_case, plot_dir_path)
-    elif dymos_options['plots'] == 'matplotlib':
-        fnames = _mpl_timeseries_plots(time_units, var_units, phase_names, phases_node_path,
-                                       last_solution_case, last_simulation_case, plot_dir_path)
-        if problem is not None:
-            for name in fnames:
-                # create html files that wrap the image files
-                fpath = pathlib.Path(name).resolve()
-                htmlpath = str(fpath.parent.joinpath(fpath.stem + '.html'))
-                with open(htmlpath, 'w', encoding='utf-8') as f:
-                    f.write(image2html(fpath.name))
-    else:
-        raise ValueError(f'Unknown plotting option: {dymos_options["plots"]}')
+    backend = dymos_options['plots']
+    if backend not in ('bokeh', 'matplotlib'):
+        raise ValueError(f'Unknown plotting option: {backend}')
+
+    hashes_path = plot_dir_path.joinpath(_PLOT_HASHES_FILE)
+    all_hashes = {}
+    if hashes_path.exists():
+        with open(hashes_path) as f:
+            all_hashes = json.load(f)
+
+    _plot_context.update(solution_case=last_solution_case, simulation_case=last_simulation_case,
+                         phases_node_path=phases_node_path, phase_names=phase_names, var_units=var_units,
+                         time_units=time_units, plot_dir_path=plot_dir_path, incremental=incremental,
+                         prev_hashes=all_hashes.get(backend, {}))
+    try:
+        if backend == 'bokeh':
+            hashes = _bokeh_timeseries_plots(num_workers)
+        else:
+            fnames, hashes = _mpl_timeseries_plots(num_workers)
+            if problem is not None:
+                for name in fnames:
+                    # create html files that wrap the image files
+                    fpath = pathlib.Path(name).resolve()
+                    htmlpath = str(fpath.parent.joinpath(fpath.stem + '.html'))
+                    with open(htmlpath, 'w', encoding='utf-8') as f:
+                        f.write(image2html(fpath.name))
+    finally:
+        _plot_context.clear()
+
+    all_hashes[backend] = hashes
+    with open(hashes_path, 'w') as f:
+        json.dump(all_hashes, f, indent=1)